@@ -0,0 +1,283 @@
+import csv
+import logging
+import re
+import sqlite3
+from pathlib import Path
+
+# 인스타그램 사용자명 규칙 (영문/숫자/마침표/밑줄, 최대 30자)
+USERNAME_PATTERN = re.compile(r'^[a-z0-9._]{1,30}$')
+
+# 대량 가져오기 시 한 번에 저장하는 행 수
+IMPORT_BATCH_SIZE = 5000
+
+# 계정별 설정 컬럼 (CSV 헤더와 동일)
+SETTING_COLUMNS = ('enabled', 'priority', 'interval_hours', 'max_posts')
+
+class AccountRegistry:
+    def __init__(self, db_path):
+        """
+        크롤링 대상 계정 목록 (accounts 테이블, DataManager.setup_database에서 생성)
+        
+        계정 목록이 바뀔 때마다 metadata 테이블의 accounts_version을 같은 트랜잭션에서 올리므로,
+        스케줄러는 get_version()만 확인하여 바뀐 경우에만 목록을 다시 읽습니다.
+        
+        Args:
+            db_path (str): SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self.logger = logging.getLogger(__name__)
+    
+    @staticmethod
+    def normalize_username(value):
+        """
+        사용자명 정규화 (앞의 @, 프로필 URL, 대문자, 공백 제거)
+        
+        Returns:
+            str: 정규화된 사용자명 (규칙에 맞지 않으면 None)
+        """
+        value = (value or '').strip()
+        if 'instagram.com/' in value:
+            value = value.split('instagram.com/', 1)[1].split('/')[0].split('?')[0]
+        value = value.lstrip('@').lower()
+        return value if USERNAME_PATTERN.match(value) else None
+    
+    def add_account(self, username, enabled=True, priority=0, interval_hours=None, max_posts=None):
+        """
+        계정 추가 (이미 있으면 설정 갱신)
+        
+        Args:
+            username (str): 인스타그램 사용자명
+            enabled (bool): 크롤링 여부
+            priority (int): 우선순위 (클수록 먼저 크롤링)
+            interval_hours (float): 계정별 최소 크롤링 간격 (None이면 스케줄러 간격)
+            max_posts (int): 계정별 최대 수집 게시물 수 (None이면 Config.MAX_POSTS_PER_ACCOUNT)
+        
+        Returns:
+            bool: 추가 성공 여부
+        """
+        normalized = self.normalize_username(username)
+        if not normalized:
+            self.logger.error(f"잘못된 사용자명: {username}")
+            return False
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self._upsert(conn, [(normalized, int(bool(enabled)), int(priority), interval_hours, max_posts)])
+                self._bump_version(conn)
+            return True
+        except Exception as e:
+            self.logger.error(f"계정 추가 실패: {username} - {e}")
+            return False
+    
+    def add_accounts(self, usernames, enabled=True, priority=0, interval_hours=None, max_posts=None):
+        """
+        여러 계정을 같은 설정으로 한 번에 추가 (잘못된 사용자명은 건너뜀)
+        
+        Returns:
+            int: 저장한 계정 수
+        """
+        defaults = {'enabled': int(bool(enabled)), 'priority': priority, 'interval_hours': interval_hours, 'max_posts': max_posts}
+        rows = [self._row(username, defaults) for username in map(self.normalize_username, usernames) if username]
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self._upsert(conn, rows)
+                self._bump_version(conn)
+            return len(rows)
+        except Exception as e:
+            self.logger.error(f"계정 일괄 추가 실패: {e}")
+            return 0
+    
+    def remove_account(self, username):
+        """
+        계정 삭제
+        
+        Returns:
+            bool: 삭제 여부 (없는 계정이면 False)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("DELETE FROM accounts WHERE username = ?", (self.normalize_username(username),))
+                if not cursor.rowcount:
+                    return False
+                self._bump_version(conn)
+            return True
+        except Exception as e:
+            self.logger.error(f"계정 삭제 실패: {username} - {e}")
+            return False
+    
+    def set_enabled(self, username, enabled):
+        """
+        계정 크롤링 여부 변경
+        
+        Returns:
+            bool: 변경 여부 (없는 계정이면 False)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute(
+                    "UPDATE accounts SET enabled = ?, updated_at = CURRENT_TIMESTAMP WHERE username = ?",
+                    (int(bool(enabled)), self.normalize_username(username))
+                )
+                if not cursor.rowcount:
+                    return False
+                self._bump_version(conn)
+            return True
+        except Exception as e:
+            self.logger.error(f"계정 상태 변경 실패: {username} - {e}")
+            return False
+    
+    def get_accounts(self, enabled_only=True):
+        """
+        계정 목록 (우선순위 높은 순, 같으면 사용자명 순)
+        
+        Args:
+            enabled_only (bool): 크롤링 대상 계정만 조회
+        
+        Returns:
+            list: 계정 설정 목록
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                where = "WHERE enabled = 1" if enabled_only else ""
+                rows = conn.execute(f'''
+                    SELECT username, enabled, priority, interval_hours, max_posts
+                    FROM accounts {where}
+                    ORDER BY priority DESC, username
+                ''').fetchall()
+                return [dict(row) for row in rows]
+        except Exception as e:
+            self.logger.error(f"계정 목록 조회 실패: {e}")
+            return []
+    
+    def get_version(self):
+        """
+        계정 목록 변경 번호 (변경될 때마다 증가)
+        
+        Returns:
+            int: 변경 번호 (조회 실패 시 None)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute("SELECT value FROM metadata WHERE key = 'accounts_version'").fetchone()
+                return int(row[0]) if row else 0
+        except Exception as e:
+            self.logger.error(f"계정 목록 변경 번호 조회 실패: {e}")
+            return None
+    
+    def import_accounts(self, path, enabled=True, priority=0, interval_hours=None, max_posts=None):
+        """
+        파일에서 계정 일괄 가져오기 (이미 있는 계정은 설정 갱신)
+        
+        - .csv: username 헤더가 있는 CSV (enabled, priority, interval_hours, max_posts 컬럼 선택)
+        - 그 외: 한 줄에 한 계정 (@, 프로필 URL 허용, # 이후는 주석)
+        
+        Args:
+            path (str): 가져올 파일 경로
+            enabled, priority, interval_hours, max_posts: 파일에 값이 없을 때 사용할 기본 설정
+        
+        Returns:
+            dict: 읽은 행 수(read), 저장한 계정 수(imported), 잘못된 행 수(invalid)
+        """
+        defaults = {'enabled': int(bool(enabled)), 'priority': priority, 'interval_hours': interval_hours, 'max_posts': max_posts}
+        counts = {'read': 0, 'imported': 0, 'invalid': 0}
+        try:
+            with open(path, 'r', encoding='utf-8-sig', newline='') as f, sqlite3.connect(self.db_path) as conn:
+                rows = self._read_csv(f, defaults) if Path(path).suffix.lower() == '.csv' else self._read_lines(f, defaults)
+                batch = []
+                for row in rows:
+                    counts['read'] += 1
+                    if row is None:
+                        counts['invalid'] += 1
+                        continue
+                    batch.append(row)
+                    if len(batch) >= IMPORT_BATCH_SIZE:
+                        counts['imported'] += self._upsert(conn, batch)
+                        batch = []
+                if batch:
+                    counts['imported'] += self._upsert(conn, batch)
+                self._bump_version(conn)
+            self.logger.info(f"계정 가져오기 완료: {path} - {counts['imported']}개 저장, {counts['invalid']}개 건너뜀")
+            return counts
+        except Exception as e:
+            self.logger.error(f"계정 가져오기 실패: {path} - {e}")
+            return {}
+    
+    def export_accounts(self, path):
+        """
+        계정 목록 내보내기 (.csv면 설정 포함, 그 외에는 사용자명만)
+        
+        Returns:
+            int: 내보낸 계정 수 (실패 시 None)
+        """
+        try:
+            accounts = self.get_accounts(enabled_only=False)
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                if Path(path).suffix.lower() == '.csv':
+                    writer = csv.DictWriter(f, fieldnames=('username',) + SETTING_COLUMNS)
+                    writer.writeheader()
+                    writer.writerows(accounts)
+                else:
+                    f.writelines(f"{account['username']}\n" for account in accounts)
+            self.logger.info(f"계정 내보내기 완료: {path} ({len(accounts)}개)")
+            return len(accounts)
+        except Exception as e:
+            self.logger.error(f"계정 내보내기 실패: {path} - {e}")
+            return None
+    
+    def _read_lines(self, f, defaults):
+        """텍스트 파일의 계정 행 (잘못된 사용자명은 None)"""
+        for line in f:
+            value = line.split('#', 1)[0].strip()
+            if not value:
+                continue
+            username = self.normalize_username(value)
+            yield self._row(username, defaults) if username else None
+    
+    def _read_csv(self, f, defaults):
+        """CSV 파일의 계정 행 (잘못된 행은 None)"""
+        for record in csv.DictReader(f):
+            username = self.normalize_username(record.get('username'))
+            if not username:
+                yield None
+                continue
+            try:
+                settings = dict(defaults)
+                for column in SETTING_COLUMNS:
+                    value = (record.get(column) or '').strip()
+                    if value:
+                        settings[column] = value
+                yield (
+                    username,
+                    int(str(settings['enabled']).lower() in ('1', 'true', 'yes', 'y')),
+                    int(settings['priority'] or 0),
+                    float(settings['interval_hours']) if settings['interval_hours'] not in (None, '') else None,
+                    int(settings['max_posts']) if settings['max_posts'] not in (None, '') else None
+                )
+            except ValueError:
+                yield None
+    
+    @staticmethod
+    def _row(username, defaults):
+        return (username, defaults['enabled'], int(defaults['priority'] or 0), defaults['interval_hours'], defaults['max_posts'])
+    
+    @staticmethod
+    def _upsert(conn, rows):
+        """계정 행 일괄 저장 (사용자명 기준 갱신)"""
+        conn.executemany('''
+            INSERT INTO accounts (username, enabled, priority, interval_hours, max_posts)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(username) DO UPDATE SET
+                enabled = excluded.enabled,
+                priority = excluded.priority,
+                interval_hours = excluded.interval_hours,
+                max_posts = excluded.max_posts,
+                updated_at = CURRENT_TIMESTAMP
+        ''', rows)
+        return len(rows)
+    
+    @staticmethod
+    def _bump_version(conn):
+        conn.execute('''
+            INSERT INTO metadata (key, value) VALUES ('accounts_version', 1)
+            ON CONFLICT(key) DO UPDATE SET value = value + 1
+        ''')
@@ -0,0 +1,441 @@
+import gzip
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from config import Config
+from time_series import ROLLUP_UPSERT_SQL, rollup_rows
+
+# 증분 백업에서 새 행을 판단하는 기준 컬럼 (테이블: (컬럼, 워터마크를 공유할 테이블))
+# 나머지 일반 테이블(account_stats 등 갱신되는 요약 테이블)은 매번 전체를 복사
+INCREMENTAL_KEYS = {
+    'account_data': ('id', 'account_data'),
+    'post_data': ('id', 'post_data'),
+    'crawl_history': ('id', 'crawl_history'),
+    'media_files': ('rowid', 'media_files'),
+    'post_hashtags': ('post_id', 'post_data'),
+    'post_mentions': ('post_id', 'post_data'),
+    'caption_dictionaries': ('id', 'caption_dictionaries'),
+    'post_changes': ('seq', 'post_changes'),
+    'post_revisions': ('id', 'post_revisions'),
+    'metric_series': ('id', 'metric_series'),
+    'metric_samples': ('id', 'metric_samples')
+}
+
+# 보존 기간이 지난 행만 삭제되는 증분 백업 대상 테이블 (삭제해도 전체 백업으로 전환하지 않음)
+PRUNED_TABLES = ('metric_samples',)
+
+# 행이 계속 갱신되어 키로 새 행을 가릴 수 없는 테이블 (증분 백업에서 제외하고 복원 시 증분 내용으로 다시 맞춤)
+DERIVED_TABLES = ('post_revisit', 'metric_rollups')
+
+# 압축 방식별 파일 확장자
+COMPRESSION_SUFFIXES = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+    'none': ''
+}
+
+MANIFEST_NAME = 'manifest.json'
+
+# 백업 파일 자체에 기록하는 백업 정보 테이블 (종류 등, 복원 시 제외)
+BACKUP_INFO_TABLE = 'backup_info'
+
+class BackupManager:
+    def __init__(self, db_path, backup_dir=None, retention=None, pages_per_step=None):
+        """
+        데이터베이스 백업 관리자 초기화
+        
+        sqlite3 온라인 백업 API를 페이지 단위로 사용하므로 크롤링 중에도 일관된 백업을 만들 수 있습니다.
+        
+        Args:
+            db_path (str): 백업할 데이터베이스 경로
+            backup_dir (str): 백업 디렉토리 (None이면 Config.BACKUP_DIRECTORY)
+            retention (int): 보관할 전체 백업 수 (None이면 Config.BACKUP_RETENTION)
+            pages_per_step (int): 백업 단계당 복사할 페이지 수 (None이면 Config.BACKUP_PAGES_PER_STEP)
+        """
+        self.db_path = db_path
+        self.backup_dir = Path(backup_dir or Config.BACKUP_DIRECTORY)
+        self.retention = retention if retention is not None else Config.BACKUP_RETENTION
+        self.pages_per_step = pages_per_step or Config.BACKUP_PAGES_PER_STEP
+        self.logger = logging.getLogger(__name__)
+    
+    def create_backup(self, backup_path=None, compression=None, incremental=False):
+        """
+        백업 생성
+        
+        Args:
+            backup_path (str): 백업 파일 경로 (None이면 백업 디렉토리에 자동 생성, 보관 정책 적용)
+            compression (str): 'gzip', 'zstd', 'none' (None이면 Config.BACKUP_COMPRESSION)
+            incremental (bool): 마지막 백업 이후 새 행만 백업 (이전 백업이 없으면 전체 백업)
+        
+        Returns:
+            str: 백업 파일 경로
+        """
+        compression = self._resolve_compression(compression or Config.BACKUP_COMPRESSION)
+        manifest = self._load_manifest()
+        last_entry = manifest['backups'][-1] if manifest['backups'] else None
+        
+        if incremental and not last_entry:
+            self.logger.info("이전 백업이 없어 전체 백업을 생성합니다.")
+            incremental = False
+        
+        managed = backup_path is None
+        target_dir = self.backup_dir if managed else Path(backup_path).parent
+        target_dir.mkdir(parents=True, exist_ok=True)
+        
+        fd, tmp_path = tempfile.mkstemp(dir=target_dir, suffix='.db.tmp')
+        os.close(fd)
+        try:
+            copied = self._copy_new_rows(tmp_path, last_entry) if incremental else None
+            if copied is None:
+                if incremental:
+                    # 증분 백업 사이에 수정/삭제되었거나 키가 워터마크 아래로 내려간 행은 새 행만으로 복원할 수 없음
+                    self.logger.info("마지막 백업 이후 기존 행이 수정/삭제되어 전체 백업을 생성합니다.")
+                    incremental = False
+                    os.remove(tmp_path)
+                copied = self._copy_full(tmp_path)
+            watermarks, rewrite_count = copied
+            kind = 'incremental' if incremental else 'full'
+            self._write_backup_info(tmp_path, kind)
+            
+            if managed:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+                backup_path = self.backup_dir / f"backup_instagram_data_{timestamp}_{kind}.db{COMPRESSION_SUFFIXES[compression]}"
+            backup_path = Path(backup_path)
+            self._compress(tmp_path, backup_path, compression)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        if managed:
+            manifest['backups'].append({
+                'file': backup_path.name,
+                'type': kind,
+                'created_at': datetime.now().isoformat(),
+                'watermarks': watermarks,
+                'rewrite_count': rewrite_count
+            })
+            self._apply_retention(manifest)
+            self._save_manifest(manifest)
+        
+        self.logger.info(f"{'증분' if incremental else '전체'} 백업 완료: {backup_path}")
+        return str(backup_path)
+    
+    def restore_backup(self, backup_path):
+        """
+        백업 파일로 데이터베이스 복원
+        
+        증분 백업을 지정하면 기준 전체 백업부터 해당 증분까지 순서대로 적용합니다.
+        복원도 온라인 백업 API로 수행하여 열린 연결이 있어도 안전합니다.
+        
+        Args:
+            backup_path (str): 복원할 백업 파일 경로
+        """
+        backup_path = Path(backup_path)
+        
+        with tempfile.TemporaryDirectory(dir=Path(self.db_path).resolve().parent) as tmp_dir:
+            # 지정한 파일의 종류는 파일에 기록된 정보로 판단 (백업 목록에 없는 파일도 증분 백업을 전체 백업으로 오인하지 않음)
+            requested_path = Path(tmp_dir) / 'requested.db'
+            self._decompress(backup_path, requested_path)
+            chain = self._restore_chain(backup_path, self._read_backup_type(requested_path, backup_path))
+            
+            base_path = Path(tmp_dir) / 'base.db'
+            if len(chain) == 1:
+                requested_path.rename(base_path)
+            else:
+                self._decompress(chain[0], base_path)
+            
+            base = sqlite3.connect(base_path)
+            target = sqlite3.connect(self.db_path)
+            try:
+                for incremental_path in chain[1:]:
+                    if incremental_path == chain[-1]:
+                        inc_path = requested_path
+                    else:
+                        inc_path = Path(tmp_dir) / 'incremental.db'
+                        self._decompress(incremental_path, inc_path)
+                    self._apply_incremental(base, inc_path)
+                    inc_path.unlink()
+                
+                base.execute(f"DROP TABLE IF EXISTS {BACKUP_INFO_TABLE}")
+                base.commit()
+                base.backup(target, pages=self.pages_per_step)
+            finally:
+                base.close()
+                target.close()
+                
+        self.logger.info(f"백업 복원 완료: {backup_path} (적용한 백업 {len(chain)}개)")
+    
+    def list_backups(self):
+        """
+        백업 디렉토리의 백업 목록 조회
+        
+        Returns:
+            list: 백업 정보 목록 (오래된 순)
+        """
+        return self._load_manifest()['backups']
+    
+    def _copy_full(self, target_path):
+        """온라인 백업 API로 페이지 단위 전체 복사 후 (워터마크, 수정/삭제 횟수) 반환"""
+        source = sqlite3.connect(self.db_path)
+        target = sqlite3.connect(target_path)
+        try:
+            # 단계 사이에 잠금을 풀어 쓰기 작업이 막히지 않도록 함
+            source.backup(target, pages=self.pages_per_step, sleep=0.005)
+            return self._read_watermarks(target), self._read_rewrite_count(target)
+        finally:
+            source.close()
+            target.close()
+    
+    def _copy_new_rows(self, target_path, last_entry):
+        """
+        마지막 워터마크 이후의 행만 복사 (하나의 읽기 트랜잭션으로 일관성 보장)
+        
+        Returns:
+            tuple: (워터마크, 수정/삭제 횟수) - 마지막 백업 이후 기존 행이 수정/삭제되었거나
+                   키가 워터마크보다 작아졌으면(초기화, 복원 등) 새 행만으로는 부족하므로 None
+        """
+        last_watermarks = last_entry['watermarks']
+        source = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            source.execute("ATTACH DATABASE ? AS inc", (str(target_path),))
+            source.execute("BEGIN")
+            rewrite_count = self._read_rewrite_count(source)
+            watermarks = self._read_watermarks(source)
+            # 이전 형식의 백업 목록(수정/삭제 횟수 없음)도 안전하게 전체 백업으로 처리
+            if rewrite_count != last_entry.get('rewrite_count') or any(
+                watermarks.get(table, 0) < value for table, value in last_watermarks.items()
+            ):
+                source.execute("ROLLBACK")
+                source.execute("DETACH DATABASE inc")
+                return None
+            
+            for table in self._regular_tables(source):
+                if table in DERIVED_TABLES:
+                    continue
+                if table in INCREMENTAL_KEYS:
+                    key, watermark_table = INCREMENTAL_KEYS[table]
+                    source.execute(
+                        f"CREATE TABLE inc.{table} AS SELECT * FROM main.{table} WHERE {key} > ?",
+                        (last_watermarks.get(watermark_table, 0),)
+                    )
+                else:
+                    source.execute(f"CREATE TABLE inc.{table} AS SELECT * FROM main.{table}")
+            source.execute("COMMIT")
+            source.execute("DETACH DATABASE inc")
+            return watermarks, rewrite_count
+        finally:
+            source.close()
+    
+    def _apply_incremental(self, conn, inc_path):
+        """증분 백업을 복원 중인 데이터베이스에 적용"""
+        conn.execute("ATTACH DATABASE ? AS inc", (str(inc_path),))
+        try:
+            main_tables = self._regular_tables(conn)
+            for table in self._regular_tables(conn, schema='inc'):
+                if table not in main_tables:
+                    self.logger.warning(f"복원 대상에 없는 테이블 건너뛰기: {table}")
+                    continue
+                columns = [row[1] for row in conn.execute(f"PRAGMA inc.table_info({table})")]
+                column_list = ', '.join(columns)
+                if table not in INCREMENTAL_KEYS:
+                    conn.execute(f"DELETE FROM main.{table}")
+                conn.execute(
+                    f"INSERT OR IGNORE INTO main.{table} ({column_list}) SELECT {column_list} FROM inc.{table}"
+                )
+            self._rebuild_derived(conn, main_tables)
+            conn.commit()
+        finally:
+            conn.execute("DETACH DATABASE inc")
+    
+    @staticmethod
+    def _rebuild_derived(conn, main_tables):
+        """
+        증분 백업에서 제외된 테이블을 증분 내용으로 다시 맞춤
+        
+        재확인 일정은 삭제 표시만 복원하고 (삭제된 게시물을 다시 확인하지 않도록), 나머지 일정은
+        기준 전체 백업의 값을 유지합니다. 일정이 없는 게시물은 다음 재확인 때 새로 만들어집니다.
+        지표 집계에는 이번 증분으로 추가된 표본을 더합니다 (집계를 통째로 담은 이전 증분 백업은 제외).
+        """
+        inc_tables = BackupManager._regular_tables(conn, schema='inc')
+        if 'metric_rollups' in main_tables and 'metric_samples' in inc_tables and 'metric_rollups' not in inc_tables:
+            samples = conn.execute('''
+                SELECT s.series_id, s.ts, s.value
+                FROM inc.metric_samples s
+                JOIN main.metric_samples m ON m.id = s.id AND m.series_id = s.series_id AND m.ts = s.ts
+            ''').fetchall()
+            for series_id, ts, value in samples:
+                conn.executemany(ROLLUP_UPSERT_SQL, rollup_rows(series_id, ts, value))
+        if 'post_revisit' in main_tables and 'post_revisions' in inc_tables:
+            conn.execute('''
+                INSERT INTO main.post_revisit (post_id, content_hash, checked_at, next_check_at, check_count, deleted_at)
+                SELECT post_id, content_hash, detected_at, detected_at, 1, detected_at
+                FROM inc.post_revisions
+                WHERE revision_type = 'deleted'
+                ON CONFLICT(post_id) DO UPDATE SET
+                    checked_at = excluded.checked_at,
+                    deleted_at = excluded.deleted_at
+                WHERE deleted_at IS NULL
+            ''')
+    
+    def _read_watermarks(self, conn):
+        """증분 기준 테이블별 최대 키값"""
+        tables = self._regular_tables(conn)
+        watermarks = {}
+        for table, (key, watermark_table) in INCREMENTAL_KEYS.items():
+            if table == watermark_table and table in tables:
+                watermarks[table] = conn.execute(f"SELECT COALESCE(MAX({key}), 0) FROM {table}").fetchone()[0]
+        return watermarks
+    
+    @staticmethod
+    def _read_rewrite_count(conn):
+        """증분 백업 대상 테이블의 누적 수정/삭제 횟수 (DataManager 트리거가 metadata에 기록)"""
+        try:
+            row = conn.execute("SELECT value FROM metadata WHERE key = 'rewrite_count'").fetchone()
+        except sqlite3.OperationalError:
+            # metadata 테이블이 없는 이전 스키마
+            return None
+        return row[0] if row else 0
+    
+    @staticmethod
+    def _write_backup_info(path, kind):
+        """백업 파일에 백업 종류 기록"""
+        conn = sqlite3.connect(path)
+        try:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {BACKUP_INFO_TABLE} (key TEXT PRIMARY KEY, value)")
+            conn.execute(f"INSERT OR REPLACE INTO {BACKUP_INFO_TABLE} (key, value) VALUES ('type', ?)", (kind,))
+            conn.commit()
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def _read_backup_type(path, backup_path):
+        """압축 해제한 백업 파일의 종류 ('full' 또는 'incremental')"""
+        conn = sqlite3.connect(path)
+        try:
+            row = conn.execute(f"SELECT value FROM {BACKUP_INFO_TABLE} WHERE key = 'type'").fetchone()
+            if row:
+                return row[0]
+        except sqlite3.OperationalError:
+            pass
+        finally:
+            conn.close()
+        # 백업 정보 테이블이 없는 이전 백업은 파일 이름으로 판단
+        return 'incremental' if '_incremental.db' in backup_path.name else 'full'
+    
+    @staticmethod
+    def _regular_tables(conn, schema='main'):
+        """백업 대상 일반 테이블 목록 (내부 테이블, 전문 검색 인덱스 제외)"""
+        rows = conn.execute(f'''
+            SELECT name FROM {schema}.sqlite_master
+            WHERE type = 'table'
+              AND name NOT LIKE 'sqlite_%'
+              AND name NOT LIKE 'post_fts%'
+              AND name != '{BACKUP_INFO_TABLE}'
+        ''').fetchall()
+        return [row[0] for row in rows]
+    
+    def _restore_chain(self, backup_path, backup_type):
+        """
+        증분 백업 복원에 필요한 백업 파일 순서 (전체 백업 → 증분들)
+        
+        Raises:
+            ValueError: 증분 백업의 기준 전체 백업을 백업 목록에서 찾을 수 없는 경우
+            FileNotFoundError: 체인에 필요한 백업 파일이 없는 경우
+        """
+        entries = self._load_manifest()['backups'] if backup_path.parent.resolve() == self.backup_dir.resolve() else []
+        names = [entry['file'] for entry in entries]
+        if backup_path.name not in names:
+            if backup_type == 'incremental':
+                raise ValueError(f"증분 백업의 기준 전체 백업을 찾을 수 없습니다 (백업 디렉토리의 {MANIFEST_NAME}에 없음): {backup_path}")
+            return [backup_path]
+        
+        index = names.index(backup_path.name)
+        start = index
+        while start >= 0 and entries[start]['type'] != 'full':
+            start -= 1
+        if start < 0:
+            raise ValueError(f"증분 백업의 기준 전체 백업이 백업 목록에 없습니다: {backup_path}")
+        
+        chain = [self.backup_dir / entry['file'] for entry in entries[start:index + 1]]
+        missing = [str(path) for path in chain if not path.exists()]
+        if missing:
+            raise FileNotFoundError(f"복원에 필요한 백업 파일이 없습니다: {', '.join(missing)}")
+        return chain
+    
+    def _apply_retention(self, manifest):
+        """최근 전체 백업 retention개와 그에 딸린 증분 백업만 보관"""
+        full_indexes = [i for i, entry in enumerate(manifest['backups']) if entry['type'] == 'full']
+        if self.retention <= 0 or len(full_indexes) <= self.retention:
+            return
+        
+        cutoff = full_indexes[-self.retention]
+        for entry in manifest['backups'][:cutoff]:
+            try:
+                (self.backup_dir / entry['file']).unlink()
+                self.logger.info(f"오래된 백업 삭제됨: {entry['file']}")
+            except FileNotFoundError:
+                pass
+        manifest['backups'] = manifest['backups'][cutoff:]
+    
+    def _load_manifest(self):
+        """백업 목록 파일 읽기"""
+        manifest_path = self.backup_dir / MANIFEST_NAME
+        if manifest_path.exists():
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {'backups': []}
+    
+    def _save_manifest(self, manifest):
+        """백업 목록 파일 저장 (원자적 교체)"""
+        manifest_path = self.backup_dir / MANIFEST_NAME
+        tmp_path = manifest_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, manifest_path)
+    
+    def _resolve_compression(self, compression):
+        """압축 방식 확인 (zstandard가 없으면 gzip으로 대체)"""
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+        if compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                self.logger.warning("zstandard가 설치되지 않아 gzip으로 압축합니다.")
+                return 'gzip'
+        return compression
+    
+    @staticmethod
+    def _compress(source_path, target_path, compression):
+        """파일을 스트리밍 방식으로 압축하여 저장"""
+        with open(source_path, 'rb') as src:
+            if compression == 'gzip':
+                with gzip.open(target_path, 'wb', compresslevel=6) as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+            elif compression == 'zstd':
+                import zstandard
+                with open(target_path, 'wb') as raw:
+                    with zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(raw) as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+            else:
+                with open(target_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+    
+    @staticmethod
+    def _decompress(source_path, target_path):
+        """확장자에 따라 백업 파일 압축 해제"""
+        source_path = Path(source_path)
+        if source_path.suffix == '.gz':
+            src = gzip.open(source_path, 'rb')
+        elif source_path.suffix == '.zst':
+            import zstandard
+            src = zstandard.ZstdDecompressor().stream_reader(open(source_path, 'rb'), closefd=True)
+        else:
+            src = open(source_path, 'rb')
+        with src, open(target_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+오프라인 크롤링 벤치마크
+
+로컬 가짜 인스타그램 서버(fake_instagram_server.py)에 InstagramCrawler를 연결하여
+실제 Chrome으로 전체 크롤링 경로(로그인, 프로필, 게시물 상세, 중복 체크, 저장)를 실행하고
+초당 페이지 수, 계정당 소요 시간, 단계별 p50/p95를 측정합니다.
+
+사용 예:
+    python bench_crawl.py --accounts 3 --posts 9 --wait-scale 0.05 --output crawl_bench.json
+    python bench_crawl.py --baseline crawl_bench.json   # 이전 결과와 비교
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from config import Config
+from fake_instagram_server import FakeInstagramServer, FakeInstagramSite
+from metrics import REGISTRY, STAGE_SECONDS, quantile
+
+# 비교 시 값이 커지면 나빠지는 지표와 작아지면 나빠지는 지표
+LOWER_IS_BETTER = ['seconds_per_account_p50', 'seconds_per_account_p95']
+HIGHER_IS_BETTER = ['pages_per_second']
+
+def run_benchmark(accounts=3, posts=9, wait_scale=0.05, headless=True, pages_dir=None, latency=0.0):
+    """
+    가짜 서버를 상대로 크롤링을 실행하고 성능 지표를 수집
+    
+    Args:
+        accounts (int): 크롤링할 합성 계정 수
+        posts (int): 계정별 게시물 수
+        wait_scale (float): 크롤러 고정 대기 시간 배율
+        headless (bool): 헤드리스 모드 여부
+        pages_dir (str): 녹화된 페이지 디렉토리
+        latency (float): 가짜 서버 페이지 응답 지연 (초)
+    
+    Returns:
+        dict: 벤치마크 결과
+    """
+    from instagram_scheduler import InstagramScheduler
+    
+    site = FakeInstagramSite(accounts, posts, pages_dir, latency)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir, FakeInstagramServer(site) as server:
+        # 크롤러가 가짜 서버와 임시 DB를 사용하도록 설정
+        Config.INSTAGRAM_BASE_URL = server.base_url
+        Config.WAIT_SCALE = wait_scale
+        Config.HEADLESS_MODE = headless
+        Config.ACCOUNT_INTERVAL_SECONDS = 0
+        Config.DATABASE_PATH = str(Path(tmp_dir) / 'bench_crawl.db')
+        os.environ.setdefault('INSTAGRAM_USERNAME', 'bench_login')
+        os.environ.setdefault('INSTAGRAM_PASSWORD', 'bench_password')
+        
+        # 요청 예산/속도 조절은 측정 대상이 아니므로 제한 없이 실행 (.env 계정 하나, 임시 세션 디렉토리)
+        Config.CREDENTIALS_FILE = ''
+        Config.SESSION_DIRECTORY = str(Path(tmp_dir) / 'sessions')
+        Config.IDENTITY_REQUESTS_PER_HOUR = Config.IDENTITY_BURST = 10 ** 9
+        Config.GOVERNOR_MAX_RATE_PER_MINUTE = Config.GOVERNOR_MIN_RATE_PER_MINUTE = 10 ** 9
+        
+        REGISTRY.reset()
+        scheduler = InstagramScheduler(accounts=site.accounts)
+        
+        account_seconds = []
+        start = time.perf_counter()
+        for username in site.accounts:
+            account_start = time.perf_counter()
+            scheduler.crawl_single_account(username)
+            account_seconds.append(time.perf_counter() - account_start)
+        elapsed = time.perf_counter() - start
+        
+        saved_posts = scheduler.data_manager.get_statistics()
+        stages = {
+            item['labels']['stage']: {
+                'count': item['count'],
+                'p50': item['p50'],
+                'p95': item['p95'],
+                'max': item['max']
+            }
+            for item in STAGE_SECONDS.to_dict()
+        }
+        account_seconds.sort()
+        
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'settings': {
+                'accounts': accounts,
+                'posts_per_account': posts,
+                'wait_scale': wait_scale,
+                'headless': headless,
+                'latency': latency,
+                'pages_dir': pages_dir
+            },
+            'elapsed_seconds': round(elapsed, 4),
+            'pages_served': site.pages_served,
+            'pages_per_second': round(site.pages_served / elapsed, 3) if elapsed else 0,
+            'seconds_per_account_p50': round(quantile(account_seconds, 0.5), 4),
+            'seconds_per_account_p95': round(quantile(account_seconds, 0.95), 4),
+            'successful_crawls': saved_posts.get('successful_crawls', 0),
+            'stages': stages
+        }
+
+def compare(results, baseline, tolerance):
+    """
+    이전 결과와 비교하여 회귀 여부 판단
+    
+    Args:
+        results (dict): 이번 결과
+        baseline (dict): 기준 결과
+        tolerance (float): 허용 악화 비율 (예: 0.2 = 20%)
+    
+    Returns:
+        list: 회귀한 지표 설명 목록
+    """
+    regressions = []
+    for key in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+        old, new = baseline.get(key), results.get(key)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        print(f"  {key}: {old} → {new} ({change:+.1%})")
+        worse = change > tolerance if key in LOWER_IS_BETTER else change < -tolerance
+        if worse:
+            regressions.append(key)
+    
+    for stage, stats in results['stages'].items():
+        old = baseline.get('stages', {}).get(stage, {}).get('p95')
+        if old and stats['p95'] is not None and (stats['p95'] - old) / old > tolerance:
+            print(f"  단계 {stage} p95: {old} → {stats['p95']}")
+            regressions.append(f"stage:{stage}")
+    return regressions
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='오프라인 크롤링 벤치마크')
+    parser.add_argument('--accounts', type=int, default=3, help='합성 계정 수 (기본값: 3)')
+    parser.add_argument('--posts', type=int, default=9, help='계정별 게시물 수 (기본값: 9)')
+    parser.add_argument('--wait-scale', type=float, default=0.05, help='크롤러 고정 대기 시간 배율 (기본값: 0.05)')
+    parser.add_argument('--no-headless', action='store_true', help='브라우저 창 표시')
+    parser.add_argument('--pages-dir', help='녹화된 페이지 디렉토리 (profile_<계정>.html, post_<코드>.html)')
+    parser.add_argument('--latency', type=float, default=0.0, help='가짜 서버 페이지 응답 지연 (초)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 악화 비율 (기본값: 0.2)')
+    args = parser.parse_args()
+    
+    results = run_benchmark(
+        accounts=args.accounts,
+        posts=args.posts,
+        wait_scale=args.wait_scale,
+        headless=not args.no_headless,
+        pages_dir=args.pages_dir,
+        latency=args.latency
+    )
+    
+    print("=== 크롤링 벤치마크 ===")
+    print(f"소요 시간: {results['elapsed_seconds']:.2f}초 (성공 {results['successful_crawls']}/{args.accounts}개 계정)")
+    print(f"페이지: {results['pages_served']}개 ({results['pages_per_second']:.2f} 페이지/초)")
+    print(f"계정당: p50 {results['seconds_per_account_p50']:.2f}초, p95 {results['seconds_per_account_p95']:.2f}초")
+    print("단계별:")
+    for stage, stats in sorted(results['stages'].items()):
+        print(f"  {stage}: {stats['count']}회, p50 {stats['p50']:.3f}초, p95 {stats['p95']:.3f}초")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장됨: {args.output}")
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"=== 기준 결과와 비교: {args.baseline} ===")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"⚠️  성능 회귀: {regressions}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+DataManager 쿼리 벤치마크
+
+DataManager의 조회/저장 메서드를 반복 실행하여 소요 시간을 측정하고,
+각 메서드가 실행한 SQL의 실행 계획(EXPLAIN QUERY PLAN)을 함께 보고합니다.
+인덱스가 없어 테이블 전체를 읽는 단계(SCAN)는 별도로 표시합니다.
+
+사용 예:
+    python bench_data_manager.py --generate --posts 1000000 --crawls 100000 --output db_bench.json
+    python bench_data_manager.py --db bench.db --baseline db_bench.json
+"""
+
+import argparse
+import json
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from data_manager import DataManager
+from image_hash import hamming_distance
+from synthetic_data import generate_database
+
+# 실행 계획을 조회할 SQL 문 종류
+_EXPLAINABLE = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH')
+
+# FTS5 등 가상 테이블 모듈이 내부적으로 실행하는 SQL 표시 ('main'.'post_fts_data' 형식)
+_INTERNAL_MARKERS = ("'main'.", '"main".')
+
+def build_cases(db_path):
+    """
+    측정할 메서드 목록 생성 (샘플 계정/게시물/태그는 데이터베이스에서 선택)
+    
+    Args:
+        db_path (str): 데이터베이스 파일 경로
+    
+    Returns:
+        list: (이름, 종류('read'/'write'), 호출 함수) 목록
+    """
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT username FROM account_stats ORDER BY total_posts DESC LIMIT 1')
+        row = cursor.fetchone()
+        username = row[0] if row else 'unknown'
+        cursor.execute('''
+            SELECT p.post_url FROM post_data p
+            JOIN media_files m ON m.sha256 = p.image_sha256
+            WHERE m.dhash IS NOT NULL
+            ORDER BY p.id DESC LIMIT 1
+        ''')
+        row = cursor.fetchone()
+        post_url = row[0] if row else ''
+        cursor.execute('SELECT tag FROM post_hashtags LIMIT 1')
+        row = cursor.fetchone()
+        tag = row[0] if row else 'coffee'
+    
+    counter = iter(range(10 ** 9))
+    
+    def save_new_posts(dm):
+        # 실행할 때마다 새 게시물 3개 저장 (save_crawl_data 전체 경로)
+        n = next(counter)
+        crawled_at = datetime.now().isoformat()
+        return dm.save_crawl_data({
+            'username': username,
+            'crawled_at': crawled_at,
+            'recent_posts': [
+                {
+                    'post_url': f"https://www.instagram.com/p/BENCH{n}x{i}/",
+                    'post_number': i + 1,
+                    'image_url': None,
+                    'caption': f"benchmark post {n} #{tag} @{username}",
+                    'posted_at': crawled_at,
+                    'hashtags': [f"#{tag}"],
+                    'mentions': [f"@{username}"],
+                    'timestamp': crawled_at
+                }
+                for i in range(3)
+            ]
+        })
+    
+    since = datetime.now().strftime('%Y-%m-01')
+    return [
+        ('get_statistics', 'read', lambda dm: dm.get_statistics()),
+        ('get_account_statistics', 'read', lambda dm: dm.get_account_statistics()),
+        ('get_account_statistics(username)', 'read', lambda dm: dm.get_account_statistics(username)),
+        ('get_new_posts_count', 'read', lambda dm: dm.get_new_posts_count(username, days=7)),
+        ('get_latest_posts', 'read', lambda dm: dm.get_latest_posts(username, limit=10)),
+        ('get_account_history', 'read', lambda dm: dm.get_account_history(username, limit=10)),
+        ('get_follower_trend', 'read', lambda dm: dm.get_follower_trend(username, days=30)),
+        ('search_posts', 'read', lambda dm: dm.search_posts(tag, limit=20)),
+        ('search_posts(username)', 'read', lambda dm: dm.search_posts(tag, username=username, limit=20)),
+        ('get_top_hashtags', 'read', lambda dm: dm.get_top_hashtags(limit=10)),
+        ('get_top_hashtags(since)', 'read', lambda dm: dm.get_top_hashtags(since=since, limit=10)),
+        ('get_top_mentions', 'read', lambda dm: dm.get_top_mentions(limit=10)),
+        ('get_posts_by_hashtag', 'read', lambda dm: dm.get_posts_by_hashtag(tag, limit=20)),
+        ('get_posts_by_mention', 'read', lambda dm: dm.get_posts_by_mention(username, limit=20)),
+        ('find_similar_posts', 'read', lambda dm: dm.find_similar_posts(post_url)),
+        ('get_database_info', 'read', lambda dm: dm.get_database_info()),
+        ('save_crawl_data', 'write', save_new_posts),
+        ('_record_crawl_error', 'write', lambda dm: dm._record_crawl_error(username, 'benchmark error'))
+    ]
+
+@contextmanager
+def trace_statements():
+    """
+    블록 안에서 열린 모든 SQLite 연결이 실행한 SQL 문을 수집
+    
+    Yields:
+        list: 실행된 SQL 문 (매개변수가 채워진 형태)
+    """
+    statements = []
+    original_connect = sqlite3.connect
+    
+    def record(sql):
+        if not any(marker in sql for marker in _INTERNAL_MARKERS):
+            statements.append(sql)
+    
+    def traced_connect(*args, **kwargs):
+        conn = original_connect(*args, **kwargs)
+        conn.set_trace_callback(record)
+        return conn
+    
+    sqlite3.connect = traced_connect
+    try:
+        yield statements
+    finally:
+        sqlite3.connect = original_connect
+
+def explain(db_path, statements):
+    """
+    SQL 문별 실행 계획 조회
+    
+    Args:
+        db_path (str): 데이터베이스 파일 경로
+        statements (list): SQL 문 목록
+    
+    Returns:
+        list: [{'sql': SQL 문, 'plan': 계획 줄 목록, 'full_scans': 인덱스 없이 읽는 단계 목록}, ...]
+    """
+    plans = []
+    seen = set()
+    with sqlite3.connect(db_path) as conn:
+        conn.create_function('hamming', 2, hamming_distance, deterministic=True)
+        for sql in statements:
+            normalized = ' '.join(sql.split())
+            if normalized in seen or not normalized.upper().startswith(_EXPLAINABLE):
+                continue
+            seen.add(normalized)
+            try:
+                rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+            except sqlite3.Error as e:
+                plans.append({'sql': normalized, 'plan': [f"(실행 계획 조회 실패: {e})"], 'full_scans': []})
+                continue
+            
+            # (id, parent, notused, detail) 트리를 들여쓰기한 줄로 변환
+            depth = {0: 0}
+            lines = []
+            for node_id, parent, _, detail in rows:
+                depth[node_id] = depth.get(parent, 0) + 1
+                lines.append('  ' * (depth[node_id] - 1) + detail)
+            full_scans = [
+                detail for _, _, _, detail in rows
+                if detail.startswith('SCAN') and 'INDEX' not in detail
+                and 'CONSTANT ROW' not in detail and not detail.startswith('SCAN sqlite_')
+            ]
+            plans.append({'sql': normalized, 'plan': lines, 'full_scans': full_scans})
+    return plans
+
+def run_benchmark(db_path, runs=5, include_writes=True, query_cache=False):
+    """
+    DataManager 메서드별 소요 시간과 실행 계획 측정
+    
+    Args:
+        db_path (str): 데이터베이스 파일 경로 (저장 메서드 측정 시 행이 추가됨)
+        runs (int): 메서드별 반복 횟수
+        include_writes (bool): 저장 메서드 측정 여부
+        query_cache (bool): 조회 캐시 사용 여부 (기본값은 캐시 적중이 아닌 SQL 소요 시간 측정)
+    
+    Returns:
+        dict: 벤치마크 결과
+    """
+    data_manager = DataManager(db_path)
+    if not query_cache:
+        data_manager._query_cache = None
+    results = {}
+    
+    for name, kind, call in build_cases(db_path):
+        if kind == 'write' and not include_writes:
+            continue
+        
+        # 첫 실행은 SQL 수집용 (페이지 캐시 준비 겸용)
+        with trace_statements() as statements:
+            call(data_manager)
+        
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            call(data_manager)
+            timings.append(time.perf_counter() - start)
+        
+        plans = explain(db_path, statements)
+        results[name] = {
+            'kind': kind,
+            'runs': runs,
+            'median_ms': round(statistics.median(timings) * 1000, 3),
+            'min_ms': round(min(timings) * 1000, 3),
+            'max_ms': round(max(timings) * 1000, 3),
+            'statements': len(statements),
+            'full_scans': sorted({scan for plan in plans for scan in plan['full_scans']}),
+            'plans': plans
+        }
+    
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        table_counts = {}
+        for table in ['account_data', 'post_data', 'crawl_history', 'post_hashtags', 'post_mentions', 'media_files']:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            table_counts[table] = cursor.fetchone()[0]
+    
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'database_path': str(db_path),
+        'sqlite_version': sqlite3.sqlite_version,
+        'table_counts': table_counts,
+        'methods': results
+    }
+
+def compare(results, baseline, tolerance):
+    """
+    이전 결과와 메서드별 중앙값 비교
+    
+    Args:
+        results (dict): 이번 결과
+        baseline (dict): 기준 결과
+        tolerance (float): 허용 악화 비율 (예: 0.2 = 20%)
+    
+    Returns:
+        list: 느려진 메서드 이름 목록
+    """
+    regressions = []
+    for name, result in results['methods'].items():
+        old = baseline.get('methods', {}).get(name, {}).get('median_ms')
+        if not old:
+            continue
+        change = (result['median_ms'] - old) / old
+        print(f"  {name}: {old:.3f}ms → {result['median_ms']:.3f}ms ({change:+.1%})")
+        if change > tolerance:
+            regressions.append(name)
+    return regressions
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='DataManager 쿼리 벤치마크')
+    parser.add_argument('--db', help='측정할 데이터베이스 경로 (저장 메서드 측정 시 행이 추가됨)')
+    parser.add_argument('--generate', action='store_true', help='임시 데이터베이스에 합성 데이터를 생성하여 측정')
+    parser.add_argument('--accounts', type=int, default=1000, help='합성 계정 수 (기본값: 1000)')
+    parser.add_argument('--posts', type=int, default=100000, help='합성 게시물 수 (기본값: 100000)')
+    parser.add_argument('--crawls', type=int, default=10000, help='합성 크롤링 히스토리 수 (기본값: 10000)')
+    parser.add_argument('--runs', type=int, default=5, help='메서드별 반복 횟수 (기본값: 5)')
+    parser.add_argument('--read-only', action='store_true', help='저장 메서드는 측정하지 않음')
+    parser.add_argument('--query-cache', action='store_true', help='조회 캐시를 켠 상태로 측정 (반복 조회는 캐시 적중)')
+    parser.add_argument('--plans', action='store_true', help='메서드별 실행 계획 전체 출력')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 악화 비율 (기본값: 0.2)')
+    args = parser.parse_args()
+    
+    if not args.db and not args.generate:
+        parser.error('--db 또는 --generate 중 하나를 지정하세요.')
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = args.db
+        if args.generate:
+            db_path = db_path or str(Path(tmp_dir) / 'bench_data_manager.db')
+            print(f"합성 데이터 생성 중: 계정 {args.accounts:,}, 게시물 {args.posts:,}, 히스토리 {args.crawls:,}")
+            generate_database(db_path, accounts=args.accounts, posts=args.posts, crawls=args.crawls, verbose=True)
+        
+        results = run_benchmark(db_path, runs=args.runs, include_writes=not args.read_only, query_cache=args.query_cache)
+    
+    print("=== DataManager 벤치마크 ===")
+    print(', '.join(f"{table} {count:,}" for table, count in results['table_counts'].items()))
+    for name, result in results['methods'].items():
+        print(f"{name}: 중앙값 {result['median_ms']:.3f}ms (최소 {result['min_ms']:.3f}, 최대 {result['max_ms']:.3f}, SQL {result['statements']}개)")
+        for scan in result['full_scans']:
+            print(f"  ⚠️  {scan}")
+        if args.plans:
+            for plan in result['plans']:
+                print(f"  SQL: {plan['sql'][:160]}")
+                for line in plan['plan']:
+                    print(f"    {line}")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장됨: {args.output}")
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"=== 기준 결과와 비교: {args.baseline} ===")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"⚠️  성능 회귀: {regressions}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
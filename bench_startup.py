@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CLI 시작 시간 회귀 벤치마크
+
+조회 명령(--config, --status, --statistics)을 별도 프로세스로 반복 실행하여
+시작 시간과 불필요하게 로드된 무거운 모듈을 측정합니다.
+
+사용 예:
+    python bench_startup.py --runs 10 --max-seconds 0.5 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 조회 명령에서 로드되면 안 되는 모듈
+HEAVY_MODULES = ['selenium', 'bs4', 'requests', 'pandas', 'schedule']
+
+# 측정할 조회 명령
+COMMANDS = ['--config', '--status', '--statistics', '--list-accounts']
+
+# 자식 프로세스에서 main()을 실행한 뒤 로드된 무거운 모듈 목록을 출력
+_CHILD_SCRIPT = '''
+import io, json, sys, contextlib
+heavy = json.loads(sys.argv[2])
+sys.argv = ['main.py'] + json.loads(sys.argv[1])
+import main
+with contextlib.redirect_stdout(io.StringIO()):
+    main.main()
+print(json.dumps(sorted(m for m in heavy if m in sys.modules)))
+'''
+
+def run_command(args, env):
+    """
+    CLI 명령을 새 프로세스로 한 번 실행
+
+    Args:
+        args (list): main.py 인자 목록
+        env (dict): 자식 프로세스 환경 변수
+
+    Returns:
+        tuple: (소요 시간(초), 로드된 무거운 모듈 목록)
+    """
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-c', _CHILD_SCRIPT, json.dumps(args), json.dumps(HEAVY_MODULES)],
+        cwd=Path(__file__).resolve().parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    elapsed = time.perf_counter() - start
+    loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+    return elapsed, loaded
+
+def run_benchmark(runs=5, db_path=None):
+    """
+    조회 명령별 시작 시간 측정
+
+    Args:
+        runs (int): 명령별 반복 횟수
+        db_path (str): 사용할 데이터베이스 경로 (None이면 임시 DB)
+
+    Returns:
+        dict: 명령별 측정 결과
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env = dict(os.environ)
+        env['DATABASE_PATH'] = db_path or str(Path(tmp_dir) / 'bench_startup.db')
+        env['LOG_FILE'] = str(Path(tmp_dir) / 'bench_startup.log')
+
+        # 첫 실행에서 스키마를 생성해 두어 이후 측정에는 DDL이 포함되지 않도록 함
+        run_command(['--statistics'], env)
+
+        results = {}
+        for command in COMMANDS:
+            timings = []
+            loaded = set()
+            for _ in range(runs):
+                elapsed, modules = run_command([command], env)
+                timings.append(elapsed)
+                loaded.update(modules)
+            results[command] = {
+                'runs': runs,
+                'median_seconds': round(statistics.median(timings), 4),
+                'min_seconds': round(min(timings), 4),
+                'max_seconds': round(max(timings), 4),
+                'heavy_modules_loaded': sorted(loaded)
+            }
+        return results
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='CLI 시작 시간 벤치마크')
+    parser.add_argument('--runs', type=int, default=5, help='명령별 반복 횟수 (기본값: 5)')
+    parser.add_argument('--db', help='사용할 데이터베이스 경로 (기본값: 임시 DB)')
+    parser.add_argument('--max-seconds', type=float, help='중앙값이 이 값을 넘으면 실패로 처리')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    results = run_benchmark(runs=args.runs, db_path=args.db)
+
+    print("=== CLI 시작 시간 ===")
+    failed = False
+    for command, result in results.items():
+        print(f"{command}: 중앙값 {result['median_seconds']:.3f}초 "
+              f"(최소 {result['min_seconds']:.3f}, 최대 {result['max_seconds']:.3f})")
+        if result['heavy_modules_loaded']:
+            print(f"  ⚠️  무거운 모듈 로드됨: {result['heavy_modules_loaded']}")
+            failed = True
+        if args.max_seconds is not None and result['median_seconds'] > args.max_seconds:
+            print(f"  ⚠️  기준 시간 초과: {args.max_seconds}초")
+            failed = True
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장됨: {args.output}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import json
+import logging
+import sqlite3
+import threading
+
+# 사전 학습에 사용할 최대 게시물 수 (최근 게시물 순)
+TRAIN_SAMPLE_LIMIT = 20000
+
+logger = logging.getLogger(__name__)
+
+def zstd_available():
+    """zstandard 패키지 설치 여부"""
+    try:
+        import zstandard
+        return True
+    except ImportError:
+        return False
+
+def _dict_id(value):
+    """사전 ID 정규화 (pandas 조회 결과의 NaN 등 숫자가 아닌 값은 None)"""
+    if value is None or value != value:
+        return None
+    return int(value)
+
+class CaptionCodec:
+    def __init__(self, db_path, level=3):
+        """
+        게시물 캡션/해시태그/멘션 압축기 (zstd, 데이터베이스에 저장된 학습 사전 사용)
+        
+        캡션, 해시태그, 멘션을 하나의 JSON 배열로 묶어 post_data.payload에 압축 저장하고,
+        사용한 사전 ID를 post_data.payload_dict에 기록합니다 (NULL이면 사전 없이 압축).
+        사전은 caption_dictionaries 테이블에 보관되므로 백업/복원 시 함께 이동합니다.
+        
+        Args:
+            db_path (str): SQLite 데이터베이스 파일 경로 (사전 조회/저장용)
+            level (int): zstd 압축 레벨
+        """
+        self.db_path = db_path
+        self.level = level
+        self._dictionaries = {}
+        self._compressors = {}
+        self._decompressors = {}
+        self._latest_id = None
+        self._latest_loaded = False
+        self._lock = threading.Lock()
+    
+    def latest_dictionary_id(self):
+        """
+        새 게시물 압축에 사용할 사전 ID (가장 최근에 학습한 사전)
+        
+        Returns:
+            int: 사전 ID (학습한 사전이 없으면 None)
+        """
+        with self._lock:
+            if not self._latest_loaded:
+                with sqlite3.connect(self.db_path) as conn:
+                    row = conn.execute("SELECT MAX(id) FROM caption_dictionaries").fetchone()
+                self._latest_id = row[0] if row else None
+                self._latest_loaded = True
+            return self._latest_id
+    
+    def encode(self, caption, hashtags, mentions):
+        """
+        게시물 텍스트 압축
+        
+        Args:
+            caption (str): 캡션
+            hashtags (list): 해시태그 목록
+            mentions (list): 멘션 목록
+        
+        Returns:
+            tuple: (압축된 payload, 사전 ID)
+        """
+        dict_id = self.latest_dictionary_id()
+        data = json.dumps([caption, hashtags, mentions], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with self._lock:
+            return self._compressor(dict_id).compress(data), dict_id
+    
+    def decode(self, payload, dict_id):
+        """
+        압축된 게시물 텍스트 복원
+        
+        Returns:
+            tuple: (캡션, 해시태그 목록, 멘션 목록)
+        """
+        dict_id = _dict_id(dict_id)
+        with self._lock:
+            data = self._decompressor(dict_id).decompress(bytes(payload))
+        caption, hashtags, mentions = json.loads(data.decode('utf-8'))
+        return caption, hashtags, mentions
+    
+    def decode_columns(self, payload, dict_id):
+        """
+        압축된 게시물 텍스트를 post_data 컬럼 형식으로 복원 (해시태그/멘션은 JSON 문자열)
+        
+        Returns:
+            tuple: (caption, hashtags, mentions) 컬럼 값
+        """
+        caption, hashtags, mentions = self.decode(payload, dict_id)
+        return caption, json.dumps(hashtags, ensure_ascii=False), json.dumps(mentions, ensure_ascii=False)
+    
+    def train(self, samples, dict_size):
+        """
+        게시물 텍스트로 zstd 사전 학습 및 저장
+        
+        Args:
+            samples (list): (캡션, 해시태그 목록, 멘션 목록) 목록
+            dict_size (int): 사전 크기 (바이트)
+        
+        Returns:
+            int: 저장된 사전 ID
+        """
+        import zstandard
+        
+        encoded = [
+            json.dumps(list(sample), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            for sample in samples
+        ]
+        dictionary = zstandard.train_dictionary(dict_size, encoded, level=self.level)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "INSERT INTO caption_dictionaries (data, sample_count) VALUES (?, ?)",
+                (dictionary.as_bytes(), len(encoded))
+            )
+            dict_id = cursor.lastrowid
+        with self._lock:
+            self._latest_id = dict_id
+            self._latest_loaded = True
+        logger.info(f"캡션 압축 사전 학습 완료: ID {dict_id} ({len(dictionary.as_bytes())}바이트, 게시물 {len(encoded)}개)")
+        return dict_id
+    
+    def _dictionary(self, dict_id):
+        import zstandard
+        
+        if dict_id not in self._dictionaries:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute("SELECT data FROM caption_dictionaries WHERE id = ?", (dict_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"캡션 압축 사전이 없습니다: {dict_id}")
+            self._dictionaries[dict_id] = zstandard.ZstdCompressionDict(row[0])
+        return self._dictionaries[dict_id]
+    
+    def _compressor(self, dict_id):
+        import zstandard
+        
+        if dict_id not in self._compressors:
+            dictionary = self._dictionary(dict_id) if dict_id is not None else None
+            # 짧은 텍스트가 대부분이므로 프레임 헤더의 사전 ID/체크섬 생략 (사전 ID는 payload_dict에 저장)
+            self._compressors[dict_id] = zstandard.ZstdCompressor(
+                level=self.level, dict_data=dictionary, write_checksum=False, write_dict_id=False
+            )
+        return self._compressors[dict_id]
+    
+    def _decompressor(self, dict_id):
+        import zstandard
+        
+        if dict_id not in self._decompressors:
+            dictionary = self._dictionary(dict_id) if dict_id is not None else None
+            self._decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=dictionary)
+        return self._decompressors[dict_id]
@@ -0,0 +1,131 @@
+import json
+import logging
+import threading
+import time
+
+# HTTP 요청 한 번에 반환할 수 있는 최대 변경 수 / 최대 대기 시간 (초)
+MAX_FEED_LIMIT = 1000
+MAX_WAIT_SECONDS = 60
+
+logger = logging.getLogger(__name__)
+
+def wait_for_changes(data_manager, since_seq=0, limit=100, timeout=30, poll_interval=1.0, stop_event=None):
+    """
+    since_seq 이후 변경이 생길 때까지 대기한 뒤 조회 (롱 폴링)
+    
+    대기 중에는 변경 피드의 마지막 seq(기본 키 조회)만 확인하므로 게시물 조인은 새 변경이 있을 때만 실행됩니다.
+    
+    Args:
+        data_manager (DataManager): 변경 피드를 읽을 데이터 관리자
+        since_seq (int): 마지막으로 처리한 seq
+        limit (int): 최대 변경 수
+        timeout (float): 최대 대기 시간 (초, 0이면 대기하지 않음)
+        poll_interval (float): 변경 확인 간격 (초)
+        stop_event (threading.Event): 설정되면 대기 중단
+    
+    Returns:
+        list: 변경 목록 (시간 초과 시 빈 목록)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if data_manager.get_latest_change_seq() > since_seq:
+            return data_manager.read_changes(since_seq, limit)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or (stop_event and stop_event.is_set()):
+            return []
+        if stop_event:
+            stop_event.wait(min(poll_interval, remaining))
+        else:
+            time.sleep(min(poll_interval, remaining))
+
+def follow_changes(data_manager, since_seq=None, limit=100, poll_interval=1.0, stop_event=None):
+    """
+    변경 피드를 계속 따라가며 새 변경을 하나씩 반환 (tail -f)
+    
+    시작 위치는 호출 시점에 정해지므로, 호출 후 첫 변경을 요청하기 전에 저장된 게시물도 빠지지 않습니다.
+    
+    Args:
+        data_manager (DataManager): 변경 피드를 읽을 데이터 관리자
+        since_seq (int): 시작 위치 (None이면 호출 시점의 마지막 seq 이후부터)
+        limit (int): 한 번에 조회할 최대 변경 수
+        poll_interval (float): 변경 확인 간격 (초)
+        stop_event (threading.Event): 설정되면 종료
+    
+    Returns:
+        generator: 변경 dict를 seq 오름차순으로 반환하는 제너레이터
+    """
+    seq = data_manager.get_latest_change_seq() if since_seq is None else since_seq
+    return _follow(data_manager, seq, limit, poll_interval, stop_event)
+
+def _follow(data_manager, seq, limit, poll_interval, stop_event):
+    while not (stop_event and stop_event.is_set()):
+        changes = wait_for_changes(data_manager, seq, limit, timeout=MAX_WAIT_SECONDS,
+                                   poll_interval=poll_interval, stop_event=stop_event)
+        for change in changes:
+            seq = change['seq']
+            yield change
+
+def start_feed_server(data_manager, port, host='127.0.0.1', poll_interval=1.0):
+    """
+    로컬 HTTP 변경 피드 엔드포인트를 백그라운드 스레드로 시작
+    
+    GET /changes?since=<seq>&limit=<수>&wait=<초> 는 since 이후 변경을 JSON으로 반환하며,
+    wait를 지정하면 변경이 생기거나 시간이 초과될 때까지 응답을 보류합니다 (롱 폴링).
+    
+    Args:
+        data_manager (DataManager): 변경 피드를 읽을 데이터 관리자
+        port (int): 포트 번호 (0이면 임의 포트)
+        host (str): 바인딩 주소 (기본값: 로컬 전용)
+        poll_interval (float): 롱 폴링 중 변경 확인 간격 (초)
+    
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (shutdown()으로 중지)
+    """
+    # http.server는 조회 명령의 시작 시간을 늘리지 않도록 서버 시작 시에만 import
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    from urllib.parse import urlsplit, parse_qs
+    
+    stop_event = threading.Event()
+    
+    class FeedHandler(BaseHTTPRequestHandler):
+        """/changes 요청 처리"""
+        
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path != '/changes':
+                self.send_error(404)
+                return
+            params = parse_qs(url.query)
+            try:
+                since_seq = int(params.get('since', ['0'])[0])
+                limit = min(max(int(params.get('limit', ['100'])[0]), 1), MAX_FEED_LIMIT)
+                wait = min(max(float(params.get('wait', ['0'])[0]), 0), MAX_WAIT_SECONDS)
+            except ValueError:
+                self.send_error(400, '잘못된 since/limit/wait 값')
+                return
+            changes = wait_for_changes(data_manager, since_seq, limit, timeout=wait,
+                                       poll_interval=poll_interval, stop_event=stop_event)
+            next_seq = changes[-1]['seq'] if changes else since_seq
+            body = json.dumps({'changes': changes, 'next_seq': next_seq}, ensure_ascii=False, default=str).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            logger.debug(f"변경 피드 요청: {format % args}")
+    
+    class FeedServer(ThreadingHTTPServer):
+        daemon_threads = True
+        
+        def shutdown(self):
+            # 대기 중인 롱 폴링 요청을 먼저 깨워 종료 지연 방지
+            stop_event.set()
+            super().shutdown()
+    
+    server = FeedServer((host, port), FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, name='feed-server', daemon=True)
+    thread.start()
+    logger.info(f"변경 피드 엔드포인트 시작: http://{host}:{server.server_address[1]}/changes")
+    return server
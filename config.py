@@ -11,17 +11,94 @@ class Config:
     CRAWL_INTERVAL_HOURS = int(os.getenv('CRAWL_INTERVAL_HOURS', 24))
     HEADLESS_MODE = os.getenv('HEADLESS_MODE', 'true').lower() == 'true'
     
+    # 접속 주소 (벤치마크/테스트에서는 로컬 가짜 서버 주소로 변경)
+    INSTAGRAM_BASE_URL = os.getenv('INSTAGRAM_BASE_URL', 'https://www.instagram.com')
+    
     # 브라우저 설정
-    BROWSER_TIMEOUT = int(os.getenv('BROWSER_TIMEOUT', 10))
+    BROWSER_TIMEOUT = int(os.getenv('BROWSER_TIMEOUT', 10))  # 요소 대기 시간
+    PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', 30))  # 페이지 이동/스크립트 실행 시간 초과
+    ACCOUNT_TIMEOUT_SECONDS = int(os.getenv('ACCOUNT_TIMEOUT_SECONDS', 600))  # 계정당 최대 크롤링 시간 (0이면 무제한)
     PAGE_LOAD_WAIT = int(os.getenv('PAGE_LOAD_WAIT', 3))
     ACCOUNT_INTERVAL_SECONDS = int(os.getenv('ACCOUNT_INTERVAL_SECONDS', 5))
+    WAIT_SCALE = float(os.getenv('WAIT_SCALE', 1.0))  # 크롤러 고정 대기 시간 배율
+    
+    # 페이지 요소 CSS 선택자 설정 파일 (수정하면 다음 계정 크롤링부터 반영)
+    SELECTORS_FILE = os.getenv('SELECTORS_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'selectors.json'))
+    
+    # 크롤링 계정 풀 (계정별 Chrome 프로필, 시간당 요청 예산, 로그인 실패 시 대기)
+    CREDENTIALS_FILE = os.getenv('CREDENTIALS_FILE', 'credentials.json')  # 없으면 .env의 계정 하나 사용
+    SESSION_DIRECTORY = os.getenv('SESSION_DIRECTORY', 'sessions')
+    IDENTITY_REQUESTS_PER_HOUR = int(os.getenv('IDENTITY_REQUESTS_PER_HOUR', 200))  # 페이지 요청 수
+    IDENTITY_BURST = int(os.getenv('IDENTITY_BURST', 60))
+    IDENTITY_COOLDOWN_SECONDS = int(os.getenv('IDENTITY_COOLDOWN_SECONDS', 1800))  # 차단기 열림 시간 (연속으로 열릴 때마다 두 배)
+    IDENTITY_MAX_COOLDOWN_SECONDS = int(os.getenv('IDENTITY_MAX_COOLDOWN_SECONDS', 86400))
+    IDENTITY_WAIT_SECONDS = float(os.getenv('IDENTITY_WAIT_SECONDS', 300))  # 계정마다 크롤링 계정을 기다리는 최대 시간 (넘으면 건너뜀)
+    
+    # 요청 속도 조절 (정상 페이지마다 가산 증가, 요청 제한 페이지마다 승산 감소)
+    GOVERNOR_MAX_RATE_PER_MINUTE = float(os.getenv('GOVERNOR_MAX_RATE_PER_MINUTE', 30))
+    GOVERNOR_MIN_RATE_PER_MINUTE = float(os.getenv('GOVERNOR_MIN_RATE_PER_MINUTE', 1))
+    GOVERNOR_RATE_INCREASE = float(os.getenv('GOVERNOR_RATE_INCREASE', 1))
+    GOVERNOR_DECREASE_FACTOR = float(os.getenv('GOVERNOR_DECREASE_FACTOR', 0.5))
+    BREAKER_THRESHOLD = int(os.getenv('BREAKER_THRESHOLD', 3))  # 연속 요청 제한 횟수
     
     # 데이터베이스 설정
     DATABASE_PATH = os.getenv('DATABASE_PATH', 'instagram_data.db')
     
+    # 분산 크롤링 설정 (여러 워커 프로세스가 공유 SQLite 코디네이터에서 계정을 나누어 가져감)
+    COORDINATOR_DB_PATH = os.getenv('COORDINATOR_DB_PATH', DATABASE_PATH)
+    LEASE_SECONDS = int(os.getenv('LEASE_SECONDS', 900))  # 계정 작업 임대 만료 시간
+    WORKER_HEARTBEAT_SECONDS = int(os.getenv('WORKER_HEARTBEAT_SECONDS', 30))
+    WORKER_TIMEOUT_SECONDS = int(os.getenv('WORKER_TIMEOUT_SECONDS', 120))  # 하트비트가 없으면 워커 제외
+    WORKER_RETRY_SECONDS = int(os.getenv('WORKER_RETRY_SECONDS', 600))  # 실패한 계정을 다시 시도하기까지 대기 시간
+    
+    # 백업 설정
+    BACKUP_DIRECTORY = os.getenv('BACKUP_DIRECTORY', 'backups')
+    BACKUP_COMPRESSION = os.getenv('BACKUP_COMPRESSION', 'gzip')  # gzip, zstd, none
+    BACKUP_RETENTION = int(os.getenv('BACKUP_RETENTION', 7))  # 보관할 전체 백업 수
+    BACKUP_PAGES_PER_STEP = int(os.getenv('BACKUP_PAGES_PER_STEP', 1024))
+    
+    # 게시물 캡션/해시태그/멘션 압축 저장 (zstd는 zstandard 패키지 필요)
+    CAPTION_COMPRESSION = os.getenv('CAPTION_COMPRESSION', 'none')  # zstd, none
+    CAPTION_COMPRESSION_LEVEL = int(os.getenv('CAPTION_COMPRESSION_LEVEL', 3))
+    CAPTION_DICT_SIZE = int(os.getenv('CAPTION_DICT_SIZE', 112640))  # 학습 사전 크기 (바이트)
+    
+    # 새 게시물 변경 피드 (--tail, --feed-port 롱 폴링의 변경 확인 간격)
+    CHANGE_FEED_POLL_SECONDS = float(os.getenv('CHANGE_FEED_POLL_SECONDS', 1.0))
+    
+    # 기존 게시물 재확인 (캡션 수정/삭제 감지, 게시 후 경과 시간에 비례하는 간격으로 표본 확인)
+    REVISIT_ENABLED = os.getenv('REVISIT_ENABLED', 'false').lower() == 'true'
+    REVISIT_MAX_POSTS = int(os.getenv('REVISIT_MAX_POSTS', 3))  # 계정 크롤링당 최대 재확인 게시물 수
+    REVISIT_AGE_FACTOR = float(os.getenv('REVISIT_AGE_FACTOR', 0.5))  # 경과 시간 대비 재확인 간격 비율
+    REVISIT_MIN_HOURS = float(os.getenv('REVISIT_MIN_HOURS', 6))
+    REVISIT_MAX_DAYS = float(os.getenv('REVISIT_MAX_DAYS', 60))
+    
+    # 프로필/참여 지표 시계열 보존 기간 (일 단위/주 단위 집계는 계속 보존)
+    TIMESERIES_RAW_RETENTION_DAYS = int(os.getenv('TIMESERIES_RAW_RETENTION_DAYS', 30))  # 원본 표본
+    TIMESERIES_HOURLY_RETENTION_DAYS = int(os.getenv('TIMESERIES_HOURLY_RETENTION_DAYS', 90))  # 시간 단위 집계
+    
+    # 게시물/통계 조회 캐시 (저장할 때마다 무효화, 0이면 비활성화)
+    QUERY_CACHE_SIZE = int(os.getenv('QUERY_CACHE_SIZE', 256))  # 최대 항목 수
+    QUERY_CACHE_TTL_SECONDS = float(os.getenv('QUERY_CACHE_TTL_SECONDS', 60))  # 항목 유효 시간 (다른 도구의 직접 수정 반영 지연 한도)
+    
+    # 새 게시물 웹훅 전송 (쉼표로 구분한 주소, 비어 있으면 비활성화)
+    WEBHOOK_URLS = os.getenv('WEBHOOK_URLS', '')
+    WEBHOOK_BATCH_SIZE = int(os.getenv('WEBHOOK_BATCH_SIZE', 100))  # 배치당 최대 게시물 수
+    WEBHOOK_BATCH_SECONDS = float(os.getenv('WEBHOOK_BATCH_SECONDS', 5))  # 첫 새 게시물 이후 배치를 닫기까지 대기 시간
+    WEBHOOK_TIMEOUT = float(os.getenv('WEBHOOK_TIMEOUT', 10))
+    WEBHOOK_MAX_RETRIES = int(os.getenv('WEBHOOK_MAX_RETRIES', 8))
+    WEBHOOK_RETRY_SECONDS = float(os.getenv('WEBHOOK_RETRY_SECONDS', 30))  # 첫 재시도 간격 (시도마다 두 배, 최대 1시간)
+    WEBHOOK_POLL_SECONDS = float(os.getenv('WEBHOOK_POLL_SECONDS', 5))
+    
     # 로깅 설정
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE', 'instagram_crawler.log')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')  # 파일 로그 형식: text, json
+    LOG_DEBUG_SAMPLE_RATE = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', 1.0))  # DEBUG 로그 표본 비율
+    LOG_DEBUG_RATE_LIMIT = int(os.getenv('LOG_DEBUG_RATE_LIMIT', 60))  # 호출 위치별 분당 DEBUG 로그 수 (0이면 제한 없음)
+    
+    # 메트릭 설정
+    METRICS_PORT = int(os.getenv('METRICS_PORT', 9108))  # 0이면 메트릭 엔드포인트 비활성화
+    METRICS_FILE = os.getenv('METRICS_FILE', 'crawl_metrics.json')
     
     # 크롤링할 계정 목록 (기본값)
     DEFAULT_ACCOUNTS = [
@@ -42,19 +119,80 @@ class Config:
     # 출력 설정
     EXPORT_DIRECTORY = os.getenv('EXPORT_DIRECTORY', 'exports')
     
+    # 미디어 다운로드 설정
+    MEDIA_DOWNLOAD_ENABLED = os.getenv('MEDIA_DOWNLOAD_ENABLED', 'false').lower() == 'true'
+    MEDIA_DIRECTORY = os.getenv('MEDIA_DIRECTORY', 'media')
+    MEDIA_DOWNLOAD_WORKERS = int(os.getenv('MEDIA_DOWNLOAD_WORKERS', 4))
+    MEDIA_DOWNLOAD_TIMEOUT = int(os.getenv('MEDIA_DOWNLOAD_TIMEOUT', 30))
+    
     @classmethod
     def get_all_settings(cls):
         """모든 설정값 반환"""
         return {
             'crawl_interval_hours': cls.CRAWL_INTERVAL_HOURS,
+            'instagram_base_url': cls.INSTAGRAM_BASE_URL,
             'headless_mode': cls.HEADLESS_MODE,
             'browser_timeout': cls.BROWSER_TIMEOUT,
+            'page_load_timeout': cls.PAGE_LOAD_TIMEOUT,
+            'account_timeout_seconds': cls.ACCOUNT_TIMEOUT_SECONDS,
             'page_load_wait': cls.PAGE_LOAD_WAIT,
             'account_interval_seconds': cls.ACCOUNT_INTERVAL_SECONDS,
+            'wait_scale': cls.WAIT_SCALE,
+            'selectors_file': cls.SELECTORS_FILE,
+            'credentials_file': cls.CREDENTIALS_FILE,
+            'session_directory': cls.SESSION_DIRECTORY,
+            'identity_requests_per_hour': cls.IDENTITY_REQUESTS_PER_HOUR,
+            'identity_burst': cls.IDENTITY_BURST,
+            'identity_cooldown_seconds': cls.IDENTITY_COOLDOWN_SECONDS,
+            'identity_max_cooldown_seconds': cls.IDENTITY_MAX_COOLDOWN_SECONDS,
+            'identity_wait_seconds': cls.IDENTITY_WAIT_SECONDS,
+            'governor_max_rate_per_minute': cls.GOVERNOR_MAX_RATE_PER_MINUTE,
+            'governor_min_rate_per_minute': cls.GOVERNOR_MIN_RATE_PER_MINUTE,
+            'governor_rate_increase': cls.GOVERNOR_RATE_INCREASE,
+            'governor_decrease_factor': cls.GOVERNOR_DECREASE_FACTOR,
+            'breaker_threshold': cls.BREAKER_THRESHOLD,
             'database_path': cls.DATABASE_PATH,
+            'coordinator_db_path': cls.COORDINATOR_DB_PATH,
+            'lease_seconds': cls.LEASE_SECONDS,
+            'worker_heartbeat_seconds': cls.WORKER_HEARTBEAT_SECONDS,
+            'worker_timeout_seconds': cls.WORKER_TIMEOUT_SECONDS,
+            'worker_retry_seconds': cls.WORKER_RETRY_SECONDS,
+            'backup_directory': cls.BACKUP_DIRECTORY,
+            'backup_compression': cls.BACKUP_COMPRESSION,
+            'backup_retention': cls.BACKUP_RETENTION,
+            'backup_pages_per_step': cls.BACKUP_PAGES_PER_STEP,
+            'caption_compression': cls.CAPTION_COMPRESSION,
+            'caption_compression_level': cls.CAPTION_COMPRESSION_LEVEL,
+            'caption_dict_size': cls.CAPTION_DICT_SIZE,
+            'change_feed_poll_seconds': cls.CHANGE_FEED_POLL_SECONDS,
+            'revisit_enabled': cls.REVISIT_ENABLED,
+            'revisit_max_posts': cls.REVISIT_MAX_POSTS,
+            'revisit_age_factor': cls.REVISIT_AGE_FACTOR,
+            'revisit_min_hours': cls.REVISIT_MIN_HOURS,
+            'revisit_max_days': cls.REVISIT_MAX_DAYS,
+            'timeseries_raw_retention_days': cls.TIMESERIES_RAW_RETENTION_DAYS,
+            'timeseries_hourly_retention_days': cls.TIMESERIES_HOURLY_RETENTION_DAYS,
+            'query_cache_size': cls.QUERY_CACHE_SIZE,
+            'query_cache_ttl_seconds': cls.QUERY_CACHE_TTL_SECONDS,
+            'webhook_urls': cls.WEBHOOK_URLS,
+            'webhook_batch_size': cls.WEBHOOK_BATCH_SIZE,
+            'webhook_batch_seconds': cls.WEBHOOK_BATCH_SECONDS,
+            'webhook_timeout': cls.WEBHOOK_TIMEOUT,
+            'webhook_max_retries': cls.WEBHOOK_MAX_RETRIES,
+            'webhook_retry_seconds': cls.WEBHOOK_RETRY_SECONDS,
+            'webhook_poll_seconds': cls.WEBHOOK_POLL_SECONDS,
             'log_level': cls.LOG_LEVEL,
             'log_file': cls.LOG_FILE,
+            'log_format': cls.LOG_FORMAT,
+            'log_debug_sample_rate': cls.LOG_DEBUG_SAMPLE_RATE,
+            'log_debug_rate_limit': cls.LOG_DEBUG_RATE_LIMIT,
+            'metrics_port': cls.METRICS_PORT,
+            'metrics_file': cls.METRICS_FILE,
             'max_posts_per_account': cls.MAX_POSTS_PER_ACCOUNT,
             'max_retries': cls.MAX_RETRIES,
-            'export_directory': cls.EXPORT_DIRECTORY
+            'export_directory': cls.EXPORT_DIRECTORY,
+            'media_download_enabled': cls.MEDIA_DOWNLOAD_ENABLED,
+            'media_directory': cls.MEDIA_DIRECTORY,
+            'media_download_workers': cls.MEDIA_DOWNLOAD_WORKERS,
+            'media_download_timeout': cls.MEDIA_DOWNLOAD_TIMEOUT
         }
@@ -0,0 +1,374 @@
+import bisect
+import hashlib
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from config import Config
+
+# 해시 링에서 워커 하나가 차지하는 가상 노드 수 (많을수록 계정이 고르게 분배됨)
+RING_REPLICAS = 100
+
+class HashRing:
+    def __init__(self, nodes, replicas=RING_REPLICAS):
+        """
+        일관된 해싱 링
+        
+        워커가 추가/제거되어도 해당 워커 구간의 계정만 다른 워커로 옮겨집니다.
+        
+        Args:
+            nodes (list): 워커 ID 목록
+            replicas (int): 워커별 가상 노드 수
+        """
+        self._ring = sorted(
+            (_hash(f"{node}#{i}"), node)
+            for node in set(nodes)
+            for i in range(replicas)
+        )
+        self._keys = [key for key, _ in self._ring]
+    
+    def node_for(self, key):
+        """
+        키를 담당하는 워커
+        
+        Returns:
+            str: 워커 ID (링이 비어 있으면 None)
+        """
+        if not self._ring:
+            return None
+        index = bisect.bisect(self._keys, _hash(key)) % len(self._ring)
+        return self._ring[index][1]
+
+class CrawlCoordinator:
+    def __init__(self, db_path=None, worker_id=None, lease_seconds=None,
+                 heartbeat_seconds=None, worker_timeout=None):
+        """
+        공유 SQLite 기반 분산 크롤링 코디네이터
+        
+        여러 프로세스(같은 호스트 또는 공유 스토리지를 사용하는 여러 호스트)가 같은 DB 파일로
+        살아 있는 워커 목록을 공유하고, 일관된 해싱으로 담당 계정을 정한 뒤
+        만료 시간이 있는 임대(lease)를 얻은 계정만 크롤링합니다.
+        
+        Args:
+            db_path (str): 코디네이터 DB 경로 (None이면 Config.COORDINATOR_DB_PATH)
+            worker_id (str): 워커 ID (None이면 호스트명-PID)
+            lease_seconds (int): 계정 임대 만료 시간 (초)
+            heartbeat_seconds (int): 하트비트 및 임대 갱신 주기 (초)
+            worker_timeout (int): 하트비트가 없으면 워커를 제외하는 시간 (초)
+        """
+        self.db_path = db_path or Config.COORDINATOR_DB_PATH
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_seconds = lease_seconds or Config.LEASE_SECONDS
+        self.heartbeat_seconds = heartbeat_seconds or Config.WORKER_HEARTBEAT_SECONDS
+        self.worker_timeout = worker_timeout or Config.WORKER_TIMEOUT_SECONDS
+        self.logger = logging.getLogger(__name__)
+        self._held = set()
+        self._held_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat_thread = None
+        self.setup_database()
+    
+    def _connect(self):
+        # 여러 프로세스가 동시에 쓰므로 잠금 대기 시간을 넉넉하게 설정
+        return sqlite3.connect(self.db_path, timeout=30)
+    
+    def setup_database(self):
+        """워커/임대 테이블 생성"""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS crawl_workers (
+                    worker_id TEXT PRIMARY KEY,
+                    hostname TEXT,
+                    pid INTEGER,
+                    started_at REAL NOT NULL,
+                    heartbeat_at REAL NOT NULL
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS account_leases (
+                    username TEXT PRIMARY KEY,
+                    worker_id TEXT,
+                    lease_expires REAL NOT NULL DEFAULT 0,
+                    last_attempt_at REAL,
+                    last_status TEXT,
+                    last_worker_id TEXT,
+                    last_success_at REAL
+                )
+            ''')
+            # 이전 버전 테이블: 성공한 마지막 시도를 마지막 성공 시간으로 사용
+            cursor.execute('PRAGMA table_info(account_leases)')
+            if 'last_success_at' not in [row[1] for row in cursor.fetchall()]:
+                cursor.execute('ALTER TABLE account_leases ADD COLUMN last_success_at REAL')
+                cursor.execute("UPDATE account_leases SET last_success_at = last_attempt_at WHERE last_status = 'SUCCESS'")
+            conn.commit()
+    
+    def register(self):
+        """워커 등록 및 하트비트 스레드 시작"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('''
+                INSERT INTO crawl_workers (worker_id, hostname, pid, started_at, heartbeat_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(worker_id) DO UPDATE SET heartbeat_at = excluded.heartbeat_at
+            ''', (self.worker_id, socket.gethostname(), os.getpid(), now, now))
+            conn.commit()
+        
+        self._stop.clear()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name='crawl-heartbeat', daemon=True)
+        self._heartbeat_thread.start()
+        self.logger.info(f"워커 등록됨: {self.worker_id}")
+    
+    def unregister(self):
+        """하트비트 중지, 보유한 임대 반납 및 워커 제거 (담당 계정은 다른 워커로 넘어감)"""
+        self._stop.set()
+        if self._heartbeat_thread:
+            self._heartbeat_thread.join(timeout=5)
+            self._heartbeat_thread = None
+        
+        try:
+            with self._connect() as conn:
+                conn.execute('UPDATE account_leases SET worker_id = NULL, lease_expires = 0 WHERE worker_id = ?',
+                             (self.worker_id,))
+                conn.execute('DELETE FROM crawl_workers WHERE worker_id = ?', (self.worker_id,))
+                conn.commit()
+            with self._held_lock:
+                self._held.clear()
+            self.logger.info(f"워커 등록 해제됨: {self.worker_id}")
+        except Exception as e:
+            self.logger.error(f"워커 등록 해제 실패: {e}")
+    
+    def heartbeat(self):
+        """워커 하트비트 기록 및 보유한 임대 연장"""
+        now = time.time()
+        with self._held_lock:
+            held = list(self._held)
+        with self._connect() as conn:
+            conn.execute('UPDATE crawl_workers SET heartbeat_at = ? WHERE worker_id = ?', (now, self.worker_id))
+            conn.executemany(
+                'UPDATE account_leases SET lease_expires = ? WHERE username = ? AND worker_id = ?',
+                [(now + self.lease_seconds, username, self.worker_id) for username in held]
+            )
+            conn.commit()
+    
+    def _heartbeat_loop(self):
+        while not self._stop.wait(self.heartbeat_seconds):
+            try:
+                self.heartbeat()
+            except Exception as e:
+                self.logger.warning(f"하트비트 실패: {e}")
+    
+    def live_workers(self, cursor=None):
+        """
+        하트비트가 유효한 워커 목록
+        
+        Returns:
+            list: 워커 ID 목록
+        """
+        threshold = time.time() - self.worker_timeout
+        if cursor is not None:
+            cursor.execute('SELECT worker_id FROM crawl_workers WHERE heartbeat_at >= ?', (threshold,))
+            return [row[0] for row in cursor.fetchall()]
+        with self._connect() as conn:
+            return self.live_workers(conn.cursor())
+    
+    def _is_due(self, username, last_attempt_at, last_success_at, now, interval_hours, interval_for, attempted_since):
+        """
+        계정을 크롤링할 때가 되었는지 확인
+        
+        간격은 마지막 성공부터 계산하고, 실패한 계정은 Config.WORKER_RETRY_SECONDS(간격보다 길면 간격) 후 다시 시도합니다.
+        attempted_since 이후에 시도한 계정은 성공 여부와 관계없이 제외합니다 (--once 실행에서 한 번씩만 시도).
+        """
+        interval = ((interval_for(username) if interval_for else None) or interval_hours) * 3600
+        if last_success_at and last_success_at > now - interval:
+            return False
+        if last_attempt_at and last_attempt_at > now - min(Config.WORKER_RETRY_SECONDS, interval):
+            return False
+        if attempted_since is not None and last_attempt_at and last_attempt_at >= attempted_since:
+            return False
+        return True
+    
+    def claim_next(self, accounts, interval_hours, interval_for=None, attempted_since=None):
+        """
+        이 워커가 담당하는 계정 중 크롤링할 때가 된 계정 하나의 임대 획득
+        
+        조회와 임대 기록을 하나의 쓰기 트랜잭션(BEGIN IMMEDIATE)에서 처리하므로
+        워커 목록이 바뀌는 중에도 같은 계정이 두 번 크롤링되지 않습니다.
+        
+        Args:
+            accounts (list): 전체 계정 목록
+            interval_hours (float): 기본 크롤링 간격 (시간)
+            interval_for (callable): 계정별 크롤링 간격(시간)을 반환하는 함수 (None을 반환하면 기본 간격)
+            attempted_since (float): 이 시각 이후에 시도한 계정은 제외 (유닉스 시각)
+        
+        Returns:
+            str: 임대를 얻은 계정 (없으면 None)
+        """
+        try:
+            conn = self._connect()
+            try:
+                cursor = conn.cursor()
+                cursor.execute('BEGIN IMMEDIATE')
+                now = time.time()
+                
+                live = set(self.live_workers(cursor))
+                live.add(self.worker_id)
+                ring = HashRing(live)
+                
+                cursor.execute('SELECT username, worker_id, lease_expires, last_attempt_at, last_success_at FROM account_leases')
+                state = {row[0]: row[1:] for row in cursor.fetchall()}
+                
+                # 가장 오래전에 시도한 계정부터
+                for username in sorted(accounts, key=lambda name: (state.get(name, (None, 0, None, None))[2] or 0, name)):
+                    if ring.node_for(username) != self.worker_id:
+                        continue
+                    holder, lease_expires, last_attempt_at, last_success_at = state.get(username, (None, 0, None, None))
+                    if holder and holder != self.worker_id and lease_expires > now:
+                        continue
+                    if not self._is_due(username, last_attempt_at, last_success_at, now, interval_hours, interval_for, attempted_since):
+                        continue
+                    
+                    cursor.execute('''
+                        INSERT INTO account_leases (username, worker_id, lease_expires)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT(username) DO UPDATE SET
+                            worker_id = excluded.worker_id,
+                            lease_expires = excluded.lease_expires
+                    ''', (username, self.worker_id, now + self.lease_seconds))
+                    conn.commit()
+                    with self._held_lock:
+                        self._held.add(username)
+                    self.logger.info(f"계정 임대 획득: {username} ({self.worker_id})")
+                    return username
+                
+                conn.commit()
+                return None
+            finally:
+                conn.close()
+        
+        except Exception as e:
+            self.logger.error(f"계정 임대 획득 실패: {e}")
+            return None
+    
+    def complete(self, username, success):
+        """
+        크롤링 결과 기록 및 임대 반납 (크롤링 간격은 성공했을 때만 새로 시작)
+        
+        Args:
+            username (str): 크롤링한 계정
+            success (bool): 성공 여부
+        """
+        try:
+            with self._connect() as conn:
+                now = time.time()
+                conn.execute('''
+                    UPDATE account_leases
+                    SET worker_id = NULL, lease_expires = 0, last_attempt_at = ?,
+                        last_status = ?, last_worker_id = ?,
+                        last_success_at = CASE WHEN ? THEN ? ELSE last_success_at END
+                    WHERE username = ?
+                ''', (now, 'SUCCESS' if success else 'ERROR', self.worker_id, bool(success), now, username))
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"임대 반납 실패: {username} - {e}")
+        finally:
+            with self._held_lock:
+                self._held.discard(username)
+    
+    def pending_accounts(self, accounts, interval_hours, interval_for=None, attempted_since=None):
+        """
+        아직 크롤링할 때가 된 계정 목록 (모든 워커 기준, 인자는 claim_next와 같음)
+        
+        Returns:
+            list: 계정 목록
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT username, last_attempt_at, last_success_at FROM account_leases')
+            state = {row[0]: row[1:] for row in cursor.fetchall()}
+        return [
+            username for username in accounts
+            if self._is_due(username, *state.get(username, (None, None)), now, interval_hours, interval_for, attempted_since)
+        ]
+    
+    def get_status(self):
+        """
+        워커와 임대 현황 조회
+        
+        Returns:
+            dict: {'workers': [...], 'leases': [...]}
+        """
+        try:
+            now = time.time()
+            with self._connect() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute('SELECT * FROM crawl_workers ORDER BY worker_id')
+                workers = []
+                for row in cursor.fetchall():
+                    item = dict(row)
+                    item['heartbeat_age'] = round(now - item['heartbeat_at'], 1)
+                    item['alive'] = item['heartbeat_age'] <= self.worker_timeout
+                    workers.append(item)
+                cursor.execute('SELECT * FROM account_leases ORDER BY username')
+                leases = [dict(row) for row in cursor.fetchall()]
+            return {'workers': workers, 'leases': leases}
+        
+        except Exception as e:
+            self.logger.error(f"코디네이터 상태 조회 실패: {e}")
+            return {'workers': [], 'leases': []}
+
+def run_worker(coordinator, accounts, crawl_account, interval_hours, once=False, stop_event=None, poll_seconds=None,
+               interval_for=None):
+    """
+    분산 크롤링 워커 루프
+    
+    Args:
+        coordinator (CrawlCoordinator): 코디네이터
+        accounts (list): 전체 계정 목록 (모든 워커가 같은 목록 사용)
+        crawl_account (callable): 계정 하나를 크롤링하고 성공 여부를 반환하는 함수
+        interval_hours (float): 기본 크롤링 간격 (시간)
+        once (bool): 모든 계정이 한 번씩 시도되면 종료 (실패한 계정은 다시 시도하지 않음)
+        stop_event (threading.Event): 설정되면 종료
+        poll_seconds (float): 담당 계정이 없을 때 다시 확인하는 간격 (None이면 하트비트 주기)
+        interval_for (callable): 계정별 크롤링 간격(시간)을 반환하는 함수 (None을 반환하면 기본 간격)
+    
+    Returns:
+        int: 이 워커가 크롤링한 계정 수
+    """
+    logger = logging.getLogger(__name__)
+    stop_event = stop_event or threading.Event()
+    poll_seconds = poll_seconds if poll_seconds is not None else coordinator.heartbeat_seconds
+    crawled = 0
+    attempted_since = time.time() if once else None
+    
+    coordinator.register()
+    try:
+        while not stop_event.is_set():
+            username = coordinator.claim_next(accounts, interval_hours, interval_for, attempted_since)
+            if username:
+                try:
+                    success = crawl_account(username)
+                except Exception as e:
+                    logger.error(f"계정 {username} 크롤링 중 오류 발생: {e}")
+                    success = False
+                coordinator.complete(username, bool(success))
+                crawled += 1
+                continue
+            
+            # 다른 워커가 담당/진행 중인 계정이 남아 있으면 대기 (워커가 사라지면 넘겨받음)
+            if once and not coordinator.pending_accounts(accounts, interval_hours, interval_for, attempted_since):
+                break
+            stop_event.wait(poll_seconds)
+    finally:
+        coordinator.unregister()
+    
+    logger.info(f"워커 종료: {coordinator.worker_id} ({crawled}개 계정 크롤링)")
+    return crawled
+
+def _hash(value):
+    """링 위치용 64비트 해시"""
+    return int.from_bytes(hashlib.md5(value.encode('utf-8')).digest()[:8], 'big')
@@ -0,0 +1,228 @@
+import json
+import logging
+import os
+import threading
+import time
+from config import Config
+from rate_governor import RateGovernor
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    def __init__(self, capacity, per_hour, clock=time.monotonic):
+        """
+        토큰 버킷 요청 예산
+        
+        시간당 per_hour개의 토큰이 채워지며, 최대 capacity개까지 모아 한 번에 사용할 수 있습니다.
+        
+        Args:
+            capacity (float): 최대 토큰 수 (버스트 크기)
+            per_hour (float): 시간당 채워지는 토큰 수
+            clock (callable): 현재 시각 함수 (테스트용)
+        """
+        self.capacity = float(capacity)
+        self.rate = float(per_hour) / 3600
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+    
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def available(self):
+        """현재 사용 가능한 토큰 수"""
+        self._refill()
+        return self.tokens
+    
+    def try_take(self, amount):
+        """
+        토큰 사용 (부족하면 사용하지 않음)
+        
+        Returns:
+            bool: 사용 여부
+        """
+        self._refill()
+        if self.tokens < amount:
+            return False
+        self.tokens -= amount
+        return True
+    
+    def adjust(self, amount):
+        """예약한 토큰과 실제 사용량의 차이 정산 (양수면 추가 차감, 음수면 반환, 음수 잔액 허용)"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+    
+    def seconds_until(self, amount):
+        """amount개의 토큰이 모일 때까지 남은 시간 (초, 용량보다 크면 가득 찰 때까지)"""
+        self._refill()
+        needed = min(amount, self.capacity) - self.tokens
+        if needed <= 0:
+            return 0.0
+        return needed / self.rate if self.rate > 0 else float('inf')
+
+class CrawlIdentity:
+    def __init__(self, username, password, requests_per_hour, burst, session_dir=None, clock=time.monotonic):
+        """
+        크롤링에 사용하는 로그인 계정 (세션 저장소, 요청 예산, 속도 조절기/차단기)
+        
+        Args:
+            username (str): 인스타그램 로그인 사용자명 (None이면 로그인 없이 크롤링)
+            password (str): 비밀번호
+            requests_per_hour (float): 시간당 페이지 요청 예산
+            burst (float): 한 번에 사용할 수 있는 최대 요청 수
+            session_dir (str): Chrome 프로필 디렉토리 (로그인 쿠키 유지, None이면 임시 프로필)
+            clock (callable): 현재 시각 함수 (테스트용)
+        """
+        self.username = username
+        self.password = password
+        self.session_dir = session_dir
+        self.bucket = TokenBucket(burst, requests_per_hour, clock=clock)
+        self.governor = RateGovernor(self.name, clock=clock)
+        self.in_use = False
+        self.crawls = 0
+    
+    @property
+    def name(self):
+        return self.username or 'anonymous'
+    
+    def is_cooling_down(self):
+        """차단기가 열려 있어 사용할 수 없는지 여부"""
+        return self.governor.is_open()
+    
+    def to_dict(self):
+        """상태 조회용 값 (비밀번호 제외)"""
+        return {
+            'identity': self.name,
+            'tokens': round(self.bucket.available(), 2),
+            'in_use': self.in_use,
+            'crawls': self.crawls,
+            **self.governor.to_dict()
+        }
+
+class CredentialPool:
+    def __init__(self, identities, clock=time.monotonic):
+        """
+        크롤링 계정 풀
+        
+        예산이 남아 있고 차단되지 않은 계정을 한 번에 하나의 크롤러에만 배정합니다.
+        계정 수만큼 동시에 크롤링할 수 있으므로 계정을 추가하면 처리량이 늘어납니다.
+        
+        Args:
+            identities (list): CrawlIdentity 목록
+            clock (callable): 현재 시각 함수 (테스트용)
+        """
+        self.identities = list(identities)
+        self.clock = clock
+        self._condition = threading.Condition()
+    
+    @classmethod
+    def from_config(cls):
+        """
+        설정에서 계정 풀 생성
+        
+        CREDENTIALS_FILE(JSON 목록: username, password, requests_per_hour, burst)이 있으면 사용하고,
+        없으면 .env의 INSTAGRAM_USERNAME/INSTAGRAM_PASSWORD 한 계정(없으면 로그인 없는 계정 하나)을 사용합니다.
+        
+        Returns:
+            CredentialPool: 계정 풀
+        """
+        entries = []
+        if Config.CREDENTIALS_FILE and os.path.exists(Config.CREDENTIALS_FILE):
+            try:
+                with open(Config.CREDENTIALS_FILE, 'r', encoding='utf-8') as f:
+                    entries = [entry for entry in json.load(f) if entry.get('username')]
+            except Exception as e:
+                logger.error(f"크롤링 계정 파일 읽기 실패: {Config.CREDENTIALS_FILE} - {e}")
+        if not entries:
+            entries = [{'username': os.getenv('INSTAGRAM_USERNAME'), 'password': os.getenv('INSTAGRAM_PASSWORD')}]
+        
+        identities = []
+        for entry in entries:
+            username = entry.get('username')
+            identities.append(CrawlIdentity(
+                username,
+                entry.get('password'),
+                requests_per_hour=entry.get('requests_per_hour', Config.IDENTITY_REQUESTS_PER_HOUR),
+                burst=entry.get('burst', Config.IDENTITY_BURST),
+                session_dir=os.path.join(Config.SESSION_DIRECTORY, username) if username else None
+            ))
+        logger.info(f"크롤링 계정 {len(identities)}개 사용")
+        return cls(identities)
+    
+    @property
+    def size(self):
+        return len(self.identities)
+    
+    def acquire(self, cost, timeout=None, stop_event=None):
+        """
+        예산이 남은 계정 배정 (없으면 예산이 채워지거나 계정이 반환될 때까지 대기)
+        
+        Args:
+            cost (float): 예약할 요청 수
+            timeout (float): 최대 대기 시간 (초, None이면 무제한)
+            stop_event (threading.Event): 설정되면 대기 중단
+        
+        Returns:
+            CrawlIdentity: 배정된 계정 (시간 초과 또는 중단 시 None)
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        with self._condition:
+            while True:
+                waits = []
+                best = None
+                for identity in self.identities:
+                    if identity.in_use:
+                        continue
+                    if identity.is_cooling_down():
+                        waits.append(identity.governor.remaining_open_seconds())
+                        continue
+                    if identity.bucket.available() >= min(cost, identity.bucket.capacity):
+                        if best is None or identity.bucket.available() > best.bucket.available():
+                            best = identity
+                    else:
+                        waits.append(identity.bucket.seconds_until(cost))
+                
+                if best is not None:
+                    best.bucket.try_take(min(cost, best.bucket.capacity))
+                    best.in_use = True
+                    return best
+                
+                if stop_event is not None and stop_event.is_set():
+                    return None
+                # 사용 중인 계정이 반환되면 깨어나므로 최대 1분 단위로 다시 확인 (중단 신호는 1초 단위로 확인)
+                wait = min(waits, default=60.0)
+                if stop_event is not None:
+                    wait = min(wait, 1.0)
+                if deadline is not None:
+                    remaining = deadline - self.clock()
+                    if remaining <= 0:
+                        return None
+                    wait = min(wait, remaining)
+                self._condition.wait(timeout=max(min(wait, 60.0), 0.01))
+    
+    def release(self, identity, reserved, used):
+        """
+        계정 반환 및 예산 정산
+        
+        Args:
+            identity (CrawlIdentity): acquire()로 배정된 계정
+            reserved (float): acquire() 시 예약한 요청 수
+            used (int): 실제 페이지 요청 수
+        """
+        with self._condition:
+            identity.bucket.adjust(used - min(reserved, identity.bucket.capacity))
+            identity.in_use = False
+            identity.crawls += 1
+            self._condition.notify_all()
+    
+    def get_status(self):
+        """
+        계정별 예산, 요청 속도, 차단 상태
+        
+        Returns:
+            list: 계정별 상태 목록
+        """
+        with self._condition:
+            return [identity.to_dict() for identity in self.identities]
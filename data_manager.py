@@ -1,19 +1,33 @@
 import json
+import re
 import sqlite3
-import pandas as pd
 import logging
 from datetime import datetime
 from pathlib import Path
+from config import Config
+from profiling import traced
+from image_hash import BAND_COUNT, MAX_EXACT_DISTANCE, compute_dhash, split_bands, to_signed, to_unsigned, hamming_distance
+from shortcode import canonicalize_post_url
+from revisit import CONTENT_FIELDS, content_hash, image_key, revisit_interval
+from time_series import RESOLUTIONS, ROLLUP_UPSERT_SQL, bucket_start, choose_resolution, rollup_rows, to_timestamp
+from query_cache import QueryCache
+
+# 스키마 버전 (PRAGMA user_version에 기록)
+# 최신 버전의 DB는 시작 시 DDL을 건너뛰어 읽기 전용 명령이 빠르게 실행됨
+SCHEMA_VERSION = 19
 
 class DataManager:
-    def __init__(self, db_path="instagram_data.db"):
+    def __init__(self, db_path=None):
         """
         데이터 관리자 초기화
         
         Args:
-            db_path (str): SQLite 데이터베이스 파일 경로
+            db_path (str): SQLite 데이터베이스 파일 경로 (None이면 Config.DATABASE_PATH)
         """
-        self.db_path = db_path
+        self.db_path = db_path or Config.DATABASE_PATH
+        self._codec = None
+        self._compression_warned = False
+        self._query_cache = QueryCache(Config.QUERY_CACHE_SIZE, Config.QUERY_CACHE_TTL_SECONDS) if Config.QUERY_CACHE_SIZE > 0 else None
         self.setup_logging()
         self.setup_database()
         
@@ -21,6 +35,27 @@ class DataManager:
         """로깅 설정"""
         self.logger = logging.getLogger(__name__)
         
+    @property
+    def codec(self):
+        """캡션 압축기 (처음 사용할 때 생성)"""
+        if self._codec is None:
+            from caption_codec import CaptionCodec
+            self._codec = CaptionCodec(self.db_path, level=Config.CAPTION_COMPRESSION_LEVEL)
+        return self._codec
+        
+    def _compress_captions(self):
+        """새 게시물을 압축 저장할지 여부 (zstandard가 없으면 압축하지 않음)"""
+        if Config.CAPTION_COMPRESSION != 'zstd':
+            return False
+        from caption_codec import zstd_available
+        if zstd_available():
+            return True
+        if not self._compression_warned:
+            self.logger.warning("zstandard가 설치되지 않아 캡션을 압축하지 않고 저장합니다.")
+            self._compression_warned = True
+        return False
+        
+    @traced()
     def setup_database(self):
         """데이터베이스 및 테이블 초기화 (기존 데이터 유지)"""
         try:
@@ -30,6 +65,13 @@ class DataManager:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
+                # 스키마가 이미 최신이면 DDL 생략
+                cursor.execute("PRAGMA user_version")
+                current_version = cursor.fetchone()[0]
+                if db_exists and current_version >= SCHEMA_VERSION:
+                    self.logger.debug("기존 데이터베이스 연결 완료 (스키마 최신)")
+                    return
+                
                 # 계정 정보 테이블
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS account_data (
@@ -45,7 +87,7 @@ class DataManager:
                     CREATE TABLE IF NOT EXISTS post_data (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         account_id INTEGER,
-                        post_url TEXT UNIQUE NOT NULL,
+                        post_url TEXT NOT NULL,
                         post_number INTEGER,
                         image_url TEXT,
                         caption TEXT,
@@ -70,6 +112,195 @@ class DataManager:
                     )
                 ''')
                 
+                # 계정별 통계 요약 테이블 (저장 시 같은 트랜잭션에서 갱신)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS account_stats (
+                        username TEXT PRIMARY KEY,
+                        total_crawls INTEGER NOT NULL DEFAULT 0,
+                        successful_crawls INTEGER NOT NULL DEFAULT 0,
+                        failed_crawls INTEGER NOT NULL DEFAULT 0,
+                        total_posts INTEGER NOT NULL DEFAULT 0,
+                        last_crawl TEXT,
+                        last_new_post TEXT,
+                        last_success TEXT
+                    )
+                ''')
+                
+                # 해시태그/멘션 정규화 테이블 (게시물당 태그별 한 행)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS post_hashtags (
+                        post_id INTEGER NOT NULL,
+                        tag TEXT NOT NULL,
+                        PRIMARY KEY (post_id, tag),
+                        FOREIGN KEY (post_id) REFERENCES post_data (id)
+                    ) WITHOUT ROWID
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_post_hashtags_tag ON post_hashtags (tag, post_id)')
+                
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS post_mentions (
+                        post_id INTEGER NOT NULL,
+                        handle TEXT NOT NULL,
+                        PRIMARY KEY (post_id, handle),
+                        FOREIGN KEY (post_id) REFERENCES post_data (id)
+                    ) WITHOUT ROWID
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_post_mentions_handle ON post_mentions (handle, post_id)')
+                
+                # 다운로드된 미디어 파일 (SHA-256 콘텐츠 주소)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS media_files (
+                        sha256 TEXT PRIMARY KEY,
+                        path TEXT NOT NULL,
+                        size_bytes INTEGER,
+                        content_type TEXT,
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # 크롤링 대상 계정 목록 및 계정별 설정 (AccountRegistry)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS accounts (
+                        username TEXT PRIMARY KEY,
+                        enabled INTEGER NOT NULL DEFAULT 1,
+                        priority INTEGER NOT NULL DEFAULT 0,
+                        interval_hours REAL,
+                        max_posts INTEGER,
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    ) WITHOUT ROWID
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_accounts_enabled_priority ON accounts (enabled, priority)')
+                
+                # 캡션 압축용 zstd 사전 (post_data.payload_dict에서 참조, 추가만 됨)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS caption_dictionaries (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        data BLOB NOT NULL,
+                        sample_count INTEGER,
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # 새 게시물 변경 피드 (저장과 같은 트랜잭션에서 추가, seq는 삭제 후에도 재사용되지 않음)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS post_changes (
+                        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                        post_id INTEGER NOT NULL,
+                        username TEXT NOT NULL,
+                        change_type TEXT NOT NULL DEFAULT 'insert',
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # 게시물 재확인 일정 (재확인 모드에서만 게시물당 한 행, 기존 게시물은 처음 재확인 대상을 찾을 때 생성)
+                # 확인할 때마다 갱신되므로 증분 백업에서 제외하고 복원 시 삭제 기록으로 다시 맞춤
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS post_revisit (
+                        post_id INTEGER PRIMARY KEY,
+                        content_hash TEXT,
+                        checked_at TEXT,
+                        next_check_at TEXT NOT NULL,
+                        check_count INTEGER NOT NULL DEFAULT 0,
+                        deleted_at TEXT,
+                        FOREIGN KEY (post_id) REFERENCES post_data (id)
+                    )
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_post_revisit_due ON post_revisit (next_check_at) WHERE deleted_at IS NULL')
+                
+                # 게시물 수정/삭제 기록 (바뀐 필드의 이전/새 값만 저장, 추가만 됨)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS post_revisions (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        post_id INTEGER NOT NULL,
+                        revision_type TEXT NOT NULL,
+                        changes TEXT,
+                        content_hash TEXT,
+                        detected_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (post_id) REFERENCES post_data (id)
+                    )
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_post_revisions_post ON post_revisions (post_id, id)')
+                
+                # 프로필/참여 지표 시계열 (계정 지표는 post_id 0, 게시물 지표는 게시물 ID)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS metric_series (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        username TEXT NOT NULL,
+                        metric TEXT NOT NULL,
+                        post_id INTEGER NOT NULL DEFAULT 0,
+                        UNIQUE (username, metric, post_id)
+                    )
+                ''')
+                # 원본 표본 (정수 시각, 시계열당 시각별 한 행, TIMESERIES_RAW_RETENTION_DAYS 이후 삭제)
+                # id는 증분 백업에서 새 표본을 가리는 키
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS metric_samples (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        series_id INTEGER NOT NULL,
+                        ts INTEGER NOT NULL,
+                        value INTEGER NOT NULL,
+                        UNIQUE (series_id, ts)
+                    )
+                ''')
+                # 시간/일/주 단위 집계 (표본 저장과 같은 트랜잭션에서 갱신, 증분 백업에서 제외하고 복원 시 표본으로 다시 계산)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS metric_rollups (
+                        series_id INTEGER NOT NULL,
+                        resolution INTEGER NOT NULL,
+                        bucket INTEGER NOT NULL,
+                        sample_count INTEGER NOT NULL,
+                        value_sum INTEGER NOT NULL,
+                        value_min INTEGER NOT NULL,
+                        value_max INTEGER NOT NULL,
+                        last_ts INTEGER NOT NULL,
+                        last_value INTEGER NOT NULL,
+                        PRIMARY KEY (series_id, resolution, bucket)
+                    ) WITHOUT ROWID
+                ''')
+                
+                # 웹훅 전송 대기열 (변경 피드의 새 게시물을 묶은 배치, 전송되면 삭제, 실패 시 재시도 시간 기록)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS webhook_deliveries (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        endpoint TEXT NOT NULL,
+                        first_seq INTEGER NOT NULL,
+                        last_seq INTEGER NOT NULL,
+                        event_count INTEGER NOT NULL,
+                        payload TEXT NOT NULL,
+                        status TEXT NOT NULL DEFAULT 'pending',
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        next_attempt_at REAL NOT NULL,
+                        last_error TEXT,
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_due ON webhook_deliveries (status, next_attempt_at)')
+                
+                # 키-값 메타데이터 (계정 목록 변경 번호 등)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS metadata (
+                        key TEXT PRIMARY KEY,
+                        value
+                    ) WITHOUT ROWID
+                ''')
+                
+                # 기간별 태그 집계를 위한 게시 시간 인덱스
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_post_data_posted_at ON post_data (posted_at)')
+                
+                # 캡션/해시태그/멘션 전문 검색 인덱스
+                self._setup_search_index(cursor)
+                
+                self._migrate_schema(cursor, current_version)
+                
+                # 증분 백업이 담지 못하는 수정/삭제 감지 (테이블을 다시 만드는 마이그레이션 이후에 생성)
+                self._setup_rewrite_triggers(cursor)
+                if current_version:
+                    # 스키마 업그레이드는 기존 행을 바꿀 수 있으므로 다음 증분 백업을 전체 백업으로 전환
+                    self._mark_rewritten(cursor)
+                    self._bump_generation(cursor)
+                
+                cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
                 conn.commit()
                 
                 if db_exists:
@@ -81,12 +312,458 @@ class DataManager:
             self.logger.error(f"데이터베이스 설정 실패: {e}")
             raise
             
+    def _setup_search_index(self, cursor):
+        """
+        post_data에 대한 FTS5 전문 검색 인덱스 및 동기화 트리거 생성
+        
+        Args:
+            cursor: 데이터베이스 커서 (setup_database 트랜잭션)
+        """
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS post_fts USING fts5(
+                    caption, hashtags, mentions,
+                    content='post_data', content_rowid='id'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            # FTS5가 없는 SQLite 빌드에서는 LIKE 검색으로 대체
+            self.logger.warning(f"FTS5를 사용할 수 없어 전문 검색 인덱스를 생성하지 않습니다: {e}")
+            return
+            
+        # 압축 저장된 게시물(payload)은 DataManager가 원문으로 직접 색인하므로 트리거에서 제외
+        # (압축/해제만 하는 갱신은 텍스트가 같으므로 색인을 그대로 둠)
+        # 이전 스키마에서도 마이그레이션 중 트리거가 실행될 수 있으므로 참조하는 컬럼을 먼저 추가
+        self._add_column(cursor, 'post_data', 'payload', 'BLOB')
+        self._add_column(cursor, 'post_data', 'payload_dict', 'INTEGER')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS post_data_fts_insert AFTER INSERT ON post_data
+            WHEN new.payload IS NULL BEGIN
+                INSERT INTO post_fts (rowid, caption, hashtags, mentions)
+                VALUES (new.id, new.caption, new.hashtags, new.mentions);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS post_data_fts_delete AFTER DELETE ON post_data
+            WHEN old.payload IS NULL BEGIN
+                INSERT INTO post_fts (post_fts, rowid, caption, hashtags, mentions)
+                VALUES ('delete', old.id, old.caption, old.hashtags, old.mentions);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS post_data_fts_update AFTER UPDATE OF caption, hashtags, mentions ON post_data
+            WHEN old.payload IS NULL AND new.payload IS NULL BEGIN
+                INSERT INTO post_fts (post_fts, rowid, caption, hashtags, mentions)
+                VALUES ('delete', old.id, old.caption, old.hashtags, old.mentions);
+                INSERT INTO post_fts (rowid, caption, hashtags, mentions)
+                VALUES (new.id, new.caption, new.hashtags, new.mentions);
+            END
+        ''')
+        
+    def _setup_rewrite_triggers(self, cursor):
+        """
+        증분 백업 대상 테이블의 UPDATE/DELETE마다 metadata.rewrite_count를 올리는 트리거 생성
+        
+        증분 백업은 키가 워터마크보다 큰 새 행만 복사하므로, 이 값이 마지막 백업 이후 바뀌었으면
+        BackupManager가 증분 대신 전체 백업을 만듭니다. 보존 기간 삭제만 일어나는 테이블은
+        삭제를 세지 않습니다 (복원된 오래된 행은 다음 저장 때 다시 삭제됨).
+        """
+        from backup_manager import INCREMENTAL_KEYS, PRUNED_TABLES
+        
+        for table in INCREMENTAL_KEYS:
+            if not self._has_table(cursor, table):
+                continue
+            events = ('UPDATE',) if table in PRUNED_TABLES else ('UPDATE', 'DELETE')
+            for event in events:
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS {table}_rewrite_{event.lower()} AFTER {event} ON {table} BEGIN
+                        INSERT INTO metadata (key, value) VALUES ('rewrite_count', 1)
+                        ON CONFLICT(key) DO UPDATE SET value = value + 1;
+                    END
+                ''')
+                
+    def _mark_rewritten(self, cursor):
+        """기존 행이 바뀌었음을 기록 (다음 증분 백업을 전체 백업으로 전환)"""
+        cursor.execute('''
+            INSERT INTO metadata (key, value) VALUES ('rewrite_count', 1)
+            ON CONFLICT(key) DO UPDATE SET value = value + 1
+        ''')
+        
+    def _bump_generation(self, cursor, floor=0):
+        """
+        데이터 세대 증가 (조회 캐시 무효화, 변경과 같은 트랜잭션에서 호출)
+        
+        Args:
+            cursor: 데이터베이스 커서
+            floor (int): 이 값보다 큰 세대로 설정 (파일을 교체한 뒤 이전 세대 번호가 재사용되지 않도록)
+        """
+        cursor.execute('''
+            INSERT INTO metadata (key, value) VALUES ('data_generation', ? + 1)
+            ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value - 1) + 1
+        ''', (floor,))
+        
+    @staticmethod
+    def _read_generation(conn):
+        """현재 데이터 세대 (저장 경로가 바꿀 때마다 증가)"""
+        row = conn.execute("SELECT value FROM metadata WHERE key = 'data_generation'").fetchone()
+        return row[0] if row else 0
+        
+    def _current_generation(self):
+        """현재 데이터 세대 (데이터베이스가 없거나 읽을 수 없으면 0)"""
+        if not Path(self.db_path).exists():
+            return 0
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                return self._read_generation(conn)
+        except sqlite3.Error:
+            return 0
+        
+    def _cached(self, method, args, loader):
+        """
+        조회 캐시를 거쳐 loader 실행 (캐시가 비활성화되어 있으면 바로 실행)
+        
+        같은 연결에서 데이터 세대를 먼저 읽고 조회하므로, 캐시된 결과는 저장 경로가
+        세대를 올리는 즉시(다른 프로세스의 저장 포함) 무효화됩니다.
+        
+        Args:
+            method (str): 조회 메서드 이름
+            args (tuple): 조회 인자
+            loader (callable): 연결을 받아 결과를 반환하는 함수 (예외는 캐시하지 않음)
+            
+        Returns:
+            조회 결과
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            if self._query_cache is None:
+                return loader(conn)
+            generation = self._read_generation(conn)
+            return self._query_cache.get_or_load(method, args, generation, lambda: loader(conn))
+        
+    def _migrate_schema(self, cursor, from_version):
+        """
+        이전 스키마 버전의 데이터를 현재 스키마에 맞게 변환
+        
+        Args:
+            cursor: 데이터베이스 커서 (setup_database 트랜잭션)
+            from_version (int): 기존 PRAGMA user_version 값
+        """
+        if from_version < 2:
+            # 기존 히스토리로부터 계정별 통계 요약 채우기
+            cursor.execute('''
+                INSERT OR REPLACE INTO account_stats
+                (username, total_crawls, successful_crawls, failed_crawls, total_posts, last_crawl, last_new_post)
+                SELECT h.username,
+                       COUNT(*),
+                       SUM(h.status = 'SUCCESS'),
+                       SUM(h.status != 'SUCCESS'),
+                       (SELECT COUNT(*) FROM post_data p
+                        JOIN account_data a ON p.account_id = a.id
+                        WHERE a.username = h.username),
+                       MAX(h.crawled_at),
+                       (SELECT MAX(p.created_at) FROM post_data p
+                        JOIN account_data a ON p.account_id = a.id
+                        WHERE a.username = h.username)
+                FROM crawl_history h
+                GROUP BY h.username
+            ''')
+            if cursor.rowcount:
+                self.logger.info(f"계정별 통계 요약 {cursor.rowcount}개 계정 생성됨")
+                
+        if from_version < 3 and self._has_table(cursor, 'post_fts'):
+            # 기존 게시물로 전문 검색 인덱스 재구성
+            cursor.execute("INSERT INTO post_fts (post_fts) VALUES ('rebuild')")
+            self.logger.info("전문 검색 인덱스 재구성 완료")
+            
+        if from_version < 4:
+            # 기존 JSON 컬럼에서 해시태그/멘션 정규화 테이블 채우기
+            cursor.execute('''
+                INSERT OR IGNORE INTO post_hashtags (post_id, tag)
+                SELECT p.id, lower(ltrim(j.value, '#'))
+                FROM post_data p, json_each(p.hashtags) j
+                WHERE json_valid(p.hashtags) AND ltrim(j.value, '#') != ''
+            ''')
+            hashtag_count = cursor.rowcount
+            cursor.execute('''
+                INSERT OR IGNORE INTO post_mentions (post_id, handle)
+                SELECT p.id, lower(ltrim(j.value, '@'))
+                FROM post_data p, json_each(p.mentions) j
+                WHERE json_valid(p.mentions) AND ltrim(j.value, '@') != ''
+            ''')
+            if hashtag_count or cursor.rowcount:
+                self.logger.info(f"해시태그 {hashtag_count}개, 멘션 {cursor.rowcount}개 정규화 완료")
+                
+        if from_version < 5:
+            # 게시물 이미지와 다운로드된 미디어 파일 연결
+            self._add_column(cursor, 'post_data', 'image_sha256', 'TEXT')
+            
+        if from_version < 6:
+            # 유사 이미지 검색용 dHash 및 다중 인덱스 밴드
+            self._add_column(cursor, 'media_files', 'dhash', 'INTEGER')
+            for band in range(BAND_COUNT):
+                self._add_column(cursor, 'media_files', f'dhash_b{band}', 'INTEGER')
+                cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_media_files_dhash_b{band} ON media_files (dhash_b{band})')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_post_data_image_sha256 ON post_data (image_sha256)')
+            
+        if from_version < 7:
+            # 계정별 게시물 조회(get_latest_posts, get_new_posts_count)가 post_data 전체를 읽지 않도록 인덱스 추가
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_account_data_username ON account_data (username)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_post_data_account_created ON post_data (account_id, created_at)')
+            
+        if from_version < 9:
+            # 게시물을 shortcode에서 변환한 정수 미디어 ID로 식별 (URL 표기가 달라도 같은 게시물로 처리)
+            self._add_column(cursor, 'post_data', 'media_id', 'INTEGER')
+            self._canonicalize_post_urls(cursor)
+            self._drop_post_url_unique(cursor)
+            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_post_data_media_id ON post_data (media_id)')
+            # 미디어 ID로 변환할 수 없는 게시물(긴 shortcode 등)만 주소로 구분
+            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_post_data_unkeyed_url ON post_data (post_url) WHERE media_id IS NULL')
+            
+        if from_version < 10:
+            # 캡션/해시태그/멘션 압축 저장 컬럼 및 압축 행을 제외하는 전문 검색 트리거
+            self._add_column(cursor, 'post_data', 'payload', 'BLOB')
+            self._add_column(cursor, 'post_data', 'payload_dict', 'INTEGER')
+            if self._has_table(cursor, 'post_fts'):
+                for trigger in ('post_data_fts_insert', 'post_data_fts_delete', 'post_data_fts_update'):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                self._setup_search_index(cursor)
+                
+        if from_version < 11:
+            # 기존 게시물을 저장 순서대로 변경 피드에 추가 (소비자가 seq 0부터 전체를 받을 수 있도록)
+            cursor.execute('''
+                INSERT INTO post_changes (post_id, username, change_type, created_at)
+                SELECT p.id, a.username, 'insert', p.created_at
+                FROM post_data p
+                JOIN account_data a ON p.account_id = a.id
+                ORDER BY p.id
+            ''')
+            
+        if from_version < 16:
+            # 이전 버전이 모든 게시물에 미리 만든 재확인 일정 정리 (한 번도 확인하지 않은 일정은 필요할 때 다시 생성)
+            cursor.execute('DELETE FROM post_revisit WHERE check_count = 0 AND deleted_at IS NULL')
+            
+        if from_version < 17:
+            # 증분 백업이 새 표본만 복사할 수 있도록 지표 표본에 증가하는 ID 추가
+            self._add_metric_sample_ids(cursor)
+            
+        if from_version < 18:
+            # 이전 버전의 게시물 중복 제거가 남긴 통계 요약의 게시물 수 보정
+            self._recount_account_posts(cursor)
+            
+        if from_version < 19:
+            # 계정별 크롤링 간격은 실패한 크롤링을 제외한 마지막 성공 시간 기준
+            self._add_column(cursor, 'account_stats', 'last_success', 'TEXT')
+            cursor.execute('''
+                UPDATE account_stats SET last_success = (
+                    SELECT MAX(h.crawled_at) FROM crawl_history h
+                    WHERE h.username = account_stats.username AND h.status = 'SUCCESS'
+                )
+            ''')
+            
+    def _canonicalize_post_urls(self, cursor):
+        """
+        기존 게시물 주소 정규화 및 미디어 ID 채우기 (같은 게시물의 중복 행은 먼저 저장된 행만 유지)
+        
+        Args:
+            cursor: 데이터베이스 커서 (setup_database 트랜잭션)
+        """
+        cursor.execute("SELECT id, post_url FROM post_data ORDER BY id")
+        seen = set()
+        duplicates = []
+        updates = []
+        for post_id, post_url in cursor.fetchall():
+            canonical_url, media_id = canonicalize_post_url(post_url)
+            key = media_id if media_id is not None else canonical_url
+            if key in seen:
+                duplicates.append((post_id,))
+                continue
+            seen.add(key)
+            updates.append((canonical_url, media_id, post_id))
+            
+        if duplicates:
+            cursor.executemany("DELETE FROM post_hashtags WHERE post_id = ?", duplicates)
+            cursor.executemany("DELETE FROM post_mentions WHERE post_id = ?", duplicates)
+            cursor.executemany("DELETE FROM post_data WHERE id = ?", duplicates)
+            self._recount_account_posts(cursor)
+            self.logger.info(f"같은 게시물의 중복 행 {len(duplicates)}개 삭제됨")
+        cursor.executemany("UPDATE post_data SET post_url = ?, media_id = ? WHERE id = ?", updates)
+        if updates:
+            self.logger.info(f"게시물 {len(updates)}개 주소 정규화 완료")
+            
+    def _recount_account_posts(self, cursor):
+        """통계 요약의 계정별 게시물 수를 post_data로 다시 계산"""
+        cursor.execute('''
+            UPDATE account_stats SET total_posts = (
+                SELECT COUNT(*) FROM post_data p
+                JOIN account_data a ON p.account_id = a.id
+                WHERE a.username = account_stats.username
+            )
+        ''')
+        
+    def _drop_post_url_unique(self, cursor):
+        """
+        post_data.post_url의 UNIQUE 제약(긴 텍스트 인덱스) 제거
+        
+        SQLite는 제약을 바로 삭제할 수 없으므로 같은 행 ID로 테이블을 다시 만들고
+        인덱스와 전문 검색 트리거를 다시 생성합니다 (post_fts는 행 ID가 같으므로 그대로 사용).
+        
+        Args:
+            cursor: 데이터베이스 커서 (setup_database 트랜잭션)
+        """
+        cursor.execute("PRAGMA index_list(post_data)")
+        if not any(row[3] == 'u' for row in cursor.fetchall()):
+            return
+            
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'post_data'")
+        table_sql = cursor.fetchone()[0]
+        table_sql = re.sub(r'post_url\s+TEXT\s+UNIQUE\s+NOT\s+NULL', 'post_url TEXT NOT NULL', table_sql, flags=re.IGNORECASE)
+        table_sql = re.sub(r'^CREATE TABLE\s+"?post_data"?', 'CREATE TABLE post_data_rebuild', table_sql, flags=re.IGNORECASE)
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'post_data' AND sql IS NOT NULL")
+        index_sql = [row[0] for row in cursor.fetchall()]
+        
+        cursor.execute(table_sql)
+        cursor.execute("INSERT INTO post_data_rebuild SELECT * FROM post_data")
+        cursor.execute("DROP TABLE post_data")
+        cursor.execute("ALTER TABLE post_data_rebuild RENAME TO post_data")
+        for sql in index_sql:
+            cursor.execute(sql)
+        self._setup_search_index(cursor)
+        self.logger.info("게시물 주소 UNIQUE 인덱스 제거 완료")
+        
+    def _add_metric_sample_ids(self, cursor):
+        """
+        WITHOUT ROWID였던 metric_samples를 id 키가 있는 테이블로 다시 만들기 (시각 순으로 ID 부여)
+        
+        Args:
+            cursor: 데이터베이스 커서 (setup_database 트랜잭션)
+        """
+        cursor.execute("PRAGMA table_info(metric_samples)")
+        if 'id' in [row[1] for row in cursor.fetchall()]:
+            return
+            
+        cursor.execute('''
+            CREATE TABLE metric_samples_rebuild (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                series_id INTEGER NOT NULL,
+                ts INTEGER NOT NULL,
+                value INTEGER NOT NULL,
+                UNIQUE (series_id, ts)
+            )
+        ''')
+        cursor.execute('''
+            INSERT INTO metric_samples_rebuild (series_id, ts, value)
+            SELECT series_id, ts, value FROM metric_samples ORDER BY ts, series_id
+        ''')
+        cursor.execute("DROP TABLE metric_samples")
+        cursor.execute("ALTER TABLE metric_samples_rebuild RENAME TO metric_samples")
+        self.logger.info("지표 표본 ID 추가 완료")
+        
+    def _add_column(self, cursor, table, column, definition):
+        """컬럼이 없을 때만 추가"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            
+    def _has_table(self, cursor, name):
+        """테이블(가상 테이블 포함) 존재 여부 확인"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,))
+        return cursor.fetchone() is not None
+        
+    def _find_post_id(self, cursor, post_url, media_id):
+        """정규화된 게시물의 ID 조회 (미디어 ID가 있으면 정수 인덱스 사용)"""
+        if media_id is not None:
+            cursor.execute('SELECT id FROM post_data WHERE media_id = ?', (media_id,))
+        else:
+            cursor.execute('SELECT id FROM post_data WHERE post_url = ? AND media_id IS NULL', (post_url,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+        
+    def _decode_posts(self, posts):
+        """
+        압축 저장된 게시물의 캡션/해시태그/멘션 복원 (payload, payload_dict 키는 제거)
+        
+        Args:
+            posts (list): post_data 조회 결과 dict 목록
+            
+        Returns:
+            list: 같은 목록 (각 dict를 직접 수정)
+        """
+        for post in posts:
+            payload = post.pop('payload', None)
+            payload_dict = post.pop('payload_dict', None)
+            if not isinstance(payload, (bytes, memoryview)):
+                continue
+            caption, hashtags, mentions = self.codec.decode_columns(payload, payload_dict)
+            post['caption'] = caption
+            if 'hashtags' in post:
+                post['hashtags'] = hashtags
+            if 'mentions' in post:
+                post['mentions'] = mentions
+        return posts
+        
+    def filter_new_post_urls(self, post_urls):
+        """
+        아직 저장되지 않은 게시물 주소만 반환 (같은 게시물의 다른 표기는 처음 나온 주소 하나로 합침)
+        
+        정규화된 주소/미디어 ID는 중복 판단에만 사용하고, 반환하는 주소는 크롤링된 원래 주소이므로
+        INSTAGRAM_BASE_URL을 바꾼 환경(오프라인 벤치마크 등)에서도 같은 서버의 게시물 페이지로 이동합니다.
+        
+        Args:
+            post_urls (list): 크롤링된 게시물 주소 목록
+            
+        Returns:
+            list: 새 게시물의 원래 주소 목록 (원래 순서 유지, 조회 실패 시 전체)
+        """
+        # 정규화된 주소 -> (원래 주소, 미디어 ID)
+        candidates = {}
+        for post_url in post_urls:
+            canonical_url, media_id = canonicalize_post_url(post_url)
+            candidates.setdefault(canonical_url, (post_url, media_id))
+        if not candidates:
+            return []
+            
+        media_ids = [media_id for _, media_id in candidates.values() if media_id is not None]
+        unkeyed_urls = [url for url, (_, media_id) in candidates.items() if media_id is None]
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                existing_ids = set()
+                existing_urls = set()
+                if media_ids:
+                    cursor.execute(
+                        f"SELECT media_id FROM post_data WHERE media_id IN ({', '.join('?' * len(media_ids))})",
+                        media_ids
+                    )
+                    existing_ids = {row[0] for row in cursor.fetchall()}
+                if unkeyed_urls:
+                    cursor.execute(
+                        f"SELECT post_url FROM post_data WHERE media_id IS NULL AND post_url IN ({', '.join('?' * len(unkeyed_urls))})",
+                        unkeyed_urls
+                    )
+                    existing_urls = {row[0] for row in cursor.fetchall()}
+        except Exception as e:
+            self.logger.warning(f"중복 체크 실패: {e}")
+            # 오류 발생 시 안전하게 모두 포함
+            return [post_url for post_url, _ in candidates.values()]
+            
+        return [
+            post_url for url, (post_url, media_id) in candidates.items()
+            if (media_id not in existing_ids if media_id is not None else url not in existing_urls)
+        ]
+            
+    @traced()
     def save_crawl_data(self, crawl_result):
         """
         크롤링 결과를 데이터베이스에 저장
         
+        저장에 성공하면 실제로 새로 저장된 게시물 수(중복, 저장 실패 제외)를
+        crawl_result['new_posts_count']에, 다시 확인한 게시물(revisited_posts)의
+        결과별 수를 crawl_result['revisit_counts']에 기록합니다.
+        
         Args:
             crawl_result (dict): 크롤링 결과 데이터
+            
+        Returns:
+            bool: 저장 성공 여부
         """
         if not crawl_result:
             self.logger.warning("저장할 데이터가 없습니다.")
@@ -108,48 +785,148 @@ class DataManager:
                 
                 account_id = cursor.lastrowid
                 
+                # 프로필 지표 시계열 (팔로워, 팔로우, 게시물 수)
+                sample_ts = to_timestamp(crawl_result['crawled_at'])
+                self._record_metrics(cursor, crawl_result['username'], 0, crawl_result.get('profile') or {}, sample_ts)
+                
+                # 압축 저장 시 전문 검색 색인은 원문으로 직접 추가
+                compress = self._compress_captions()
+                index_directly = compress and self._has_table(cursor, 'post_fts')
+                
                 # 게시물 정보 저장 (새로운 게시글만)
+                now = datetime.now()
                 new_posts_count = 0
                 for post in crawl_result.get('recent_posts', []):
+                    # 게시물과 태그, 변경 피드, 지표, 재확인 일정을 함께 저장하거나 모두 되돌림
+                    cursor.execute('SAVEPOINT post')
                     try:
-                        # 게시물 URL이 이미 존재하는지 확인
-                        cursor.execute('SELECT id FROM post_data WHERE post_url = ?', (post['post_url'],))
-                        existing_post = cursor.fetchone()
+                        # 같은 게시물(미디어 ID 또는 정규화된 주소)이 이미 존재하는지 확인
+                        post_url, media_id = canonicalize_post_url(post['post_url'])
+                        existing_post = self._find_post_id(cursor, post_url, media_id)
                         
                         if not existing_post:
+                            # 다운로드된 이미지 기록 (같은 이미지는 한 번만 저장)
+                            media = post.get('media')
+                            if media:
+                                self._insert_media_file(cursor, media)
+                            
+                            caption = post['caption']
+                            hashtags = json.dumps(post['hashtags'], ensure_ascii=False)
+                            mentions = json.dumps(post['mentions'], ensure_ascii=False)
+                            payload, payload_dict = None, None
+                            if compress:
+                                payload, payload_dict = self.codec.encode(post['caption'], post['hashtags'], post['mentions'])
+                                
                             # 새로운 게시글인 경우에만 저장
                             cursor.execute('''
                                 INSERT INTO post_data 
                                 (account_id, post_url, post_number, image_url, caption, 
-                                 posted_at, hashtags, mentions, timestamp)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                 posted_at, hashtags, mentions, timestamp, image_sha256, media_id,
+                                 payload, payload_dict)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                             ''', (
                                 account_id, 
-                                post['post_url'],
+                                post_url,
                                 post['post_number'], 
                                 post['image_url'], 
-                                post['caption'],
+                                None if compress else caption,
                                 post['posted_at'],
-                                json.dumps(post['hashtags'], ensure_ascii=False),
-                                json.dumps(post['mentions'], ensure_ascii=False),
-                                post['timestamp']
+                                None if compress else hashtags,
+                                None if compress else mentions,
+                                post['timestamp'],
+                                media['sha256'] if media else None,
+                                media_id,
+                                payload,
+                                payload_dict
                             ))
+                            post_id = cursor.lastrowid
+                            
+                            if index_directly:
+                                cursor.execute(
+                                    'INSERT INTO post_fts (rowid, caption, hashtags, mentions) VALUES (?, ?, ?, ?)',
+                                    (post_id, caption, hashtags, mentions)
+                                )
+                            
+                            # 해시태그/멘션 정규화 테이블 저장
+                            cursor.executemany(
+                                'INSERT OR IGNORE INTO post_hashtags (post_id, tag) VALUES (?, ?)',
+                                [(post_id, tag) for tag in self._normalize_tags(post['hashtags'], '#')]
+                            )
+                            cursor.executemany(
+                                'INSERT OR IGNORE INTO post_mentions (post_id, handle) VALUES (?, ?)',
+                                [(post_id, handle) for handle in self._normalize_tags(post['mentions'], '@')]
+                            )
+                            
+                            # 변경 피드 기록 (같은 트랜잭션이므로 커밋된 게시물만 소비자에게 보임)
+                            cursor.execute(
+                                'INSERT INTO post_changes (post_id, username, change_type) VALUES (?, ?, ?)',
+                                (post_id, crawl_result['username'], 'insert')
+                            )
+                            
+                            # 게시물 참여 지표 (좋아요, 댓글 수)
+                            self._record_metrics(cursor, crawl_result['username'], post_id, self._engagement(post), sample_ts)
+                            
+                            # 재확인 일정 (재확인 모드에서만, 최근 게시물일수록 빨리 다시 확인)
+                            if Config.REVISIT_ENABLED:
+                                cursor.execute(
+                                    'INSERT INTO post_revisit (post_id, content_hash, checked_at, next_check_at) VALUES (?, ?, ?, ?)',
+                                    (
+                                        post_id,
+                                        content_hash(caption, post['image_url'], post['posted_at']),
+                                        now.isoformat(timespec='seconds'),
+                                        self._next_check_at(post['posted_at'], now)
+                                    )
+                                )
                             new_posts_count += 1
                         else:
-                            self.logger.info(f"게시물 이미 존재함: {post['post_url']}")
+                            self.logger.info(f"게시물 이미 존재함: {post_url}")
                             
                     except Exception as e:
+                        cursor.execute('ROLLBACK TO post')
                         self.logger.warning(f"게시물 저장 실패: {e}")
+                    cursor.execute('RELEASE post')
                 
                 self.logger.info(f"새로운 게시물 {new_posts_count}개 저장됨")
                 
+                # 다시 확인한 기존 게시물의 수정/삭제 기록 (게시물별로 적용하거나 모두 되돌림)
+                revisit_counts = {}
+                if crawl_result.get('revisited_posts'):
+                    has_search_index = self._has_table(cursor, 'post_fts')
+                    for post in crawl_result['revisited_posts']:
+                        cursor.execute('SAVEPOINT revisit')
+                        try:
+                            outcome = self._save_revisit(cursor, crawl_result['username'], post, now, has_search_index, sample_ts)
+                            revisit_counts[outcome] = revisit_counts.get(outcome, 0) + 1
+                        except Exception as e:
+                            cursor.execute('ROLLBACK TO revisit')
+                            self.logger.warning(f"게시물 재확인 결과 저장 실패: {e}")
+                        cursor.execute('RELEASE revisit')
+                    self.logger.info(f"게시물 재확인 결과: {revisit_counts}")
+                
                 # 크롤링 성공 기록
                 cursor.execute('''
                     INSERT INTO crawl_history (username, status, crawled_at)
                     VALUES (?, ?, ?)
                 ''', (crawl_result['username'], 'SUCCESS', crawl_result['crawled_at']))
                 
+                # 계정별 통계 요약 갱신 (같은 트랜잭션)
+                cursor.execute('''
+                    INSERT INTO account_stats
+                    (username, total_crawls, successful_crawls, total_posts, last_crawl, last_new_post, last_success)
+                    VALUES (?, 1, 1, ?, ?, CASE WHEN ? > 0 THEN CURRENT_TIMESTAMP END, ?)
+                    ON CONFLICT(username) DO UPDATE SET
+                        total_crawls = total_crawls + 1,
+                        successful_crawls = successful_crawls + 1,
+                        total_posts = total_posts + excluded.total_posts,
+                        last_crawl = MAX(COALESCE(last_crawl, ''), excluded.last_crawl),
+                        last_new_post = COALESCE(excluded.last_new_post, last_new_post),
+                        last_success = MAX(COALESCE(last_success, ''), excluded.last_success)
+                ''', (crawl_result['username'], new_posts_count, crawl_result['crawled_at'], new_posts_count, crawl_result['crawled_at']))
+                
+                self._bump_generation(cursor)
                 conn.commit()
+                crawl_result['new_posts_count'] = new_posts_count
+                crawl_result['revisit_counts'] = revisit_counts
                 self.logger.info(f"데이터 저장 완료: {crawl_result['username']}")
                 return True
                 
@@ -158,15 +935,255 @@ class DataManager:
             self._record_crawl_error(crawl_result['username'], str(e))
             return False
             
+    def _next_check_at(self, posted_at, now):
+        """게시 시간 기준 다음 재확인 시각 (ISO 형식 문자열)"""
+        interval = revisit_interval(
+            posted_at, now, Config.REVISIT_AGE_FACTOR, Config.REVISIT_MIN_HOURS, Config.REVISIT_MAX_DAYS
+        )
+        return (now + interval).isoformat(timespec='seconds')
+        
+    def _save_revisit(self, cursor, username, post, now, has_search_index, sample_ts):
+        """
+        다시 확인한 게시물을 저장된 내용과 비교하여 바뀐 필드만 수정 기록으로 저장
+        
+        내용 해시가 같으면 재확인 일정만 갱신하므로 post_data는 수정되지 않습니다.
+        이미지 주소와 게시 시간은 추출에 실패하면(None) 기존 값으로 간주합니다.
+        
+        Args:
+            cursor: 데이터베이스 커서 (save_crawl_data 트랜잭션)
+            username (str): 계정 사용자명
+            post (dict): 다시 추출한 게시물 정보 (삭제된 게시물은 deleted=True)
+            now (datetime): 확인 시각
+            has_search_index (bool): 전문 검색 색인 사용 여부
+            sample_ts (int): 참여 지표 표본 시각 (유닉스 시각)
+            
+        Returns:
+            str: 'unchanged', 'edited', 'deleted', 'missing'(저장되지 않은 게시물) 중 하나
+        """
+        post_url, media_id = canonicalize_post_url(post['post_url'])
+        post_id = self._find_post_id(cursor, post_url, media_id)
+        if not post_id:
+            return 'missing'
+            
+        cursor.execute('''
+            SELECT p.caption, p.hashtags, p.mentions, p.payload, p.payload_dict, p.image_url, p.posted_at, r.content_hash
+            FROM post_data p
+            LEFT JOIN post_revisit r ON r.post_id = p.id
+            WHERE p.id = ?
+        ''', (post_id,))
+        row = cursor.fetchone()
+        stored = {'caption': self._post_text(row[:5])[0], 'image_url': row[5], 'posted_at': row[6]}
+        stored_hash = row[7] or content_hash(**stored)
+        checked_at = now.isoformat(timespec='seconds')
+        
+        if post.get('deleted'):
+            # 게시물 행은 남기고 삭제 표시만 기록 (이후 재확인 대상에서 제외)
+            cursor.execute(
+                "INSERT INTO post_revisions (post_id, revision_type, content_hash) VALUES (?, 'deleted', ?)",
+                (post_id, stored_hash)
+            )
+            cursor.execute(
+                "INSERT INTO post_changes (post_id, username, change_type) VALUES (?, ?, 'delete')",
+                (post_id, username)
+            )
+            self._update_revisit(cursor, post_id, stored_hash, checked_at, None, checked_at)
+            return 'deleted'
+            
+        current = {
+            'caption': post.get('caption'),
+            'image_url': post.get('image_url') or stored['image_url'],
+            'posted_at': post.get('posted_at') or stored['posted_at']
+        }
+        new_hash = content_hash(**current)
+        outcome = 'unchanged'
+        if new_hash != stored_hash:
+            changes = {
+                field: [stored[field], current[field]] for field in CONTENT_FIELDS
+                if (image_key(stored[field]) != image_key(current[field]) if field == 'image_url' else stored[field] != current[field])
+            }
+            self._update_post_content(cursor, post_id, row, current, post.get('hashtags') or [], post.get('mentions') or [], has_search_index)
+            cursor.execute(
+                "INSERT INTO post_revisions (post_id, revision_type, changes, content_hash) VALUES (?, 'edited', ?, ?)",
+                (post_id, json.dumps(changes, ensure_ascii=False), new_hash)
+            )
+            cursor.execute(
+                "INSERT INTO post_changes (post_id, username, change_type) VALUES (?, ?, 'update')",
+                (post_id, username)
+            )
+            outcome = 'edited'
+            
+        self._update_revisit(cursor, post_id, new_hash, checked_at, self._next_check_at(current['posted_at'], now), None)
+        self._record_metrics(cursor, username, post_id, self._engagement(post), sample_ts)
+        return outcome
+        
+    def _update_revisit(self, cursor, post_id, post_hash, checked_at, next_check_at, deleted_at):
+        """재확인 결과로 게시물의 재확인 일정 갱신"""
+        cursor.execute('''
+            INSERT INTO post_revisit (post_id, content_hash, checked_at, next_check_at, check_count, deleted_at)
+            VALUES (?, ?, ?, ?, 1, ?)
+            ON CONFLICT(post_id) DO UPDATE SET
+                content_hash = excluded.content_hash,
+                checked_at = excluded.checked_at,
+                next_check_at = excluded.next_check_at,
+                check_count = check_count + 1,
+                deleted_at = excluded.deleted_at
+        ''', (post_id, post_hash, checked_at, next_check_at or checked_at, deleted_at))
+        
+    def _update_post_content(self, cursor, post_id, row, current, hashtags, mentions, has_search_index):
+        """
+        수정된 게시물 내용 저장 (현재 압축 설정 적용, 해시태그/멘션 정규화 테이블과 전문 검색 색인 갱신)
+        
+        Args:
+            cursor: 데이터베이스 커서 (save_crawl_data 트랜잭션)
+            post_id (int): 게시물 ID
+            row (tuple): 기존 (caption, hashtags, mentions, payload, payload_dict, ...) 행
+            current (dict): 새 caption, image_url, posted_at
+            hashtags (list): 새 해시태그 목록
+            mentions (list): 새 멘션 목록
+            has_search_index (bool): 전문 검색 색인 사용 여부
+        """
+        caption = current['caption']
+        hashtags_json = json.dumps(hashtags, ensure_ascii=False)
+        mentions_json = json.dumps(mentions, ensure_ascii=False)
+        compress = self._compress_captions()
+        payload, payload_dict = None, None
+        if compress:
+            payload, payload_dict = self.codec.encode(caption, hashtags, mentions)
+            
+        # 원문 행끼리의 수정만 트리거가 색인하므로, 압축 행이 관련되면 색인을 직접 갱신
+        index_directly = has_search_index and (row[3] is not None or compress)
+        if index_directly:
+            old_text = row[:3] if row[3] is None else self.codec.decode_columns(row[3], row[4])
+            cursor.execute(
+                "INSERT INTO post_fts (post_fts, rowid, caption, hashtags, mentions) VALUES ('delete', ?, ?, ?, ?)",
+                (post_id, *old_text)
+            )
+            
+        cursor.execute('''
+            UPDATE post_data SET caption = ?, hashtags = ?, mentions = ?, payload = ?, payload_dict = ?,
+                                 image_url = ?, posted_at = ?
+            WHERE id = ?
+        ''', (
+            None if compress else caption,
+            None if compress else hashtags_json,
+            None if compress else mentions_json,
+            payload,
+            payload_dict,
+            current['image_url'],
+            current['posted_at'],
+            post_id
+        ))
+        
+        if index_directly:
+            cursor.execute(
+                'INSERT INTO post_fts (rowid, caption, hashtags, mentions) VALUES (?, ?, ?, ?)',
+                (post_id, caption, hashtags_json, mentions_json)
+            )
+            
+        cursor.execute('DELETE FROM post_hashtags WHERE post_id = ?', (post_id,))
+        cursor.execute('DELETE FROM post_mentions WHERE post_id = ?', (post_id,))
+        cursor.executemany(
+            'INSERT OR IGNORE INTO post_hashtags (post_id, tag) VALUES (?, ?)',
+            [(post_id, tag) for tag in self._normalize_tags(hashtags, '#')]
+        )
+        cursor.executemany(
+            'INSERT OR IGNORE INTO post_mentions (post_id, handle) VALUES (?, ?)',
+            [(post_id, handle) for handle in self._normalize_tags(mentions, '@')]
+        )
+        
+    @staticmethod
+    def _engagement(post):
+        """게시물 정보에서 참여 지표 (좋아요, 댓글 수)"""
+        return {'likes': post.get('likes'), 'comments': post.get('comments')}
+        
+    def _record_metrics(self, cursor, username, post_id, values, ts):
+        """
+        지표 표본 저장 및 시간/일/주 집계 갱신 (보존 기간이 지난 원본 표본과 시간 단위 집계는 삭제)
+        
+        같은 시계열에 같은 시각의 표본이 이미 있으면 무시하므로 집계가 중복되지 않습니다.
+        
+        Args:
+            cursor: 데이터베이스 커서 (save_crawl_data 트랜잭션)
+            username (str): 계정 사용자명
+            post_id (int): 게시물 ID (계정 지표는 0)
+            values (dict): 지표 이름 -> 값 (None인 지표는 건너뜀)
+            ts (int): 표본 시각 (유닉스 시각)
+        """
+        for metric, value in values.items():
+            if value is None:
+                continue
+            cursor.execute(
+                'INSERT OR IGNORE INTO metric_series (username, metric, post_id) VALUES (?, ?, ?)',
+                (username, metric, post_id)
+            )
+            cursor.execute(
+                'SELECT id FROM metric_series WHERE username = ? AND metric = ? AND post_id = ?',
+                (username, metric, post_id)
+            )
+            series_id = cursor.fetchone()[0]
+            cursor.execute('INSERT OR IGNORE INTO metric_samples (series_id, ts, value) VALUES (?, ?, ?)', (series_id, ts, value))
+            if not cursor.rowcount:
+                continue
+            cursor.executemany(ROLLUP_UPSERT_SQL, rollup_rows(series_id, ts, value))
+            cursor.execute(
+                'DELETE FROM metric_samples WHERE series_id = ? AND ts < ?',
+                (series_id, ts - Config.TIMESERIES_RAW_RETENTION_DAYS * 86400)
+            )
+            cursor.execute(
+                'DELETE FROM metric_rollups WHERE series_id = ? AND resolution = ? AND bucket < ?',
+                (series_id, RESOLUTIONS['hour'], ts - Config.TIMESERIES_HOURLY_RETENTION_DAYS * 86400)
+            )
+            
+    def _insert_media_file(self, cursor, media):
+        """다운로드된 미디어 파일 기록 (이미 있으면 무시)"""
+        dhash = media.get('dhash')
+        bands = split_bands(dhash) if dhash is not None else [None] * BAND_COUNT
+        band_columns = ', '.join(f'dhash_b{band}' for band in range(BAND_COUNT))
+        cursor.execute(f'''
+            INSERT OR IGNORE INTO media_files
+            (sha256, path, size_bytes, content_type, dhash, {band_columns})
+            VALUES (?, ?, ?, ?, ?, {', '.join('?' * BAND_COUNT)})
+        ''', (
+            media['sha256'],
+            media['path'],
+            media['size_bytes'],
+            media['content_type'],
+            to_signed(dhash) if dhash is not None else None,
+            *bands
+        ))
+        
+    @staticmethod
+    def _normalize_tags(values, prefix):
+        """해시태그/멘션을 접두어 없는 소문자로 정규화 (중복 제거)"""
+        normalized = []
+        for value in values or []:
+            tag = value.lstrip(prefix).lower()
+            if tag and tag not in normalized:
+                normalized.append(tag)
+        return normalized
+        
+    @traced()
     def _record_crawl_error(self, username, error_message):
         """크롤링 오류 기록"""
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
+                crawled_at = datetime.now().isoformat()
                 cursor.execute('''
                     INSERT INTO crawl_history (username, status, crawled_at, error_message)
                     VALUES (?, ?, ?, ?)
-                ''', (username, 'ERROR', datetime.now().isoformat(), error_message))
+                ''', (username, 'ERROR', crawled_at, error_message))
+                
+                # 계정별 통계 요약 갱신 (같은 트랜잭션)
+                cursor.execute('''
+                    INSERT INTO account_stats (username, total_crawls, failed_crawls, last_crawl)
+                    VALUES (?, 1, 1, ?)
+                    ON CONFLICT(username) DO UPDATE SET
+                        total_crawls = total_crawls + 1,
+                        failed_crawls = failed_crawls + 1,
+                        last_crawl = MAX(COALESCE(last_crawl, ''), excluded.last_crawl)
+                ''', (username, crawled_at))
+                self._bump_generation(cursor)
                 conn.commit()
         except Exception as e:
             self.logger.error(f"오류 기록 실패: {e}")
@@ -183,6 +1200,7 @@ class DataManager:
             list: 크롤링 히스토리 목록
         """
         try:
+            import pandas as pd
             with sqlite3.connect(self.db_path) as conn:
                 query = '''
                     SELECT * FROM account_data 
@@ -196,32 +1214,83 @@ class DataManager:
             self.logger.error(f"히스토리 조회 실패: {e}")
             return []
             
-    def get_follower_trend(self, username, days=30):
+    def get_metric_trend(self, username, metric, days=30, resolution=None, post_url=None):
         """
-        팔로워 수 변화 추이 조회
+        지표 시계열 조회 (기간에 맞는 집계 단위 사용, 오래된 순)
         
         Args:
-            username (str): 조회할 사용자명
+            username (str): 계정 사용자명
+            metric (str): 지표 이름 (followers, following, posts / 게시물 지표는 likes, comments)
             days (int): 조회할 일수
+            resolution (str): 'raw', 'hour', 'day', 'week' (None이면 기간에 따라 선택)
+            post_url (str): 게시물 주소 (게시물 지표 조회 시)
             
         Returns:
-            list: 팔로워 수 변화 데이터
+            list: 구간별 {'time', 'value'(마지막 값), 'min', 'max', 'avg', 'samples'} 목록
+                  (원본 표본은 {'time', 'value'}, 조회 실패 시 빈 목록)
         """
         try:
+            resolution = resolution or choose_resolution(days)
+            since = int(datetime.now().timestamp()) - days * 86400
             with sqlite3.connect(self.db_path) as conn:
-                query = '''
-                    SELECT crawled_at, followers 
-                    FROM account_data 
-                    WHERE username = ? 
-                    AND crawled_at >= datetime('now', '-{} days')
-                    ORDER BY crawled_at ASC
-                '''.format(days)
-                df = pd.read_sql_query(query, conn, params=(username,))
-                return df.to_dict('records')
+                cursor = conn.cursor()
+                post_id = 0
+                if post_url:
+                    post_id = self._find_post_id(cursor, *canonicalize_post_url(post_url))
+                    if not post_id:
+                        return []
+                cursor.execute(
+                    'SELECT id FROM metric_series WHERE username = ? AND metric = ? AND post_id = ?',
+                    (username, metric, post_id)
+                )
+                row = cursor.fetchone()
+                if not row:
+                    return []
+                if resolution == 'raw':
+                    cursor.execute(
+                        'SELECT ts, value FROM metric_samples WHERE series_id = ? AND ts >= ? ORDER BY ts',
+                        (row[0], since)
+                    )
+                    return [{'time': datetime.fromtimestamp(ts).isoformat(), 'value': value} for ts, value in cursor.fetchall()]
+                    
+                seconds = RESOLUTIONS[resolution]
+                cursor.execute('''
+                    SELECT bucket, last_value, value_min, value_max, value_sum * 1.0 / sample_count, sample_count
+                    FROM metric_rollups
+                    WHERE series_id = ? AND resolution = ? AND bucket >= ?
+                    ORDER BY bucket
+                ''', (row[0], seconds, bucket_start(since, seconds)))
+                return [
+                    {
+                        'time': datetime.fromtimestamp(bucket).isoformat(),
+                        'value': last_value,
+                        'min': value_min,
+                        'max': value_max,
+                        'avg': avg,
+                        'samples': samples
+                    }
+                    for bucket, last_value, value_min, value_max, avg, samples in cursor.fetchall()
+                ]
         except Exception as e:
-            self.logger.error(f"팔로워 추이 조회 실패: {e}")
+            self.logger.error(f"지표 추이 조회 실패: {e}")
             return []
             
+    def get_follower_trend(self, username, days=30):
+        """
+        팔로워 수 변화 추이 조회
+        
+        Args:
+            username (str): 조회할 사용자명
+            days (int): 조회할 일수
+            
+        Returns:
+            list: 구간별 {'crawled_at', 'followers'} 목록 (구간의 마지막 값)
+        """
+        return [
+            {'crawled_at': point['time'], 'followers': point['value']}
+            for point in self.get_metric_trend(username, 'followers', days)
+        ]
+        
     def export_to_json(self, username, output_path=None):
         """
         특정 계정의 데이터를 JSON 파일로 내보내기
@@ -255,6 +1324,7 @@ class DataManager:
             self.logger.error(f"데이터 내보내기 실패: {e}")
             return False
             
+    @traced()
     def get_statistics(self):
         """
         전체 크롤링 통계 조회
@@ -262,57 +1332,81 @@ class DataManager:
         Returns:
             dict: 통계 정보
         """
+        try:
+            return self._cached('get_statistics', (), self._query_statistics)
+        except Exception as e:
+            self.logger.error(f"통계 조회 실패: {e}")
+            return {}
+            
+    def _query_statistics(self, conn):
+        """get_statistics 조회 (캐시 미적중 시)"""
+        cursor = conn.cursor()
+        
+        # 계정별 요약 테이블에서 한 번에 집계 (히스토리 크기와 무관)
+        cursor.execute('''
+            SELECT COUNT(CASE WHEN successful_crawls > 0 THEN 1 END),
+                   COALESCE(SUM(total_crawls), 0),
+                   COALESCE(SUM(successful_crawls), 0),
+                   MAX(last_crawl)
+            FROM account_stats
+        ''')
+        total_accounts, total_crawls, successful_crawls, last_crawl = cursor.fetchone()
+        
+        return {
+            'total_accounts': total_accounts,
+            'total_crawls': total_crawls,
+            'successful_crawls': successful_crawls,
+            'success_rate': (successful_crawls / total_crawls * 100) if total_crawls > 0 else 0,
+            'last_crawl': last_crawl
+        }
+            
+    @traced()
+    def get_account_statistics(self, username=None):
+        """
+        계정별 크롤링 통계 조회
+        
+        Args:
+            username (str): 조회할 사용자명 (None이면 전체 계정)
+            
+        Returns:
+            list: 계정별 통계 목록
+        """
         try:
             with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
+                if username:
+                    cursor.execute('SELECT * FROM account_stats WHERE username = ?', (username,))
+                else:
+                    cursor.execute('SELECT * FROM account_stats ORDER BY username')
                 
-                # 전체 계정 수
-                cursor.execute("SELECT COUNT(DISTINCT username) FROM account_data")
-                total_accounts = cursor.fetchone()[0]
-                
-                # 전체 크롤링 수
-                cursor.execute("SELECT COUNT(*) FROM crawl_history")
-                total_crawls = cursor.fetchone()[0]
-                
-                # 성공한 크롤링 수
-                cursor.execute("SELECT COUNT(*) FROM crawl_history WHERE status = 'SUCCESS'")
-                successful_crawls = cursor.fetchone()[0]
-                
-                # 최근 크롤링 시간
-                cursor.execute("SELECT MAX(crawled_at) FROM crawl_history")
-                last_crawl = cursor.fetchone()[0]
-                
-                return {
-                    'total_accounts': total_accounts,
-                    'total_crawls': total_crawls,
-                    'successful_crawls': successful_crawls,
-                    'success_rate': (successful_crawls / total_crawls * 100) if total_crawls > 0 else 0,
-                    'last_crawl': last_crawl
-                }
+                stats = []
+                for row in cursor.fetchall():
+                    item = dict(row)
+                    item['success_rate'] = (item['successful_crawls'] / item['total_crawls'] * 100) if item['total_crawls'] > 0 else 0
+                    stats.append(item)
+                return stats
                 
         except Exception as e:
-            self.logger.error(f"통계 조회 실패: {e}")
-            return {}
+            self.logger.error(f"계정별 통계 조회 실패: {e}")
+            return []
             
-    def backup_database(self, backup_path=None):
+    @traced()
+    def backup_database(self, backup_path=None, compression=None, incremental=False):
         """
-        데이터베이스 백업
+        데이터베이스 백업 (온라인 백업 API, 스트리밍 압축)
         
         Args:
-            backup_path (str): 백업 파일 경로 (None이면 자동 생성)
+            backup_path (str): 백업 파일 경로 (None이면 백업 디렉토리에 자동 생성 및 보관 정책 적용)
+            compression (str): 'gzip', 'zstd', 'none' (None이면 Config.BACKUP_COMPRESSION)
+            incremental (bool): 마지막 백업 이후 새 행만 백업
             
         Returns:
             str: 백업 파일 경로
         """
         try:
-            if not backup_path:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_path = f"backup_instagram_data_{timestamp}.db"
-            
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
-            self.logger.info(f"데이터베이스 백업 완료: {backup_path}")
-            return backup_path
+            from backup_manager import BackupManager
+            return BackupManager(self.db_path).create_backup(backup_path, compression, incremental)
             
         except Exception as e:
             self.logger.error(f"데이터베이스 백업 실패: {e}")
@@ -323,7 +1417,7 @@ class DataManager:
         데이터베이스 복원
         
         Args:
-            backup_path (str): 복원할 백업 파일 경로
+            backup_path (str): 복원할 백업 파일 경로 (.db, .db.gz, .db.zst, 증분 백업 가능)
             
         Returns:
             bool: 복원 성공 여부
@@ -335,10 +1429,24 @@ class DataManager:
                 
             # 현재 데이터베이스 백업
             current_backup = self.backup_database()
+            generation = self._current_generation()
             
             # 백업 파일로 복원
-            import shutil
-            shutil.copy2(backup_path, self.db_path)
+            from backup_manager import BackupManager
+            BackupManager(self.db_path).restore_backup(backup_path)
+            self._codec = None
+            
+            # 이전 스키마의 백업이면 현재 스키마로 변환
+            self.setup_database()
+            
+            # 증분 백업으로 추가된 압축 게시물은 트리거로 색인되지 않으므로 전문 검색 색인 재구성
+            with sqlite3.connect(self.db_path) as conn:
+                # 데이터 전체가 바뀌었으므로 다음 증분 백업은 전체 백업으로 전환하고 조회 캐시 무효화
+                self._mark_rewritten(conn.cursor())
+                self._bump_generation(conn.cursor(), floor=generation)
+                has_payload = conn.execute("SELECT 1 FROM post_data WHERE payload IS NOT NULL LIMIT 1").fetchone()
+            if has_payload:
+                self.rebuild_search_index()
             
             self.logger.info(f"데이터베이스 복원 완료: {backup_path}")
             self.logger.info(f"현재 데이터베이스 백업: {current_backup}")
@@ -389,6 +1497,7 @@ class DataManager:
             self.logger.error(f"데이터베이스 정보 조회 실패: {e}")
             return {}
             
+    @traced()
     def get_new_posts_count(self, username, days=7):
         """
         특정 기간 동안 새로 저장된 게시물 수 조회
@@ -401,20 +1510,24 @@ class DataManager:
             int: 새로운 게시물 수
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                query = '''
-                    SELECT COUNT(*) FROM post_data p
-                    JOIN account_data a ON p.account_id = a.id
-                    WHERE a.username = ? 
-                    AND p.created_at >= datetime('now', '-{} days')
-                '''.format(days)
-                cursor = conn.cursor()
-                cursor.execute(query, (username,))
-                return cursor.fetchone()[0]
+            return self._cached('get_new_posts_count', (username, days), lambda conn: self._query_new_posts_count(conn, username, days))
         except Exception as e:
             self.logger.error(f"새 게시물 수 조회 실패: {e}")
             return 0
             
+    def _query_new_posts_count(self, conn, username, days):
+        """get_new_posts_count 조회 (캐시 미적중 시)"""
+        query = '''
+            SELECT COUNT(*) FROM post_data p
+            JOIN account_data a ON p.account_id = a.id
+            WHERE a.username = ? 
+            AND p.created_at >= datetime('now', '-{} days')
+        '''.format(days)
+        cursor = conn.cursor()
+        cursor.execute(query, (username,))
+        return cursor.fetchone()[0]
+            
+    @traced()
     def get_latest_posts(self, username, limit=10):
         """
         특정 계정의 최신 게시물 조회
@@ -427,21 +1540,595 @@ class DataManager:
             list: 최신 게시물 목록
         """
         try:
+            return self._cached('get_latest_posts', (username, limit), lambda conn: self._query_latest_posts(conn, username, limit))
+        except Exception as e:
+            self.logger.error(f"최신 게시물 조회 실패: {e}")
+            return []
+            
+    def _query_latest_posts(self, conn, username, limit):
+        """get_latest_posts 조회 (캐시 미적중 시)"""
+        import pandas as pd
+        query = '''
+            SELECT p.*, a.username, m.path AS image_path
+            FROM post_data p
+            JOIN account_data a ON p.account_id = a.id
+            LEFT JOIN media_files m ON m.sha256 = p.image_sha256
+            WHERE a.username = ?
+            ORDER BY p.created_at DESC
+            LIMIT ?
+        '''
+        df = pd.read_sql_query(query, conn, params=(username, limit))
+        return self._decode_posts(df.to_dict('records'))
+            
+    @traced()
+    def search_posts(self, query, username=None, since=None, until=None, limit=20, cursor=None):
+        """
+        캡션/해시태그/멘션 전문 검색 (관련도 순, 키셋 페이지네이션)
+        
+        Args:
+            query (str): 검색어 (공백으로 구분된 단어는 모두 포함, 각 단어는 접두어 일치)
+            username (str): 특정 계정으로 제한 (None이면 전체)
+            since (str): 게시 시간 하한 (ISO 형식, 포함)
+            until (str): 게시 시간 상한 (ISO 형식, 미포함)
+            limit (int): 페이지 크기
+            cursor (str): 이전 결과의 next_cursor (None이면 첫 페이지)
+            
+        Returns:
+            dict: {'results': 게시물 목록, 'next_cursor': 다음 페이지 커서 또는 None}
+        """
+        try:
+            terms = query.split()
+            if not terms:
+                return {'results': [], 'next_cursor': None}
+                
             with sqlite3.connect(self.db_path) as conn:
-                query = '''
-                    SELECT p.*, a.username 
-                    FROM post_data p
+                conn.row_factory = sqlite3.Row
+                db_cursor = conn.cursor()
+                
+                if self._has_table(db_cursor, 'post_fts'):
+                    # bm25 점수가 낮을수록 관련도가 높음
+                    score_expr = 'bm25(post_fts)'
+                    from_clause = 'post_fts JOIN post_data p ON p.id = post_fts.rowid'
+                    conditions = ['post_fts MATCH ?']
+                    params = [' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)]
+                else:
+                    score_expr = '0.0'
+                    from_clause = 'post_data p'
+                    # 검색어의 %, _는 와일드카드가 아닌 문자 그대로 일치
+                    conditions = [
+                        "(p.caption LIKE ? ESCAPE '\\' OR p.hashtags LIKE ? ESCAPE '\\' OR p.mentions LIKE ? ESCAPE '\\')"
+                        for _ in terms
+                    ]
+                    params = [f'%{self._escape_like(term)}%' for term in terms for _ in range(3)]
+                    
+                if username:
+                    conditions.append('a.username = ?')
+                    params.append(username)
+                if since:
+                    conditions.append('p.posted_at >= ?')
+                    params.append(since)
+                if until:
+                    conditions.append('p.posted_at < ?')
+                    params.append(until)
+                if cursor:
+                    last_score, last_id = cursor.rsplit(':', 1)
+                    conditions.append(f'({score_expr} > ? OR ({score_expr} = ? AND p.id > ?))')
+                    params.extend([float(last_score), float(last_score), int(last_id)])
+                    
+                db_cursor.execute(f'''
+                    SELECT p.id, p.post_url, p.caption, p.posted_at, p.created_at,
+                           a.username, {score_expr} AS score, p.payload, p.payload_dict
+                    FROM {from_clause}
                     JOIN account_data a ON p.account_id = a.id
-                    WHERE a.username = ?
-                    ORDER BY p.created_at DESC
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY score, p.id
                     LIMIT ?
-                '''
-                df = pd.read_sql_query(query, conn, params=(username, limit))
-                return df.to_dict('records')
+                ''', params + [limit])
+                results = self._decode_posts([dict(row) for row in db_cursor.fetchall()])
+                
+                next_cursor = None
+                if len(results) == limit:
+                    last = results[-1]
+                    next_cursor = f"{last['score']!r}:{last['id']}"
+                return {'results': results, 'next_cursor': next_cursor}
+                
         except Exception as e:
-            self.logger.error(f"최신 게시물 조회 실패: {e}")
+            self.logger.error(f"게시물 검색 실패: {e}")
+            return {'results': [], 'next_cursor': None}
+            
+    @staticmethod
+    def _escape_like(value):
+        """LIKE 패턴의 와일드카드 문자 이스케이프 (ESCAPE '\\'와 함께 사용)"""
+        return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        
+    def read_changes(self, since_seq=0, limit=100):
+        """
+        변경 피드에서 since_seq 이후의 새 게시물 조회 (seq 오름차순)
+        
+        Args:
+            since_seq (int): 마지막으로 처리한 seq (0이면 처음부터)
+            limit (int): 최대 변경 수
+            
+        Returns:
+            list: 변경 목록 (seq, change_type, changed_at, username과 게시물 정보,
+                  이후 삭제된 게시물은 post_url 등이 None)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT c.seq, c.change_type, c.created_at AS changed_at, c.post_id, c.username,
+                           p.post_url, p.media_id, p.post_number, p.image_url, p.caption, p.posted_at,
+                           p.hashtags, p.mentions, p.timestamp, p.image_sha256, p.payload, p.payload_dict
+                    FROM post_changes c
+                    LEFT JOIN post_data p ON p.id = c.post_id
+                    WHERE c.seq > ?
+                    ORDER BY c.seq
+                    LIMIT ?
+                ''', (since_seq, limit))
+                changes = self._decode_posts([dict(row) for row in cursor.fetchall()])
+            for change in changes:
+                change['hashtags'] = json.loads(change['hashtags']) if change['hashtags'] else []
+                change['mentions'] = json.loads(change['mentions']) if change['mentions'] else []
+            return changes
+        except Exception as e:
+            self.logger.error(f"변경 피드 조회 실패: {e}")
+            return []
+            
+    def get_latest_change_seq(self):
+        """
+        변경 피드의 마지막 seq
+        
+        Returns:
+            int: 마지막 seq (변경이 없으면 0)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute("SELECT MAX(seq) FROM post_changes").fetchone()
+                return row[0] or 0
+        except Exception as e:
+            self.logger.error(f"변경 피드 위치 조회 실패: {e}")
+            return 0
+            
+    def get_posts_due_for_revisit(self, username, limit=None, now=None):
+        """
+        다시 확인할 때가 된 계정의 기존 게시물 (확인 예정 시각이 오래된 순, 삭제된 게시물 제외)
+        
+        재확인 일정이 없는 게시물(재확인 모드를 켜기 전에 저장된 게시물 등)은 먼저 게시 시간 기준
+        일정을 만듭니다 (내용 해시는 첫 재확인 시 저장된 내용으로 계산).
+        
+        Args:
+            username (str): 계정 사용자명
+            limit (int): 최대 게시물 수 (None이면 Config.REVISIT_MAX_POSTS)
+            now (datetime): 기준 시각 (None이면 현재)
+            
+        Returns:
+            list: {'post_id', 'post_url'} 목록 (조회 실패 시 빈 목록)
+        """
+        try:
+            now = now or datetime.now()
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT p.id, p.posted_at
+                    FROM post_data p
+                    JOIN account_data a ON a.id = p.account_id
+                    LEFT JOIN post_revisit r ON r.post_id = p.id
+                    WHERE a.username = ? AND r.post_id IS NULL
+                ''', (username,))
+                cursor.executemany(
+                    'INSERT OR IGNORE INTO post_revisit (post_id, next_check_at) VALUES (?, ?)',
+                    [(post_id, self._next_check_at(posted_at, now)) for post_id, posted_at in cursor.fetchall()]
+                )
+                conn.commit()
+                
+                cursor.execute('''
+                    SELECT p.id, p.post_url
+                    FROM post_revisit r
+                    JOIN post_data p ON p.id = r.post_id
+                    JOIN account_data a ON a.id = p.account_id
+                    WHERE a.username = ? AND r.deleted_at IS NULL AND r.next_check_at <= ?
+                    ORDER BY r.next_check_at
+                    LIMIT ?
+                ''', (username, now.isoformat(timespec='seconds'), limit or Config.REVISIT_MAX_POSTS))
+                return [{'post_id': row[0], 'post_url': row[1]} for row in cursor.fetchall()]
+        except Exception as e:
+            self.logger.error(f"재확인 대상 게시물 조회 실패: {e}")
+            return []
+            
+    def get_post_revisions(self, post_url):
+        """
+        게시물의 수정/삭제 기록 조회 (오래된 순)
+        
+        Args:
+            post_url (str): 게시물 주소 (표기가 달라도 같은 게시물이면 조회)
+            
+        Returns:
+            list: 기록 목록 (revision_type, 바뀐 필드별 [이전 값, 새 값] changes, detected_at)
+        """
+        try:
+            post_url, media_id = canonicalize_post_url(post_url)
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                post_id = self._find_post_id(cursor, post_url, media_id)
+                if not post_id:
+                    return []
+                cursor.execute('''
+                    SELECT id, revision_type, changes, content_hash, detected_at
+                    FROM post_revisions
+                    WHERE post_id = ?
+                    ORDER BY id
+                ''', (post_id,))
+                revisions = [dict(row) for row in cursor.fetchall()]
+            for revision in revisions:
+                revision['changes'] = json.loads(revision['changes']) if revision['changes'] else {}
+            return revisions
+        except Exception as e:
+            self.logger.error(f"게시물 수정 기록 조회 실패: {e}")
+            return []
+            
+    def _get_top_tags(self, table, column, since=None, until=None, username=None, limit=10):
+        """정규화 테이블에서 기간 내 게시물 수 기준 상위 태그 집계"""
+        conditions = []
+        params = []
+        if since:
+            conditions.append('p.posted_at >= ?')
+            params.append(since)
+        if until:
+            conditions.append('p.posted_at < ?')
+            params.append(until)
+        if username:
+            conditions.append('p.account_id IN (SELECT id FROM account_data WHERE username = ?)')
+            params.append(username)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT t.{column}, COUNT(*) AS post_count
+                FROM {table} t
+                JOIN post_data p ON p.id = t.post_id
+                {where}
+                GROUP BY t.{column}
+                ORDER BY post_count DESC, t.{column}
+                LIMIT ?
+            ''', params + [limit])
+            return [{column: row[0], 'post_count': row[1]} for row in cursor.fetchall()]
+            
+    def _get_posts_by_tag(self, table, column, value, prefix, limit=20):
+        """정규화 테이블 인덱스로 특정 태그가 포함된 게시물 조회 (최신순)"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT p.id, p.post_url, p.caption, p.posted_at, p.created_at, a.username,
+                       p.payload, p.payload_dict
+                FROM {table} t
+                JOIN post_data p ON p.id = t.post_id
+                JOIN account_data a ON p.account_id = a.id
+                WHERE t.{column} = ?
+                ORDER BY p.posted_at DESC, p.id DESC
+                LIMIT ?
+            ''', (value.lstrip(prefix).lower(), limit))
+            return self._decode_posts([dict(row) for row in cursor.fetchall()])
+            
+    def get_top_hashtags(self, since=None, until=None, username=None, limit=10):
+        """
+        기간 내 가장 많이 사용된 해시태그 조회
+        
+        Args:
+            since (str): 게시 시간 하한 (ISO 형식, 포함)
+            until (str): 게시 시간 상한 (ISO 형식, 미포함)
+            username (str): 특정 계정으로 제한 (None이면 전체)
+            limit (int): 조회할 해시태그 수
+            
+        Returns:
+            list: [{'tag': 해시태그, 'post_count': 게시물 수}, ...]
+        """
+        try:
+            return self._get_top_tags('post_hashtags', 'tag', since, until, username, limit)
+        except Exception as e:
+            self.logger.error(f"상위 해시태그 조회 실패: {e}")
+            return []
+            
+    def get_top_mentions(self, since=None, until=None, username=None, limit=10):
+        """
+        기간 내 가장 많이 멘션된 계정 조회
+        
+        Args:
+            since (str): 게시 시간 하한 (ISO 형식, 포함)
+            until (str): 게시 시간 상한 (ISO 형식, 미포함)
+            username (str): 특정 계정으로 제한 (None이면 전체)
+            limit (int): 조회할 멘션 수
+            
+        Returns:
+            list: [{'handle': 멘션 계정, 'post_count': 게시물 수}, ...]
+        """
+        try:
+            return self._get_top_tags('post_mentions', 'handle', since, until, username, limit)
+        except Exception as e:
+            self.logger.error(f"상위 멘션 조회 실패: {e}")
+            return []
+            
+    def get_posts_by_hashtag(self, tag, limit=20):
+        """
+        특정 해시태그가 포함된 게시물 조회
+        
+        Args:
+            tag (str): 해시태그 ('#' 생략 가능, 대소문자 무시)
+            limit (int): 조회할 게시물 수
+            
+        Returns:
+            list: 게시물 목록 (최신 게시 순)
+        """
+        try:
+            return self._get_posts_by_tag('post_hashtags', 'tag', tag, '#', limit)
+        except Exception as e:
+            self.logger.error(f"해시태그 게시물 조회 실패: {e}")
+            return []
+            
+    def get_posts_by_mention(self, handle, limit=20):
+        """
+        특정 계정을 멘션한 게시물 조회
+        
+        Args:
+            handle (str): 멘션 계정 ('@' 생략 가능, 대소문자 무시)
+            limit (int): 조회할 게시물 수
+            
+        Returns:
+            list: 게시물 목록 (최신 게시 순)
+        """
+        try:
+            return self._get_posts_by_tag('post_mentions', 'handle', handle, '@', limit)
+        except Exception as e:
+            self.logger.error(f"멘션 게시물 조회 실패: {e}")
+            return []
+            
+    @traced()
+    def find_similar_posts(self, post_url, max_distance=MAX_EXACT_DISTANCE, limit=20):
+        """
+        이미지가 비슷한(재게시, 교차 게시 등) 다른 게시물 조회
+        
+        dHash를 16비트 밴드 4개로 나누어 인덱스로 후보를 찾으므로 저장된 이미지 수와 무관하게 빠릅니다.
+        max_distance가 MAX_EXACT_DISTANCE(3)를 넘으면 전체 이미지를 비교합니다.
+        
+        Args:
+            post_url (str): 기준 게시물 URL
+            max_distance (int): 허용할 최대 해밍 거리 (0이면 동일 이미지)
+            limit (int): 조회할 게시물 수
+            
+        Returns:
+            list: 유사 게시물 목록 (해밍 거리 오름차순, 'distance' 포함)
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                conn.create_function('hamming', 2, hamming_distance, deterministic=True)
+                cursor = conn.cursor()
+                
+                post_id = self._find_post_id(cursor, *canonicalize_post_url(post_url))
+                cursor.execute('''
+                    SELECT p.id, m.dhash FROM post_data p
+                    JOIN media_files m ON m.sha256 = p.image_sha256
+                    WHERE p.id = ?
+                ''', (post_id,))
+                source = cursor.fetchone()
+                if not source or source['dhash'] is None:
+                    self.logger.warning(f"이미지 해시가 없는 게시물: {post_url}")
+                    return []
+                    
+                dhash = source['dhash']
+                if max_distance <= MAX_EXACT_DISTANCE:
+                    # 밴드 중 하나라도 일치하는 이미지만 후보로 사용
+                    bands = split_bands(to_unsigned(dhash))
+                    candidate_filter = ' OR '.join(f'm.dhash_b{band} = ?' for band in range(BAND_COUNT))
+                    params = bands
+                else:
+                    candidate_filter = 'm.dhash IS NOT NULL'
+                    params = []
+                    
+                cursor.execute(f'''
+                    SELECT * FROM (
+                        SELECT p.id, p.post_url, p.caption, p.posted_at, a.username,
+                               m.path AS image_path, hamming(m.dhash, ?) AS distance,
+                               p.payload, p.payload_dict
+                        FROM media_files m
+                        JOIN post_data p ON p.image_sha256 = m.sha256
+                        JOIN account_data a ON p.account_id = a.id
+                        WHERE ({candidate_filter}) AND p.id != ?
+                    )
+                    WHERE distance <= ?
+                    ORDER BY distance, id
+                    LIMIT ?
+                ''', [dhash, *params, source['id'], max_distance, limit])
+                return self._decode_posts([dict(row) for row in cursor.fetchall()])
+                
+        except Exception as e:
+            self.logger.error(f"유사 게시물 조회 실패: {e}")
             return []
             
+    def update_image_hashes(self):
+        """
+        해시가 없는 저장된 미디어 파일의 dHash 계산 (기존 데이터 백필)
+        
+        Returns:
+            int: 해시를 계산한 파일 수
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT sha256, path FROM media_files WHERE dhash IS NULL AND COALESCE(content_type, '') NOT LIKE 'video/%'")
+                rows = cursor.fetchall()
+                
+                updated = 0
+                band_assignments = ', '.join(f'dhash_b{band} = ?' for band in range(BAND_COUNT))
+                for sha256, path in rows:
+                    dhash = compute_dhash(path)
+                    if dhash is None:
+                        continue
+                    cursor.execute(
+                        f'UPDATE media_files SET dhash = ?, {band_assignments} WHERE sha256 = ?',
+                        (to_signed(dhash), *split_bands(dhash), sha256)
+                    )
+                    updated += 1
+                    
+                if updated:
+                    self._bump_generation(cursor)
+                conn.commit()
+                self.logger.info(f"이미지 해시 계산 완료: {len(rows)}개 중 {updated}개")
+                return updated
+                
+        except Exception as e:
+            self.logger.error(f"이미지 해시 계산 실패: {e}")
+            return 0
+            
+    def train_caption_dictionary(self, sample_limit=None, dict_size=None):
+        """
+        저장된 게시물 텍스트로 캡션 압축 사전 학습 (이후 새 게시물과 recompress_posts에서 사용)
+        
+        Args:
+            sample_limit (int): 학습에 사용할 최근 게시물 수 (None이면 caption_codec.TRAIN_SAMPLE_LIMIT)
+            dict_size (int): 사전 크기 (바이트, None이면 Config.CAPTION_DICT_SIZE)
+            
+        Returns:
+            int: 학습된 사전 ID (실패 시 None)
+        """
+        try:
+            from caption_codec import TRAIN_SAMPLE_LIMIT
+            
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute('''
+                    SELECT caption, hashtags, mentions, payload, payload_dict FROM post_data
+                    ORDER BY id DESC LIMIT ?
+                ''', (sample_limit or TRAIN_SAMPLE_LIMIT,)).fetchall()
+            samples = [self._post_text(row) for row in rows]
+            return self.codec.train(samples, dict_size or Config.CAPTION_DICT_SIZE)
+        except Exception as e:
+            self.logger.error(f"캡션 압축 사전 학습 실패: {e}")
+            return None
+            
+    def recompress_posts(self, batch_size=1000, vacuum=True):
+        """
+        저장된 게시물 텍스트를 현재 설정에 맞게 다시 저장
+        
+        CAPTION_COMPRESSION=zstd이면 최신 사전으로 압축하고(이미 최신 사전이면 건너뜀),
+        none이면 원문으로 되돌립니다. 텍스트가 바뀌지 않으므로 전문 검색 색인은 그대로 사용합니다.
+        
+        Args:
+            batch_size (int): 한 트랜잭션에서 처리할 게시물 수
+            vacuum (bool): 완료 후 VACUUM으로 빈 공간 반환
+            
+        Returns:
+            dict: 다시 저장한 게시물 수와 전후 데이터베이스 크기 (실패 시 빈 dict)
+        """
+        try:
+            compress = Config.CAPTION_COMPRESSION == 'zstd'
+            if compress and not self._compress_captions():
+                return {}
+            size_before = Path(self.db_path).stat().st_size
+            target_dict = self.codec.latest_dictionary_id() if compress else None
+            
+            updated = 0
+            last_id = 0
+            with sqlite3.connect(self.db_path) as conn:
+                while True:
+                    rows = conn.execute('''
+                        SELECT id, caption, hashtags, mentions, payload, payload_dict FROM post_data
+                        WHERE id > ? ORDER BY id LIMIT ?
+                    ''', (last_id, batch_size)).fetchall()
+                    if not rows:
+                        break
+                    last_id = rows[-1][0]
+                    
+                    changes = []
+                    for row in rows:
+                        payload, payload_dict = row[4], row[5]
+                        if compress and payload is not None and payload_dict == target_dict:
+                            continue
+                        if not compress and payload is None:
+                            continue
+                        caption, hashtags, mentions = self._post_text(row[1:])
+                        if compress:
+                            payload, payload_dict = self.codec.encode(caption, hashtags, mentions)
+                            changes.append((None, None, None, payload, payload_dict, row[0]))
+                        else:
+                            changes.append((
+                                caption,
+                                json.dumps(hashtags, ensure_ascii=False),
+                                json.dumps(mentions, ensure_ascii=False),
+                                None, None, row[0]
+                            ))
+                    conn.executemany('''
+                        UPDATE post_data SET caption = ?, hashtags = ?, mentions = ?, payload = ?, payload_dict = ?
+                        WHERE id = ?
+                    ''', changes)
+                    if changes:
+                        self._bump_generation(conn.cursor())
+                    conn.commit()
+                    updated += len(changes)
+                    
+            if vacuum and updated:
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute("VACUUM")
+                    
+            result = {
+                'updated': updated,
+                'size_before': size_before,
+                'size_after': Path(self.db_path).stat().st_size
+            }
+            self.logger.info(f"게시물 텍스트 {updated}개 다시 저장 완료 ({size_before} → {result['size_after']}바이트)")
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"게시물 텍스트 다시 저장 실패: {e}")
+            return {}
+            
+    def rebuild_search_index(self, batch_size=1000):
+        """
+        전문 검색 색인 재구성 (압축 저장된 게시물은 원문으로 복원하여 색인)
+        
+        Returns:
+            bool: 재구성 성공 여부
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                if not self._has_table(conn.cursor(), 'post_fts'):
+                    return False
+                conn.execute("INSERT INTO post_fts (post_fts) VALUES ('delete-all')")
+                last_id = 0
+                while True:
+                    rows = conn.execute('''
+                        SELECT id, caption, hashtags, mentions, payload, payload_dict FROM post_data
+                        WHERE id > ? ORDER BY id LIMIT ?
+                    ''', (last_id, batch_size)).fetchall()
+                    if not rows:
+                        break
+                    last_id = rows[-1][0]
+                    entries = []
+                    for row in rows:
+                        caption, hashtags, mentions = row[1:4]
+                        if row[4] is not None:
+                            caption, hashtags, mentions = self.codec.decode_columns(row[4], row[5])
+                        entries.append((row[0], caption, hashtags, mentions))
+                    conn.executemany(
+                        'INSERT INTO post_fts (rowid, caption, hashtags, mentions) VALUES (?, ?, ?, ?)', entries
+                    )
+                conn.commit()
+            self.logger.info("전문 검색 색인 재구성 완료")
+            return True
+        except Exception as e:
+            self.logger.error(f"전문 검색 색인 재구성 실패: {e}")
+            return False
+            
+    def _post_text(self, row):
+        """(caption, hashtags, mentions, payload, payload_dict) 행의 원문 (해시태그/멘션은 목록)"""
+        caption, hashtags, mentions, payload, payload_dict = row
+        if payload is not None:
+            return self.codec.decode(payload, payload_dict)
+        return caption, json.loads(hashtags) if hashtags else [], json.loads(mentions) if mentions else []
+        
     def initialize_database(self):
         """
         데이터베이스 초기화 (데이터만 삭제, 테이블 구조 유지)
@@ -455,8 +2142,8 @@ class DataManager:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                # 각 테이블의 데이터만 삭제
-                tables = ['post_data', 'account_data', 'crawl_history']
+                # 각 테이블의 데이터만 삭제 (accounts, metadata는 설정이므로 유지)
+                tables = ['post_hashtags', 'post_mentions', 'post_data', 'account_data', 'crawl_history', 'account_stats', 'media_files', 'post_changes', 'post_revisit', 'post_revisions', 'metric_series', 'metric_samples', 'metric_rollups']
                 for table in tables:
                     try:
                         cursor.execute(f"DELETE FROM {table}")
@@ -465,9 +2152,14 @@ class DataManager:
                     except Exception as e:
                         self.logger.warning(f"{table} 테이블 삭제 실패: {e}")
                 
-                # AUTOINCREMENT 값 초기화
-                cursor.execute("DELETE FROM sqlite_sequence")
+                # 압축 저장된 게시물은 트리거로 색인이 삭제되지 않으므로 전문 검색 색인 전체 삭제
+                if self._has_table(cursor, 'post_fts'):
+                    cursor.execute("INSERT INTO post_fts (post_fts) VALUES ('delete-all')")
+                    
+                # AUTOINCREMENT 값 초기화 (변경 피드 seq는 소비자의 읽기 위치가 유효하도록 유지)
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name != 'post_changes'")
                 
+                self._bump_generation(cursor)
                 conn.commit()
                 self.logger.info("데이터베이스 초기화 완료")
                 return True
@@ -493,7 +2185,8 @@ class DataManager:
             else:
                 self.logger.warning("백업 생성 실패, 계속 진행")
             
-            # 데이터베이스 파일 삭제
+            # 데이터베이스 파일 삭제 (조회 캐시 무효화를 위해 데이터 세대는 이어서 증가)
+            generation = self._current_generation()
             try:
                 import os
                 if os.path.exists(self.db_path):
@@ -506,6 +2199,8 @@ class DataManager:
             # 새로운 데이터베이스 및 테이블 생성
             try:
                 self.setup_database()
+                with sqlite3.connect(self.db_path) as conn:
+                    self._bump_generation(conn.cursor(), floor=generation)
                 self.logger.info("새 데이터베이스 및 테이블 생성 완료")
                 return True
             except Exception as e:
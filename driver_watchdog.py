@@ -0,0 +1,152 @@
+import itertools
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Selenium 자체 시간 초과가 동작하지 않을 때 프로세스를 강제 종료하기까지 추가로 기다리는 시간 (초)
+KILL_GRACE_SECONDS = 15
+
+logger = logging.getLogger(__name__)
+
+class DriverWatchdog:
+    def __init__(self, on_expire, check_interval=1.0):
+        """
+        드라이버 작업 마감 시간 감시
+        
+        등록된 마감 시간이 지나면 감시 스레드에서 on_expire(kind)를 호출합니다.
+        (응답 없는 드라이버 호출은 메인 스레드에서 중단할 수 없으므로 프로세스를 종료해 풀어줌)
+        
+        Args:
+            on_expire (callable): 마감 시간 초과 시 호출할 함수 (인자: 작업 종류)
+            check_interval (float): 마감 시간 확인 주기 (초)
+        """
+        self.on_expire = on_expire
+        self.check_interval = check_interval
+        self.expired = []
+        self._deadlines = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='driver-watchdog', daemon=True)
+        self._thread.start()
+    
+    @contextmanager
+    def deadline(self, kind, seconds):
+        """
+        with 블록에 마감 시간 설정
+        
+        Args:
+            kind (str): 작업 종류 (navigation, account, quit 등)
+            seconds (float): 허용 시간 (초, 0 이하이면 감시하지 않음)
+        """
+        if not seconds or seconds <= 0:
+            yield
+            return
+        
+        token = next(self._ids)
+        with self._lock:
+            self._deadlines[token] = (time.monotonic() + seconds, kind)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._deadlines.pop(token, None)
+    
+    def _run(self):
+        while not self._stop.wait(self.check_interval):
+            now = time.monotonic()
+            with self._lock:
+                expired = [(token, kind) for token, (expires, kind) in self._deadlines.items() if expires <= now]
+                for token, _ in expired:
+                    del self._deadlines[token]
+            
+            for _, kind in expired:
+                self.expired.append(kind)
+                try:
+                    self.on_expire(kind)
+                except Exception as e:
+                    logger.error(f"감시 처리 실패 ({kind}): {e}")
+    
+    def stop(self):
+        """감시 스레드 종료"""
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.check_interval * 2)
+
+def kill_process_tree(pid, timeout=5):
+    """
+    프로세스와 모든 하위 프로세스 강제 종료 (chromedriver와 Chrome 렌더러 등)
+    
+    Args:
+        pid (int): 최상위 프로세스 ID
+        timeout (float): Windows taskkill 대기 시간 (초)
+    
+    Returns:
+        list: 종료 신호를 보낸 프로세스 ID 목록
+    """
+    if sys.platform == 'win32':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)], capture_output=True, timeout=timeout)
+        return [pid]
+    
+    # 부모를 먼저 멈춰 하위 프로세스가 새로 생기지 않도록 한 뒤 자식부터 종료
+    pids = [pid] + _descendant_pids(pid)
+    for target in pids:
+        _send_signal(target, signal.SIGSTOP)
+    for target in reversed(pids):
+        _send_signal(target, signal.SIGKILL)
+    return pids
+
+def _send_signal(pid, sig):
+    try:
+        os.kill(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+def _descendant_pids(pid):
+    """하위 프로세스 ID 목록 (너비 우선)"""
+    children = _child_map()
+    result = []
+    queue = [pid]
+    while queue:
+        current = queue.pop(0)
+        for child in children.get(current, []):
+            if child not in result:
+                result.append(child)
+                queue.append(child)
+    return result
+
+def _child_map():
+    """부모 PID → 자식 PID 목록 (psutil, /proc, ps 순으로 시도)"""
+    children = {}
+    try:
+        import psutil
+        for process in psutil.process_iter(['pid', 'ppid']):
+            children.setdefault(process.info['ppid'], []).append(process.info['pid'])
+        return children
+    except ImportError:
+        pass
+    
+    if os.path.isdir('/proc'):
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat', 'rb') as f:
+                    # 프로세스 이름에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후를 파싱
+                    fields = f.read().rsplit(b')', 1)[1].split()
+                children.setdefault(int(fields[1]), []).append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+        return children
+    
+    output = subprocess.run(['ps', '-A', '-o', 'pid=,ppid='], capture_output=True, text=True).stdout
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            children.setdefault(int(parts[1]), []).append(int(parts[0]))
+    return children
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+벤치마크/테스트용 로컬 가짜 인스타그램 서버
+
+InstagramCrawler가 사용하는 선택자 구조(로그인 폼, 로그인 정보 저장 팝업, 프로필 게시물 그리드,
+'더 보기' 팝업, 게시물 캡션/이미지/게시 시간)를 그대로 흉내 낸 페이지를 제공합니다.
+pages_dir를 지정하면 녹화된 페이지(profile_<계정>.html, post_<코드>.html)를 우선 사용합니다.
+
+단독 실행:
+    python fake_instagram_server.py --port 8765 --accounts 3 --posts 9
+"""
+
+import argparse
+import html
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+SESSION_COOKIE = 'sessionid=fake-session'
+
+_PAGE = '''<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>{meta}</head>
+<body>{body}</body></html>'''
+
+_HOME_LOGGED_IN = '''
+<nav aria-label="Primary navigation"><a href="/explore/">탐색</a></nav>
+<main><div><div><div>로그인 정보를 저장하시겠어요? 나중에 하기</div></div></div></main>
+'''
+
+_LOGIN_FORM = '''
+<main>
+  <form method="post" action="/accounts/login/">
+    <input name="username" type="text">
+    <input name="password" type="password">
+    <button type="submit">로그인</button>
+  </form>
+</main>
+'''
+
+_POST = '''
+<div id="more-popup"><div><div><div>
+  <span>{username}님의 글 더 보기</span>
+  <div><div><svg aria-label="닫기" width="10" height="10"
+       onclick="document.getElementById('more-popup').remove()"><rect width="10" height="10"/></svg></div></div>
+</div></div></div>
+<article>
+  <img src="/media/{code}.jpg" alt="">
+  <div><span><div><span>{caption}</span></div></span></div>
+  <time datetime="{posted_at}">{posted_at}</time>
+</article>
+'''
+
+class FakeInstagramSite:
+    def __init__(self, accounts=3, posts_per_account=9, pages_dir=None, latency=0.0):
+        """
+        가짜 인스타그램 사이트 데이터
+        
+        Args:
+            accounts (int or list): 계정 수 또는 계정명 목록
+            posts_per_account (int): 계정별 게시물 수
+            pages_dir (str): 녹화된 페이지 디렉토리 (없는 페이지는 합성)
+            latency (float): 페이지 응답 지연 (초)
+        """
+        if isinstance(accounts, int):
+            accounts = [f"bench_user{i}" for i in range(accounts)]
+        self.accounts = list(accounts)
+        self.posts_per_account = posts_per_account
+        self.pages_dir = Path(pages_dir) if pages_dir else None
+        self.latency = latency
+        self.pages_served = 0
+        self._lock = threading.Lock()
+    
+    def post_codes(self, username):
+        """계정의 게시물 코드 목록 (최신순)"""
+        index = self.accounts.index(username)
+        return [f"B{index:03d}P{i:03d}" for i in range(self.posts_per_account)]
+    
+    def render(self, path, logged_in):
+        """
+        경로에 해당하는 HTML 반환
+        
+        Returns:
+            str: HTML (없는 경로면 None)
+        """
+        parts = [part for part in path.split('/') if part]
+        
+        if not parts:
+            body = _HOME_LOGGED_IN if logged_in else _LOGIN_FORM
+            return self._page('Instagram', body)
+        if parts == ['accounts', 'login']:
+            return self._page('로그인', _LOGIN_FORM)
+        if parts[0] == 'p' and len(parts) >= 2:
+            return self._render_post(parts[1])
+        if len(parts) == 1 and parts[0] in self.accounts:
+            return self._render_profile(parts[0])
+        return None
+    
+    def _render_profile(self, username):
+        recorded = self._recorded(f"profile_{username}.html")
+        if recorded:
+            return recorded
+        links = ''.join(
+            f'<div><div><div><div><div><div><a href="/p/{code}/">게시물 {code}</a></div></div></div></div></div></div>'
+            for code in self.post_codes(username)
+        )
+        index = self.accounts.index(username)
+        description = (
+            f"{1000 * (index + 1):,} Followers, {10 * (index + 1)} Following, {self.posts_per_account} Posts"
+            f" - See Instagram photos and videos from {username} (@{username})"
+        )
+        return self._page(f"@{username}", f'<main><header>{username}</header><article>{links}</article></main>', description)
+    
+    def _render_post(self, code):
+        recorded = self._recorded(f"post_{code}.html")
+        if recorded:
+            return recorded
+        username = next((u for u in self.accounts if code in self.post_codes(u)), None)
+        if not username:
+            return None
+        number = int(code.split('P')[-1])
+        caption = html.escape(
+            f"{username}의 {number}번째 게시물입니다. 오늘의 커피 #cafe #daily{number % 3} @friend{number % 5}"
+        )
+        posted_at = f"2024-01-{(number % 28) + 1:02d}T12:00:00.000Z"
+        description = f"{100 + number * 7:,} likes, {number % 11} comments - {username} on January {(number % 28) + 1}, 2024"
+        return self._page(code, _POST.format(username=username, code=code, caption=caption, posted_at=posted_at), description)
+    
+    def _recorded(self, name):
+        if self.pages_dir and (self.pages_dir / name).exists():
+            return (self.pages_dir / name).read_text(encoding='utf-8')
+        return None
+    
+    @staticmethod
+    def _page(title, body, description=None):
+        meta = f'<meta property="og:description" content="{html.escape(description)}">' if description else ''
+        return _PAGE.format(title=html.escape(title), meta=meta, body=body)
+    
+    def count_page(self):
+        with self._lock:
+            self.pages_served += 1
+
+def make_handler(site):
+    """사이트 데이터를 제공하는 요청 핸들러 클래스 생성"""
+    
+    class FakeInstagramHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def do_GET(self):
+            path = urlparse(self.path).path
+            if path.startswith('/media/'):
+                # 게시물 이미지 (작은 더미 바이트)
+                self._send(200, b'\xff\xd8\xff\xe0' + path.encode('utf-8'), 'image/jpeg')
+                return
+            
+            logged_in = SESSION_COOKIE in (self.headers.get('Cookie') or '')
+            page = site.render(path, logged_in)
+            if page is None:
+                self._send(404, '페이지를 찾을 수 없습니다'.encode('utf-8'), 'text/plain; charset=utf-8')
+                return
+            if site.latency:
+                time.sleep(site.latency)
+            site.count_page()
+            self._send(200, page.encode('utf-8'), 'text/html; charset=utf-8')
+        
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            form = parse_qs(self.rfile.read(length).decode('utf-8'))
+            if urlparse(self.path).path.rstrip('/') == '/accounts/login' and form.get('username') and form.get('password'):
+                # 로그인 성공: 세션 쿠키 발급 후 홈으로 이동
+                self.send_response(302)
+                self.send_header('Set-Cookie', f"{SESSION_COOKIE}; Path=/")
+                self.send_header('Location', '/')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self._send(400, b'login failed', 'text/plain')
+        
+        def _send(self, status, body, content_type):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return FakeInstagramHandler
+
+class FakeInstagramServer:
+    def __init__(self, site=None, host='127.0.0.1', port=0):
+        """
+        로컬 가짜 인스타그램 HTTP 서버
+        
+        Args:
+            site (FakeInstagramSite): 제공할 사이트 데이터 (None이면 기본 합성 데이터)
+            host (str): 바인딩 주소
+            port (int): 포트 (0이면 임의 포트)
+        """
+        self.site = site or FakeInstagramSite()
+        self.server = ThreadingHTTPServer((host, port), make_handler(self.site))
+        self.thread = None
+    
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name='fake-instagram', daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='로컬 가짜 인스타그램 서버')
+    parser.add_argument('--port', type=int, default=8765, help='포트 (기본값: 8765)')
+    parser.add_argument('--accounts', type=int, default=3, help='합성 계정 수 (기본값: 3)')
+    parser.add_argument('--posts', type=int, default=9, help='계정별 게시물 수 (기본값: 9)')
+    parser.add_argument('--pages-dir', help='녹화된 페이지 디렉토리')
+    parser.add_argument('--latency', type=float, default=0.0, help='페이지 응답 지연 (초)')
+    args = parser.parse_args()
+    
+    site = FakeInstagramSite(args.accounts, args.posts, args.pages_dir, args.latency)
+    with FakeInstagramServer(site, port=args.port) as server:
+        print(f"가짜 인스타그램 서버: {server.base_url}")
+        print(f"계정: {site.accounts}")
+        print("Ctrl+C로 중지할 수 있습니다.")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
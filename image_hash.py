@@ -0,0 +1,73 @@
+import logging
+
+# dHash 비트 수와 다중 인덱스 밴드 구성 (64비트 = 16비트 x 4밴드)
+HASH_BITS = 64
+BAND_BITS = 16
+BAND_COUNT = HASH_BITS // BAND_BITS
+
+# 밴드 중 하나 이상이 정확히 일치해야 후보가 되므로,
+# 해밍 거리가 BAND_COUNT - 1 이하인 이미지는 빠짐없이 찾을 수 있음 (비둘기집 원리)
+MAX_EXACT_DISTANCE = BAND_COUNT - 1
+
+logger = logging.getLogger(__name__)
+
+def compute_dhash(image_path):
+    """
+    이미지의 64비트 dHash(difference hash) 계산
+    
+    크기 조정/재압축/약간의 색 보정에도 값이 거의 변하지 않아
+    다른 URL로 올라온 같은 이미지를 찾는 데 사용합니다.
+    
+    Args:
+        image_path (str): 이미지 파일 경로
+    
+    Returns:
+        int: 부호 없는 64비트 해시값 (Pillow가 없거나 실패 시 None)
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        logger.warning("Pillow가 설치되지 않아 이미지 해시를 계산할 수 없습니다.")
+        return None
+    
+    try:
+        with Image.open(image_path) as img:
+            # 9x8 흑백 이미지에서 가로로 인접한 픽셀의 밝기 비교
+            pixels = list(img.convert('L').resize((9, 8), Image.LANCZOS).getdata())
+        
+        value = 0
+        for row in range(8):
+            for col in range(8):
+                left = pixels[row * 9 + col]
+                right = pixels[row * 9 + col + 1]
+                value = (value << 1) | (1 if left > right else 0)
+        return value
+    
+    except Exception as e:
+        logger.warning(f"이미지 해시 계산 실패: {image_path} - {e}")
+        return None
+
+def to_signed(value):
+    """부호 없는 64비트 값을 SQLite INTEGER(부호 있는 64비트)로 변환"""
+    return value - (1 << HASH_BITS) if value >= (1 << (HASH_BITS - 1)) else value
+
+def to_unsigned(value):
+    """SQLite INTEGER 값을 부호 없는 64비트 값으로 변환"""
+    return value + (1 << HASH_BITS) if value < 0 else value
+
+def split_bands(value):
+    """
+    해시를 다중 인덱스 검색용 밴드로 분할
+    
+    Args:
+        value (int): 부호 없는 64비트 해시값
+    
+    Returns:
+        list: 상위 비트부터 BAND_BITS씩 자른 정수 목록
+    """
+    mask = (1 << BAND_BITS) - 1
+    return [(value >> (BAND_BITS * (BAND_COUNT - 1 - i))) & mask for i in range(BAND_COUNT)]
+
+def hamming_distance(a, b):
+    """두 해시값(부호 무관) 사이의 해밍 거리"""
+    return bin(to_unsigned(a) ^ to_unsigned(b)).count('1')
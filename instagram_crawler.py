@@ -4,8 +4,8 @@ import json
 import logging
 import re
 import os
-import sqlite3
 from datetime import datetime
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -15,42 +15,94 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.keys import Keys
 from dotenv import load_dotenv
+from config import Config
+from metrics import DRIVER_TIMEOUTS, stage_timer
+from driver_watchdog import KILL_GRACE_SECONDS, DriverWatchdog, kill_process_tree
+from profiling import traced
+from logging_setup import configure_logging, log_context
+from profile_stats import POST_LABELS, PROFILE_LABELS, parse_counts
+from selector_registry import get_registry
+from rate_governor import (CHALLENGE, LOGGED_OUT, PAGE_SNAPSHOT_SCRIPT, CircuitOpenError, LoggedOutError,
+                           RateGovernor, classify_driver_page)
+
+# 삭제되었거나 비공개로 바뀐 게시물 페이지의 문구 (소문자 비교)
+POST_UNAVAILABLE_TEXT_MARKERS = (
+    'this page isn\'t available',
+    'sorry, this page',
+    '페이지를 사용할 수 없습니다',
+    '페이지를 찾을 수 없습니다',
+)
 
 class InstagramCrawler:
-    def __init__(self, headless=False):  # 디버깅을 위해 헤드리스 모드 비활성화
+    def __init__(self, headless=False, download_media=None, identity=None):  # 디버깅을 위해 헤드리스 모드 비활성화
         """
         인스타그램 크롤러 초기화
         
         Args:
             headless (bool): 브라우저를 백그라운드에서 실행할지 여부
+            download_media (bool): 게시물 이미지 다운로드 여부 (None이면 Config.MEDIA_DOWNLOAD_ENABLED)
+            identity (CrawlIdentity): 사용할 로그인 계정 (None이면 .env의 로그인 정보)
         """
         # 환경 변수 로드
         load_dotenv()
         
+        # 접속 주소 및 대기 시간 배율 (벤치마크에서는 로컬 서버와 짧은 대기 사용)
+        self.base_url = Config.INSTAGRAM_BASE_URL.rstrip('/')
+        self.wait_scale = Config.WAIT_SCALE
+        
         self.setup_logging()
-        self.setup_driver(headless)
-        self.wait = WebDriverWait(self.driver, 10)
+        
+        # 응답 없는 드라이버를 강제 종료하는 감시 스레드 (종료된 드라이버는 다음 크롤링 전에 교체)
+        self.headless = headless
+        self._driver_killed = False
+        
+        # 로그인 계정별 Chrome 프로필(세션 저장소)과 요청 수 (계정 풀 예산 정산용)
+        self.identity = identity
+        self.request_count = 0
+        self.blocked = False
+        
+        # 설정 파일 기반 선택자 (프로세스 공용, 성공률 통계 유지)
+        self.selectors = get_registry()
+        
+        with stage_timer('driver_start'):
+            self.setup_driver(headless)
+        # 드라이버 시작에 실패하면 감시 스레드가 남지 않도록 시작 후에 생성
+        self.watchdog = DriverWatchdog(self._on_deadline_expired)
+        self.wait = WebDriverWait(self.driver, Config.BROWSER_TIMEOUT)
+        
+        # 미디어 다운로드 (게시물 탐색과 병렬로 백그라운드 다운로드)
+        if download_media is None:
+            download_media = Config.MEDIA_DOWNLOAD_ENABLED
+        self.media_downloader = None
+        if download_media:
+            from media_downloader import MediaDownloader
+            self.media_downloader = MediaDownloader()
         
         # 로그인 정보
-        self.username = os.getenv('INSTAGRAM_USERNAME')
-        self.password = os.getenv('INSTAGRAM_PASSWORD')
+        if identity is not None:
+            self.username = identity.username
+            self.password = identity.password
+        else:
+            self.username = os.getenv('INSTAGRAM_USERNAME')
+            self.password = os.getenv('INSTAGRAM_PASSWORD')
+        
+        # 요청 속도 조절기/차단기 (계정 풀을 사용하면 같은 계정의 모든 크롤러가 공유)
+        self.governor = identity.governor if identity is not None else RateGovernor(self.username or 'anonymous')
         
         if not self.username or not self.password:
             self.logger.warning("인스타그램 로그인 정보가 .env 파일에 설정되지 않았습니다.")
             self.logger.warning("INSTAGRAM_USERNAME과 INSTAGRAM_PASSWORD를 설정해주세요.")
         
     def setup_logging(self):
-        """로깅 설정"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('instagram_crawler.log', encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        """로깅 설정 (프로세스에서 이미 설정된 경우 그대로 사용)"""
+        configure_logging()
         self.logger = logging.getLogger(__name__)
         
+    def _sleep(self, seconds):
+        """페이지 로딩 등을 위한 고정 대기 (Config.WAIT_SCALE 배율 적용)"""
+        time.sleep(seconds * self.wait_scale)
+        
+    @traced()
     def setup_driver(self, headless):
         """Selenium WebDriver 설정"""
         chrome_options = Options()
@@ -62,128 +114,220 @@ class InstagramCrawler:
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
         
+        # 계정별 프로필 디렉토리에 로그인 쿠키를 유지하여 크롤링마다 다시 로그인하지 않음
+        session_dir = getattr(self.identity, 'session_dir', None)
+        if session_dir:
+            os.makedirs(session_dir, exist_ok=True)
+            chrome_options.add_argument(f'--user-data-dir={os.path.abspath(session_dir)}')
+        
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
+            # 페이지 이동/스크립트가 끝나지 않으면 TimeoutException 발생
+            self.driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
+            self.driver.set_script_timeout(Config.PAGE_LOAD_TIMEOUT)
             self.logger.info("WebDriver 초기화 성공")
         except Exception as e:
             self.logger.error(f"WebDriver 초기화 실패: {e}")
             raise
             
-    def crawl_account(self, username):
+    def _on_deadline_expired(self, kind):
+        """감시 스레드에서 호출: 마감 시간을 넘긴 드라이버 프로세스 트리 강제 종료"""
+        DRIVER_TIMEOUTS.inc(kind=f"{kind}_killed")
+        self.logger.error(f"드라이버 작업 시간 초과 ({kind}), 드라이버 프로세스를 강제 종료합니다.")
+        self._kill_driver()
+        
+    def _kill_driver(self):
+        """chromedriver와 하위 Chrome 프로세스 강제 종료"""
+        self._driver_killed = True
+        process = getattr(getattr(getattr(self, 'driver', None), 'service', None), 'process', None)
+        if process is None or process.poll() is not None:
+            return
+        pids = kill_process_tree(process.pid)
+        try:
+            # 좀비 프로세스가 남지 않도록 회수
+            process.wait(timeout=5)
+        except Exception:
+            pass
+        self.logger.warning(f"드라이버 프로세스 {len(pids)}개 종료됨")
+        
+    def restart_driver(self):
+        """종료된(또는 응답 없는) 드라이버를 새 드라이버로 교체"""
+        if not self._driver_killed:
+            self._kill_driver()
+        with stage_timer('driver_start'):
+            self.setup_driver(self.headless)
+        self.wait = WebDriverWait(self.driver, Config.BROWSER_TIMEOUT)
+        self._driver_killed = False
+        self.logger.info("WebDriver 교체 완료")
+        
+    def _navigate(self, url, login_expected=False):
         """
-        특정 인스타그램 계정 크롤링
+        페이지 이동 (페이지 로드 시간 초과 시 로딩을 멈추고 계속 진행)
+        
+        Selenium 시간 초과에도 응답이 없으면 감시 스레드가 드라이버를 강제 종료합니다.
+        이동 전에는 속도 조절기에 맞춰 대기하고, 이동 후에는 페이지 상태(요청 제한, 본인 확인 등)를 반영합니다.
+        
+        Args:
+            url (str): 이동할 주소
+            login_expected (bool): 로그인 확인 전 이동이라 로그인 페이지가 표시되어도 되는지 여부
+            
+        Returns:
+            str: 페이지 상태 (normal, rate_limited, logged_out)
+            
+        Raises:
+            CircuitOpenError: 차단기가 열려 있거나 본인 확인 페이지가 표시됨
+            LoggedOutError: 로그인 상태여야 하는 페이지에서 로그인 페이지로 이동됨
+        """
+        self.governor.before_request()
+        self.request_count += 1
+        with self.watchdog.deadline('navigation', Config.PAGE_LOAD_TIMEOUT + KILL_GRACE_SECONDS):
+            try:
+                self.driver.get(url)
+            except TimeoutException:
+                DRIVER_TIMEOUTS.inc(kind='page_load')
+                self.logger.warning(f"페이지 로드 시간 초과, 로딩 중지 후 계속 진행: {url}")
+                try:
+                    self.driver.execute_script("window.stop();")
+                except Exception:
+                    pass
+                    
+        status = self.governor.observe(classify_driver_page(self.driver), login_expected=login_expected)
+        if status == CHALLENGE or self.governor.is_open():
+            raise CircuitOpenError(f"크롤링 계정 {self.governor.name} 차단됨 ({status}): {url}")
+        if status == LOGGED_OUT and not login_expected:
+            raise LoggedOutError(f"크롤링 계정 {self.governor.name} 로그인 세션 끊김: {url}")
+        return status
+        
+    @traced()
+    def crawl_account(self, username, max_posts=None):
+        """
+        특정 인스타그램 계정 크롤링 (계정당 최대 Config.ACCOUNT_TIMEOUT_SECONDS)
         
         Args:
             username (str): 크롤링할 인스타그램 사용자명
+            max_posts (int): 수집할 최근 게시물 수 (None이면 Config.MAX_POSTS_PER_ACCOUNT)
             
         Returns:
             dict: 수집된 계정 정보
         """
+        if self._driver_killed:
+            try:
+                self.restart_driver()
+            except Exception as e:
+                self.logger.error(f"WebDriver 교체 실패: {e}")
+                return None
+                
+        # 선택자 설정 파일이 수정되었으면 다시 읽기
+        self.selectors.reload_if_changed()
+        
+        with log_context(username=username), self.watchdog.deadline('account', Config.ACCOUNT_TIMEOUT_SECONDS):
+            result = self._crawl_account(username, max_posts or Config.MAX_POSTS_PER_ACCOUNT)
+            
+        if self._driver_killed:
+            self.logger.error(f"계정 {username} 크롤링 중 드라이버가 강제 종료되었습니다.")
+            return None
+        return result
+        
+    def _crawl_account(self, username, max_posts):
+        """crawl_account 본문 (감시 마감 시간 안에서 실행)"""
         try:
             self.logger.info(f"계정 {username} 크롤링 시작")
             
             # 현재 크롤링 중인 사용자명 저장
             self.current_username = username
             
-            # 인스타그램 메인 페이지로 이동
-            self.driver.get("https://www.instagram.com/")
-            time.sleep(3)
+            # 인스타그램 메인 페이지로 이동 (로그인 전이면 로그인 페이지로 이동될 수 있음)
+            self._navigate(f"{self.base_url}/", login_expected=True)
+            self._sleep(3)
             
             # 로그인 상태 확인 및 필요시 로그인
             if not self._check_login_status():
                 self.logger.info("로그인이 필요합니다. 자동 로그인을 시도합니다...")
-                if not self._perform_login():
+                with stage_timer('login'):
+                    logged_in = self._perform_login()
+                if not logged_in:
                     self.logger.error("로그인 실패. 크롤링을 중단합니다.")
+                    # 같은 계정으로 로그인을 반복하지 않도록 차단기 열기
+                    if self.username:
+                        self.governor.record_login(False)
                     return None
                 self.logger.info("로그인 성공!")
             
-            # 인스타그램 프로필 페이지로 이동
-            profile_url = f"https://www.instagram.com/{username}/#"
-            self.driver.get(profile_url)
-            
-            # 페이지 로딩 대기
-            time.sleep(3)
-            
-            # JavaScript로 동적 로딩되는 게시물들을 기다림
-            self.logger.info("게시물 로딩 대기 중...")
-            try:
-                # 게시물이 로드될 때까지 최대 30초 대기
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'article a[href*="/p/"]'))
-                )
-                self.logger.info("게시물 로딩 완료")
-            except TimeoutException:
-                self.logger.warning("게시물 로딩 시간 초과, 계속 진행")
-            
-            # 추가 대기 시간
-            time.sleep(5)
+            with stage_timer('profile_load'):
+                # 인스타그램 프로필 페이지로 이동
+                profile_url = f"{self.base_url}/{username}/#"
+                self._navigate(profile_url)
+                
+                # 페이지 로딩 대기
+                self._sleep(3)
+                
+                # JavaScript로 동적 로딩되는 게시물들을 기다림
+                self.logger.info("게시물 로딩 대기 중...")
+                try:
+                    # 게시물이 로드될 때까지 최대 Config.BROWSER_TIMEOUT초 대기
+                    WebDriverWait(self.driver, Config.BROWSER_TIMEOUT).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, 'article a[href*="/p/"]'))
+                    )
+                    self.logger.info("게시물 로딩 완료")
+                except TimeoutException:
+                    self.logger.warning("게시물 로딩 시간 초과, 계속 진행")
+                
+                # 추가 대기 시간
+                self._sleep(5)
+                
+                # 프로필 지표 (팔로워, 팔로우, 게시물 수)
+                profile = self._extract_profile_stats()
             
             # 페이지 스크롤하여 더 많은 게시물 로드
             self.logger.info("페이지 스크롤하여 게시물 로드 중...")
             try:
-                # 페이지 하단으로 스크롤
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
+                with stage_timer('grid_scroll'):
+                    # 페이지 하단으로 스크롤
+                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    self._sleep(3)
                 
                 self.logger.info("페이지 스크롤 완료")
             except Exception as e:
                 self.logger.warning(f"페이지 스크롤 실패: {e}")
             
             # 최근 게시물 정보 수집
-            recent_posts = self._extract_recent_posts()
+            recent_posts = self._extract_recent_posts(max_posts)
+            
+            # 확인할 때가 된 기존 게시물 다시 수집 (수정/삭제 감지)
+            revisited_posts = self._revisit_known_posts(username) if Config.REVISIT_ENABLED else []
             
             result = {
                 'username': username,
                 'crawled_at': datetime.now().isoformat(),
+                'profile': profile,
                 'recent_posts': recent_posts,
+                'revisited_posts': revisited_posts,
             }
             
             self.logger.info(f"계정 {username} 크롤링 완료")
             return result
             
+        except CircuitOpenError as e:
+            self.blocked = True
+            self.logger.error(f"계정 {username} 크롤링 중단: {e}")
+            return None
         except Exception as e:
             self.logger.error(f"계정 {username} 크롤링 실패: {e}")
             return None
             
+    @traced()
     def _check_login_status(self):
         """로그인 상태 확인"""
         try:
             # 로그인된 상태를 나타내는 요소들 확인
-            login_indicators = [
-                'nav[aria-label="Primary navigation"]',  # 메인 네비게이션
-                'a[href="/accounts/activity/"]',  # 활동 알림
-                'a[href="/direct/inbox/"]',  # DM
-                'a[href="/explore/"]',  # 탐색
-                'div[data-testid="user-avatar"]',  # 사용자 아바타
-                'img[alt*="profile picture"]',  # 프로필 사진
-                'a[href="/accounts/edit/"]'  # 프로필 편집
-            ]
-            
-            for indicator in login_indicators:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, indicator)
-                    if element:
-                        self.logger.info("로그인된 상태로 확인됨")
-                        return True
-                except NoSuchElementException:
-                    continue
+            if self.selectors.find(self.driver, 'login_indicators'):
+                self.logger.info("로그인된 상태로 확인됨")
+                return True
             
             # 로그인 페이지 요소 확인
-            login_page_indicators = [
-                'input[name="username"]',
-                'input[name="password"]',
-                'button[type="submit"]',
-                'form[action*="/accounts/login"]'
-            ]
-            
-            for indicator in login_page_indicators:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, indicator)
-                    if element:
-                        self.logger.info("로그인 페이지가 표시됨")
-                        return False
-                except NoSuchElementException:
-                    continue
+            if self.selectors.find(self.driver, 'login_page_indicators'):
+                self.logger.info("로그인 페이지가 표시됨")
+                return False
             
             self.logger.info("로그인 상태를 확인할 수 없습니다. 로그인을 시도합니다.")
             return False
@@ -192,6 +336,7 @@ class InstagramCrawler:
             self.logger.error(f"로그인 상태 확인 중 오류: {e}")
             return False
             
+    @traced()
     def _perform_login(self):
         """인스타그램 로그인 수행"""
         try:
@@ -202,40 +347,37 @@ class InstagramCrawler:
             self.logger.info("로그인 페이지 로딩 중...")
             
             # 로그인 페이지로 이동
-            self.driver.get("https://www.instagram.com/accounts/login/")
-            time.sleep(2)
+            self._navigate(f"{self.base_url}/accounts/login/", login_expected=True)
+            self._sleep(2)
             
             # 사용자명 입력
-            try:
-                username_input = self.driver.find_element(By.CSS_SELECTOR, 'input[name="username"]')
-                username_input.clear()
-                username_input.send_keys(self.username)
-                self.logger.info("사용자명 입력 완료")
-            except NoSuchElementException:
+            username_input = self.selectors.find(self.driver, 'login_username_input')
+            if not username_input:
                 self.logger.error("사용자명 입력 필드를 찾을 수 없습니다.")
                 return False
+            username_input.clear()
+            username_input.send_keys(self.username)
+            self.logger.info("사용자명 입력 완료")
             
             # 비밀번호 입력
-            try:
-                password_input = self.driver.find_element(By.CSS_SELECTOR, 'input[name="password"]')
-                password_input.clear()
-                password_input.send_keys(self.password)
-                self.logger.info("비밀번호 입력 완료")
-            except NoSuchElementException:
+            password_input = self.selectors.find(self.driver, 'login_password_input')
+            if not password_input:
                 self.logger.error("비밀번호 입력 필드를 찾을 수 없습니다.")
                 return False
+            password_input.clear()
+            password_input.send_keys(self.password)
+            self.logger.info("비밀번호 입력 완료")
             
             # 로그인 버튼 클릭
-            try:
-                login_button = self.driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
-                login_button.click()
-                self.logger.info("로그인 버튼 클릭됨")
-            except NoSuchElementException:
+            login_button = self.selectors.find(self.driver, 'login_submit_button')
+            if not login_button:
                 self.logger.error("로그인 버튼을 찾을 수 없습니다.")
                 return False
+            login_button.click()
+            self.logger.info("로그인 버튼 클릭됨")
             
                                     # 로그인 완료 대기
-            time.sleep(2)
+            self._sleep(2)
             
             # 로그인 후 팝업 처리 (로그인 정보 저장 여부)
             self._handle_login_popup()
@@ -248,30 +390,23 @@ class InstagramCrawler:
                 self.logger.error("로그인 실패")
                 return False
     
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.error(f"로그인 중 오류 발생: {e}")
             return False
             
+    @traced()
     def _handle_login_popup(self):
         """로그인 후 나타나는 팝업 처리 (로그인 정보 저장 여부)"""
         try:
             self.logger.info("로그인 후 팝업 처리 중...")
             
             # 팝업이 나타날 때까지 잠시 대기
-            time.sleep(3)
+            self._sleep(3)
             
-            # 팝업 관련 div들을 찾기 (더 정확한 선택자들)
-            div_selectors = [
-                'main>div>div>div'  # 기본 선택자 요소
-            ]
-            
-            divs = []
-            for selector in div_selectors:
-                try:
-                    found_divs = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    divs.extend(found_divs)
-                except:
-                    continue
+            # 팝업 관련 div들을 찾기
+            divs, _ = self.selectors.find_all(self.driver, 'login_popup_containers')
             
             for div in divs:
                 try:
@@ -280,9 +415,9 @@ class InstagramCrawler:
                     
                     # "저장 안 함" 관련 텍스트가 있는 div 찾기
                     if any(keyword in div_text for keyword in ['나중에 하기', '저장 안 함', 'Don\'t Save', '아니오', 'No', '취소', 'Cancel']):
-                        self.logger.info(f"팝업 div 발견: {div_text}")
+                        self.logger.debug(f"팝업 div 발견: {div_text}")
                         div.click()
-                        time.sleep(1)
+                        self._sleep(1)
                         return
                         
                 except Exception as e:
@@ -290,25 +425,15 @@ class InstagramCrawler:
                     continue
             
             # 특정 data-testid를 가진 버튼들도 확인
-            specific_selectors = [
-                'button[data-testid="login-save-login-info-dialog-not-now-button"]',
-                'button[data-testid="login-save-login-info-dialog-not-now"]',
-                'button[data-testid="close-button"]'
-            ]
-            
-            for selector in specific_selectors:
+            element = self.selectors.find(self.driver, 'login_popup_buttons', predicate=lambda e: e.is_displayed())
+            if element:
+                self.logger.debug("특정 팝업 요소 발견")
                 try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element and element.is_displayed():
-                        self.logger.info(f"특정 팝업 요소 발견: {selector}")
-                        element.click()
-                        time.sleep(1)
-                        return
-                except NoSuchElementException:
-                    continue
+                    element.click()
+                    self._sleep(1)
+                    return
                 except Exception as e:
-                    self.logger.debug(f"특정 선택자 처리 중 오류 (무시): {e}")
-                    continue
+                    self.logger.debug(f"특정 팝업 요소 클릭 중 오류 (무시): {e}")
             
             self.logger.info("로그인 후 팝업이 발견되지 않았거나 이미 처리됨")
             
@@ -316,29 +441,15 @@ class InstagramCrawler:
             self.logger.warning(f"팝업 처리 중 오류 (무시): {e}")
             
             
-    def _extract_recent_posts(self):
-        """최근 게시물 정보 추출"""
+    @traced()
+    def _extract_recent_posts(self, max_posts=9):
+        """최근 게시물 정보 추출 (최대 max_posts개)"""
         posts = []
         try:
-            # 여러 가지 선택자로 게시물 찾기 시도
-            post_selectors = [
-                'div>div>div>div>div>div>a'
-            ]
-            
-            post_elements = []
-            used_selector = None
-            
-            for selector in post_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        post_elements = elements
-                        used_selector = selector
-                        self.logger.info(f"게시물 발견! 선택자: {selector}, 개수: {len(elements)}")
-                        break
-                except Exception as e:
-                    self.logger.debug(f"선택자 실패: {selector} - {e}")
-                    continue
+            # 설정된 선택자로 게시물 찾기 시도 (최근 성공한 선택자 우선)
+            post_elements, used_selector = self.selectors.find_all(self.driver, 'post_links')
+            if post_elements:
+                self.logger.debug(f"게시물 발견! 선택자: {used_selector}, 개수: {len(post_elements)}")
             
             if not post_elements:
                 self.logger.warning("모든 선택자로 게시물을 찾을 수 없습니다")
@@ -358,7 +469,7 @@ class InstagramCrawler:
             
             # 모든 게시물 URL을 먼저 수집
             post_urls = []
-            for post_link in post_elements[:9]:  # 최근 9개 게시물
+            for post_link in post_elements[:max_posts]:
                 try:
                     post_url = post_link.get_attribute('href')
                     if post_url and '/p/' in post_url:
@@ -373,73 +484,144 @@ class InstagramCrawler:
             from data_manager import DataManager
             data_manager = DataManager()
             
-            # 중복되지 않는 게시물 URL만 필터링
-            new_post_urls = []
-            for post_url in post_urls:
-                try:
-                    # 데이터베이스에서 해당 URL이 이미 존재하는지 확인
-                    with sqlite3.connect(data_manager.db_path) as conn:
-                        cursor = conn.cursor()
-                        cursor.execute('SELECT id FROM post_data WHERE post_url = ?', (post_url,))
-                        existing_post = cursor.fetchone()
-                        
-                        if not existing_post:
-                            new_post_urls.append(post_url)
-                            self.logger.debug(f"새로운 게시물: {post_url}")
-                        else:
-                            self.logger.info(f"중복 게시물 건너뛰기: {post_url}")
-                            
-                except Exception as e:
-                    self.logger.warning(f"중복 체크 실패: {e}")
-                    # 오류 발생 시 안전하게 포함
-                    new_post_urls.append(post_url)
+            # 중복되지 않는 게시물만 필터링 (미디어 ID 인덱스로 한 번에 조회, 이동할 주소는 원래 주소 유지)
+            with stage_timer('dedup'):
+                new_post_urls = data_manager.filter_new_post_urls(post_urls)
             
             self.logger.info(f"중복 체크 완료: {len(post_urls)}개 중 {len(new_post_urls)}개가 새로운 게시물")
             
             # 중복되지 않는 게시물만 상세 정보 수집
+            media_futures = []
             for i, post_url in enumerate(new_post_urls):
-                try:
-                    self.logger.info(f"새로운 게시물 {i+1}/{len(new_post_urls)} 처리 중: {post_url}")
-                    
-                    # 게시물 페이지로 이동하여 상세 정보 수집
-                    post_info = self._extract_post_details(post_url)
-                    if post_info:
-                        post_info['post_number'] = i + 1
-                        posts.append(post_info)
-                        self.logger.info(f"게시물 {i+1} 정보 추출 성공")
-                    
-                    # 인스타그램 메인 페이지로 돌아가기
-                    self.driver.get(f"https://www.instagram.com/{self.current_username}/")
-                    time.sleep(3)  # 페이지 로딩 대기
-                    
-                except Exception as e:
-                    self.logger.warning(f"게시물 {i+1} 정보 추출 실패: {e}")
+                with log_context(post_url=post_url):
+                    try:
+                        self.logger.debug(f"새로운 게시물 {i+1}/{len(new_post_urls)} 처리 중: {post_url}")
+                        
+                        # 게시물 페이지로 이동하여 상세 정보 수집
+                        with stage_timer('post_detail'):
+                            post_info = self._extract_post_details(post_url)
+                        if post_info:
+                            post_info['post_number'] = i + 1
+                            posts.append(post_info)
+                            self.logger.debug(f"게시물 {i+1} 정보 추출 성공")
+                            
+                            # 이미지 다운로드는 백그라운드에서 진행
+                            if self.media_downloader and post_info.get('image_url'):
+                                media_futures.append((post_info, self.media_downloader.submit(post_info['image_url'])))
+                        
+                        # 인스타그램 메인 페이지로 돌아가기
+                        with stage_timer('profile_return'):
+                            self._navigate(f"{self.base_url}/{self.current_username}/")
+                            self._sleep(3)  # 페이지 로딩 대기
+                        
+                    except CircuitOpenError:
+                        raise
+                    except Exception as e:
+                        self.logger.warning(f"게시물 {i+1} 정보 추출 실패: {e}")
+            
+            # 이미지 다운로드 결과 수집
+            for post_info, future in media_futures:
+                post_info['media'] = future.result()
+            if media_futures:
+                downloaded = sum(1 for post_info, _ in media_futures if post_info['media'])
+                self.logger.info(f"이미지 다운로드 완료: {len(media_futures)}개 중 {downloaded}개")
                     
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.warning(f"게시물 정보 추출 실패: {e}")
             
         return posts
         
+    def _extract_profile_stats(self):
+        """
+        프로필 페이지의 팔로워/팔로우/게시물 수 추출 (og:description 우선, 없으면 프로필 헤더)
+        
+        Returns:
+            dict: followers, following, posts 중 찾은 지표 (실패 시 빈 dict)
+        """
+        try:
+            texts = []
+            description = self.selectors.find(self.driver, 'page_description')
+            if description:
+                texts.append(description.get_attribute('content'))
+            profile = parse_counts(texts, PROFILE_LABELS)
+            if len(profile) < len(PROFILE_LABELS):
+                elements, _ = self.selectors.find_all(self.driver, 'profile_stats')
+                for metric, value in parse_counts([element.text for element in elements], PROFILE_LABELS).items():
+                    profile.setdefault(metric, value)
+            self.logger.debug(f"프로필 지표: {profile}")
+            return profile
+        except Exception as e:
+            self.logger.warning(f"프로필 지표 추출 실패: {e}")
+            return {}
+        
+    def _revisit_known_posts(self, username):
+        """
+        저장된 게시물 중 재확인 일정이 된 게시물을 다시 수집 (계정 크롤링당 최대 Config.REVISIT_MAX_POSTS개)
+        
+        Returns:
+            list: 다시 추출한 게시물 정보 목록 (삭제된 게시물은 post_url과 deleted=True만 포함)
+        """
+        revisited = []
+        from data_manager import DataManager
+        due_posts = DataManager().get_posts_due_for_revisit(username)
+        for post in due_posts:
+            # 저장된 주소는 정규화된 주소이므로 현재 접속 주소(INSTAGRAM_BASE_URL)의 같은 경로로 이동
+            post_url = f"{self.base_url}{urlsplit(post['post_url']).path}"
+            with log_context(post_url=post_url):
+                try:
+                    with stage_timer('post_revisit'):
+                        post_info = self._extract_post_details(post_url)
+                    if post_info is None:
+                        continue
+                    if post_info['image_url'] or post_info['caption'] or post_info['posted_at']:
+                        post_info['post_url'] = post['post_url']
+                        revisited.append(post_info)
+                    elif self._is_post_unavailable():
+                        revisited.append({'post_url': post['post_url'], 'deleted': True})
+                    else:
+                        # 페이지를 읽지 못한 경우 수정으로 잘못 기록하지 않도록 건너뜀 (다음 크롤링에서 다시 확인)
+                        self.logger.warning(f"게시물 재확인 실패, 내용을 찾을 수 없습니다: {post_url}")
+                except CircuitOpenError:
+                    raise
+                except Exception as e:
+                    self.logger.warning(f"게시물 재확인 실패: {e}")
+        if due_posts:
+            self.logger.info(f"기존 게시물 {len(due_posts)}개 중 {len(revisited)}개 재확인 완료")
+        return revisited
+        
+    def _is_post_unavailable(self):
+        """현재 페이지가 삭제되었거나 볼 수 없는 게시물 안내 페이지인지 확인"""
+        try:
+            _, text = self.driver.execute_script(PAGE_SNAPSHOT_SCRIPT)
+        except Exception as e:
+            self.logger.debug(f"게시물 페이지 상태 확인 실패: {e}")
+            return False
+        text = (text or '').lower()
+        return any(marker in text for marker in POST_UNAVAILABLE_TEXT_MARKERS)
+        
+    @traced()
     def _extract_post_details(self, post_url):
         """개별 게시물 상세 정보 추출"""
         def _close_more_text_popup():
             """'더 보기' 팝업 닫기"""
             try:
                 # "00님의 글 더 보기" 텍스트가 있는 span 찾기
-                spans = self.driver.find_elements(By.CSS_SELECTOR, 'div>div>div>div>span')
+                spans, _ = self.selectors.find_all(self.driver, 'more_text_spans')
                 
                 for span in spans:
                     span_text = span.text.strip()
                     if '님의 글 더 보기' in span_text:
-                        self.logger.info(f"'더 보기' 팝업 발견: {span_text}")
+                        self.logger.debug(f"'더 보기' 팝업 발견: {span_text}")
                         
                         # aria-label="닫기"인 svg 직접 찾기
                         try:
-                            close_svgs = self.driver.find_elements(By.CSS_SELECTOR, 'div>div>svg[aria-label="닫기"]')
+                            close_svgs, _ = self.selectors.find_all(self.driver, 'more_text_close_buttons')
                             if close_svgs:
-                                self.logger.info("닫기 버튼 발견, 클릭합니다.")
+                                self.logger.debug("닫기 버튼 발견, 클릭합니다.")
                                 close_svgs[0].click()
-                                time.sleep(1)
+                                self._sleep(1)
                                 return
                         except Exception as e:
                             self.logger.debug(f"닫기 버튼 찾기 실패: {e}")
@@ -450,8 +632,8 @@ class InstagramCrawler:
                 pass
         try:
             # 게시물 페이지로 이동
-            self.driver.get(post_url)
-            time.sleep(3)  # 페이지 로딩 대기
+            self._navigate(post_url)
+            self._sleep(3)  # 페이지 로딩 대기
             
             # '더 보기' 팝업 닫기
             _close_more_text_popup()
@@ -479,53 +661,37 @@ class InstagramCrawler:
                 'posted_at': None,
                 'hashtags': [],
                 'mentions': [],
+                'likes': None,
+                'comments': None,
                 'timestamp': datetime.now().isoformat()
             }
             
             # 이미지 URL 추출
-            try:
-                img_element = self.driver.find_element(By.CSS_SELECTOR, 'article img')
+            img_element = self.selectors.find(self.driver, 'post_image')
+            if img_element:
                 post_info['image_url'] = img_element.get_attribute('src')
-            except NoSuchElementException:
-                pass
                 
             # 캡션 추출
             try:
-                self.logger.info("캡션 요소 찾기 시도 중...")
-                
-                # 여러 가지 선택자 시도
-                caption_selectors = [
-                    'div>span>div>span'
-                ]
+                self.logger.debug("캡션 요소 찾기 시도 중...")
                 
-                caption_element = None
-                used_selector = None
-                
-                for selector in caption_selectors:
-                    try:
-                        caption_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if caption_element and caption_element.text.strip():
-                            used_selector = selector
-                            self.logger.info(f"캡션 요소 발견! 선택자: {selector}")
-                            break
-                    except NoSuchElementException:
-                        self.logger.debug(f"선택자 실패: {selector}")
-                        continue
+                # 텍스트가 있는 첫 캡션 요소 (최근 성공한 선택자 우선)
+                caption_element = self.selectors.find(self.driver, 'post_caption', predicate=lambda e: e.text.strip())
                 
-                if caption_element and caption_element.text.strip():
+                if caption_element:
                     caption = caption_element.text.strip()
-                    self.logger.info(f"캡션 추출 성공: {caption[:100]}...")
+                    self.logger.debug(f"캡션 추출 성공: {caption[:100]}...")
                     post_info['caption'] = caption
                     
                     # 해시태그 추출
                     hashtags = re.findall(r'#\w+', caption)
                     post_info['hashtags'] = hashtags
-                    self.logger.info(f"해시태그 추출: {hashtags}")
+                    self.logger.debug(f"해시태그 추출: {hashtags}")
                     
                     # 멘션 추출
                     mentions = re.findall(r'@\w+', caption)
                     post_info['mentions'] = mentions
-                    self.logger.info(f"멘션 추출: {mentions}")
+                    self.logger.debug(f"멘션 추출: {mentions}")
                 else:
                     self.logger.warning("캡션을 찾을 수 없습니다")
                     
@@ -534,23 +700,40 @@ class InstagramCrawler:
                 pass
                 
             # 게시 시간 추출
-            try:
-                time_element = self.driver.find_element(By.CSS_SELECTOR, 'time')
+            time_element = self.selectors.find(self.driver, 'post_time')
+            if time_element:
                 post_info['posted_at'] = time_element.get_attribute('datetime')
-            except NoSuchElementException:
-                pass
+                
+            # 좋아요/댓글 수 추출 (og:description 요약)
+            description = self.selectors.find(self.driver, 'page_description')
+            if description:
+                post_info.update(parse_counts([description.get_attribute('content')], POST_LABELS))
                 
             return post_info
             
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.warning(f"게시물 상세 정보 추출 실패: {e}")
             return None
             
     def close(self):
-        """브라우저 종료"""
+        """브라우저 종료 (정상 종료되지 않으면 프로세스 트리 강제 종료)"""
+        if getattr(self, 'media_downloader', None):
+            self.media_downloader.close()
         if hasattr(self, 'driver'):
-            self.driver.quit()
-            self.logger.info("WebDriver 종료")
+            if self._driver_killed:
+                self.logger.info("WebDriver 이미 강제 종료됨")
+            else:
+                try:
+                    with self.watchdog.deadline('quit', KILL_GRACE_SECONDS):
+                        self.driver.quit()
+                    self.logger.info("WebDriver 종료")
+                except Exception as e:
+                    self.logger.warning(f"WebDriver 정상 종료 실패, 강제 종료합니다: {e}")
+                    self._kill_driver()
+        if hasattr(self, 'watchdog'):
+            self.watchdog.stop()
             
     def __enter__(self):
         return self
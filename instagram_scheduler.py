@@ -1,57 +1,187 @@
-import schedule
 import time
 import threading
 import logging
 from datetime import datetime, timedelta
-from instagram_crawler import InstagramCrawler
 from data_manager import DataManager
 from config import Config
+from metrics import ACCOUNT_CRAWLS, POST_REVISITS, POSTS_SAVED, stage_timer
+from profiling import profile_context
+
+# schedule, InstagramCrawler(selenium/bs4/requests)는 실제 크롤링 시에만 지연 import
+# (--status, --statistics 등 조회 명령의 시작 시간 단축)
 
 class InstagramScheduler:
-    def __init__(self, accounts=None, interval_hours=24):
+    def __init__(self, accounts=None, interval_hours=24, profiler=None):
         """
         인스타그램 크롤링 스케줄러 초기화
         
         Args:
-            accounts (list): 크롤링할 인스타그램 계정 목록
+            accounts (list): 크롤링할 인스타그램 계정 목록 (None이면 계정 목록 DB에서 읽음)
             interval_hours (int): 크롤링 간격 (시간 단위)
+            profiler (CrawlProfiler): 계정별 크롤링을 프로파일링할 프로파일러 (None이면 비활성화)
         """
-        self.accounts = accounts or []
+        # accounts를 지정하지 않으면 처음 사용할 때 계정 목록 DB에서 읽고, 변경 번호가 바뀔 때만 다시 읽음
+        self._use_registry = accounts is None
+        self._accounts = list(accounts) if accounts is not None else None
+        self._accounts_version = None
+        self._registry = None
+        self.account_settings = {}
         self.interval_hours = interval_hours
-        self.data_manager = DataManager()
+        self.profiler = profiler
+        self._data_manager = None
+        self._credentials = None
+        self.notifier = None
         self.setup_logging()
         self.running = False
         self.thread = None
+        # 설정되면 크롤링 계정 대기를 중단 (stop()에서 설정)
+        self.stop_event = threading.Event()
         
     def setup_logging(self):
         """로깅 설정"""
         self.logger = logging.getLogger(__name__)
         
-    def add_account(self, username):
+    @property
+    def data_manager(self):
+        """데이터 관리자 (처음 사용할 때 생성)"""
+        if self._data_manager is None:
+            self._data_manager = DataManager()
+        return self._data_manager
+        
+    @property
+    def credentials(self):
+        """크롤링 계정 풀 (처음 사용할 때 생성)"""
+        if self._credentials is None:
+            from credential_pool import CredentialPool
+            self._credentials = CredentialPool.from_config()
+        return self._credentials
+        
+    def start_notifier(self):
+        """새 게시물 웹훅 전송기 시작 (WEBHOOK_URLS가 없으면 아무것도 하지 않음, 크롤링 스레드는 notify()만 호출)"""
+        if self.notifier is None:
+            from webhook_notifier import WebhookNotifier
+            self.notifier = WebhookNotifier.from_config(self.data_manager)
+            if self.notifier:
+                self.notifier.start()
+                
+    def stop_notifier(self):
+        """웹훅 전송기 중지 (남은 새 게시물은 전송을 한 번 시도하고, 실패분은 대기열에 남김)"""
+        if self.notifier:
+            self.notifier.stop(flush=True)
+        self.notifier = None
+        
+    @property
+    def registry(self):
+        """계정 목록 DB (처음 사용할 때 생성, 테이블은 DataManager가 생성)"""
+        if self._registry is None:
+            from account_registry import AccountRegistry
+            self._registry = AccountRegistry(self.data_manager.db_path)
+        return self._registry
+        
+    @property
+    def accounts(self):
+        """크롤링할 계정 목록 (분산 워커가 같은 리스트를 참조하므로 내용만 갱신)"""
+        if self._accounts is None:
+            self._accounts = []
+            self.refresh_accounts()
+        return self._accounts
+        
+    def refresh_accounts(self):
+        """
+        계정 목록 DB가 변경되었으면 계정 목록과 계정별 설정 다시 읽기
+        
+        변경 번호 한 행만 조회하므로 크롤링마다 호출해도 부담이 없습니다.
+        계정 목록 DB를 한 번도 사용하지 않았으면 Config.DEFAULT_ACCOUNTS로 채웁니다.
+        
+        Returns:
+            bool: 다시 읽었는지 여부
+        """
+        if not self._use_registry:
+            return False
+        if self._accounts is None:
+            self._accounts = []
+            
+        version = self.registry.get_version()
+        if version is None or version == self._accounts_version:
+            return False
+        if version == 0 and Config.DEFAULT_ACCOUNTS:
+            self.registry.add_accounts(Config.DEFAULT_ACCOUNTS)
+            version = self.registry.get_version()
+            
+        rows = self.registry.get_accounts()
+        self.account_settings = {row['username']: row for row in rows}
+        self._accounts[:] = [row['username'] for row in rows]
+        self._accounts_version = version
+        self.logger.info(f"계정 목록 로드됨: {len(rows)}개 (변경 번호 {version})")
+        return True
+        
+    def add_account(self, username, **settings):
         """
-        크롤링할 계정 추가
+        크롤링할 계정 추가 (계정 목록 DB에 저장, 이미 있으면 설정 갱신)
         
         Args:
             username (str): 인스타그램 사용자명
+            **settings: enabled, priority, interval_hours, max_posts
+            
+        Returns:
+            bool: 추가 성공 여부
         """
-        if username not in self.accounts:
+        if not self.registry.add_account(username, **settings):
+            return False
+        if not self._use_registry and username not in self.accounts:
             self.accounts.append(username)
-            self.logger.info(f"계정 추가됨: {username}")
-        else:
-            self.logger.warning(f"이미 존재하는 계정: {username}")
+        self.refresh_accounts()
+        self.logger.info(f"계정 추가됨: {username}")
+        return True
             
     def remove_account(self, username):
         """
-        크롤링할 계정 제거
+        크롤링할 계정 제거 (계정 목록 DB에서 삭제)
         
         Args:
             username (str): 제거할 인스타그램 사용자명
+            
+        Returns:
+            bool: 제거 여부
         """
-        if username in self.accounts:
+        removed = self.registry.remove_account(username)
+        if not self._use_registry and username in self.accounts:
             self.accounts.remove(username)
+            removed = True
+        if removed:
+            self.refresh_accounts()
             self.logger.info(f"계정 제거됨: {username}")
         else:
             self.logger.warning(f"존재하지 않는 계정: {username}")
+        return removed
+        
+    def due_accounts(self):
+        """
+        이번 회차에 크롤링할 계정 (마지막 성공한 크롤링 이후 계정별 interval_hours가 지나지 않은 계정 제외)
+        
+        실패한 크롤링은 간격 계산에 포함하지 않으므로 실패한 계정은 다음 회차에 다시 크롤링합니다.
+        
+        Returns:
+            list: 사용자명 목록 (우선순위 순)
+        """
+        accounts = list(self.accounts)
+        if not any(self.account_settings.get(username, {}).get('interval_hours') for username in accounts):
+            return accounts
+        
+        last_successes = {item['username']: item['last_success'] for item in self.data_manager.get_account_statistics()}
+        now = datetime.now()
+        due = []
+        for username in accounts:
+            interval = self.account_settings.get(username, {}).get('interval_hours')
+            last_success = last_successes.get(username)
+            if interval and last_success:
+                try:
+                    if datetime.fromisoformat(last_success) + timedelta(hours=interval) > now:
+                        continue
+                except ValueError:
+                    pass
+            due.append(username)
+        return due
             
     def set_interval(self, hours):
         """
@@ -63,54 +193,155 @@ class InstagramScheduler:
         self.interval_hours = hours
         self.logger.info(f"크롤링 간격 설정: {hours}시간")
         
-    def crawl_single_account(self, username):
+    def crawl_single_account(self, username, stop_event=None):
         """
         단일 계정 크롤링
         
+        모든 크롤링 계정의 예산이 없거나 차단기가 열려 있으면 최대 Config.IDENTITY_WAIT_SECONDS 동안
+        기다린 뒤 이 계정을 건너뜁니다.
+        
         Args:
             username (str): 크롤링할 인스타그램 사용자명
+            stop_event (threading.Event): 설정되면 크롤링 계정 대기 중단 (None이면 self.stop_event)
+            
+        Returns:
+            bool: 크롤링 및 저장 성공 여부
         """
+        max_posts = self.account_settings.get(username, {}).get('max_posts') or Config.MAX_POSTS_PER_ACCOUNT
+        
+        # 예산이 남은 크롤링 계정 배정 (프로필 1회 + 게시물마다 이동/복귀 2회 요청으로 예약)
+        reserved = 2 + 2 * max_posts
+        identity = self.credentials.acquire(
+            reserved, timeout=Config.IDENTITY_WAIT_SECONDS, stop_event=stop_event or self.stop_event
+        )
+        if identity is None:
+            ACCOUNT_CRAWLS.inc(username=username, status='no_identity')
+            self.logger.error(f"계정 {username} 크롤링 실패: 사용할 수 있는 크롤링 계정 없음")
+            return False
+        
+        crawler = None
+        success = False
         try:
-            self.logger.info(f"계정 {username} 크롤링 시작")
+            from instagram_crawler import InstagramCrawler
             
-            with InstagramCrawler(headless=Config.HEADLESS_MODE) as crawler:
-                result = crawler.crawl_account(username)
+            self.logger.info(f"계정 {username} 크롤링 시작 (크롤링 계정: {identity.name})")
+            
+            with profile_context(self.profiler, username), stage_timer('account_total', username=username), \
+                    InstagramCrawler(headless=Config.HEADLESS_MODE, identity=identity) as crawler:
+                result = crawler.crawl_account(username, max_posts=max_posts)
                 
                 if result:
                     # 데이터 저장
-                    if self.data_manager.save_crawl_data(result):
+                    with stage_timer('db_save'):
+                        saved = self.data_manager.save_crawl_data(result)
+                    if saved:
+                        ACCOUNT_CRAWLS.inc(username=username, status='success')
+                        POSTS_SAVED.inc(result.get('new_posts_count', 0), username=username)
+                        revisit_counts = result.get('revisit_counts', {})
+                        for outcome, count in revisit_counts.items():
+                            POST_REVISITS.inc(count, result=outcome)
+                        changed = result.get('new_posts_count') or revisit_counts.get('edited') or revisit_counts.get('deleted')
+                        if changed and self.notifier:
+                            # 전송 스레드만 깨우므로 크롤링을 막지 않음
+                            self.notifier.notify()
                         self.logger.info(f"계정 {username} 크롤링 및 저장 완료")
+                        success = True
                     else:
+                        ACCOUNT_CRAWLS.inc(username=username, status='save_failed')
                         self.logger.error(f"계정 {username} 데이터 저장 실패")
                 else:
+                    ACCOUNT_CRAWLS.inc(username=username, status='blocked' if crawler.blocked else 'crawl_failed')
                     self.logger.error(f"계정 {username} 크롤링 실패")
                     
         except Exception as e:
+            ACCOUNT_CRAWLS.inc(username=username, status='error')
             self.logger.error(f"계정 {username} 크롤링 중 오류 발생: {e}")
+        finally:
+            self.credentials.release(identity, reserved, used=crawler.request_count if crawler else 0)
+        return success
             
     def crawl_all_accounts(self):
         """모든 계정 크롤링"""
+        self.refresh_accounts()
         if not self.accounts:
             self.logger.warning("크롤링할 계정이 없습니다.")
             return
             
-        self.logger.info(f"전체 {len(self.accounts)}개 계정 크롤링 시작")
+        accounts = self.due_accounts()
+        if not accounts:
+            self.logger.info("크롤링 간격이 지난 계정이 없습니다.")
+            return
+            
+        # 크롤링 계정 수만큼 동시에 크롤링 (계정이 하나면 기존처럼 순서대로)
+        workers = min(self.credentials.size, len(accounts))
+        if self.profiler and workers > 1:
+            # cProfile은 프로세스당 하나만 활성화할 수 있으므로 프로파일링 중에는 순서대로 크롤링
+            self.logger.info(f"프로파일링 모드이므로 동시 크롤링 {workers}개 대신 순서대로 크롤링합니다.")
+            workers = 1
+        self.logger.info(f"전체 {len(accounts)}개 계정 크롤링 시작 (동시 {workers}개)")
         start_time = datetime.now()
         
-        for username in self.accounts:
+        def crawl(username):
             try:
                 self.crawl_single_account(username)
                 # 계정 간 간격을 두어 서버 부하 방지
-                time.sleep(5)
+                time.sleep(Config.ACCOUNT_INTERVAL_SECONDS)
             except Exception as e:
                 self.logger.error(f"계정 {username} 크롤링 실패: {e}")
                 
+        if workers <= 1:
+            for username in accounts:
+                crawl(username)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='crawl') as executor:
+                list(executor.map(crawl, accounts))
+                
         end_time = datetime.now()
         duration = end_time - start_time
         self.logger.info(f"전체 크롤링 완료. 소요시간: {duration}")
         
+    def run_worker(self, coordinator, once=False, stop_event=None):
+        """
+        분산 크롤링 워커로 실행 (코디네이터에서 담당 계정의 임대를 얻어 크롤링)
+        
+        Args:
+            coordinator (CrawlCoordinator): 공유 코디네이터
+            once (bool): 모든 계정이 한 번씩 크롤링되면 종료
+            stop_event (threading.Event): 설정되면 종료
+            
+        Returns:
+            int: 이 워커가 크롤링한 계정 수
+        """
+        from coordinator import run_worker
+        from logging_setup import log_context
+        
+        stop_event = stop_event or self.stop_event
+        
+        def crawl(username):
+            success = self.crawl_single_account(username, stop_event=stop_event)
+            # 계정 간 간격을 두어 서버 부하 방지
+            time.sleep(Config.ACCOUNT_INTERVAL_SECONDS)
+            # 계정 목록 DB가 바뀌었으면 코디네이터가 보는 목록도 갱신
+            self.refresh_accounts()
+            return success
+        
+        self.logger.info(f"분산 워커 시작: {coordinator.worker_id}, 계정 {len(self.accounts)}개")
+        self.start_notifier()
+        try:
+            with log_context(worker_id=coordinator.worker_id):
+                return run_worker(
+                    coordinator, self.accounts, crawl, self.interval_hours, once=once, stop_event=stop_event,
+                    interval_for=lambda username: self.account_settings.get(username, {}).get('interval_hours')
+                )
+        finally:
+            self.stop_notifier()
+        
     def schedule_crawling(self):
         """크롤링 스케줄 설정"""
+        import schedule
+        
         # 매일 지정된 시간에 크롤링 실행
         schedule.every(self.interval_hours).hours.do(self.crawl_all_accounts)
         
@@ -125,7 +356,11 @@ class InstagramScheduler:
             self.logger.warning("스케줄러가 이미 실행 중입니다.")
             return
             
+        import schedule
+        
         self.running = True
+        self.stop_event.clear()
+        self.start_notifier()
         self.schedule_crawling()
         
         def run_scheduler():
@@ -144,11 +379,15 @@ class InstagramScheduler:
             self.logger.warning("스케줄러가 실행 중이 아닙니다.")
             return
             
+        import schedule
+        
         self.running = False
+        self.stop_event.set()
         schedule.clear()
         
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5)
+        self.stop_notifier()
             
         self.logger.info("스케줄러 중지됨")
         
@@ -159,7 +398,11 @@ class InstagramScheduler:
         Returns:
             dict: 스케줄러 상태 정보
         """
-        next_run = schedule.next_run()
+        # 실행 중이 아니면 등록된 작업이 없으므로 schedule을 import하지 않음
+        next_run = None
+        if self.running:
+            import schedule
+            next_run = schedule.next_run()
         
         return {
             'running': self.running,
@@ -172,7 +415,11 @@ class InstagramScheduler:
     def run_once(self):
         """즉시 한 번 크롤링 실행"""
         self.logger.info("즉시 크롤링 실행")
-        self.crawl_all_accounts()
+        self.start_notifier()
+        try:
+            self.crawl_all_accounts()
+        finally:
+            self.stop_notifier()
         
     def get_statistics(self):
         """
@@ -0,0 +1,197 @@
+import atexit
+import contextvars
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 텍스트 로그 형식 (기존 로그 파일과 동일 + 계정/게시물 문맥, 속도 제한으로 버려진 DEBUG 로그 수)
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s%(context_suffix)s'
+
+# JSON 레코드에 포함할 LogRecord 기본 필드 외의 문맥 키 순서
+CONTEXT_KEYS = ('username', 'post_url', 'worker_id')
+
+_context = contextvars.ContextVar('log_context', default={})
+_listener = None
+_configure_lock = threading.Lock()
+
+class ContextFilter(logging.Filter):
+    """현재 실행 문맥(계정, 게시물 등)과 버려진 DEBUG 로그 수를 로그 레코드에 추가 (DebugSampler 다음에 적용)"""
+    
+    def filter(self, record):
+        context = _context.get()
+        record.context = context
+        items = dict(context)
+        if getattr(record, 'suppressed', 0):
+            items['suppressed'] = record.suppressed
+        record.context_suffix = ' [' + ' '.join(f"{key}={value}" for key, value in items.items()) + ']' if items else ''
+        return True
+
+class DebugSampler(logging.Filter):
+    def __init__(self, sample_rate=1.0, limit=60, window_seconds=60.0):
+        """
+        DEBUG 로그 표본 추출 및 호출 위치별 속도 제한
+        
+        INFO 이상은 항상 통과하며, DEBUG는 sample_rate 확률로 통과한 뒤
+        같은 호출 위치(파일:줄)에서 window_seconds 동안 최대 limit개까지만 기록합니다.
+        제한으로 버려진 개수는 다음으로 기록되는 레코드의 suppressed 값으로 남깁니다.
+        
+        Args:
+            sample_rate (float): DEBUG 로그 표본 비율 (0~1)
+            limit (int): 호출 위치별 구간당 최대 기록 수 (0 이하이면 제한 없음)
+            window_seconds (float): 속도 제한 구간 (초)
+        """
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._windows = {}
+        self._lock = threading.Lock()
+    
+    def filter(self, record):
+        if record.levelno > logging.DEBUG:
+            return True
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+        if self.limit <= 0:
+            return True
+        
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.window_seconds:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            if window[1] >= self.limit:
+                window[2] += 1
+                return False
+            window[1] += 1
+            return True
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 객체로 출력하는 구조화 로그 형식"""
+    
+    def format(self, record):
+        data = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName
+        }
+        data.update(getattr(record, 'context', {}))
+        if getattr(record, 'suppressed', 0):
+            data['suppressed'] = record.suppressed
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+def configure_logging(level=None, log_file=None, log_format=None, console=True,
+                      debug_sample_rate=None, debug_rate_limit=None):
+    """
+    프로세스 로깅 설정 (한 번만 적용되며 이후 호출은 무시)
+    
+    루트 로거에는 큐에 넣기만 하는 QueueHandler를 두고, 파일/콘솔 쓰기는
+    QueueListener 스레드에서 처리하여 크롤링 스레드가 디스크 I/O를 기다리지 않도록 합니다.
+    
+    Args:
+        level (str): 로그 레벨 (None이면 Config.LOG_LEVEL)
+        log_file (str): 로그 파일 경로 (None이면 Config.LOG_FILE, 빈 문자열이면 파일 기록 안 함)
+        log_format (str): 파일 로그 형식 (text, json / None이면 Config.LOG_FORMAT)
+        console (bool): 표준 출력에도 기록
+        debug_sample_rate (float): DEBUG 로그 표본 비율 (None이면 Config.LOG_DEBUG_SAMPLE_RATE)
+        debug_rate_limit (int): 호출 위치별 분당 DEBUG 로그 수 (None이면 Config.LOG_DEBUG_RATE_LIMIT)
+    
+    Returns:
+        bool: 이번 호출에서 설정이 적용되었는지 여부
+    """
+    global _listener
+    
+    with _configure_lock:
+        if _listener is not None:
+            return False
+        
+        # 로그 큐 처리 모듈은 로깅 설정 시에만 로드
+        import logging.handlers
+        import queue
+        from config import Config
+        
+        level = (level or Config.LOG_LEVEL).upper()
+        log_file = Config.LOG_FILE if log_file is None else log_file
+        log_format = log_format or Config.LOG_FORMAT
+        
+        handlers = []
+        if log_file:
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler.setFormatter(JsonFormatter() if log_format == 'json' else logging.Formatter(TEXT_FORMAT))
+            handlers.append(file_handler)
+        if console:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+            handlers.append(console_handler)
+        
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(DebugSampler(
+            sample_rate=Config.LOG_DEBUG_SAMPLE_RATE if debug_sample_rate is None else debug_sample_rate,
+            limit=Config.LOG_DEBUG_RATE_LIMIT if debug_rate_limit is None else debug_rate_limit
+        ))
+        queue_handler.addFilter(ContextFilter())
+        
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(getattr(logging, level, logging.INFO))
+        
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return True
+
+def shutdown_logging():
+    """대기 중인 로그를 모두 기록하고 로깅 스레드 종료 (이후 configure_logging으로 다시 설정 가능)"""
+    global _listener
+    
+    with _configure_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root.removeHandler(handler)
+
+@contextmanager
+def log_context(**fields):
+    """
+    with 블록 안의 로그 레코드에 문맥 값 추가 (중첩 가능)
+    
+    사용 예:
+        with log_context(username='alice'):
+            logger.info("크롤링 시작")  # ... [username=alice]
+    
+    Args:
+        **fields: 로그에 추가할 값 (username, post_url 등)
+    """
+    merged = dict(_context.get())
+    merged.update(fields)
+    ordered = {key: merged[key] for key in CONTEXT_KEYS if key in merged}
+    ordered.update((key, value) for key, value in merged.items() if key not in ordered)
+    token = _context.set(ordered)
+    try:
+        yield
+    finally:
+        _context.reset(token)
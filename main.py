@@ -7,39 +7,84 @@ import sys
 from pathlib import Path
 from instagram_scheduler import InstagramScheduler
 from config import Config
+from logging_setup import configure_logging
 
 def setup_logging():
-    """로깅 설정"""
-    logging.basicConfig(
-        level=getattr(logging, Config.LOG_LEVEL),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(Config.LOG_FILE, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    """로깅 설정 (파일/콘솔 쓰기는 별도 스레드에서 처리)"""
+    configure_logging()
 
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description='인스타그램 계정 크롤링 스케줄러')
-    parser.add_argument('--accounts', nargs='+', help='크롤링할 인스타그램 계정 목록')
+    parser.add_argument('--accounts', nargs='+', help='크롤링할 인스타그램 계정 목록 (생략 시 계정 목록 DB 사용)')
     parser.add_argument('--interval', type=int, default=Config.CRAWL_INTERVAL_HOURS, 
                        help=f'크롤링 간격 (시간, 기본값: {Config.CRAWL_INTERVAL_HOURS})')
     parser.add_argument('--once', action='store_true', help='즉시 한 번만 크롤링 실행')
-    parser.add_argument('--add-account', help='새로운 계정 추가')
+    parser.add_argument('--metrics-port', type=int, default=Config.METRICS_PORT,
+                       help=f'스케줄러 실행 중 /metrics 엔드포인트 포트 (0이면 비활성화, 기본값: {Config.METRICS_PORT})')
+    parser.add_argument('--metrics-file', default=Config.METRICS_FILE,
+                       help=f'--once 실행 후 메트릭을 저장할 JSON 파일 (기본값: {Config.METRICS_FILE})')
+    parser.add_argument('--profile', metavar='DIR',
+                       help='계정별 크롤링을 프로파일링하여 결과(pstats, 접힌 스택, 추적 구간)를 디렉토리에 저장')
+    parser.add_argument('--worker', action='store_true',
+                       help='분산 크롤링 워커로 실행 (공유 코디네이터 DB에서 담당 계정을 나누어 크롤링)')
+    parser.add_argument('--worker-id', help='워커 ID (기본값: 호스트명-PID)')
+    parser.add_argument('--coordinator-db', default=Config.COORDINATOR_DB_PATH,
+                       help=f'코디네이터 DB 경로 (기본값: {Config.COORDINATOR_DB_PATH})')
+    parser.add_argument('--workers', action='store_true', help='분산 워커 및 계정 임대 현황 조회')
+    parser.add_argument('--add-account', help='새로운 계정 추가 (계정 목록 DB에 저장)')
     parser.add_argument('--remove-account', help='계정 제거')
+    parser.add_argument('--enable-account', help='계정 크롤링 재개')
+    parser.add_argument('--disable-account', help='계정 크롤링 중지 (설정은 유지)')
+    parser.add_argument('--import-accounts', metavar='FILE',
+                       help='파일에서 계정 일괄 가져오기 (.csv: username,enabled,priority,interval_hours,max_posts / 그 외: 한 줄에 한 계정)')
+    parser.add_argument('--export-accounts', metavar='FILE', help='계정 목록 내보내기 (.csv면 계정별 설정 포함)')
+    parser.add_argument('--priority', type=int, default=0, help='--add-account/--import-accounts 계정 우선순위 (클수록 먼저, 기본값: 0)')
+    parser.add_argument('--account-interval', type=float,
+                       help='--add-account/--import-accounts 계정별 최소 크롤링 간격 (시간, 기본값: --interval)')
+    parser.add_argument('--max-posts', type=int,
+                       help=f'--add-account/--import-accounts 계정별 수집 게시물 수 (기본값: {Config.MAX_POSTS_PER_ACCOUNT})')
     parser.add_argument('--list-accounts', action='store_true', help='크롤링 중인 계정 목록 조회')
     parser.add_argument('--status', action='store_true', help='스케줄러 상태 조회')
     parser.add_argument('--statistics', action='store_true', help='크롤링 통계 조회')
+    parser.add_argument('--account-stats', nargs='?', const='', metavar='USERNAME',
+                       help='계정별 크롤링 통계 조회 (계정 생략 시 전체)')
     parser.add_argument('--export', help='특정 계정의 데이터를 JSON으로 내보내기')
     parser.add_argument('--config', action='store_true', help='현재 설정값 조회')
     parser.add_argument('--backup', action='store_true', help='데이터베이스 백업')
+    parser.add_argument('--incremental', action='store_true', help='--backup 시 마지막 백업 이후 새 데이터만 백업')
+    parser.add_argument('--compression', choices=['gzip', 'zstd', 'none'], help='백업 압축 방식 (기본값: 설정값)')
     parser.add_argument('--restore', help='백업 파일에서 데이터베이스 복원')
     parser.add_argument('--db-info', action='store_true', help='데이터베이스 정보 조회')
     parser.add_argument('--db-init', action='store_true', help='데이터베이스 초기화 (모든 데이터 삭제)')
     parser.add_argument('--db-reset', action='store_true', help='데이터베이스 완전 초기화 (백업 후 모든 데이터 삭제)')
     parser.add_argument('--new-posts', help='특정 계정의 새 게시물 수 조회 (기본값: 7일)')
     parser.add_argument('--latest-posts', help='특정 계정의 최신 게시물 조회')
+    parser.add_argument('--trend', help='특정 계정의 지표 추이 조회 (기간에 따라 시간/일/주 단위 집계)')
+    parser.add_argument('--metric', default='followers', choices=['followers', 'following', 'posts', 'likes', 'comments'],
+                       help='--trend로 조회할 지표 (likes, comments는 --trend-post 필요, 기본값: followers)')
+    parser.add_argument('--trend-post', help='--trend로 조회할 게시물 URL (게시물 지표)')
+    parser.add_argument('--days', type=int, default=30, help='--trend 조회 일수 (기본값: 30)')
+    parser.add_argument('--similar-posts', help='이미지가 비슷한 게시물 조회 (게시물 URL)')
+    parser.add_argument('--revisions', help='게시물의 수정/삭제 기록 조회 (게시물 URL, REVISIT_ENABLED=true로 수집)')
+    parser.add_argument('--max-distance', type=int, default=3, help='유사 이미지 최대 해밍 거리 (기본값: 3)')
+    parser.add_argument('--hash-images', action='store_true', help='저장된 이미지의 유사도 해시 계산 (기존 데이터 백필)')
+    parser.add_argument('--train-caption-dict', action='store_true', help='저장된 게시물로 캡션 압축 사전 학습 (zstandard 필요)')
+    parser.add_argument('--recompress-captions', action='store_true',
+                       help='저장된 게시물 텍스트를 CAPTION_COMPRESSION 설정에 맞게 다시 저장 (최신 사전으로 압축 또는 원문으로 복원)')
+    parser.add_argument('--search', help='캡션/해시태그/멘션 전문 검색')
+    parser.add_argument('--search-account', help='검색을 특정 계정으로 제한')
+    parser.add_argument('--since', help='검색할 게시 시간 하한 (예: 2024-01-01)')
+    parser.add_argument('--until', help='검색할 게시 시간 상한 (예: 2024-02-01, 미포함)')
+    parser.add_argument('--limit', type=int, default=20, help='검색 결과 수 (기본값: 20)')
+    parser.add_argument('--cursor', help='다음 페이지 검색 커서 (이전 검색 결과에 표시됨)')
+    parser.add_argument('--changes', nargs='?', type=int, const=0, metavar='SEQ',
+                       help='변경 피드에서 SEQ 이후 새 게시물을 JSON 줄로 출력 (생략 시 처음부터, 최대 --limit개)')
+    parser.add_argument('--tail', action='store_true',
+                       help='변경 피드를 계속 따라가며 새 게시물 출력 (--changes SEQ 이후부터, 생략 시 지금부터)')
+    parser.add_argument('--feed-port', type=int, help='로컬 HTTP 변경 피드 엔드포인트 실행 (/changes?since=SEQ&wait=초)')
+    parser.add_argument('--webhooks', action='store_true', help='웹훅 전송 대기열 현황 조회')
+    parser.add_argument('--retry-webhooks', action='store_true', help='전송 실패로 표시된 웹훅 배치를 다시 전송 대기 상태로 변경')
     
     args = parser.parse_args()
     
@@ -48,35 +93,91 @@ def main():
     logger = logging.getLogger(__name__)
     
     try:
-        # 스케줄러 초기화
-        accounts = args.accounts or Config.DEFAULT_ACCOUNTS
-        scheduler = InstagramScheduler(accounts=accounts, interval_hours=args.interval)
+        # 스케줄러 초기화 (--accounts가 없으면 계정 목록 DB 사용)
+        accounts = args.accounts
+        
+        # 프로파일링 모드 (크롤링 실행 시에만 사용)
+        profiler = None
+        if args.profile:
+            from profiling import CrawlProfiler, enable_tracing
+            profiler = CrawlProfiler(args.profile)
+            enable_tracing()
+        
+        scheduler = InstagramScheduler(accounts=accounts, interval_hours=args.interval, profiler=profiler)
         
         # 설정 조회
         if args.config:
             print("=== 현재 설정 ===")
             for key, value in Config.get_all_settings().items():
                 print(f"{key}: {value}")
-            print(f"크롤링 계정: {accounts}")
+            print(f"크롤링 계정: {len(scheduler.accounts)}개")
             return
         
+        account_settings = {
+            'priority': args.priority,
+            'interval_hours': args.account_interval,
+            'max_posts': args.max_posts
+        }
+        
         # 계정 추가
         if args.add_account:
-            scheduler.add_account(args.add_account)
-            print(f"계정 추가됨: {args.add_account}")
+            if scheduler.add_account(args.add_account, **account_settings):
+                print(f"계정 추가됨: {args.add_account}")
+            else:
+                print(f"계정 추가 실패: {args.add_account}")
             return
         
         # 계정 제거
         if args.remove_account:
-            scheduler.remove_account(args.remove_account)
-            print(f"계정 제거됨: {args.remove_account}")
+            if scheduler.remove_account(args.remove_account):
+                print(f"계정 제거됨: {args.remove_account}")
+            else:
+                print(f"존재하지 않는 계정: {args.remove_account}")
+            return
+        
+        # 계정 크롤링 재개/중지
+        if args.enable_account or args.disable_account:
+            username = args.enable_account or args.disable_account
+            if scheduler.registry.set_enabled(username, bool(args.enable_account)):
+                print(f"계정 {'크롤링 재개' if args.enable_account else '크롤링 중지'}: {username}")
+            else:
+                print(f"존재하지 않는 계정: {username}")
+            return
+        
+        # 계정 일괄 가져오기
+        if args.import_accounts:
+            counts = scheduler.registry.import_accounts(args.import_accounts, **account_settings)
+            if counts:
+                print(f"계정 가져오기 완료: {counts['imported']}개 저장, 잘못된 행 {counts['invalid']}개 건너뜀")
+            else:
+                print(f"계정 가져오기 실패: {args.import_accounts}")
+            return
+        
+        # 계정 목록 내보내기
+        if args.export_accounts:
+            count = scheduler.registry.export_accounts(args.export_accounts)
+            if count is not None:
+                print(f"계정 내보내기 완료: {args.export_accounts} ({count}개)")
+            else:
+                print(f"계정 내보내기 실패: {args.export_accounts}")
             return
         
         # 계정 목록 조회
         if args.list_accounts:
             print("=== 크롤링 중인 계정 목록 ===")
-            for account in scheduler.accounts:
-                print(f"- {account}")
+            if args.accounts:
+                for account in scheduler.accounts:
+                    print(f"- {account}")
+                return
+            for account in scheduler.registry.get_accounts(enabled_only=False):
+                options = [f"우선순위 {account['priority']}"]
+                if account['interval_hours']:
+                    options.append(f"간격 {account['interval_hours']}시간")
+                if account['max_posts']:
+                    options.append(f"게시물 {account['max_posts']}개")
+                if not account['enabled']:
+                    options.append("중지됨")
+                print(f"- {account['username']} ({', '.join(options)})")
             return
         
         # 상태 조회
@@ -87,7 +188,6 @@ def main():
             print(f"계정 수: {status['accounts_count']}")
             print(f"크롤링 간격: {status['interval_hours']}시간")
             print(f"다음 실행: {status['next_run']}")
-            print(f"계정 목록: {status['accounts']}")
             return
         
         # 통계 조회
@@ -101,6 +201,22 @@ def main():
             print(f"마지막 크롤링: {stats.get('last_crawl', 'N/A')}")
             return
         
+        # 계정별 통계 조회
+        if args.account_stats is not None:
+            account_stats = scheduler.data_manager.get_account_statistics(args.account_stats or None)
+            print("=== 계정별 크롤링 통계 ===")
+            if account_stats:
+                for item in account_stats:
+                    print(f"\n- {item['username']}")
+                    print(f"   크롤링: {item['total_crawls']}회 (성공 {item['successful_crawls']}, 실패 {item['failed_crawls']})")
+                    print(f"   성공률: {item['success_rate']:.1f}%")
+                    print(f"   저장된 게시물: {item['total_posts']}개")
+                    print(f"   마지막 크롤링: {item['last_crawl'] or 'N/A'}")
+                    print(f"   마지막 새 게시물: {item['last_new_post'] or 'N/A'}")
+            else:
+                print("통계가 없습니다.")
+            return
+        
         # 데이터 내보내기
         if args.export:
             if scheduler.export_account_data(args.export):
@@ -111,7 +227,10 @@ def main():
             
         # 데이터베이스 백업
         if args.backup:
-            backup_path = scheduler.data_manager.backup_database()
+            backup_path = scheduler.data_manager.backup_database(
+                compression=args.compression,
+                incremental=args.incremental
+            )
             if backup_path:
                 print(f"데이터베이스 백업 완료: {backup_path}")
             else:
@@ -175,6 +294,17 @@ def main():
             print(f"최근 7일간 새로 저장된 게시물: {new_posts_count}개")
             return
             
+        # 지표 추이 조회
+        if args.trend:
+            points = scheduler.data_manager.get_metric_trend(args.trend, args.metric, days=args.days, post_url=args.trend_post)
+            print(f"=== {args.trend} 계정의 {args.metric} 추이 (최근 {args.days}일) ===")
+            if points:
+                for point in points:
+                    print(f"- {point['time']}: {point['value']}")
+            else:
+                print("수집된 지표가 없습니다.")
+            return
+            
         # 최신 게시물 조회
         if args.latest_posts:
             latest_posts = scheduler.data_manager.get_latest_posts(args.latest_posts, limit=10)
@@ -197,22 +327,203 @@ def main():
                 print("저장된 게시물이 없습니다.")
             return
         
+        # 유사 이미지 게시물 조회
+        if args.similar_posts:
+            similar_posts = scheduler.data_manager.find_similar_posts(args.similar_posts, max_distance=args.max_distance)
+            print(f"=== 유사 이미지 게시물 (최대 거리 {args.max_distance}) ===")
+            if similar_posts:
+                for post in similar_posts:
+                    print(f"- [{post['username']}] {post['post_url']} (거리: {post['distance']})")
+            else:
+                print("유사한 게시물이 없습니다.")
+            return
+            
+        # 게시물 수정/삭제 기록 조회
+        if args.revisions:
+            revisions = scheduler.data_manager.get_post_revisions(args.revisions)
+            print(f"=== 게시물 수정 기록: {args.revisions} ===")
+            if revisions:
+                for revision in revisions:
+                    print(f"- {revision['detected_at']} {revision['revision_type']}")
+                    for field, (old_value, new_value) in revision['changes'].items():
+                        print(f"   {field}: {old_value!r} → {new_value!r}")
+            else:
+                print("수정 기록이 없습니다.")
+            return
+            
+        # 이미지 해시 백필
+        if args.hash_images:
+            updated = scheduler.data_manager.update_image_hashes()
+            print(f"이미지 해시 계산 완료: {updated}개")
+            return
+        
+        # 캡션 압축 사전 학습 / 다시 압축
+        if args.train_caption_dict or args.recompress_captions:
+            if args.train_caption_dict:
+                dict_id = scheduler.data_manager.train_caption_dictionary()
+                if dict_id is None:
+                    print("캡션 압축 사전 학습 실패")
+                    return
+                print(f"캡션 압축 사전 학습 완료: ID {dict_id}")
+            if args.recompress_captions:
+                result = scheduler.data_manager.recompress_posts()
+                if result:
+                    print(f"게시물 {result['updated']}개 다시 저장 완료")
+                    print(f"데이터베이스 크기: {result['size_before'] / 1024 / 1024:.2f} MB → {result['size_after'] / 1024 / 1024:.2f} MB")
+                else:
+                    print("게시물 다시 저장 실패")
+            return
+        
+        # 게시물 검색
+        if args.search:
+            page = scheduler.data_manager.search_posts(
+                args.search,
+                username=args.search_account,
+                since=args.since,
+                until=args.until,
+                limit=args.limit,
+                cursor=args.cursor
+            )
+            print(f"=== '{args.search}' 검색 결과 ===")
+            if page['results']:
+                for post in page['results']:
+                    print(f"\n- [{post['username']}] {post['post_url']}")
+                    caption = post.get('caption')
+                    if caption:
+                        print(f"   캡션: {caption[:100]}...")
+                    else:
+                        print(f"   캡션: N/A")
+                    print(f"   게시시간: {post.get('posted_at') or 'N/A'}")
+                if page['next_cursor']:
+                    print(f"\n다음 페이지: --cursor '{page['next_cursor']}'")
+            else:
+                print("검색 결과가 없습니다.")
+            return
+        
+        # 변경 피드 조회 / 따라가기 / HTTP 엔드포인트
+        if args.changes is not None or args.tail or args.feed_port is not None:
+            import json
+            
+            if args.feed_port is not None:
+                from change_feed import start_feed_server
+                feed_server = start_feed_server(scheduler.data_manager, args.feed_port, poll_interval=Config.CHANGE_FEED_POLL_SECONDS)
+                print(f"변경 피드: http://127.0.0.1:{feed_server.server_address[1]}/changes?since=0")
+                print("Ctrl+C로 중지할 수 있습니다.")
+                try:
+                    import time
+                    while True:
+                        time.sleep(1)
+                except KeyboardInterrupt:
+                    feed_server.shutdown()
+                return
+            
+            if args.tail:
+                from change_feed import follow_changes
+                try:
+                    for change in follow_changes(scheduler.data_manager, since_seq=args.changes,
+                                                 limit=args.limit, poll_interval=Config.CHANGE_FEED_POLL_SECONDS):
+                        print(json.dumps(change, ensure_ascii=False, default=str), flush=True)
+                except KeyboardInterrupt:
+                    pass
+                return
+            
+            for change in scheduler.data_manager.read_changes(args.changes, limit=args.limit):
+                print(json.dumps(change, ensure_ascii=False, default=str))
+            return
+        
+        # 웹훅 전송 대기열 현황 / 실패 배치 재시도
+        if args.webhooks or args.retry_webhooks:
+            from webhook_notifier import WebhookNotifier
+            notifier = WebhookNotifier(scheduler.data_manager, [])
+            if args.retry_webhooks:
+                print(f"다시 전송할 웹훅 배치: {notifier.retry_failed()}개 (다음 크롤링 실행 시 전송)")
+            status = notifier.get_status()
+            print("=== 웹훅 전송 ===")
+            print(f"설정된 엔드포인트: {Config.WEBHOOK_URLS or '없음'}")
+            print(f"변경 피드 위치: {status.get('cursor', 0)} / {status.get('latest_seq', 0)}")
+            for item in status.get('queue', []):
+                state = '대기' if item['status'] == 'pending' else '실패'
+                print(f"- {item['endpoint']}: {state} {item['batches']}개 배치 (게시물 {item['events']}개)")
+                if item['last_error']:
+                    print(f"   마지막 오류: {item['last_error']}")
+            return
+        
+        # 분산 워커 현황 조회
+        if args.workers:
+            from coordinator import CrawlCoordinator
+            status = CrawlCoordinator(args.coordinator_db).get_status()
+            print("=== 분산 워커 ===")
+            for worker in status['workers']:
+                state = '활성' if worker['alive'] else '응답 없음'
+                print(f"- {worker['worker_id']}: {state} (마지막 하트비트 {worker['heartbeat_age']}초 전)")
+            print("=== 계정 임대 ===")
+            for lease in status['leases']:
+                holder = lease['worker_id'] or '-'
+                print(f"- {lease['username']}: 진행 워커 {holder}, 마지막 결과 {lease['last_status'] or 'N/A'} ({lease['last_worker_id'] or '-'})")
+            return
+        
+        # 분산 워커 실행
+        if args.worker:
+            from coordinator import CrawlCoordinator
+            
+            if not scheduler.accounts:
+                logger.error("크롤링할 계정이 없습니다. --import-accounts로 계정 목록 DB를 채우거나 모든 워커에 같은 --accounts 목록을 지정하세요.")
+                return
+            
+            coordinator = CrawlCoordinator(args.coordinator_db, worker_id=args.worker_id)
+            print(f"분산 워커 시작: {coordinator.worker_id} (코디네이터: {args.coordinator_db})")
+            
+            # 같은 호스트의 다른 워커가 포트를 사용 중이면 메트릭 없이 실행
+            metrics_server = None
+            if args.metrics_port and not args.once:
+                from metrics import start_metrics_server
+                try:
+                    metrics_server = start_metrics_server(args.metrics_port)
+                except OSError as e:
+                    logger.warning(f"메트릭 엔드포인트를 시작할 수 없습니다 (포트 {args.metrics_port}): {e}")
+            
+            try:
+                crawled = scheduler.run_worker(coordinator, once=args.once)
+                print(f"워커 종료: {crawled}개 계정 크롤링")
+            except KeyboardInterrupt:
+                # 워커 루프 종료 시 임대 반납 및 등록 해제됨
+                logger.info("사용자에 의해 중지됨")
+            finally:
+                if metrics_server:
+                    metrics_server.shutdown()
+            return
+        
         # 즉시 실행
         if args.once:
+            from metrics import REGISTRY
+            
             logger.info("즉시 크롤링 실행")
             scheduler.run_once()
+            REGISTRY.dump_json(args.metrics_file)
+            print(f"메트릭 저장됨: {args.metrics_file}")
+            if profiler:
+                profiler.write_aggregate()
+                print(profiler.summary(limit=20))
+                print(f"프로파일 저장됨: {args.profile} (aggregate.pstats, aggregate.collapsed, spans.json)")
             return
         
         # 스케줄러 시작
-        if not accounts:
-            logger.error("크롤링할 계정이 없습니다. --accounts 옵션으로 계정을 지정하거나 config.py에서 기본값을 설정하세요.")
+        if not scheduler.accounts:
+            logger.error("크롤링할 계정이 없습니다. --add-account/--import-accounts로 계정을 추가하거나 --accounts 옵션으로 지정하세요.")
             return
         
-        logger.info(f"스케줄러 시작 - 계정: {accounts}, 간격: {args.interval}시간")
-        print(f"크롤링 시작: {accounts}")
+        logger.info(f"스케줄러 시작 - 계정: {len(scheduler.accounts)}개, 간격: {args.interval}시간")
+        print(f"크롤링 시작: 계정 {len(scheduler.accounts)}개")
         print(f"크롤링 간격: {args.interval}시간")
         print("Ctrl+C로 중지할 수 있습니다.")
         
+        # 메트릭 엔드포인트 시작 (로컬 전용)
+        metrics_server = None
+        if args.metrics_port:
+            from metrics import start_metrics_server
+            metrics_server = start_metrics_server(args.metrics_port)
+            print(f"메트릭: http://127.0.0.1:{args.metrics_port}/metrics")
+        
         try:
             scheduler.start()
             
@@ -225,6 +536,11 @@ def main():
             logger.info("사용자에 의해 중지됨")
             print("\n스케줄러를 중지합니다...")
             scheduler.stop()
+            if metrics_server:
+                metrics_server.shutdown()
+            if profiler:
+                profiler.write_aggregate()
+                print(f"프로파일 저장됨: {args.profile}")
             
     except Exception as e:
         logger.error(f"오류 발생: {e}")
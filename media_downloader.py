@@ -0,0 +1,163 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from config import Config
+from image_hash import compute_dhash
+
+# Content-Type별 파일 확장자
+CONTENT_TYPE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+    'image/webp': '.webp',
+    'image/gif': '.gif',
+    'image/heic': '.heic',
+    'video/mp4': '.mp4'
+}
+
+class MediaDownloader:
+    def __init__(self, media_dir=None, max_workers=None, timeout=None):
+        """
+        게시물 이미지 다운로더 초기화
+        
+        SHA-256 콘텐츠 주소 방식으로 저장하므로 같은 이미지는 한 번만 저장됩니다.
+        하나의 requests.Session을 공유하여 keep-alive 연결을 재사용합니다.
+        
+        Args:
+            media_dir (str): 미디어 저장 디렉토리 (None이면 Config.MEDIA_DIRECTORY)
+            max_workers (int): 동시 다운로드 스레드 수 (None이면 Config.MEDIA_DOWNLOAD_WORKERS)
+            timeout (int): 요청 타임아웃 (초, None이면 Config.MEDIA_DOWNLOAD_TIMEOUT)
+        """
+        self.media_dir = Path(media_dir or Config.MEDIA_DIRECTORY)
+        self.max_workers = max_workers or Config.MEDIA_DOWNLOAD_WORKERS
+        self.timeout = timeout or Config.MEDIA_DOWNLOAD_TIMEOUT
+        self.logger = logging.getLogger(__name__)
+        
+        # 작업 스레드 수만큼 연결을 유지하는 세션
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = Config.USER_AGENT
+        
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='media')
+        self._store_lock = threading.Lock()
+    
+    def submit(self, url):
+        """
+        이미지 다운로드를 백그라운드로 예약
+        
+        Args:
+            url (str): 이미지 URL
+        
+        Returns:
+            Future: download(url) 결과를 돌려주는 Future
+        """
+        return self.executor.submit(self.download, url)
+    
+    def download_all(self, urls):
+        """
+        여러 이미지를 동시에 다운로드
+        
+        Args:
+            urls (list): 이미지 URL 목록
+        
+        Returns:
+            dict: URL별 다운로드 결과 (실패한 URL은 None)
+        """
+        futures = {url: self.submit(url) for url in dict.fromkeys(urls) if url}
+        return {url: future.result() for url, future in futures.items()}
+    
+    def download(self, url):
+        """
+        이미지를 다운로드하여 콘텐츠 주소 경로에 저장
+        
+        Args:
+            url (str): 이미지 URL
+        
+        Returns:
+            dict: {'sha256', 'path', 'size_bytes', 'content_type', 'dhash'} (실패 시 None)
+        """
+        tmp_path = None
+        try:
+            with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                
+                # 임시 파일에 쓰면서 해시 계산
+                self.media_dir.mkdir(parents=True, exist_ok=True)
+                digest = hashlib.sha256()
+                size = 0
+                fd, tmp_path = tempfile.mkstemp(dir=self.media_dir, suffix='.part')
+                with os.fdopen(fd, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        digest.update(chunk)
+                        size += len(chunk)
+                        f.write(chunk)
+            
+            sha256 = digest.hexdigest()
+            path = self.media_path(sha256, self._guess_extension(url, content_type))
+            
+            with self._store_lock:
+                if path.exists():
+                    self.logger.debug(f"이미 저장된 미디어: {sha256}")
+                else:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(tmp_path, path)
+                    tmp_path = None
+                    self.logger.debug(f"미디어 저장됨: {path}")
+            
+            return {
+                'sha256': sha256,
+                'path': str(path),
+                'size_bytes': size,
+                'content_type': content_type or None,
+                'dhash': compute_dhash(path) if not content_type.startswith('video/') else None
+            }
+        
+        except Exception as e:
+            self.logger.warning(f"미디어 다운로드 실패: {url} - {e}")
+            return None
+        
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def media_path(self, sha256, extension=''):
+        """
+        해시값에 해당하는 저장 경로 (예: media/ab/cd/abcd....jpg)
+        
+        Args:
+            sha256 (str): SHA-256 16진수 문자열
+            extension (str): 파일 확장자
+        
+        Returns:
+            Path: 저장 경로
+        """
+        return self.media_dir / sha256[:2] / sha256[2:4] / f"{sha256}{extension}"
+    
+    @staticmethod
+    def _guess_extension(url, content_type):
+        """Content-Type 또는 URL 경로로 확장자 추정"""
+        if content_type in CONTENT_TYPE_EXTENSIONS:
+            return CONTENT_TYPE_EXTENSIONS[content_type]
+        suffix = Path(urlparse(url).path).suffix.lower()
+        return suffix if suffix in CONTENT_TYPE_EXTENSIONS.values() else ''
+    
+    def close(self):
+        """진행 중인 다운로드를 마치고 연결 종료"""
+        self.executor.shutdown(wait=True)
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
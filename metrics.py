@@ -0,0 +1,362 @@
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from profiling import is_tracing_enabled, span
+
+# 단계별 소요 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# 분위수(p50/p95) 계산을 위해 시계열별로 보관하는 최근 관측값 수
+RECENT_SAMPLES = 2048
+
+logger = logging.getLogger(__name__)
+
+class Counter:
+    def __init__(self, name, description, label_names=()):
+        """
+        누적 카운터
+        
+        Args:
+            name (str): 메트릭 이름
+            description (str): 설명
+            label_names (tuple): 레이블 이름 목록
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, amount=1, **labels):
+        """레이블 조합의 값을 amount만큼 증가"""
+        key = _label_key(self.label_names, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels):
+        """레이블 조합의 현재 값"""
+        return self._values.get(_label_key(self.label_names, labels), 0)
+    
+    def samples(self):
+        """Prometheus 텍스트 형식의 샘플 줄 목록"""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {value}" for key, value in items]
+    
+    def to_dict(self):
+        """JSON 출력용 값"""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [{'labels': dict(zip(self.label_names, key)), 'value': value} for key, value in items]
+    
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+class Histogram:
+    def __init__(self, name, description, label_names=(), buckets=DEFAULT_BUCKETS):
+        """
+        소요 시간 등의 분포를 버킷별로 집계하는 히스토그램
+        
+        Args:
+            name (str): 메트릭 이름
+            description (str): 설명
+            label_names (tuple): 레이블 이름 목록
+            buckets (tuple): 버킷 상한값 목록 (오름차순)
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, value, **labels):
+        """관측값 기록"""
+        key = _label_key(self.label_names, labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {
+                    'counts': [0] * len(self.buckets),
+                    'count': 0,
+                    'sum': 0.0,
+                    'max': 0.0,
+                    'recent': deque(maxlen=RECENT_SAMPLES)
+                }
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['counts'][i] += 1
+                    break
+            series['count'] += 1
+            series['sum'] += value
+            series['max'] = max(series['max'], value)
+            series['recent'].append(value)
+            
+    def quantile(self, q, **labels):
+        """
+        최근 관측값 기준 분위수
+        
+        Args:
+            q (float): 0~1 사이 분위 (예: 0.95)
+            
+        Returns:
+            float: 분위수 (관측값이 없으면 None)
+        """
+        with self._lock:
+            series = self._series.get(_label_key(self.label_names, labels))
+            values = sorted(series['recent']) if series else []
+        return quantile(values, q)
+    
+    @contextmanager
+    def time(self, **labels):
+        """with 블록의 소요 시간을 기록 (예외가 발생해도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+    
+    def samples(self):
+        """Prometheus 텍스트 형식의 샘플 줄 목록 (누적 버킷)"""
+        lines = []
+        with self._lock:
+            items = sorted(((key, dict(series, counts=list(series['counts']))) for key, series in self._series.items()), key=lambda item: item[0])
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, series['counts']):
+                cumulative += count
+                labels = _format_labels(self.label_names + ('le',), key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names + ('le',), key + ('+Inf',))
+            lines.append(f"{self.name}_bucket{labels} {series['count']}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {series['sum']}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {series['count']}")
+        return lines
+    
+    def to_dict(self):
+        """JSON 출력용 값 (횟수, 합계, 평균, 최대, 버킷별 개수)"""
+        with self._lock:
+            items = [(key, series, sorted(series['recent'])) for key, series in sorted(self._series.items(), key=lambda item: item[0])]
+        return [
+            {
+                'labels': dict(zip(self.label_names, key)),
+                'count': series['count'],
+                'sum': round(series['sum'], 6),
+                'avg': round(series['sum'] / series['count'], 6) if series['count'] else 0,
+                'p50': round(quantile(recent, 0.5), 6) if recent else None,
+                'p95': round(quantile(recent, 0.95), 6) if recent else None,
+                'max': round(series['max'], 6),
+                'buckets': {_format_value(bound): count for bound, count in zip(self.buckets, series['counts'])}
+            }
+            for key, series, recent in items
+        ]
+    
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+class MetricsRegistry:
+    def __init__(self):
+        """메트릭 저장소 (같은 이름의 메트릭은 한 번만 생성)"""
+        self._metrics = {}
+        self._lock = threading.Lock()
+    
+    def counter(self, name, description, label_names=()):
+        """카운터 조회 또는 생성"""
+        return self._get_or_create(Counter, name, description, label_names)
+    
+    def histogram(self, name, description, label_names=(), buckets=DEFAULT_BUCKETS):
+        """히스토그램 조회 또는 생성"""
+        return self._get_or_create(Histogram, name, description, label_names, buckets=buckets)
+    
+    def _get_or_create(self, metric_class, name, description, label_names, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, description, label_names, **kwargs)
+            return metric
+    
+    def render_prometheus(self):
+        """Prometheus 텍스트 노출 형식으로 변환"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            metric_type = 'counter' if isinstance(metric, Counter) else 'histogram'
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric_type}")
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+    
+    def to_dict(self):
+        """JSON 출력용 전체 메트릭"""
+        return {
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'metrics': {name: metric.to_dict() for name, metric in list(self._metrics.items())}
+        }
+    
+    def dump_json(self, path):
+        """전체 메트릭을 JSON 파일로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        logger.info(f"메트릭 저장됨: {path}")
+    
+    def reset(self):
+        """모든 메트릭 값 초기화 (메트릭 정의는 유지)"""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+# 프로세스 전역 메트릭 저장소와 크롤링 메트릭
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'instagram_crawl_stage_seconds',
+    '크롤링 단계별 소요 시간 (초)',
+    ['stage']
+)
+ACCOUNT_CRAWLS = REGISTRY.counter(
+    'instagram_account_crawls_total',
+    '계정별 크롤링 결과 수',
+    ['username', 'status']
+)
+POSTS_SAVED = REGISTRY.counter(
+    'instagram_posts_saved_total',
+    '계정별 새로 저장된 게시물 수',
+    ['username']
+)
+DRIVER_TIMEOUTS = REGISTRY.counter(
+    'instagram_driver_timeouts_total',
+    '드라이버 시간 초과 및 강제 종료 수',
+    ['kind']
+)
+SELECTOR_LOOKUPS = REGISTRY.counter(
+    'instagram_selector_lookups_total',
+    '선택자별 조회 성공/실패 수',
+    ['group', 'selector', 'result']
+)
+SELECTOR_SECONDS = REGISTRY.histogram(
+    'instagram_selector_lookup_seconds',
+    '선택자 그룹 조회 소요 시간 (초)',
+    ['group'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+)
+PAGE_STATUS = REGISTRY.counter(
+    'instagram_page_status_total',
+    '페이지 상태별 수 (normal, rate_limited, challenge, logged_out)',
+    ['status']
+)
+CIRCUIT_BREAKER_TRIPS = REGISTRY.counter(
+    'instagram_circuit_breaker_trips_total',
+    '크롤링 계정 차단기 열림 수',
+    ['reason']
+)
+WEBHOOK_DELIVERIES = REGISTRY.counter(
+    'instagram_webhook_deliveries_total',
+    '웹훅 배치 전송 결과 수 (delivered, retry, failed)',
+    ['status']
+)
+POST_REVISITS = REGISTRY.counter(
+    'instagram_post_revisits_total',
+    '기존 게시물 재확인 결과 수 (unchanged, edited, deleted)',
+    ['result']
+)
+
+QUERY_CACHE_LOOKUPS = REGISTRY.counter(
+    'instagram_query_cache_lookups_total',
+    'DataManager 조회 캐시 조회 수 (메서드, hit/miss, 적중률 = hit / 전체)',
+    ['method', 'result']
+)
+
+def stage_timer(stage, **attrs):
+    """
+    크롤링 단계 소요 시간 측정 (추적이 켜져 있으면 같은 이름의 추적 구간도 기록)
+
+    사용 예:
+        with stage_timer('login'):
+            ...
+
+    Args:
+        stage (str): 단계 이름 (driver_start, login, profile_load, grid_scroll, post_detail, dedup, db_save 등)
+        **attrs: 추적 구간에만 기록할 값 (메트릭 레이블에는 포함되지 않음)
+    """
+    timer = STAGE_SECONDS.time(stage=stage)
+    if not is_tracing_enabled():
+        return timer
+    return _stage_span(timer, span(stage, **attrs))
+
+@contextmanager
+def _stage_span(timer, stage_span):
+    with timer, stage_span:
+        yield
+
+def start_metrics_server(port, host='127.0.0.1', registry=REGISTRY):
+    """
+    로컬 HTTP 메트릭 엔드포인트를 백그라운드 스레드로 시작
+    
+    Args:
+        port (int): 포트 번호 (0이면 임의 포트)
+        host (str): 바인딩 주소 (기본값: 로컬 전용)
+        registry (MetricsRegistry): 노출할 메트릭 저장소
+    
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (shutdown()으로 중지)
+    """
+    # http.server는 조회 명령의 시작 시간을 늘리지 않도록 서버 시작 시에만 import
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """/metrics (Prometheus 텍스트), /metrics.json 요청 처리"""
+        
+        def do_GET(self):
+            if self.path == '/metrics':
+                body = registry.render_prometheus().encode('utf-8')
+                content_type = 'text/plain; version=0.0.4; charset=utf-8'
+            elif self.path == '/metrics.json':
+                body = json.dumps(registry.to_dict(), ensure_ascii=False).encode('utf-8')
+                content_type = 'application/json; charset=utf-8'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            
+        def log_message(self, format, *args):
+            logger.debug(f"메트릭 요청: {format % args}")
+            
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True)
+    thread.start()
+    logger.info(f"메트릭 엔드포인트 시작: http://{host}:{server.server_address[1]}/metrics")
+    return server
+
+def quantile(sorted_values, q):
+    """정렬된 값 목록의 분위수 (선형 보간)"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def _label_key(label_names, labels):
+    """레이블 값을 정해진 순서의 튜플로 변환"""
+    return tuple(str(labels.get(name, '')) for name in label_names)
+
+def _format_labels(label_names, key):
+    """Prometheus 레이블 문자열 ({a="1",b="2"})"""
+    if not label_names:
+        return ''
+    pairs = []
+    for name, value in zip(label_names, key):
+        escaped = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{escaped}"')
+    return '{' + ','.join(pairs) + '}'
+
+def _format_value(value):
+    """버킷 상한값 표기 (정수는 소수점 없이)"""
+    return str(int(value)) if float(value).is_integer() else str(value)
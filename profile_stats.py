@@ -0,0 +1,60 @@
+import re
+
+# 표시된 숫자 (1,234 / 12.5K / 1.2M / 1.2만 / 3천)
+COUNT_PATTERN = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([KkMmBb](?![A-Za-z])|[만천억])?')
+COUNT_SUFFIXES = {'k': 1_000, 'm': 1_000_000, 'b': 1_000_000_000, '천': 1_000, '만': 10_000, '억': 100_000_000}
+
+# 지표별 표시 문구 (영어/한국어 화면)
+PROFILE_LABELS = {
+    'followers': re.compile(r'\bfollowers?\b|팔로워', re.IGNORECASE),
+    'following': re.compile(r'\bfollowing\b|팔로우|팔로잉', re.IGNORECASE),
+    'posts': re.compile(r'\bposts?\b|게시물', re.IGNORECASE),
+}
+POST_LABELS = {
+    'likes': re.compile(r'\blikes?\b|좋아요', re.IGNORECASE),
+    'comments': re.compile(r'\bcomments?\b|댓글', re.IGNORECASE),
+}
+
+# og:description 등 한 줄 요약을 지표별 조각으로 나누는 구분자 (숫자 안의 쉼표는 제외)
+SEGMENT_SEPARATOR = re.compile(r',\s+|\s+[-·•]\s+')
+
+def parse_count(text):
+    """
+    화면에 표시된 숫자를 정수로 변환
+    
+    Returns:
+        int: 변환한 값 (숫자가 없으면 None)
+    """
+    match = COUNT_PATTERN.search(text or '')
+    if not match:
+        return None
+    value = float(match.group(1).replace(',', ''))
+    suffix = match.group(2)
+    if suffix:
+        value *= COUNT_SUFFIXES[suffix.lower()]
+    return int(round(value))
+
+def parse_counts(texts, labels):
+    """
+    텍스트 조각에서 지표별 숫자 추출 ("1,234 Followers", "팔로워 1.2만명" 등 순서 무관)
+    
+    한 조각에는 지표 하나만 있다고 보고, 같은 지표가 여러 번 나오면 처음 값을 사용합니다.
+    
+    Args:
+        texts (list): 텍스트 목록 (요소 텍스트 또는 og:description, 쉼표/대시로 다시 나눔)
+        labels (dict): 지표 이름 -> 표시 문구 정규식 (PROFILE_LABELS, POST_LABELS)
+    
+    Returns:
+        dict: 지표 이름 -> 정수 (찾은 지표만)
+    """
+    counts = {}
+    for text in texts:
+        for segment in SEGMENT_SEPARATOR.split(' '.join((text or '').split())):
+            for metric, label in labels.items():
+                if metric in counts or not label.search(segment):
+                    continue
+                value = parse_count(segment)
+                if value is not None:
+                    counts[metric] = value
+                break
+    return counts
@@ -0,0 +1,330 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+# 콜 그래프 → 접힌 스택 변환 시 최대 깊이와 버릴 최소 시간 (초)
+MAX_STACK_DEPTH = 64
+MIN_STACK_SECONDS = 1e-6
+
+# 스케줄러 장기 실행 시 메모리 사용을 제한하기 위해 보관하는 최근 추적 구간 수
+MAX_SPANS = 100000
+
+logger = logging.getLogger(__name__)
+
+# 추적 비활성화 시 span()이 반환하는 공용 컨텍스트 (객체 생성 없음)
+_NULL_SPAN = nullcontext()
+
+_enabled = False
+_spans = deque(maxlen=MAX_SPANS)
+_spans_lock = threading.Lock()
+_local = threading.local()
+
+class _Span:
+    __slots__ = ('name', 'attrs', 'start', 'child_seconds', 'stack')
+    
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+        self.child_seconds = 0.0
+    
+    def __enter__(self):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        self.stack = tuple(item.name for item in stack) + (self.name,)
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self.start
+        stack = _local.stack
+        stack.pop()
+        if stack:
+            stack[-1].child_seconds += duration
+        
+        record = {
+            'name': self.name,
+            'stack': self.stack,
+            'start': self.start,
+            'seconds': duration,
+            'self_seconds': max(duration - self.child_seconds, 0.0),
+            'thread': threading.get_ident(),
+            'attrs': self.attrs
+        }
+        if exc_type is not None:
+            record['error'] = exc_type.__name__
+        with _spans_lock:
+            _spans.append(record)
+        return False
+
+def enable_tracing():
+    """추적 구간 기록 시작"""
+    global _enabled
+    _enabled = True
+
+def disable_tracing():
+    """추적 구간 기록 중지 (기록된 구간은 유지)"""
+    global _enabled
+    _enabled = False
+
+def is_tracing_enabled():
+    return _enabled
+
+def span(name, **attrs):
+    """
+    추적 구간 (비활성화 상태에서는 아무것도 하지 않음)
+    
+    사용 예:
+        with span('parse_caption', post_url=url):
+            ...
+    
+    Args:
+        name (str): 구간 이름
+        **attrs: 구간에 함께 기록할 값
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, attrs)
+
+def traced(name=None):
+    """
+    메서드 실행을 추적 구간으로 기록하는 데코레이터
+    
+    Args:
+        name (str): 구간 이름 (None이면 클래스명.메서드명)
+    """
+    def decorator(func):
+        label = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def get_spans(clear=False):
+    """
+    기록된 추적 구간 목록
+    
+    Args:
+        clear (bool): 조회 후 기록 비우기
+    
+    Returns:
+        list: 종료 순서대로 정렬된 구간 목록
+    """
+    with _spans_lock:
+        spans = list(_spans)
+        if clear:
+            _spans.clear()
+    return spans
+
+def write_trace(path, spans=None):
+    """
+    추적 구간을 Chrome Trace Event 형식으로 저장 (chrome://tracing, Perfetto에서 열람)
+    
+    Args:
+        path (str): 저장할 JSON 파일 경로
+        spans (list): 저장할 구간 (None이면 기록된 전체)
+    """
+    spans = get_spans() if spans is None else spans
+    origin = min((item['start'] for item in spans), default=0.0)
+    events = [
+        {
+            'name': item['name'],
+            'ph': 'X',
+            'ts': round((item['start'] - origin) * 1e6, 1),
+            'dur': round(item['seconds'] * 1e6, 1),
+            'pid': os.getpid(),
+            'tid': item['thread'],
+            'args': {key: str(value) for key, value in item['attrs'].items()}
+        }
+        for item in spans
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+
+def collapse_spans(spans=None):
+    """
+    추적 구간을 접힌 스택 형식(flamegraph.pl, speedscope 입력)으로 변환
+    
+    Returns:
+        list: "a;b;c 마이크로초" 형식의 줄 목록
+    """
+    spans = get_spans() if spans is None else spans
+    totals = {}
+    for item in spans:
+        key = ';'.join(name.replace(';', ',') for name in item['stack'])
+        totals[key] = totals.get(key, 0.0) + item['self_seconds']
+    return _format_collapsed(totals)
+
+def collapse_stats(stats):
+    """
+    cProfile 통계를 접힌 스택 형식으로 변환
+    
+    cProfile은 호출자-피호출자 관계만 기록하므로, 루트 함수부터 호출 관계를 따라가며
+    각 함수의 자체 시간을 호출 경로별 누적 시간 비율로 나누어 근사합니다.
+    
+    Args:
+        stats (pstats.Stats): 프로파일 통계
+    
+    Returns:
+        list: "a;b;c 마이크로초" 형식의 줄 목록
+    """
+    entries = stats.stats
+    callees = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+    
+    totals = {}
+    
+    def walk(func, stack, share):
+        _, _, self_time, cumulative, _ = entries[func]
+        stack = stack + (_func_label(func),)
+        if self_time * share >= MIN_STACK_SECONDS:
+            key = ';'.join(stack)
+            totals[key] = totals.get(key, 0.0) + self_time * share
+        if len(stack) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_cumulative in callees.get(func, {}).items():
+            callee_cumulative = entries[callee][3]
+            if callee_cumulative <= 0 or _func_label(callee) in stack:
+                continue
+            callee_share = share * min(edge_cumulative / callee_cumulative, 1.0)
+            if callee_share * callee_cumulative >= MIN_STACK_SECONDS:
+                walk(callee, stack, callee_share)
+    
+    for func, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            walk(func, (), 1.0)
+    return _format_collapsed(totals)
+
+class CrawlProfiler:
+    def __init__(self, output_dir):
+        """
+        계정 크롤링 단위 cProfile 프로파일러
+        
+        계정별 결과(<계정>_<시각>.pstats/.collapsed)와 누적 결과(aggregate.pstats/.collapsed/.txt),
+        추적 구간(spans.json, spans.collapsed)을 output_dir에 저장합니다.
+        
+        Args:
+            output_dir (str): 결과 저장 디렉토리
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.aggregate = None
+        self.profiled = []
+        self._lock = threading.Lock()
+        # 동시에 활성화된 cProfile은 Python 3.12+에서 ValueError를 일으키므로 한 번에 하나만 프로파일링
+        self._profile_lock = threading.Lock()
+    
+    @contextmanager
+    def profile(self, label):
+        """
+        with 블록을 프로파일링하고 결과 저장 (예외가 발생해도 저장)
+        
+        다른 스레드가 프로파일링 중이면 끝날 때까지 기다립니다.
+        
+        Args:
+            label (str): 결과 파일 이름에 사용할 이름 (계정명 등)
+        """
+        # 프로파일링 모드에서만 로드
+        import cProfile
+        
+        with self._profile_lock:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield profiler
+            finally:
+                profiler.disable()
+                self._save(label, profiler)
+    
+    def _save(self, label, profiler):
+        import pstats
+        
+        try:
+            stats = pstats.Stats(profiler)
+        except TypeError:
+            # 기록된 호출이 없음
+            return
+        
+        try:
+            safe_label = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in label)
+            base = self.output_dir / f"{safe_label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            stats.dump_stats(f"{base}.pstats")
+            _write_lines(f"{base}.collapsed", collapse_stats(stats))
+            
+            with self._lock:
+                if self.aggregate is None:
+                    # Stats(profiler)는 프로파일러의 기록을 비우므로 저장한 파일에서 다시 읽음
+                    self.aggregate = pstats.Stats(f"{base}.pstats")
+                else:
+                    self.aggregate.add(stats)
+                self.profiled.append(label)
+                self.write_aggregate()
+            logger.info(f"프로파일 저장됨: {base}.pstats")
+        
+        except Exception as e:
+            logger.error(f"프로파일 저장 실패: {label} - {e}")
+    
+    def write_aggregate(self):
+        """누적 프로파일과 추적 구간 저장"""
+        if self.aggregate is not None:
+            self.aggregate.dump_stats(str(self.output_dir / 'aggregate.pstats'))
+            _write_lines(self.output_dir / 'aggregate.collapsed', collapse_stats(self.aggregate))
+            (self.output_dir / 'aggregate.txt').write_text(self.summary(limit=40), encoding='utf-8')
+        
+        spans = get_spans()
+        if spans:
+            write_trace(self.output_dir / 'spans.json', spans)
+            _write_lines(self.output_dir / 'spans.collapsed', collapse_spans(spans))
+    
+    def summary(self, limit=20):
+        """
+        누적 프로파일 상위 함수 (누적 시간 순)
+        
+        Returns:
+            str: pstats 출력 텍스트
+        """
+        if self.aggregate is None:
+            return ''
+        import io
+        import pstats
+        
+        stream = io.StringIO()
+        summary = pstats.Stats(stream=stream)
+        summary.add(self.aggregate)
+        summary.sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue()
+
+def profile_context(profiler, label):
+    """profiler가 None이면 아무것도 하지 않는 프로파일링 컨텍스트"""
+    return profiler.profile(label) if profiler else nullcontext()
+
+def _func_label(func):
+    """pstats 함수 키를 스택 프레임 이름으로 변환"""
+    filename, lineno, name = func
+    if filename == '~':
+        # 내장 함수 (예: <built-in method time.sleep>)
+        return name.replace(';', ',')
+    return f"{Path(filename).name}:{name}:{lineno}".replace(';', ',')
+
+def _format_collapsed(totals):
+    """스택별 초 단위 합계를 마이크로초 정수 줄로 변환"""
+    return [f"{stack} {round(seconds * 1e6)}" for stack, seconds in sorted(totals.items()) if round(seconds * 1e6) > 0]
+
+def _write_lines(path, lines):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + ('\n' if lines else ''))
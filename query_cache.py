@@ -0,0 +1,62 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from metrics import QUERY_CACHE_LOOKUPS
+
+class QueryCache:
+    def __init__(self, max_entries, ttl_seconds):
+        """
+        조회 결과 캐시 (LRU, 항목별 유효 시간)
+        
+        항목마다 조회 직전에 읽은 데이터 세대(data_generation)를 함께 저장하고,
+        조회할 때 세대가 다르면 저장 이후 데이터가 바뀐 것으로 보고 다시 조회합니다.
+        유효 시간은 세대를 올리지 않는 변경(외부 도구의 직접 수정)과
+        현재 시각 기준 조회(최근 N일)의 결과가 오래 남지 않도록 제한합니다.
+        
+        Args:
+            max_entries (int): 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목 제거)
+            ttl_seconds (float): 항목 유효 시간 (초)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_or_load(self, method, args, generation, loader):
+        """
+        캐시된 결과 반환 (없거나 세대/유효 시간이 지났으면 loader 결과를 저장 후 반환)
+        
+        loader가 예외를 발생시키면 저장하지 않고 그대로 전달합니다.
+        호출자가 결과를 수정해도 캐시가 바뀌지 않도록 복사본을 반환합니다.
+        
+        Args:
+            method (str): 조회 메서드 이름 (메트릭 레이블)
+            args (tuple): 조회 인자 (메서드 이름과 함께 캐시 키)
+            generation (int): 조회 직전에 읽은 데이터 세대
+            loader (callable): 데이터베이스 조회 함수
+        
+        Returns:
+            조회 결과 복사본
+        """
+        key = (method,) + tuple(args)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == generation and entry[1] > now:
+                self._entries.move_to_end(key)
+                QUERY_CACHE_LOOKUPS.inc(method=method, result='hit')
+                return copy.deepcopy(entry[2])
+        
+        QUERY_CACHE_LOOKUPS.inc(method=method, result='miss')
+        value = loader()
+        with self._lock:
+            # 조회 전에 읽은 세대로 저장하므로, 조회 중에 커밋된 변경은 다음 조회에서 세대 차이로 감지됨
+            self._entries[key] = (generation, now + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(value)
+    
+    def __len__(self):
+        return len(self._entries)
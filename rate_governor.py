@@ -0,0 +1,184 @@
+import logging
+import threading
+import time
+from config import Config
+from metrics import CIRCUIT_BREAKER_TRIPS, PAGE_STATUS
+
+# 페이지 상태
+NORMAL = 'normal'
+RATE_LIMITED = 'rate_limited'
+CHALLENGE = 'challenge'
+LOGGED_OUT = 'logged_out'
+
+# 페이지 주소/본문으로 상태를 판별하는 문구 (소문자 비교)
+CHALLENGE_URL_MARKERS = ('/challenge/', '/checkpoint/', '/accounts/suspended/', '/auth_platform/')
+LOGIN_URL_MARKERS = ('/accounts/login',)
+RATE_LIMIT_TEXT_MARKERS = (
+    'please wait a few minutes',
+    'try again later',
+    'too many requests',
+    '잠시 후 다시 시도',
+    '몇 분 후에 다시 시도',
+    '요청이 너무 많',
+)
+CHALLENGE_TEXT_MARKERS = (
+    'confirm it\'s you',
+    'suspicious login attempt',
+    'we detected an unusual login attempt',
+    '본인 확인',
+    '의심스러운 로그인 시도',
+)
+
+# 현재 주소와 본문 앞부분을 한 번의 드라이버 왕복으로 조회
+PAGE_SNAPSHOT_SCRIPT = "return [window.location.href, document.body ? document.body.innerText.slice(0, 3000) : ''];"
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 크롤링 계정을 사용할 수 없음"""
+
+class LoggedOutError(CircuitOpenError):
+    """크롤링 도중 로그인 세션이 끊겨 로그인 페이지로 이동됨"""
+
+def classify_page(url, text):
+    """
+    페이지 상태 판별
+    
+    Args:
+        url (str): 현재 페이지 주소
+        text (str): 페이지 본문 텍스트 (앞부분)
+    
+    Returns:
+        str: normal, rate_limited, challenge, logged_out 중 하나
+    """
+    url = (url or '').lower()
+    text = (text or '').lower()
+    if any(marker in url for marker in CHALLENGE_URL_MARKERS) or any(marker in text for marker in CHALLENGE_TEXT_MARKERS):
+        return CHALLENGE
+    if any(marker in text for marker in RATE_LIMIT_TEXT_MARKERS):
+        return RATE_LIMITED
+    if any(marker in url for marker in LOGIN_URL_MARKERS):
+        return LOGGED_OUT
+    return NORMAL
+
+def classify_driver_page(driver):
+    """현재 드라이버 페이지 상태 판별 (조회 실패 시 normal)"""
+    try:
+        url, text = driver.execute_script(PAGE_SNAPSHOT_SCRIPT)
+    except Exception as e:
+        logger.debug(f"페이지 상태 조회 실패: {e}")
+        return NORMAL
+    return classify_page(url, text)
+
+class RateGovernor:
+    def __init__(self, name, clock=time.monotonic, sleep=time.sleep):
+        """
+        크롤링 계정별 요청 속도 조절기 (AIMD) 및 차단기
+        
+        정상 페이지마다 분당 요청 수를 조금씩 늘리고(가산 증가), 요청 제한 페이지가 나오면
+        절반으로 줄입니다(승산 감소). 요청 제한이나 로그아웃(로그인 페이지로 이동)이 연속되거나
+        본인 확인 페이지가 나오거나 로그인에 실패하면 차단기를 열어 일정 시간 동안 해당 계정의
+        요청을 막습니다.
+        차단 시간은 연속으로 열릴 때마다 두 배로 늘어나며, 정상 페이지를 받으면 초기화됩니다.
+        
+        Args:
+            name (str): 크롤링 계정 이름 (로그, 메트릭용)
+            clock (callable): 현재 시각 함수 (테스트용)
+            sleep (callable): 대기 함수 (테스트용)
+        """
+        self.name = name
+        self.clock = clock
+        self.sleep = sleep
+        self.max_rate = Config.GOVERNOR_MAX_RATE_PER_MINUTE
+        self.min_rate = Config.GOVERNOR_MIN_RATE_PER_MINUTE
+        self.increase = Config.GOVERNOR_RATE_INCREASE
+        self.decrease_factor = Config.GOVERNOR_DECREASE_FACTOR
+        self.threshold = Config.BREAKER_THRESHOLD
+        self.open_seconds = Config.IDENTITY_COOLDOWN_SECONDS
+        self.max_open_seconds = Config.IDENTITY_MAX_COOLDOWN_SECONDS
+        self.rate = float(self.max_rate)
+        self.consecutive_limited = 0
+        self.consecutive_logged_out = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.last_request = None
+        self._lock = threading.Lock()
+    
+    def is_open(self):
+        """차단기가 열려 있는지 여부"""
+        return self.clock() < self.open_until
+    
+    def remaining_open_seconds(self):
+        return max(self.open_until - self.clock(), 0.0)
+    
+    def before_request(self):
+        """
+        요청 전 호출: 현재 속도에 맞춰 대기 (차단기가 열려 있으면 CircuitOpenError)
+        """
+        with self._lock:
+            if self.is_open():
+                raise CircuitOpenError(f"크롤링 계정 {self.name} 차단됨 ({self.remaining_open_seconds():.0f}초 남음)")
+            now = self.clock()
+            interval = 60.0 / self.rate
+            wait = 0.0 if self.last_request is None else self.last_request + interval - now
+            self.last_request = now + max(wait, 0.0)
+        if wait > 0:
+            self.sleep(wait)
+    
+    def observe(self, status, login_expected=False):
+        """
+        페이지 상태 반영
+        
+        Args:
+            status (str): classify_page() 결과
+            login_expected (bool): 로그인 전이라 로그인 페이지가 정상인 이동인지 여부
+        
+        Returns:
+            str: 전달받은 상태
+        """
+        PAGE_STATUS.inc(status=status)
+        with self._lock:
+            if status == NORMAL:
+                self.rate = min(self.rate + self.increase, self.max_rate)
+                self.consecutive_limited = 0
+                self.consecutive_logged_out = 0
+                self.trips = 0
+            elif status == RATE_LIMITED:
+                self.rate = max(self.rate * self.decrease_factor, self.min_rate)
+                self.consecutive_limited += 1
+                logger.warning(f"요청 제한 감지 ({self.name}), 분당 요청 수 {self.rate:.1f}회로 감소")
+                if self.consecutive_limited >= self.threshold:
+                    self._trip('연속 요청 제한')
+            elif status == CHALLENGE:
+                self._trip('본인 확인 페이지')
+            elif status == LOGGED_OUT and not login_expected:
+                self.consecutive_logged_out += 1
+                logger.warning(f"로그인 세션 끊김 감지 ({self.name}, {self.consecutive_logged_out}회 연속)")
+                if self.consecutive_logged_out >= self.threshold:
+                    self._trip('연속 로그아웃')
+        return status
+    
+    def record_login(self, success):
+        """로그인 결과 반영 (실패 시 다시 로그인을 반복하지 않도록 차단기 열기)"""
+        if not success:
+            with self._lock:
+                self._trip('로그인 실패')
+    
+    def _trip(self, reason):
+        self.trips += 1
+        seconds = min(self.open_seconds * 2 ** (self.trips - 1), self.max_open_seconds)
+        self.open_until = self.clock() + seconds
+        self.rate = float(self.min_rate)
+        self.consecutive_limited = 0
+        self.consecutive_logged_out = 0
+        CIRCUIT_BREAKER_TRIPS.inc(reason=reason)
+        logger.error(f"크롤링 계정 {self.name} 차단기 열림 ({reason}), {seconds:.0f}초 동안 사용 중지")
+    
+    def to_dict(self):
+        """상태 조회용 값"""
+        with self._lock:
+            return {
+                'rate_per_minute': round(self.rate, 2),
+                'open_seconds': round(self.remaining_open_seconds(), 1),
+                'trips': self.trips
+            }
@@ -0,0 +1,63 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+# 다시 확인할 게시물 내용 필드 (해시태그/멘션은 캡션에서 추출되므로 캡션에 포함)
+CONTENT_FIELDS = ('caption', 'image_url', 'posted_at')
+
+def image_key(image_url):
+    """
+    이미지 주소에서 비교에 사용할 부분 (CDN 서명/만료 쿼리 문자열 제외)
+    
+    Returns:
+        str: 주소의 경로 (주소가 없으면 None)
+    """
+    if not image_url:
+        return None
+    return urlsplit(image_url).path or image_url
+
+def content_hash(caption, image_url, posted_at):
+    """
+    게시물 내용 해시 (캡션, 이미지, 게시 시간)
+    
+    이미지 주소는 요청마다 바뀌는 서명 쿼리를 제외한 경로만 사용합니다.
+    
+    Returns:
+        str: SHA-1 16진수 문자열
+    """
+    content = json.dumps([caption, image_key(image_url), posted_at], ensure_ascii=False)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+def revisit_interval(posted_at, now, age_factor, min_hours, max_days):
+    """
+    다음 확인까지의 간격 (게시물이 오래될수록 길어짐)
+    
+    게시 후 경과 시간에 age_factor를 곱한 값을 [min_hours, max_days] 범위로 제한합니다.
+    예: age_factor=0.5이면 하루 된 게시물은 12시간, 한 달 된 게시물은 15일 뒤에 다시 확인합니다.
+    
+    Args:
+        posted_at (str): 게시 시간 (ISO 형식, 없거나 해석할 수 없으면 now)
+        now (datetime): 현재 시각
+        age_factor (float): 경과 시간 대비 확인 간격 비율
+        min_hours (float): 최소 간격 (시간)
+        max_days (float): 최대 간격 (일)
+    
+    Returns:
+        timedelta: 다음 확인까지의 간격
+    """
+    posted = _parse_time(posted_at) or now
+    age = max(now - posted, timedelta(0))
+    return min(max(age * age_factor, timedelta(hours=min_hours)), timedelta(days=max_days))
+
+def _parse_time(value):
+    """ISO 형식 시간을 시간대 없는 현지 시각으로 변환 (실패 시 None)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
@@ -0,0 +1,257 @@
+import json
+import logging
+import os
+import threading
+import time
+from metrics import SELECTOR_LOOKUPS, SELECTOR_SECONDS
+
+# 최근 성공률 지수 이동 평균 가중치 (클수록 최근 결과를 빠르게 반영)
+SCORE_ALPHA = 0.2
+
+# 여러 후보 선택자를 한 번의 드라이버 왕복으로 조회하는 스크립트
+# (선택자별 결과 목록 반환, 잘못된 선택자는 null, stopAtFirst이면 처음 찾은 선택자까지만 조회)
+COMPOUND_QUERY_SCRIPT = '''
+var selectors = arguments[0], all = arguments[1], stopAtFirst = arguments[2], results = [];
+for (var i = 0; i < selectors.length; i++) {
+    var found;
+    try {
+        if (all) {
+            found = Array.prototype.slice.call(document.querySelectorAll(selectors[i]));
+        } else {
+            var element = document.querySelector(selectors[i]);
+            found = element ? [element] : [];
+        }
+    } catch (e) {
+        found = null;
+    }
+    results.push(found);
+    if (stopAtFirst && found && found.length) {
+        break;
+    }
+}
+return results;
+'''
+
+logger = logging.getLogger(__name__)
+
+class SelectorRegistry:
+    def __init__(self, path):
+        """
+        설정 파일 기반 CSS 선택자 저장소
+        
+        그룹별 후보 선택자를 JSON 파일({"그룹": ["선택자", ...]})에서 읽고,
+        선택자별 성공/실패 수와 조회 시간을 기록하여 최근에 성공한 선택자를 먼저 시도합니다.
+        파일이 바뀌면 reload_if_changed()에서 다시 읽으므로 스케줄러를 재시작할 필요가 없습니다.
+        
+        Args:
+            path (str): 선택자 설정 파일 경로
+        """
+        self.path = path
+        self.groups = {}
+        self._mtime = None
+        self._stats = {}
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        """
+        설정 파일 읽기 (실패 시 기존 선택자 유지)
+        
+        Returns:
+            bool: 읽기 성공 여부
+        """
+        try:
+            mtime = os.path.getmtime(self.path)
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            groups = {
+                str(group): [str(selector) for selector in selectors]
+                for group, selectors in data.items()
+                if isinstance(selectors, list)
+            }
+        except Exception as e:
+            logger.error(f"선택자 설정 파일 읽기 실패: {self.path} - {e}")
+            return False
+        
+        with self._lock:
+            self.groups = groups
+            self._mtime = mtime
+            # 설정에서 빠진 선택자의 통계는 버림
+            self._stats = {key: value for key, value in self._stats.items() if key[1] in groups.get(key[0], [])}
+        logger.info(f"선택자 설정 로드됨: {self.path} ({len(groups)}개 그룹)")
+        return True
+    
+    def reload_if_changed(self):
+        """
+        설정 파일이 수정되었으면 다시 읽기
+        
+        Returns:
+            bool: 다시 읽었는지 여부
+        """
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+        return self.load()
+    
+    def candidates(self, group):
+        """
+        그룹의 후보 선택자 (최근 성공률 높은 순, 같으면 설정 파일 순서)
+        
+        Returns:
+            list: 선택자 목록
+        """
+        with self._lock:
+            selectors = self.groups.get(group, [])
+            if not selectors:
+                logger.warning(f"선택자 그룹이 설정되지 않음: {group}")
+            order = {selector: i for i, selector in enumerate(selectors)}
+            return sorted(selectors, key=lambda selector: (-self._stat(group, selector)['score'], order[selector]))
+    
+    def find(self, driver, group, predicate=None):
+        """
+        후보 선택자 중 처음 일치하는 요소 찾기
+        
+        Args:
+            driver: Selenium WebDriver
+            group (str): 선택자 그룹 이름
+            predicate (callable): 요소 조건 (선택자별 첫 요소에 적용, False이면 다음 선택자)
+        
+        Returns:
+            WebElement: 찾은 요소 (없으면 None)
+        """
+        selectors = self.candidates(group)
+        start = time.perf_counter()
+        results = self._query(driver, selectors, all_elements=False, stop_at_first=predicate is None)
+        
+        missed = []
+        for selector, found in zip(selectors, results):
+            element = found[0] if found else None
+            if element is not None and (predicate is None or _matches(predicate, element)):
+                self._record(group, selector, missed, time.perf_counter() - start)
+                return element
+            missed.append(selector)
+        
+        self._record(group, None, missed, time.perf_counter() - start)
+        return None
+    
+    def find_all(self, driver, group):
+        """
+        후보 선택자 중 처음 일치하는 선택자의 모든 요소 찾기
+        
+        Args:
+            driver: Selenium WebDriver
+            group (str): 선택자 그룹 이름
+        
+        Returns:
+            tuple: (요소 목록, 사용된 선택자) - 없으면 ([], None)
+        """
+        selectors = self.candidates(group)
+        start = time.perf_counter()
+        results = self._query(driver, selectors, all_elements=True, stop_at_first=True)
+        
+        missed = []
+        for selector, found in zip(selectors, results):
+            if found:
+                self._record(group, selector, missed, time.perf_counter() - start)
+                return list(found), selector
+            missed.append(selector)
+        
+        self._record(group, None, missed, time.perf_counter() - start)
+        return [], None
+    
+    def _query(self, driver, selectors, all_elements, stop_at_first):
+        """선택자별 조회 결과 목록 (스크립트 실행이 안 되면 선택자마다 조회)"""
+        if not selectors:
+            return []
+        try:
+            results = driver.execute_script(COMPOUND_QUERY_SCRIPT, selectors, all_elements, stop_at_first)
+            if isinstance(results, list):
+                return results
+        except Exception as e:
+            logger.debug(f"복합 선택자 조회 실패, 개별 조회로 대체: {e}")
+        
+        from selenium.webdriver.common.by import By
+        
+        results = []
+        for selector in selectors:
+            try:
+                found = driver.find_elements(By.CSS_SELECTOR, selector)
+            except Exception:
+                found = None
+            if found and not all_elements:
+                found = found[:1]
+            results.append(found)
+            if found and stop_at_first:
+                break
+        return results
+    
+    def _stat(self, group, selector):
+        key = (group, selector)
+        stat = self._stats.get(key)
+        if stat is None:
+            stat = self._stats[key] = {'hits': 0, 'misses': 0, 'seconds': 0.0, 'score': 0.0}
+        return stat
+    
+    def _record(self, group, hit, missed, seconds):
+        """조회 결과 기록 (실패한 선택자는 점수 감소, 성공한 선택자는 점수 증가)"""
+        SELECTOR_SECONDS.observe(seconds, group=group)
+        with self._lock:
+            for selector in missed:
+                stat = self._stat(group, selector)
+                stat['misses'] += 1
+                stat['score'] *= 1 - SCORE_ALPHA
+            if hit is not None:
+                stat = self._stat(group, hit)
+                stat['hits'] += 1
+                stat['seconds'] += seconds
+                stat['score'] = stat['score'] * (1 - SCORE_ALPHA) + SCORE_ALPHA
+        for selector in missed:
+            SELECTOR_LOOKUPS.inc(group=group, selector=selector, result='miss')
+        if hit is not None:
+            SELECTOR_LOOKUPS.inc(group=group, selector=hit, result='hit')
+        else:
+            logger.debug(f"선택자 그룹 {group}: 일치하는 요소 없음")
+    
+    def get_stats(self):
+        """
+        선택자별 통계
+        
+        Returns:
+            list: 그룹/선택자별 성공 수, 실패 수, 성공률, 평균 조회 시간, 점수
+        """
+        with self._lock:
+            items = sorted(self._stats.items())
+        return [
+            {
+                'group': group,
+                'selector': selector,
+                'hits': stat['hits'],
+                'misses': stat['misses'],
+                'hit_rate': round(stat['hits'] / (stat['hits'] + stat['misses']), 4) if stat['hits'] + stat['misses'] else 0.0,
+                'avg_seconds': round(stat['seconds'] / stat['hits'], 6) if stat['hits'] else None,
+                'score': round(stat['score'], 4)
+            }
+            for (group, selector), stat in items
+        ]
+
+def _matches(predicate, element):
+    """요소 조건 확인 (요소가 사라지는 등 오류 발생 시 불일치)"""
+    try:
+        return bool(predicate(element))
+    except Exception:
+        return False
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_registry():
+    """프로세스 공용 선택자 저장소 (크롤러 인스턴스가 바뀌어도 통계 유지)"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            from config import Config
+            _registry = SelectorRegistry(Config.SELECTORS_FILE)
+        return _registry
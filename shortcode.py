@@ -0,0 +1,71 @@
+import re
+
+# 인스타그램 shortcode 문자 집합 (미디어 ID를 6비트씩 나타내는 URL-safe base64)
+SHORTCODE_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_'
+_ALPHABET_INDEX = {char: i for i, char in enumerate(SHORTCODE_ALPHABET)}
+
+# /p/<code>/, /<user>/p/<code>/, /reel/<code>/, /tv/<code>/ 형태의 게시물 주소
+SHORTCODE_PATTERN = re.compile(r'/(?:p|reels?|tv)/([A-Za-z0-9_-]+)')
+
+# SQLite INTEGER(부호 있는 64비트)에 저장할 수 있는 최대 미디어 ID
+MAX_MEDIA_ID = 2 ** 63 - 1
+
+POST_URL_FORMAT = 'https://www.instagram.com/p/{}/'
+
+def extract_shortcode(post_url):
+    """
+    게시물 주소에서 shortcode 추출 (사용자명 경로, 쿼리 문자열, 조각 무시)
+    
+    Returns:
+        str: shortcode (게시물 주소가 아니면 None)
+    """
+    match = SHORTCODE_PATTERN.search(post_url or '')
+    return match.group(1) if match else None
+
+def shortcode_to_media_id(shortcode):
+    """
+    shortcode를 정수 미디어 ID로 변환
+    
+    앞에 'A'(0)가 붙은 코드는 같은 숫자의 다른 표기가 되므로, 다시 인코딩했을 때
+    원래 코드와 같은 경우에만 변환합니다. 비공개 게시물의 긴 코드처럼 64비트를
+    넘는 값도 None을 반환하며, 이 경우 정규화된 게시물 주소로 구분합니다.
+    
+    Returns:
+        int: 미디어 ID (변환할 수 없으면 None)
+    """
+    if not shortcode or len(shortcode) > 11:
+        return None
+    value = 0
+    for char in shortcode:
+        index = _ALPHABET_INDEX.get(char)
+        if index is None:
+            return None
+        value = value * 64 + index
+    if value > MAX_MEDIA_ID or media_id_to_shortcode(value) != shortcode:
+        return None
+    return value
+
+def media_id_to_shortcode(media_id):
+    """정수 미디어 ID를 shortcode로 변환"""
+    chars = []
+    while True:
+        media_id, index = divmod(media_id, 64)
+        chars.append(SHORTCODE_ALPHABET[index])
+        if not media_id:
+            break
+    return ''.join(reversed(chars))
+
+def canonicalize_post_url(post_url):
+    """
+    게시물 주소 정규화
+    
+    Args:
+        post_url (str): 크롤링된 게시물 주소
+    
+    Returns:
+        tuple: (정규화된 주소, 미디어 ID) - shortcode가 없으면 (원래 주소, None)
+    """
+    shortcode = extract_shortcode(post_url)
+    if not shortcode:
+        return post_url, None
+    return POST_URL_FORMAT.format(shortcode), shortcode_to_media_id(shortcode)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+부하 테스트용 합성 데이터 생성기
+
+DataManager와 같은 스키마의 데이터베이스에 계정, 크롤링 히스토리, 게시물,
+해시태그/멘션, 미디어 파일(유사 이미지 포함)을 지정한 규모로 채웁니다.
+같은 seed는 항상 같은 데이터를 생성합니다.
+
+사용 예:
+    python synthetic_data.py --db bench.db --accounts 1000 --posts 1000000 --crawls 100000
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from data_manager import DataManager
+from image_hash import BAND_COUNT, split_bands, to_signed
+from shortcode import POST_URL_FORMAT, media_id_to_shortcode
+
+# 캡션/태그 생성용 단어 (앞쪽 단어일수록 자주 사용)
+WORDS = [
+    'coffee', 'daily', 'travel', 'food', 'ootd', 'seoul', 'busan', 'cafe', 'sunset', 'weekend',
+    'friends', 'family', 'workout', 'book', 'music', 'art', 'photo', 'nature', 'dog', 'cat',
+    'beach', 'mountain', 'night', 'morning', 'dessert', 'fashion', 'beauty', 'design', 'study', 'home'
+]
+
+def generate_database(db_path, accounts=100, posts=10000, crawls=1000, failure_rate=0.1,
+                      media_ratio=0.5, duplicate_ratio=0.05, days=365, seed=42, batch_size=10000, verbose=False):
+    """
+    합성 데이터로 데이터베이스 채우기
+    
+    Args:
+        db_path (str): 데이터베이스 파일 경로 (없으면 생성, 있으면 데이터 추가)
+        accounts (int): 계정 수
+        posts (int): 게시물 수 (성공한 크롤링에 시간 순으로 나누어 배정)
+        crawls (int): 크롤링 히스토리 행 수
+        failure_rate (float): 실패한 크롤링 비율
+        media_ratio (float): 다운로드된 이미지가 있는 게시물 비율
+        duplicate_ratio (float): 기존 이미지와 거의 같은(해밍 거리 1~2) 이미지 비율
+        days (int): 크롤링 기간 (오늘부터 과거로)
+        seed (int): 난수 시드
+        batch_size (int): 한 트랜잭션에 넣을 게시물 수
+        verbose (bool): 진행 상황 출력 여부
+    
+    Returns:
+        dict: 테이블별 생성된 행 수
+    """
+    rng = random.Random(seed)
+    DataManager(db_path)
+    
+    usernames = [f"synthetic_user{i:05d}" for i in range(accounts)]
+    now = datetime.now().replace(microsecond=0)
+    start = now - timedelta(days=days)
+    
+    # 크롤링 히스토리 (시간 순, 일부 실패)
+    history = []
+    for i in range(crawls):
+        crawled_at = start + timedelta(seconds=days * 86400 * i / max(crawls, 1))
+        success = rng.random() >= failure_rate
+        history.append((rng.choice(usernames), crawled_at, success))
+    successes = [item for item in history if item[2]]
+    
+    counts = {'account_data': 0, 'crawl_history': 0, 'post_data': 0, 'post_hashtags': 0,
+              'post_mentions': 0, 'media_files': 0, 'account_stats': 0}
+    stats = {}
+    post_numbers = {}
+    hashes = []
+    started = time.perf_counter()
+    
+    with sqlite3.connect(db_path) as conn:
+        # 생성 전용 연결이므로 내구성보다 속도 우선
+        conn.execute('PRAGMA synchronous = OFF')
+        cursor = conn.cursor()
+        
+        for username, crawled_at, success in history:
+            item = stats.setdefault(username, {'total': 0, 'success': 0, 'failed': 0, 'posts': 0,
+                                               'last_crawl': None, 'last_new_post': None})
+            item['total'] += 1
+            item['success' if success else 'failed'] += 1
+            item['last_crawl'] = crawled_at.isoformat()
+            cursor.execute(
+                'INSERT INTO crawl_history (username, status, crawled_at, error_message, created_at) VALUES (?, ?, ?, ?, ?)',
+                (username, 'SUCCESS' if success else 'ERROR', crawled_at.isoformat(),
+                 None if success else 'synthetic error', _sql_time(crawled_at))
+            )
+        counts['crawl_history'] = len(history)
+        
+        # 성공한 크롤링마다 account_data 행 생성 (save_crawl_data와 같은 구조)
+        account_ids = []
+        for username, crawled_at, _ in successes:
+            cursor.execute(
+                'INSERT INTO account_data (user_id, username, created_at) VALUES (?, ?, ?)',
+                (username, username, _sql_time(crawled_at))
+            )
+            account_ids.append(cursor.lastrowid)
+        counts['account_data'] = len(successes)
+        conn.commit()
+        
+        for batch_start in range(0, posts if successes else 0, batch_size):
+            for i in range(batch_start, min(batch_start + batch_size, posts)):
+                crawl_index = i * len(successes) // posts
+                username, crawled_at, _ = successes[crawl_index]
+                post_numbers[username] = post_numbers.get(username, 0) + 1
+                
+                hashtags = [f"#{tag}" for tag in _pick_words(rng, 3)]
+                mentions = [f"@{name}" for name in rng.sample(usernames, min(2, accounts))] if rng.random() < 0.3 else []
+                caption = ' '.join(_pick_words(rng, 8) + hashtags + mentions)
+                posted_at = crawled_at - timedelta(seconds=rng.randint(0, 86400 * 3))
+                
+                image_sha256 = None
+                if rng.random() < media_ratio:
+                    image_sha256 = hashlib.sha256(f"{seed}:{i}".encode('utf-8')).hexdigest()
+                    dhash = _make_dhash(rng, hashes, duplicate_ratio)
+                    cursor.execute(
+                        f'''INSERT OR IGNORE INTO media_files
+                            (sha256, path, size_bytes, content_type, created_at, dhash,
+                             {', '.join(f'dhash_b{band}' for band in range(BAND_COUNT))})
+                            VALUES (?, ?, ?, ?, ?, ?, {', '.join('?' * BAND_COUNT)})''',
+                        (image_sha256, f"media/{image_sha256[:2]}/{image_sha256[2:4]}/{image_sha256}.jpg",
+                         rng.randint(20000, 400000), 'image/jpeg', _sql_time(crawled_at),
+                         to_signed(dhash), *split_bands(dhash))
+                    )
+                    counts['media_files'] += 1
+                
+                # 시드별로 겹치지 않는 미디어 ID (save_crawl_data와 같은 정규화된 주소)
+                media_id = (seed + 1) * 10 ** 12 + i
+                cursor.execute('''
+                    INSERT INTO post_data
+                    (account_id, post_url, post_number, image_url, caption, posted_at,
+                     hashtags, mentions, timestamp, created_at, image_sha256, media_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    account_ids[crawl_index],
+                    POST_URL_FORMAT.format(media_id_to_shortcode(media_id)),
+                    post_numbers[username],
+                    f"https://cdn.example.com/{i}.jpg",
+                    caption,
+                    posted_at.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+                    json.dumps(hashtags, ensure_ascii=False),
+                    json.dumps(mentions, ensure_ascii=False),
+                    crawled_at.isoformat(),
+                    _sql_time(crawled_at),
+                    image_sha256,
+                    media_id
+                ))
+                post_id = cursor.lastrowid
+                
+                tags = sorted({tag.lstrip('#') for tag in hashtags})
+                handles = sorted({handle.lstrip('@') for handle in mentions})
+                cursor.executemany('INSERT OR IGNORE INTO post_hashtags (post_id, tag) VALUES (?, ?)',
+                                   [(post_id, tag) for tag in tags])
+                cursor.executemany('INSERT OR IGNORE INTO post_mentions (post_id, handle) VALUES (?, ?)',
+                                   [(post_id, handle) for handle in handles])
+                counts['post_hashtags'] += len(tags)
+                counts['post_mentions'] += len(handles)
+                
+                stats[username]['posts'] += 1
+                stats[username]['last_new_post'] = _sql_time(crawled_at)
+            
+            conn.commit()
+            if verbose:
+                done = min(batch_start + batch_size, posts)
+                print(f"  게시물 {done:,}/{posts:,} ({time.perf_counter() - started:.1f}초)")
+        counts['post_data'] = posts if successes else 0
+        
+        # 계정별 통계 요약 (기존 요약에 누적)
+        cursor.executemany('''
+            INSERT INTO account_stats
+            (username, total_crawls, successful_crawls, failed_crawls, total_posts, last_crawl, last_new_post)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(username) DO UPDATE SET
+                total_crawls = total_crawls + excluded.total_crawls,
+                successful_crawls = successful_crawls + excluded.successful_crawls,
+                failed_crawls = failed_crawls + excluded.failed_crawls,
+                total_posts = total_posts + excluded.total_posts,
+                last_crawl = MAX(COALESCE(last_crawl, ''), excluded.last_crawl),
+                last_new_post = COALESCE(excluded.last_new_post, last_new_post)
+        ''', [
+            (username, item['total'], item['success'], item['failed'], item['posts'],
+             item['last_crawl'], item['last_new_post'])
+            for username, item in stats.items()
+        ])
+        counts['account_stats'] = len(stats)
+        conn.commit()
+    
+    return counts
+
+def _pick_words(rng, count):
+    """앞쪽 단어가 자주 나오도록 치우친 단어 선택"""
+    return [WORDS[min(int(rng.expovariate(0.15)), len(WORDS) - 1)] for _ in range(count)]
+
+def _make_dhash(rng, hashes, duplicate_ratio):
+    """임의의 64비트 dHash (일부는 기존 해시에서 1~2비트만 다르게)"""
+    if hashes and rng.random() < duplicate_ratio:
+        value = rng.choice(hashes)
+        for bit in rng.sample(range(64), rng.randint(1, 2)):
+            value ^= 1 << bit
+    else:
+        value = rng.getrandbits(64)
+    hashes.append(value)
+    return value
+
+def _sql_time(value):
+    """SQLite CURRENT_TIMESTAMP와 같은 형식"""
+    return value.strftime('%Y-%m-%d %H:%M:%S')
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='부하 테스트용 합성 데이터 생성기')
+    parser.add_argument('--db', required=True, help='생성할 데이터베이스 파일 경로')
+    parser.add_argument('--accounts', type=int, default=100, help='계정 수 (기본값: 100)')
+    parser.add_argument('--posts', type=int, default=10000, help='게시물 수 (기본값: 10000)')
+    parser.add_argument('--crawls', type=int, default=1000, help='크롤링 히스토리 행 수 (기본값: 1000)')
+    parser.add_argument('--failure-rate', type=float, default=0.1, help='실패한 크롤링 비율 (기본값: 0.1)')
+    parser.add_argument('--media-ratio', type=float, default=0.5, help='이미지가 있는 게시물 비율 (기본값: 0.5)')
+    parser.add_argument('--days', type=int, default=365, help='크롤링 기간 일수 (기본값: 365)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본값: 42)')
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    counts = generate_database(
+        args.db,
+        accounts=args.accounts,
+        posts=args.posts,
+        crawls=args.crawls,
+        failure_rate=args.failure_rate,
+        media_ratio=args.media_ratio,
+        days=args.days,
+        seed=args.seed,
+        verbose=True
+    )
+    
+    print(f"=== 합성 데이터 생성 완료: {args.db} ({time.perf_counter() - started:.1f}초) ===")
+    for table, count in counts.items():
+        print(f"  {table}: {count:,}행")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+계정 목록 DB 테스트 (대량 가져오기, CSV 계정별 설정, 변경 시 스케줄러 목록 갱신)
+"""
+
+from datetime import datetime
+from account_registry import AccountRegistry
+from data_manager import DataManager
+from instagram_scheduler import InstagramScheduler
+from test_data_manager import make_crawl_result
+
+def make_registry(tmp_path):
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    return data_manager, AccountRegistry(data_manager.db_path)
+
+def test_import_large_text_file(tmp_path):
+    """수만 줄 텍스트 파일 가져오기 (@, 주석, 잘못된 사용자명, 중복 처리)"""
+    _, registry = make_registry(tmp_path)
+    path = tmp_path / 'accounts.txt'
+    lines = ['# 가져올 계정', '@First.User', 'https://www.instagram.com/second_user/', 'bad name!', '']
+    lines += [f"user{i}" for i in range(20000)] + ['user0']
+    path.write_text('\n'.join(lines), encoding='utf-8')
+    
+    counts = registry.import_accounts(str(path), priority=2)
+    assert counts == {'read': 20004, 'imported': 20003, 'invalid': 1}
+    
+    accounts = registry.get_accounts()
+    assert len(accounts) == 20002
+    assert {'first.user', 'second_user'} <= {account['username'] for account in accounts}
+    assert all(account['priority'] == 2 for account in accounts)
+
+def test_csv_settings_and_export(tmp_path):
+    """CSV 컬럼별 설정 적용, 우선순위 순 조회, 내보내기 후 다시 가져오기"""
+    _, registry = make_registry(tmp_path)
+    path = tmp_path / 'accounts.csv'
+    path.write_text(
+        'username,enabled,priority,interval_hours,max_posts\n'
+        'alpha,1,5,6,20\n'
+        'beta,0,,,\n'
+        'gamma,,1,,3\n'
+        'delta,1,not-a-number,,\n',
+        encoding='utf-8'
+    )
+    counts = registry.import_accounts(str(path))
+    assert counts == {'read': 4, 'imported': 3, 'invalid': 1}
+    
+    assert [account['username'] for account in registry.get_accounts()] == ['alpha', 'gamma']
+    alpha = registry.get_accounts()[0]
+    assert (alpha['interval_hours'], alpha['max_posts']) == (6.0, 20)
+    
+    export_path = tmp_path / 'export.csv'
+    assert registry.export_accounts(str(export_path)) == 3
+    
+    other_dir = tmp_path / 'other'
+    other_dir.mkdir()
+    _, other = make_registry(other_dir)
+    assert other.import_accounts(str(export_path))['imported'] == 3
+    assert other.get_accounts(enabled_only=False) == registry.get_accounts(enabled_only=False)
+
+def test_scheduler_refreshes_on_change(tmp_path, monkeypatch):
+    """변경 번호가 바뀔 때만 다시 읽고, 기존 리스트 객체 내용을 갱신"""
+    monkeypatch.setattr('config.Config.DEFAULT_ACCOUNTS', ['seed_account'])
+    data_manager, registry = make_registry(tmp_path)
+    scheduler = InstagramScheduler()
+    scheduler._data_manager = data_manager
+    
+    accounts = scheduler.accounts
+    assert accounts == ['seed_account']
+    assert not scheduler.refresh_accounts()
+    
+    registry.add_account('urgent', priority=10, max_posts=3)
+    registry.set_enabled('seed_account', False)
+    assert scheduler.refresh_accounts()
+    assert accounts == ['urgent']
+    assert scheduler.account_settings['urgent']['max_posts'] == 3
+    
+    assert scheduler.remove_account('urgent')
+    assert accounts == []
+    # 모든 계정을 지워도 기본 계정으로 다시 채우지 않음
+    assert not scheduler.refresh_accounts()
+    assert registry.get_accounts(enabled_only=False)[0]['username'] == 'seed_account'
+
+def test_failed_crawl_leaves_account_due(tmp_path, monkeypatch):
+    """계정별 간격은 마지막 성공한 크롤링 기준이므로 실패한 계정은 간격을 기다리지 않고 다시 크롤링"""
+    monkeypatch.setattr('config.Config.DEFAULT_ACCOUNTS', [])
+    data_manager, registry = make_registry(tmp_path)
+    registry.add_account('alice', interval_hours=24)
+    registry.add_account('bob', interval_hours=24)
+    scheduler = InstagramScheduler()
+    scheduler._data_manager = data_manager
+    scheduler.refresh_accounts()
+    
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1'], datetime.now().isoformat()))
+    data_manager._record_crawl_error('bob', 'timeout')
+    assert scheduler.due_accounts() == ['bob']
+    
+    # 오래전에 성공하고 방금 실패한 계정도 다시 크롤링 대상
+    data_manager.save_crawl_data(make_crawl_result('bob', ['B1'], '2024-01-01T00:00:00'))
+    data_manager._record_crawl_error('bob', 'timeout')
+    assert scheduler.due_accounts() == ['bob']
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+백업 관리자 테스트 (온라인 백업, 증분 백업, 보관 정책)
+"""
+
+import gzip
+import shutil
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+import pytest
+from backup_manager import BackupManager
+from data_manager import DataManager
+from test_data_manager import make_crawl_result
+
+def test_incremental_backup_and_restore(tmp_path):
+    """전체 + 증분 백업 체인으로 복원하면 모든 데이터가 돌아와야 함"""
+    data_manager = DataManager(str(tmp_path / 'live.db'))
+    backups = BackupManager(data_manager.db_path, backup_dir=tmp_path / 'backups')
+    
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    full_path = backups.create_backup()
+    with gzip.open(full_path, 'rb') as f:
+        assert f.read(16) == b'SQLite format 3\x00'
+    
+    data_manager.save_crawl_data(make_crawl_result('bob', ['B1']))
+    first_incremental = backups.create_backup(incremental=True)
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A3'], '2024-01-02T00:00:00'))
+    second_incremental = backups.create_backup(incremental=True)
+    
+    assert [entry['type'] for entry in backups.list_backups()] == ['full', 'incremental', 'incremental']
+    
+    # 증분 백업에는 새 게시물만 포함
+    restored = DataManager(str(tmp_path / 'restored.db'))
+    BackupManager(restored.db_path, backup_dir=tmp_path / 'backups').restore_backup(first_incremental)
+    assert restored.get_statistics()['total_crawls'] == 2
+    
+    BackupManager(restored.db_path, backup_dir=tmp_path / 'backups').restore_backup(second_incremental)
+    assert restored.get_statistics()['total_crawls'] == 3
+    assert len(restored.get_latest_posts('alice')) == 3
+    assert restored.get_account_statistics('alice')[0]['total_posts'] == 3
+    assert len(restored.search_posts('캡션')['results']) == 4
+    assert restored.get_top_hashtags(limit=1) == [{'tag': 'tag0', 'post_count': 3}]
+
+def test_backup_retention(tmp_path):
+    """보관 개수를 넘는 오래된 전체 백업과 증분 백업은 삭제"""
+    data_manager = DataManager(str(tmp_path / 'live.db'))
+    backups = BackupManager(data_manager.db_path, backup_dir=tmp_path / 'backups', retention=2)
+    
+    for i in range(3):
+        backups.create_backup(compression='none')
+        backups.create_backup(incremental=True, compression='none')
+    
+    entries = backups.list_backups()
+    assert [entry['type'] for entry in entries] == ['full', 'incremental', 'full', 'incremental']
+    stored = sorted(p.name for p in (tmp_path / 'backups').glob('backup_*'))
+    assert stored == sorted(entry['file'] for entry in entries)
+
+def test_restore_database_keeps_safety_backup(tmp_path, monkeypatch):
+    """DataManager.restore_database는 복원 전 현재 데이터베이스를 백업"""
+    monkeypatch.setattr('config.Config.BACKUP_DIRECTORY', str(tmp_path / 'backups'))
+    data_manager = DataManager(str(tmp_path / 'live.db'))
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1']))
+    backup_path = data_manager.backup_database(backup_path=str(tmp_path / 'manual.db.gz'))
+    
+    data_manager.save_crawl_data(make_crawl_result('bob', ['B1']))
+    assert data_manager.restore_database(backup_path)
+    assert data_manager.get_statistics()['total_crawls'] == 1
+    assert len(list((tmp_path / 'backups').glob('backup_*'))) == 1
+
+def test_rewritten_rows_force_full_backup(tmp_path):
+    """마지막 백업 이후 기존 행이 수정/삭제되면 증분 대신 전체 백업을 만들어 변경이 빠지지 않음"""
+    data_manager = DataManager(str(tmp_path / 'live.db'))
+    backups = BackupManager(data_manager.db_path, backup_dir=tmp_path / 'backups')
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    backups.create_backup(compression='none')
+    
+    data_manager.save_crawl_data(make_crawl_result('bob', ['B1']))
+    backups.create_backup(incremental=True, compression='none')
+    
+    with sqlite3.connect(data_manager.db_path) as conn:
+        conn.execute("UPDATE post_data SET image_url = 'https://cdn.example.com/new.jpg' WHERE post_url LIKE '%A1%'")
+    rewritten = backups.create_backup(incremental=True, compression='none')
+    
+    # 초기화 후에는 키가 워터마크보다 작은 새 행이 생기므로 역시 전체 백업
+    data_manager.initialize_database()
+    data_manager.save_crawl_data(make_crawl_result('carol', ['C1']))
+    reset = backups.create_backup(incremental=True, compression='none')
+    
+    assert [entry['type'] for entry in backups.list_backups()] == ['full', 'incremental', 'full', 'full']
+    assert rewritten.endswith('_full.db') and reset.endswith('_full.db')
+    
+    restored = DataManager(str(tmp_path / 'restored.db'))
+    BackupManager(restored.db_path, backup_dir=tmp_path / 'backups').restore_backup(rewritten)
+    assert 'https://cdn.example.com/new.jpg' in [post['image_url'] for post in restored.get_latest_posts('alice')]
+
+def test_orphan_incremental_is_not_restored_as_full(tmp_path, monkeypatch):
+    """백업 목록에 없는 증분 백업은 기준 전체 백업을 찾을 수 없으므로 복원하지 않음"""
+    monkeypatch.setattr('config.Config.BACKUP_DIRECTORY', str(tmp_path / 'backups'))
+    data_manager = DataManager(str(tmp_path / 'live.db'))
+    backups = BackupManager(data_manager.db_path, backup_dir=tmp_path / 'backups')
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1']))
+    backups.create_backup()
+    data_manager.save_crawl_data(make_crawl_result('bob', ['B1']))
+    incremental = Path(backups.create_backup(incremental=True))
+    
+    # 다른 위치로 복사된 증분 백업 (이름도 바뀜)
+    orphan = tmp_path / 'copied.db.gz'
+    shutil.copy(incremental, orphan)
+    with pytest.raises(ValueError):
+        backups.restore_backup(orphan)
+    
+    assert not data_manager.restore_database(str(orphan))
+    assert data_manager.get_statistics()['total_crawls'] == 2
+
+def test_incremental_backup_excludes_revisit_schedules(tmp_path, monkeypatch):
+    """재확인 일정은 증분 백업에 담지 않고, 복원 시 삭제 표시만 증분의 삭제 기록으로 다시 맞춤"""
+    monkeypatch.setattr('config.Config.REVISIT_ENABLED', True)
+    data_manager = DataManager(str(tmp_path / 'live.db'))
+    backups = BackupManager(data_manager.db_path, backup_dir=tmp_path / 'backups')
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    backups.create_backup(compression='none')
+    
+    result = make_crawl_result('alice', ['A3'], '2024-01-02T00:00:00')
+    result['revisited_posts'] = [{'post_url': 'https://www.instagram.com/p/A1/', 'deleted': True}]
+    data_manager.save_crawl_data(result)
+    incremental = backups.create_backup(incremental=True, compression='none')
+    assert incremental.endswith('_incremental.db')
+    
+    with sqlite3.connect(incremental) as conn:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        assert 'post_revisit' not in tables
+        assert conn.execute('SELECT COUNT(*) FROM post_data').fetchone()[0] == 1
+    
+    restored = DataManager(str(tmp_path / 'restored.db'))
+    BackupManager(restored.db_path, backup_dir=tmp_path / 'backups').restore_backup(incremental)
+    later = datetime.now() + timedelta(days=61)
+    # 삭제된 A1은 제외, 일정이 빠진 A3는 이번 조회 시각 기준으로 새 일정 생성
+    due = restored.get_posts_due_for_revisit('alice', now=later)
+    assert [post['post_url'] for post in due] == ['https://www.instagram.com/p/A2/']
+    with sqlite3.connect(restored.db_path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM post_revisit').fetchone()[0] == 3
+
+def test_revisit_schedules_only_in_revisit_mode(tmp_path):
+    """재확인 모드가 꺼져 있으면 저장 시 재확인 일정을 만들지 않음"""
+    data_manager = DataManager(str(tmp_path / 'live.db'))
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    with sqlite3.connect(data_manager.db_path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM post_revisit').fetchone()[0] == 0
+
+def test_incremental_backup_copies_only_new_metric_samples(tmp_path):
+    """증분 백업에는 새 지표 표본만 담고, 복원 시 집계를 표본으로 다시 계산해 원본과 같아야 함"""
+    data_manager = DataManager(str(tmp_path / 'live.db'))
+    backups = BackupManager(data_manager.db_path, backup_dir=tmp_path / 'backups')
+    for day, followers in [(1, 100), (2, 110)]:
+        result = make_crawl_result('alice', [], f'2024-01-0{day}T00:00:00')
+        result['profile'] = {'followers': followers, 'posts': 10}
+        data_manager.save_crawl_data(result)
+    backups.create_backup(compression='none')
+    
+    result = make_crawl_result('alice', [], '2024-01-02T12:00:00')
+    result['profile'] = {'followers': 130, 'posts': 11}
+    data_manager.save_crawl_data(result)
+    incremental = backups.create_backup(incremental=True, compression='none')
+    assert incremental.endswith('_incremental.db')
+    
+    with sqlite3.connect(incremental) as conn:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        assert 'metric_rollups' not in tables
+        assert conn.execute('SELECT value FROM metric_samples ORDER BY value').fetchall() == [(11,), (130,)]
+    
+    restored = DataManager(str(tmp_path / 'restored.db'))
+    BackupManager(restored.db_path, backup_dir=tmp_path / 'backups').restore_backup(incremental)
+    query = 'SELECT * FROM metric_rollups ORDER BY series_id, resolution, bucket'
+    with sqlite3.connect(data_manager.db_path) as live, sqlite3.connect(restored.db_path) as conn:
+        assert conn.execute(query).fetchall() == live.execute(query).fetchall()
+        assert conn.execute('SELECT COUNT(*) FROM metric_samples').fetchone()[0] == 6
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+캡션 압축 저장 테스트 (투명한 복원, 전문 검색 색인 유지, 사전 학습 및 다시 압축)
+"""
+
+import json
+import sqlite3
+import zlib
+import pytest
+import caption_codec
+from config import Config
+from data_manager import DataManager
+from test_data_manager import make_crawl_result
+
+class ZlibCodec:
+    """zstandard 없이 저장/조회 경로를 확인하기 위한 압축기"""
+    
+    def encode(self, caption, hashtags, mentions):
+        return zlib.compress(json.dumps([caption, hashtags, mentions]).encode('utf-8')), None
+    
+    def decode(self, payload, dict_id):
+        return tuple(json.loads(zlib.decompress(bytes(payload))))
+    
+    def decode_columns(self, payload, dict_id):
+        caption, hashtags, mentions = self.decode(payload, dict_id)
+        return caption, json.dumps(hashtags, ensure_ascii=False), json.dumps(mentions, ensure_ascii=False)
+    
+    def latest_dictionary_id(self):
+        return None
+
+def test_compressed_rows_are_transparent(tmp_path, monkeypatch):
+    """압축 저장된 게시물도 검색/조회 결과가 같고, 원문으로 되돌려도 색인이 유지됨"""
+    monkeypatch.setattr(Config, 'CAPTION_COMPRESSION', 'zstd')
+    monkeypatch.setattr(caption_codec, 'zstd_available', lambda: True)
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    data_manager._codec = ZlibCodec()
+    
+    assert data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    with sqlite3.connect(data_manager.db_path) as conn:
+        rows = conn.execute('SELECT caption, hashtags, payload FROM post_data').fetchall()
+    assert all(row[0] is None and row[1] is None and row[2] for row in rows)
+    
+    [post] = data_manager.search_posts('A2')['results']
+    assert post['caption'] == 'A2 캡션 #tag1 @friend1'
+    assert 'payload' not in post
+    assert [item['caption'] for item in data_manager.get_posts_by_hashtag('tag0')] == ['A1 캡션 #tag0 @friend0']
+    latest = data_manager.get_latest_posts('alice')
+    assert sorted(post['caption'] for post in latest) == ['A1 캡션 #tag0 @friend0', 'A2 캡션 #tag1 @friend1']
+    assert all('payload' not in post for post in latest)
+    
+    monkeypatch.setattr(Config, 'CAPTION_COMPRESSION', 'none')
+    assert data_manager.recompress_posts(vacuum=False)['updated'] == 2
+    with sqlite3.connect(data_manager.db_path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM post_data WHERE payload IS NULL AND hashtags = \'["#tag0"]\'').fetchone()[0] == 1
+    assert len(data_manager.search_posts('friend1')['results']) == 1
+    
+    # 압축 행이 섞여 있어도 초기화 후 색인에 남지 않음
+    monkeypatch.setattr(Config, 'CAPTION_COMPRESSION', 'zstd')
+    assert data_manager.save_crawl_data(make_crawl_result('bob', ['B1']))
+    assert data_manager.rebuild_search_index()
+    assert len(data_manager.search_posts('B1')['results']) == 1
+    assert data_manager.initialize_database()
+    assert data_manager.search_posts('캡션')['results'] == []
+
+def test_missing_zstandard_falls_back(tmp_path, monkeypatch):
+    """zstandard가 없으면 압축 설정이어도 원문으로 저장"""
+    monkeypatch.setattr(Config, 'CAPTION_COMPRESSION', 'zstd')
+    monkeypatch.setattr(caption_codec, 'zstd_available', lambda: False)
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    
+    assert data_manager.save_crawl_data(make_crawl_result('alice', ['A1']))
+    with sqlite3.connect(data_manager.db_path) as conn:
+        assert conn.execute('SELECT caption FROM post_data').fetchone()[0] == 'A1 캡션 #tag0 @friend0'
+
+def test_dictionary_training_shrinks_database(tmp_path, monkeypatch):
+    """학습 사전으로 다시 압축하면 원문보다 작아지고 같은 내용으로 복원됨"""
+    pytest.importorskip('zstandard')
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    for n in range(40):
+        result = make_crawl_result(f'user{n % 4}', [f'P{n}x{i}' for i in range(25)])
+        for post in result['recent_posts']:
+            post['caption'] += ' 오늘도 맛있는 커피 한 잔과 함께하는 여유로운 오후 #cafe #coffee #daily'
+        data_manager.save_crawl_data(result)
+    
+    monkeypatch.setattr(Config, 'CAPTION_COMPRESSION', 'zstd')
+    monkeypatch.setattr(Config, 'CAPTION_DICT_SIZE', 4096)
+    dict_id = data_manager.train_caption_dictionary()
+    assert dict_id is not None
+    
+    result = data_manager.recompress_posts()
+    assert result['updated'] == 1000
+    assert result['size_after'] < result['size_before']
+    # 이미 최신 사전으로 압축된 게시물은 건너뜀
+    assert data_manager.recompress_posts(vacuum=False)['updated'] == 0
+    
+    [post] = data_manager.search_posts('P7x3')['results']
+    assert post['caption'].startswith('P7x3 캡션 #tag3 @friend3 오늘도')
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+변경 피드 테스트 (seq 순서, 초기화 후 seq 유지, 기존 게시물 백필, HTTP 롱 폴링)
+"""
+
+import json
+import sqlite3
+import threading
+import urllib.request
+from change_feed import follow_changes, start_feed_server
+from data_manager import DataManager
+from test_data_manager import make_crawl_result
+
+def test_read_changes_returns_new_posts_in_order(tmp_path):
+    """새로 저장된 게시물만 seq 순서대로 한 번씩 기록됨"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    assert data_manager.get_latest_change_seq() == 0
+    
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    data_manager.save_crawl_data(make_crawl_result('bob', ['B1', 'A2']))
+    
+    changes = data_manager.read_changes(0)
+    assert [(change['seq'], change['username']) for change in changes] == [(1, 'alice'), (2, 'alice'), (3, 'bob')]
+    assert changes[2]['post_url'] == 'https://www.instagram.com/p/B1/'
+    assert changes[2]['hashtags'] == ['#tag0']
+    assert [change['seq'] for change in data_manager.read_changes(1, limit=1)] == [2]
+    assert data_manager.read_changes(3) == []
+    
+    # 초기화 후에도 seq는 이어지므로 소비자의 읽기 위치가 유효함
+    assert data_manager.initialize_database()
+    data_manager.save_crawl_data(make_crawl_result('carol', ['C1']))
+    [change] = data_manager.read_changes(3)
+    assert change['seq'] == 4 and change['username'] == 'carol'
+
+def test_existing_posts_are_backfilled(tmp_path):
+    """변경 피드가 없던 데이터베이스의 기존 게시물을 저장 순서대로 채움"""
+    db_path = str(tmp_path / 'old.db')
+    DataManager(db_path).save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('DROP TABLE post_changes')
+        conn.execute('PRAGMA user_version = 10')
+    
+    data_manager = DataManager(db_path)
+    assert [change['post_url'] for change in data_manager.read_changes(0)] == [
+        'https://www.instagram.com/p/A1/', 'https://www.instagram.com/p/A2/'
+    ]
+    
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A3']))
+    assert data_manager.get_latest_change_seq() == 3
+
+def test_feed_server_long_poll_and_follow(tmp_path):
+    """롱 폴링 요청이 새 게시물 저장 시 바로 응답하고, 따라가기가 새 변경만 반환"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1']))
+    
+    # 회귀 시 무한 대기 대신 실패하도록 따라가기 최대 대기 시간 제한
+    stop_event = threading.Event()
+    stop_timer = threading.Timer(10, stop_event.set)
+    stop_timer.start()
+    follower = follow_changes(data_manager, poll_interval=0.05, stop_event=stop_event)
+    server = start_feed_server(data_manager, 0, poll_interval=0.05)
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{base_url}/changes?since=0") as response:
+            page = json.loads(response.read())
+        assert page['next_seq'] == 1
+        
+        timer = threading.Timer(0.2, data_manager.save_crawl_data, args=(make_crawl_result('bob', ['B1']),))
+        timer.start()
+        with urllib.request.urlopen(f"{base_url}/changes?since=1&wait=10") as response:
+            page = json.loads(response.read())
+        timer.join()
+        assert [change['post_url'] for change in page['changes']] == ['https://www.instagram.com/p/B1/']
+        assert page['next_seq'] == 2
+        
+        # 따라가기는 시작 시점 이후의 변경부터 반환
+        assert next(follower, {}).get('seq') == 2
+    finally:
+        stop_timer.cancel()
+        stop_event.set()
+        server.shutdown()
+
+def test_failed_post_is_rolled_back_whole(tmp_path, monkeypatch):
+    """게시물 저장 도중 실패하면 게시물, 태그, 변경 피드 행을 모두 되돌리고 다음 크롤링에서 새 게시물로 저장"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    record_metrics = DataManager._record_metrics
+    
+    def failing_record_metrics(self, cursor, username, post_id, values, ts):
+        if post_id:
+            raise sqlite3.OperationalError('disk I/O error')
+        return record_metrics(self, cursor, username, post_id, values, ts)
+    
+    monkeypatch.setattr(DataManager, '_record_metrics', failing_record_metrics)
+    result = make_crawl_result('alice', ['A1'])
+    assert data_manager.save_crawl_data(result)
+    assert result['new_posts_count'] == 0
+    with sqlite3.connect(data_manager.db_path) as conn:
+        for table in ('post_data', 'post_hashtags', 'post_changes'):
+            assert conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0] == 0
+    
+    monkeypatch.setattr(DataManager, '_record_metrics', record_metrics)
+    result = make_crawl_result('alice', ['A1'], '2024-01-02T00:00:00')
+    assert data_manager.save_crawl_data(result)
+    assert result['new_posts_count'] == 1
+    assert [change['post_url'] for change in data_manager.read_changes(0)] == ['https://www.instagram.com/p/A1/']
+    assert data_manager.get_account_statistics('alice')[0]['total_posts'] == 1
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+분산 크롤링 코디네이터 테스트 (일관된 해싱, 임대 만료, 다중 프로세스)
+"""
+
+import multiprocessing
+import sqlite3
+import time
+from coordinator import CrawlCoordinator, HashRing, run_worker
+from data_manager import DataManager
+from test_data_manager import make_crawl_result
+
+ACCOUNTS = [f"user{i:02d}" for i in range(24)]
+
+def test_hash_ring_moves_only_removed_worker_keys():
+    """워커가 빠지면 그 워커의 계정만 다른 워커로 이동"""
+    before = HashRing(['w1', 'w2', 'w3'])
+    after = HashRing(['w1', 'w2'])
+    keys = [f"account{i}" for i in range(300)]
+    
+    owners = {key: before.node_for(key) for key in keys}
+    assert set(owners.values()) == {'w1', 'w2', 'w3'}
+    for key in keys:
+        if owners[key] != 'w3':
+            assert after.node_for(key) == owners[key]
+
+def test_lease_takeover_after_worker_dies(tmp_path):
+    """응답 없는 워커의 계정은 하트비트/임대 만료 후 다른 워커가 가져감"""
+    db_path = str(tmp_path / 'coordinator.db')
+    first = CrawlCoordinator(db_path, worker_id='first', lease_seconds=1, heartbeat_seconds=60, worker_timeout=1)
+    second = CrawlCoordinator(db_path, worker_id='second', lease_seconds=1, heartbeat_seconds=60, worker_timeout=1)
+    first.register()
+    
+    username = first.claim_next(['solo'], interval_hours=24)
+    assert username == 'solo'
+    
+    # first가 크롤링 도중 종료된 상황 (임대 반납/등록 해제 없이 하트비트만 중지)
+    first._stop.set()
+    second.register()
+    assert second.claim_next(['solo'], interval_hours=24) is None
+    
+    time.sleep(1.2)
+    second.heartbeat()
+    assert second.claim_next(['solo'], interval_hours=24) == 'solo'
+    second.complete('solo', True)
+    assert second.pending_accounts(['solo'], interval_hours=24) == []
+    second.unregister()
+
+def _worker_process(db_path, worker_id):
+    data_manager = DataManager(db_path)
+    coordinator = CrawlCoordinator(db_path, worker_id=worker_id, heartbeat_seconds=1)
+    
+    def crawl(username):
+        time.sleep(0.05)
+        result = make_crawl_result(username, [f"{username}-{worker_id}"])
+        return data_manager.save_crawl_data(result)
+    
+    run_worker(coordinator, ACCOUNTS, crawl, interval_hours=24, once=True, poll_seconds=0.1)
+
+def test_multiple_processes_crawl_each_account_once(tmp_path):
+    """여러 워커 프로세스가 계정을 나누어 한 번씩만 크롤링하고 같은 DB에 저장"""
+    db_path = str(tmp_path / 'shared.db')
+    DataManager(db_path)
+    
+    processes = [
+        multiprocessing.Process(target=_worker_process, args=(db_path, f"worker{i}"))
+        for i in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+    
+    with sqlite3.connect(db_path) as conn:
+        crawled = [row[0] for row in conn.execute('SELECT username FROM crawl_history')]
+        workers = {row[0] for row in conn.execute('SELECT last_worker_id FROM account_leases')}
+        remaining = conn.execute('SELECT COUNT(*) FROM crawl_workers').fetchone()[0]
+    
+    assert sorted(crawled) == ACCOUNTS
+    assert len(workers) >= 2
+    assert remaining == 0
+
+def test_worker_interval_counts_from_last_success(tmp_path, monkeypatch):
+    """워커 모드도 계정별 간격을 마지막 성공부터 계산하고, 실패한 계정은 재시도 대기 후 다시 가져감"""
+    monkeypatch.setattr('config.Config.WORKER_RETRY_SECONDS', 0)
+    coordinator = CrawlCoordinator(str(tmp_path / 'coordinator.db'), worker_id='solo', heartbeat_seconds=60)
+    coordinator.register()
+    try:
+        assert coordinator.claim_next(['alice'], interval_hours=24) == 'alice'
+        coordinator.complete('alice', False)
+        assert coordinator.pending_accounts(['alice'], interval_hours=24) == ['alice']
+        assert coordinator.claim_next(['alice'], interval_hours=24) == 'alice'
+        coordinator.complete('alice', True)
+        assert coordinator.claim_next(['alice'], interval_hours=24) is None
+        
+        # 2시간 전에 성공한 계정은 계정별 간격이 1시간이면 다시 크롤링
+        with sqlite3.connect(coordinator.db_path) as conn:
+            conn.execute('UPDATE account_leases SET last_success_at = last_success_at - 7200')
+        intervals = {'alice': 1}
+        assert coordinator.claim_next(['alice'], interval_hours=24) is None
+        assert coordinator.claim_next(['alice'], interval_hours=24, interval_for=intervals.get) == 'alice'
+        coordinator.complete('alice', True)
+    finally:
+        coordinator.unregister()
+
+def test_once_worker_tries_failed_accounts_once(tmp_path, monkeypatch):
+    """--once 워커는 실패한 계정을 이번 실행에서 다시 시도하지 않고 종료"""
+    monkeypatch.setattr('config.Config.WORKER_RETRY_SECONDS', 0)
+    coordinator = CrawlCoordinator(str(tmp_path / 'coordinator.db'), worker_id='solo', heartbeat_seconds=60)
+    attempts = []
+    
+    def crawl(username):
+        attempts.append(username)
+        return False
+    
+    assert run_worker(coordinator, ['alice', 'bob'], crawl, interval_hours=24, once=True, poll_seconds=0.1) == 2
+    assert sorted(attempts) == ['alice', 'bob']
+    # 실패했으므로 다음 실행에서 다시 크롤링 대상
+    assert coordinator.pending_accounts(['alice', 'bob'], interval_hours=24) == ['alice', 'bob']
@@ -28,7 +28,7 @@ def test_crawler():
                 print(f"수집된 데이터:")
                 print(f"- 사용자명: {result['username']}")
                 print(f"- 크롤링 시간: {result['crawled_at']}")
-                print(f"- 팔로워 수: {result.get('follower_info', {}).get('followers', 'N/A')}")
+                print(f"- 팔로워 수: {result.get('profile', {}).get('followers', 'N/A')}")
                 print(f"- 게시물 수: {len(result.get('recent_posts', []))}")
                 
                 # 데이터 저장 테스트
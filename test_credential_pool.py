@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 계정 풀 테스트 (토큰 버킷 예산, 로그인 실패 대기, 계정 수만큼 동시 크롤링)
+"""
+
+import sys
+import threading
+import time
+import types
+from config import Config
+from credential_pool import CredentialPool, CrawlIdentity, TokenBucket
+from instagram_scheduler import InstagramScheduler
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+def test_token_bucket_refill():
+    """시간당 예산만큼 채워지고 용량을 넘지 않음"""
+    clock = FakeClock()
+    bucket = TokenBucket(10, per_hour=3600, clock=clock)
+    assert bucket.try_take(10)
+    assert not bucket.try_take(1)
+    assert bucket.seconds_until(5) == 5
+    
+    clock.now = 3
+    assert bucket.available() == 3
+    clock.now = 100
+    assert bucket.available() == 10
+    
+    # 예약보다 많이 사용하면 잔액이 음수가 될 수 있음
+    bucket.adjust(15)
+    assert bucket.available() == -5
+
+def test_pool_assigns_identity_with_budget():
+    """예산이 남은 계정을 배정하고, 차단기가 열린 계정은 배정하지 않음"""
+    clock = FakeClock()
+    rich = CrawlIdentity('rich', 'pw', requests_per_hour=3600, burst=20, clock=clock)
+    poor = CrawlIdentity('poor', 'pw', requests_per_hour=3600, burst=5, clock=clock)
+    pool = CredentialPool([poor, rich], clock=clock)
+    
+    first = pool.acquire(10, timeout=0)
+    assert first is rich
+    # rich는 사용 중이고 poor는 예산 부족 (버킷 용량보다 큰 예약은 가득 찬 버킷이면 허용)
+    second = pool.acquire(10, timeout=0)
+    assert second is poor
+    assert pool.acquire(1, timeout=0) is None
+    
+    pool.release(rich, 10, used=4)
+    assert rich.bucket.available() == 16
+    poor.governor.record_login(False)
+    pool.release(poor, 10, used=5)
+    
+    # 차단된 계정은 배정하지 않음
+    assert pool.acquire(1, timeout=0) is rich
+    assert pool.acquire(1, timeout=0) is None
+    
+    clock.now = poor.governor.open_until
+    assert pool.acquire(1, timeout=0) is poor
+    
+    status = {item['identity']: item for item in pool.get_status()}
+    assert status['poor']['trips'] == 1
+    assert status['poor']['in_use']
+    assert 'password' not in status['poor']
+
+def test_scheduler_crawls_in_parallel_per_identity(tmp_path, monkeypatch):
+    """계정이 3개면 3개 크롤러가 동시에 실행되어 처리 시간이 줄어듦"""
+    active = []
+    peak = []
+    lock = threading.Lock()
+    
+    class FakeCrawler:
+        def __init__(self, headless=False, identity=None):
+            self.identity = identity
+            self.request_count = 3
+            self.blocked = False
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *args):
+            pass
+        
+        def crawl_account(self, username, max_posts=None):
+            with lock:
+                active.append(self.identity.name)
+                peak.append(len(active))
+            time.sleep(0.2)
+            with lock:
+                active.remove(self.identity.name)
+            return None
+    
+    monkeypatch.setitem(sys.modules, 'instagram_crawler', types.SimpleNamespace(InstagramCrawler=FakeCrawler))
+    monkeypatch.setattr(Config, 'ACCOUNT_INTERVAL_SECONDS', 0)
+    
+    scheduler = InstagramScheduler(accounts=[f"user{i}" for i in range(6)])
+    scheduler._credentials = CredentialPool([CrawlIdentity(f"id{i}", 'pw', 3600, 100) for i in range(3)])
+    
+    start = time.perf_counter()
+    scheduler.crawl_all_accounts()
+    elapsed = time.perf_counter() - start
+    
+    assert max(peak) == 3
+    assert elapsed < 1.0
+    assert sum(item['crawls'] for item in scheduler.credentials.get_status()) == 6
+    assert all(item['tokens'] < 100 for item in scheduler.credentials.get_status())
+
+def test_profiled_scheduler_crawls_one_at_a_time(tmp_path, monkeypatch):
+    """프로파일링 중에는 크롤링 계정이 여러 개여도 cProfile이 겹치지 않도록 순서대로 크롤링"""
+    from profiling import CrawlProfiler
+    
+    active = []
+    peak = []
+    lock = threading.Lock()
+    
+    class FakeCrawler:
+        def __init__(self, headless=False, identity=None):
+            self.identity = identity
+            self.request_count = 3
+            self.blocked = False
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *args):
+            pass
+        
+        def crawl_account(self, username, max_posts=None):
+            with lock:
+                active.append(username)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(username)
+            return None
+    
+    monkeypatch.setitem(sys.modules, 'instagram_crawler', types.SimpleNamespace(InstagramCrawler=FakeCrawler))
+    monkeypatch.setattr(Config, 'ACCOUNT_INTERVAL_SECONDS', 0)
+    
+    profiler = CrawlProfiler(tmp_path / 'profile')
+    scheduler = InstagramScheduler(accounts=['alice', 'bob'], profiler=profiler)
+    scheduler._credentials = CredentialPool([CrawlIdentity(f"id{i}", 'pw', 3600, 100) for i in range(2)])
+    scheduler.crawl_all_accounts()
+    
+    assert max(peak) == 1
+    assert profiler.profiled == ['alice', 'bob']
+
+def test_scheduler_skips_account_without_identity(monkeypatch):
+    """모든 크롤링 계정의 차단기가 열려 있으면 최대 대기 시간 후, 중지되면 바로 계정을 건너뜀"""
+    class FakeCrawler:
+        def __init__(self, headless=False, identity=None):
+            raise AssertionError('크롤링 계정 없이 크롤러를 만들면 안 됨')
+    
+    monkeypatch.setitem(sys.modules, 'instagram_crawler', types.SimpleNamespace(InstagramCrawler=FakeCrawler))
+    monkeypatch.setattr(Config, 'IDENTITY_WAIT_SECONDS', 0.2)
+    identity = CrawlIdentity('blocked', 'pw', 3600, 100)
+    identity.governor.record_login(False)
+    scheduler = InstagramScheduler(accounts=['alice'])
+    scheduler._credentials = CredentialPool([identity])
+    
+    start = time.perf_counter()
+    assert not scheduler.crawl_single_account('alice')
+    assert time.perf_counter() - start < 2.0
+    
+    monkeypatch.setattr(Config, 'IDENTITY_WAIT_SECONDS', 3600)
+    stop_event = threading.Event()
+    threading.Timer(0.1, stop_event.set).start()
+    start = time.perf_counter()
+    assert not scheduler.crawl_single_account('alice', stop_event=stop_event)
+    assert time.perf_counter() - start < 2.0
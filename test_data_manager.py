@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+데이터 관리자 테스트 (임시 데이터베이스 사용)
+"""
+
+import sqlite3
+from data_manager import DataManager
+
+def make_crawl_result(username, post_ids, crawled_at='2024-01-01T00:00:00'):
+    """테스트용 크롤링 결과 생성"""
+    return {
+        'username': username,
+        'crawled_at': crawled_at,
+        'recent_posts': [
+            {
+                'post_url': f'https://www.instagram.com/p/{post_id}/',
+                'post_number': i + 1,
+                'image_url': f'https://cdn.example.com/{post_id}.jpg',
+                'caption': f'{post_id} 캡션 #tag{i} @friend{i}',
+                'posted_at': crawled_at,
+                'hashtags': [f'#tag{i}'],
+                'mentions': [f'@friend{i}'],
+                'timestamp': crawled_at
+            }
+            for i, post_id in enumerate(post_ids)
+        ]
+    }
+
+def test_statistics_summary(tmp_path):
+    """통계 요약 테이블이 저장/오류 기록과 함께 갱신되는지 확인"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    
+    assert data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    repeated = make_crawl_result('alice', ['A2', 'A3'], '2024-01-02T00:00:00')
+    assert data_manager.save_crawl_data(repeated)
+    # 이미 저장된 A2는 새 게시물 수에서 제외
+    assert repeated['new_posts_count'] == 1
+    assert data_manager.save_crawl_data(make_crawl_result('bob', []))
+    data_manager._record_crawl_error('carol', 'timeout')
+    
+    stats = data_manager.get_statistics()
+    assert stats['total_accounts'] == 2
+    assert stats['total_crawls'] == 4
+    assert stats['successful_crawls'] == 3
+    
+    alice = data_manager.get_account_statistics('alice')[0]
+    assert alice['total_crawls'] == 2
+    assert alice['total_posts'] == 3
+    assert alice['last_crawl'] == '2024-01-02T00:00:00'
+    assert alice['last_new_post'] is not None
+    
+    bob = data_manager.get_account_statistics('bob')[0]
+    assert bob['total_posts'] == 0
+    assert bob['last_new_post'] is None
+    
+    carol = data_manager.get_account_statistics('carol')[0]
+    assert carol['failed_crawls'] == 1
+
+def test_statistics_summary_backfill(tmp_path):
+    """기존(버전 1) 데이터베이스의 히스토리로부터 통계 요약을 채우는지 확인"""
+    db_path = str(tmp_path / 'old.db')
+    data_manager = DataManager(db_path)
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    
+    # 요약 테이블을 비우고 버전 1로 되돌림
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('DELETE FROM account_stats')
+        conn.execute('PRAGMA user_version = 1')
+    
+    alice = DataManager(db_path).get_account_statistics('alice')[0]
+    assert alice['total_crawls'] == 1
+    assert alice['total_posts'] == 2
+
+def test_search_posts(tmp_path):
+    """전문 검색의 필터 및 키셋 페이지네이션 확인"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2', 'A3'], '2024-01-01T00:00:00'))
+    data_manager.save_crawl_data(make_crawl_result('bob', ['B1'], '2024-03-01T00:00:00'))
+    
+    assert len(data_manager.search_posts('캡션')['results']) == 4
+    assert len(data_manager.search_posts('tag0')['results']) == 2
+    assert [p['username'] for p in data_manager.search_posts('캡션', username='bob')['results']] == ['bob']
+    assert len(data_manager.search_posts('캡션', since='2024-02-01')['results']) == 1
+    assert data_manager.search_posts('없는단어')['results'] == []
+    
+    # 페이지를 이어 붙이면 중복 없이 전체 결과가 나와야 함
+    seen = []
+    cursor = None
+    while True:
+        page = data_manager.search_posts('캡션', limit=3, cursor=cursor)
+        seen.extend(post['id'] for post in page['results'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert sorted(seen) == [1, 2, 3, 4]
+
+def test_hashtag_and_mention_tables(tmp_path):
+    """해시태그/멘션 정규화 테이블 저장, 백필, 집계 확인"""
+    db_path = str(tmp_path / 'test.db')
+    data_manager = DataManager(db_path)
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2'], '2024-01-01T00:00:00'))
+    data_manager.save_crawl_data(make_crawl_result('bob', ['B1'], '2024-03-01T00:00:00'))
+    
+    assert data_manager.get_top_hashtags(limit=1) == [{'tag': 'tag0', 'post_count': 2}]
+    assert data_manager.get_top_hashtags(since='2024-02-01') == [{'tag': 'tag0', 'post_count': 1}]
+    assert data_manager.get_top_mentions(username='alice', limit=5) == [
+        {'handle': 'friend0', 'post_count': 1},
+        {'handle': 'friend1', 'post_count': 1}
+    ]
+    assert [p['username'] for p in data_manager.get_posts_by_hashtag('#TAG0')] == ['bob', 'alice']
+    assert len(data_manager.get_posts_by_mention('@friend1')) == 1
+    
+    # 기존(버전 3) 데이터베이스는 JSON 컬럼에서 백필
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('DELETE FROM post_hashtags')
+        conn.execute('DELETE FROM post_mentions')
+        conn.execute('PRAGMA user_version = 3')
+    data_manager = DataManager(db_path)
+    assert data_manager.get_top_hashtags(limit=1) == [{'tag': 'tag0', 'post_count': 2}]
+    assert len(data_manager.get_posts_by_mention('friend0')) == 2
+
+def test_find_similar_posts(tmp_path):
+    """dHash 밴드 인덱스로 유사 이미지 게시물을 찾는지 확인"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    base_hash = 0xF0F0F0F0F0F0F0F0
+    hashes = {
+        'A1': base_hash,
+        'B1': base_hash ^ 0b111,           # 거리 3 (같은 밴드 3비트 차이)
+        'C1': base_hash ^ (1 << 63),       # 거리 1, 부호 비트 변경
+        'D1': base_hash ^ 0xFFFF0000FFFF,  # 거리 32
+    }
+    for username, post_id in [('alice', 'A1'), ('bob', 'B1'), ('carol', 'C1'), ('dave', 'D1')]:
+        crawl_result = make_crawl_result(username, [post_id])
+        crawl_result['recent_posts'][0]['media'] = {
+            'sha256': f'{post_id}-sha',
+            'path': f'/media/{post_id}.jpg',
+            'size_bytes': 1,
+            'content_type': 'image/jpeg',
+            'dhash': hashes[post_id]
+        }
+        data_manager.save_crawl_data(crawl_result)
+    
+    similar = data_manager.find_similar_posts('https://www.instagram.com/p/A1/')
+    assert [(p['username'], p['distance']) for p in similar] == [('carol', 1), ('bob', 3)]
+    
+    similar = data_manager.find_similar_posts('https://www.instagram.com/p/A1/', max_distance=64)
+    assert [p['username'] for p in similar] == ['carol', 'bob', 'dave']
+
+def test_synthetic_data_benchmark(tmp_path):
+    """합성 데이터 생성 및 메서드별 벤치마크/실행 계획 확인"""
+    from bench_data_manager import run_benchmark
+    from synthetic_data import generate_database
+    
+    db_path = str(tmp_path / 'synthetic.db')
+    counts = generate_database(db_path, accounts=5, posts=300, crawls=40, seed=1)
+    assert counts['post_data'] == 300
+    
+    data_manager = DataManager(db_path)
+    stats = data_manager.get_statistics()
+    assert stats['total_crawls'] == 40
+    assert sum(item['total_posts'] for item in data_manager.get_account_statistics()) == 300
+    
+    results = run_benchmark(db_path, runs=1)
+    assert results['table_counts']['post_data'] == 306
+    latest = results['methods']['get_latest_posts']
+    assert latest['plans'] and latest['full_scans'] == []
+    assert results['methods']['get_new_posts_count']['full_scans'] == []
+
+def test_shortcode_post_identity(tmp_path):
+    """주소 표기가 달라도 shortcode(미디어 ID)가 같으면 같은 게시물로 처리"""
+    from shortcode import canonicalize_post_url, media_id_to_shortcode, shortcode_to_media_id
+    
+    assert shortcode_to_media_id(media_id_to_shortcode(3141592653589793238)) == 3141592653589793238
+    # 앞의 'A'는 같은 숫자의 다른 표기, 64비트를 넘는 긴 코드는 변환하지 않음
+    assert shortcode_to_media_id('AB') is None
+    assert shortcode_to_media_id('C' * 30) is None
+    assert canonicalize_post_url('https://www.instagram.com/alice/p/CqW3pLBrXYZ/?img_index=1') == (
+        'https://www.instagram.com/p/CqW3pLBrXYZ/', shortcode_to_media_id('CqW3pLBrXYZ')
+    )
+    
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    result = make_crawl_result('alice', ['CqW3pLBrXYZ', 'C' * 30])
+    assert data_manager.save_crawl_data(result)
+    
+    variants = [
+        'https://www.instagram.com/alice/p/CqW3pLBrXYZ/',
+        'https://www.instagram.com/p/CqW3pLBrXYZ/?utm_source=ig_web_copy_link',
+        f"https://www.instagram.com/p/{'C' * 30}/",
+        'https://www.instagram.com/p/DnewPost/',
+        'https://www.instagram.com/alice/p/DnewPost/'
+    ]
+    assert data_manager.filter_new_post_urls(variants) == ['https://www.instagram.com/p/DnewPost/']
+    # 중복 판단은 shortcode로 하되 이동할 주소는 원래 서버 주소 유지 (INSTAGRAM_BASE_URL 변경 환경)
+    assert data_manager.filter_new_post_urls(['http://127.0.0.1:8765/p/Bx1abc/?igsh=1', 'http://127.0.0.1:8765/alice/p/Bx1abc/']) == [
+        'http://127.0.0.1:8765/p/Bx1abc/?igsh=1'
+    ]
+    
+    result['recent_posts'][0]['post_url'] = variants[1]
+    assert data_manager.save_crawl_data(result)
+    with sqlite3.connect(data_manager.db_path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM post_data').fetchone()[0] == 2
+
+def test_post_identity_migration(tmp_path):
+    """기존 주소 키 데이터베이스의 주소 정규화, 중복 제거, UNIQUE 제약 제거"""
+    db_path = str(tmp_path / 'old.db')
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('CREATE TABLE account_data (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id TEXT NOT NULL, username TEXT NOT NULL, created_at TEXT DEFAULT CURRENT_TIMESTAMP)')
+        conn.execute('''
+            CREATE TABLE post_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, account_id INTEGER, post_url TEXT UNIQUE NOT NULL,
+                post_number INTEGER, image_url TEXT, caption TEXT, posted_at TEXT, hashtags TEXT,
+                mentions TEXT, timestamp TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('CREATE TABLE crawl_history (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT NOT NULL, status TEXT NOT NULL, crawled_at TEXT NOT NULL, error_message TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP)')
+        conn.execute("INSERT INTO crawl_history (username, status, crawled_at) VALUES ('alice', 'SUCCESS', '2024-01-01T00:00:00')")
+        conn.execute("INSERT INTO account_data (user_id, username) VALUES ('alice', 'alice')")
+        conn.executemany(
+            "INSERT INTO post_data (account_id, post_url, caption, hashtags, mentions) VALUES (1, ?, ?, '[\"#cat\"]', '[]')",
+            [
+                ('https://www.instagram.com/p/CqW3pLBrXYZ/', 'first copy'),
+                ('https://www.instagram.com/alice/p/CqW3pLBrXYZ/?img_index=1', 'second copy'),
+                ('https://www.instagram.com/alice/p/DnewPost/', 'other post')
+            ]
+        )
+    
+    data_manager = DataManager(db_path)
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute('SELECT id, post_url, media_id FROM post_data ORDER BY id').fetchall()
+        assert [row[1] for row in rows] == ['https://www.instagram.com/p/CqW3pLBrXYZ/', 'https://www.instagram.com/p/DnewPost/']
+        assert all(row[2] is not None for row in rows)
+        assert conn.execute('SELECT COUNT(*) FROM post_hashtags').fetchone()[0] == 2
+        assert not any(row[3] == 'u' for row in conn.execute('PRAGMA index_list(post_data)'))
+    # 삭제된 중복 행은 통계 요약의 게시물 수에서도 빠짐
+    assert data_manager.get_account_statistics('alice')[0]['total_posts'] == 2
+    
+    # 다시 만든 테이블에서도 전문 검색 트리거가 동작
+    assert len(data_manager.search_posts('copy')['results']) == 1
+    assert data_manager.save_crawl_data(make_crawl_result('alice', ['Dsearchable']))
+    assert len(data_manager.search_posts('Dsearchable')['results']) == 1
+
+def test_like_search_escapes_wildcards(tmp_path, monkeypatch):
+    """FTS5가 없을 때의 LIKE 검색에서 검색어의 %, _는 문자 그대로 일치"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    result = make_crawl_result('alice', ['A1', 'A2', 'A3'])
+    result['recent_posts'][0]['caption'] = '50% 할인 a_b'
+    result['recent_posts'][1]['caption'] = '500원 할인 axb'
+    result['recent_posts'][2]['caption'] = 'back\\slash'
+    assert data_manager.save_crawl_data(result)
+    
+    has_table = DataManager._has_table
+    monkeypatch.setattr(DataManager, '_has_table', lambda self, cursor, name: name != 'post_fts' and has_table(self, cursor, name))
+    
+    assert [post['caption'] for post in data_manager.search_posts('50%')['results']] == ['50% 할인 a_b']
+    assert [post['caption'] for post in data_manager.search_posts('a_b')['results']] == ['50% 할인 a_b']
+    assert [post['caption'] for post in data_manager.search_posts('k\\s')['results']] == ['back\\slash']
+    assert len(data_manager.search_posts('할인')['results']) == 2
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+드라이버 감시자 테스트 (작업별 시간 제한 만료, 프로세스 트리 종료)
+"""
+
+import os
+import subprocess
+import threading
+import time
+import pytest
+from driver_watchdog import DriverWatchdog, kill_process_tree
+from instagram_crawler import InstagramCrawler
+
+def test_deadline_expires_only_when_exceeded():
+    """시간 제한을 넘긴 작업만 만료 콜백이 호출됨"""
+    expired = []
+    watchdog = DriverWatchdog(expired.append, check_interval=0.05)
+    try:
+        with watchdog.deadline('fast', 1):
+            pass
+        with watchdog.deadline('slow', 0.1):
+            time.sleep(0.4)
+        time.sleep(0.2)
+        assert expired == ['slow']
+        assert watchdog.expired == ['slow']
+    finally:
+        watchdog.stop()
+
+def test_failed_driver_start_leaves_no_watchdog(monkeypatch):
+    """드라이버 시작에 실패하면 감시 스레드가 남지 않음"""
+    def fail_setup_driver(self, headless):
+        raise RuntimeError('chrome not found')
+    
+    monkeypatch.setattr(InstagramCrawler, 'setup_driver', fail_setup_driver)
+    before = sum(1 for thread in threading.enumerate() if thread.name == 'driver-watchdog')
+    with pytest.raises(RuntimeError):
+        InstagramCrawler(headless=True, download_media=False)
+    assert sum(1 for thread in threading.enumerate() if thread.name == 'driver-watchdog') == before
+
+@pytest.mark.skipif(not os.path.isdir('/proc'), reason='/proc이 있는 환경에서만 프로세스 상태 확인 가능')
+def test_kill_process_tree_kills_children():
+    """프로세스와 자식 프로세스가 모두 종료됨"""
+    process = subprocess.Popen(['sh', '-c', 'sleep 30 & sleep 30 & wait'])
+    try:
+        time.sleep(0.3)
+        pids = kill_process_tree(process.pid)
+        assert process.pid in pids
+        assert len(pids) >= 3
+        process.wait(timeout=5)
+        for pid in pids[1:]:
+            deadline = time.time() + 5
+            while time.time() < deadline and _alive(pid):
+                time.sleep(0.05)
+            assert not _alive(pid)
+    finally:
+        if process.poll() is None:
+            process.kill()
+
+def _alive(pid):
+    """프로세스 실행 여부 (/proc 상태 확인)"""
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            # 부모가 회수하지 않은 좀비(Z)는 종료된 것으로 간주
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except FileNotFoundError:
+        return False
+    except OSError:
+        return True
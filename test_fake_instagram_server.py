@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+가짜 인스타그램 서버 테스트 (벤치마크용 페이지 구성 확인)
+"""
+
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.cookiejar import CookieJar
+from fake_instagram_server import FakeInstagramServer, FakeInstagramSite
+
+def test_login_profile_and_post_pages():
+    """로그인 쿠키 발급, 프로필 그리드, 게시물 상세 페이지 확인"""
+    site = FakeInstagramSite(accounts=['alice'], posts_per_account=3)
+    
+    with FakeInstagramServer(site) as server:
+        opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+        
+        home = opener.open(server.base_url + '/').read().decode('utf-8')
+        assert 'name="username"' in home
+        
+        form = urllib.parse.urlencode({'username': 'bench', 'password': 'secret'}).encode('utf-8')
+        home = opener.open(server.base_url + '/accounts/login/', data=form).read().decode('utf-8')
+        assert 'Primary navigation' in home
+        assert '나중에 하기' in home
+        
+        profile = opener.open(server.base_url + '/alice/').read().decode('utf-8')
+        assert profile.count('href="/p/') == 3
+        assert 'content="1,000 Followers, 10 Following, 3 Posts' in profile
+        
+        code = site.post_codes('alice')[1]
+        post = opener.open(f"{server.base_url}/p/{code}/").read().decode('utf-8')
+        assert '#cafe' in post
+        assert '<time datetime="2024-01-02T12:00:00.000Z">' in post
+        assert 'content="107 likes, 1 comments' in post
+        
+        try:
+            opener.open(server.base_url + '/unknown/')
+            assert False, '없는 경로는 404여야 합니다'
+        except urllib.error.HTTPError as e:
+            assert e.code == 404
+    
+    assert site.pages_served == 4
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+이미지 유사도 해시 테스트
+"""
+
+import pytest
+from image_hash import compute_dhash, hamming_distance, split_bands, to_signed, to_unsigned
+
+def test_dhash_tolerates_resize_and_recompress(tmp_path):
+    """크기 조정/재압축된 이미지는 해시가 거의 같아야 함"""
+    Image = pytest.importorskip('PIL.Image')
+    
+    original = Image.new('L', (256, 256))
+    original.putdata([(x * y) % 256 for y in range(256) for x in range(256)])
+    original.save(tmp_path / 'original.png')
+    original.resize((120, 120)).convert('RGB').save(tmp_path / 'small.jpg', quality=60)
+    Image.new('L', (256, 256), 128).save(tmp_path / 'flat.png')
+    
+    original_hash = compute_dhash(tmp_path / 'original.png')
+    assert hamming_distance(original_hash, compute_dhash(tmp_path / 'small.jpg')) <= 6
+    assert hamming_distance(original_hash, compute_dhash(tmp_path / 'flat.png')) > 10
+
+def test_hash_conversions():
+    """SQLite 저장용 부호 변환과 밴드 분할 확인"""
+    value = 0xFEDCBA9876543210
+    assert to_unsigned(to_signed(value)) == value
+    assert to_signed(value) < 0
+    assert split_bands(value) == [0xFEDC, 0xBA98, 0x7654, 0x3210]
+    assert hamming_distance(to_signed(value), value ^ 0b101) == 2
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+로깅 설정 테스트 (큐 기반 기록, JSON 문맥, DEBUG 속도 제한)
+"""
+
+import json
+import logging
+import logging.handlers
+import logging_setup
+from logging_setup import ContextFilter, DebugSampler, configure_logging, log_context, shutdown_logging
+
+def test_json_log_with_context(tmp_path):
+    """별도 스레드에서 JSON 레코드를 기록하고 문맥 값을 포함하는지 확인"""
+    shutdown_logging()
+    log_file = tmp_path / 'crawler.log'
+    try:
+        assert configure_logging(level='DEBUG', log_file=str(log_file), log_format='json', console=False, debug_rate_limit=2)
+        # 두 번째 호출은 무시됨 (핸들러 중복 없음)
+        assert not configure_logging(log_file=str(tmp_path / 'other.log'))
+        assert sum(1 for h in logging.getLogger().handlers if isinstance(h, logging.handlers.QueueHandler)) == 1
+        
+        logger = logging.getLogger('test_logging_setup')
+        with log_context(username='alice'):
+            logger.info("크롤링 시작")
+            with log_context(post_url='https://example.com/p/1/'):
+                for i in range(5):
+                    logger.debug(f"선택자 실패 {i}")
+        logger.warning("문맥 없음")
+    finally:
+        shutdown_logging()
+    
+    records = [json.loads(line) for line in log_file.read_text(encoding='utf-8').splitlines()]
+    assert records[0]['message'] == "크롤링 시작"
+    assert records[0]['username'] == 'alice'
+    assert 'post_url' not in records[0]
+    
+    debug_records = [r for r in records if r['level'] == 'DEBUG']
+    assert [r['message'] for r in debug_records] == ["선택자 실패 0", "선택자 실패 1"]
+    assert debug_records[0]['post_url'] == 'https://example.com/p/1/'
+    assert records[-1]['message'] == "문맥 없음"
+    assert 'username' not in records[-1]
+    assert not logging_setup._listener
+
+def test_debug_sampler_reports_suppressed():
+    """구간이 지나면 버려진 DEBUG 로그 수를 다음 레코드에 기록"""
+    sampler = DebugSampler(limit=1, window_seconds=60)
+    
+    def record():
+        return logging.LogRecord('x', logging.DEBUG, 'crawler.py', 10, 'msg', None, None)
+    
+    assert sampler.filter(record())
+    assert not sampler.filter(record())
+    assert not sampler.filter(record())
+    assert sampler.filter(logging.LogRecord('x', logging.INFO, 'crawler.py', 10, 'msg', None, None))
+    
+    sampler.window_seconds = 0
+    next_record = record()
+    assert sampler.filter(next_record)
+    assert next_record.suppressed == 2
+    
+    # 텍스트 로그에도 버려진 개수 표시
+    with log_context(username='alice'):
+        assert ContextFilter().filter(next_record)
+    assert logging.Formatter(logging_setup.TEXT_FORMAT).format(next_record).endswith(' - msg [username=alice suppressed=2]')
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+미디어 다운로더 테스트 (로컬 정적 파일 서버 사용)
+"""
+
+import functools
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+from media_downloader import MediaDownloader
+from data_manager import DataManager
+from test_data_manager import make_crawl_result
+
+class KeepAliveHandler(SimpleHTTPRequestHandler):
+    """keep-alive 연결을 지원하는 정적 파일 핸들러"""
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, format, *args):
+        pass
+
+def start_static_server(directory):
+    """임시 디렉토리를 제공하는 로컬 HTTP 서버 시작"""
+    handler = functools.partial(KeepAliveHandler, directory=str(directory))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def test_download_deduplicates_by_content(tmp_path):
+    """같은 내용의 이미지는 한 번만 저장되고 경로가 DB에 기록되는지 확인"""
+    static_dir = tmp_path / 'static'
+    static_dir.mkdir()
+    image = b'\xff\xd8\xff' + b'fake-jpeg' * 1000
+    (static_dir / 'a.jpg').write_bytes(image)
+    (static_dir / 'b.jpg').write_bytes(image)
+    (static_dir / 'c.png').write_bytes(b'other image')
+    
+    server, base_url = start_static_server(static_dir)
+    try:
+        with MediaDownloader(media_dir=tmp_path / 'media', max_workers=2) as downloader:
+            results = downloader.download_all([
+                f"{base_url}/a.jpg",
+                f"{base_url}/b.jpg",
+                f"{base_url}/c.png",
+                f"{base_url}/missing.jpg"
+            ])
+    finally:
+        server.shutdown()
+    
+    sha256 = hashlib.sha256(image).hexdigest()
+    assert results[f"{base_url}/a.jpg"]['sha256'] == sha256
+    assert results[f"{base_url}/a.jpg"]['path'] == results[f"{base_url}/b.jpg"]['path']
+    assert results[f"{base_url}/missing.jpg"] is None
+    
+    stored = sorted(p for p in (tmp_path / 'media').rglob('*') if p.is_file())
+    assert len(stored) == 2
+    assert Path(results[f"{base_url}/a.jpg"]['path']).read_bytes() == image
+    
+    # 크롤링 결과에 포함된 다운로드 결과를 DB에 기록
+    crawl_result = make_crawl_result('alice', ['A1', 'A2'])
+    crawl_result['recent_posts'][0]['media'] = results[f"{base_url}/a.jpg"]
+    crawl_result['recent_posts'][1]['media'] = results[f"{base_url}/b.jpg"]
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    assert data_manager.save_crawl_data(crawl_result)
+    
+    paths = {post['image_path'] for post in data_manager.get_latest_posts('alice')}
+    assert paths == {results[f"{base_url}/a.jpg"]['path']}
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+메트릭 테스트 (히스토그램/카운터 집계, /metrics 엔드포인트)
+"""
+
+import json
+import urllib.request
+from metrics import MetricsRegistry, start_metrics_server
+
+def test_histogram_and_counter_rendering():
+    """Prometheus 텍스트와 JSON 출력 확인"""
+    registry = MetricsRegistry()
+    stages = registry.histogram('stage_seconds', '단계별 소요 시간', ['stage'], buckets=(1, 5))
+    crawls = registry.counter('crawls_total', '크롤링 결과 수', ['username', 'status'])
+    
+    stages.observe(0.5, stage='login')
+    stages.observe(3, stage='login')
+    stages.observe(10, stage='login')
+    crawls.inc(username='alice', status='success')
+    crawls.inc(username='alice', status='success')
+    
+    text = registry.render_prometheus()
+    assert 'stage_seconds_bucket{stage="login",le="1"} 1' in text
+    assert 'stage_seconds_bucket{stage="login",le="5"} 2' in text
+    assert 'stage_seconds_bucket{stage="login",le="+Inf"} 3' in text
+    assert 'stage_seconds_count{stage="login"} 3' in text
+    assert 'crawls_total{username="alice",status="success"} 2' in text
+    
+    login = registry.to_dict()['metrics']['stage_seconds'][0]
+    assert login['count'] == 3
+    assert login['max'] == 10
+
+def test_metrics_endpoint():
+    """로컬 HTTP 엔드포인트로 메트릭 노출"""
+    registry = MetricsRegistry()
+    registry.counter('crawls_total', '크롤링 결과 수').inc()
+    server = start_metrics_server(0, registry=registry)
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{base_url}/metrics") as response:
+            assert 'crawls_total 1' in response.read().decode('utf-8')
+        with urllib.request.urlopen(f"{base_url}/metrics.json") as response:
+            assert json.load(response)['metrics']['crawls_total'][0]['value'] == 1
+    finally:
+        server.shutdown()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+프로파일링/추적 구간 테스트
+"""
+
+import json
+import threading
+import time
+import profiling
+from data_manager import DataManager
+from profiling import CrawlProfiler, span, traced
+from test_data_manager import make_crawl_result
+
+@traced()
+def _traced_work():
+    with span('inner', step=1):
+        sum(range(1000))
+
+def test_spans_only_recorded_when_enabled():
+    """비활성화 상태에서는 기록하지 않고, 활성화 시 중첩 구간과 자체 시간을 기록"""
+    profiling.get_spans(clear=True)
+    _traced_work()
+    assert profiling.get_spans() == []
+    
+    profiling.enable_tracing()
+    try:
+        _traced_work()
+    finally:
+        profiling.disable_tracing()
+    
+    spans = profiling.get_spans(clear=True)
+    assert [item['stack'] for item in spans] == [('_traced_work', 'inner'), ('_traced_work',)]
+    assert spans[1]['seconds'] >= spans[0]['seconds']
+    assert spans[0]['attrs'] == {'step': 1}
+    
+    lines = profiling.collapse_spans(spans)
+    assert any(line.startswith('_traced_work;inner ') for line in lines)
+
+def test_crawl_profiler_outputs(tmp_path):
+    """계정별/누적 pstats, 접힌 스택, 추적 구간 파일 생성"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    profiler = CrawlProfiler(tmp_path / 'profile')
+    
+    profiling.enable_tracing()
+    try:
+        for username in ['alice', 'bob']:
+            with profiler.profile(username):
+                data_manager.save_crawl_data(make_crawl_result(username, [f'{username}1']))
+    finally:
+        profiling.disable_tracing()
+    
+    output = tmp_path / 'profile'
+    assert len(list(output.glob('alice_*.pstats'))) == 1
+    assert len(list(output.glob('bob_*.collapsed'))) == 1
+    assert profiler.profiled == ['alice', 'bob']
+    
+    collapsed = (output / 'aggregate.collapsed').read_text(encoding='utf-8')
+    assert 'save_crawl_data' in collapsed
+    assert 'save_crawl_data' in profiler.summary()
+    
+    trace = json.loads((output / 'spans.json').read_text(encoding='utf-8'))
+    assert [event['name'] for event in trace['traceEvents']].count('DataManager.save_crawl_data') == 2
+    profiling.get_spans(clear=True)
+
+def test_concurrent_profiles_run_one_at_a_time(tmp_path):
+    """여러 스레드가 동시에 프로파일링해도 cProfile을 하나씩만 활성화하고 모두 저장"""
+    profiler = CrawlProfiler(tmp_path / 'profile')
+    active = []
+    peak = []
+    errors = []
+    lock = threading.Lock()
+    
+    def crawl(username):
+        try:
+            with profiler.profile(username):
+                with lock:
+                    active.append(username)
+                    peak.append(len(active))
+                time.sleep(0.05)
+                with lock:
+                    active.remove(username)
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=crawl, args=(username,)) for username in ['alice', 'bob']]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    assert max(peak) == 1
+    assert sorted(profiler.profiled) == ['alice', 'bob']
+    assert len(list((tmp_path / 'profile').glob('*_*.pstats'))) == 2
+    assert (tmp_path / 'profile' / 'aggregate.pstats').exists()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+조회 캐시 테스트 (세대 기반 무효화, 다른 인스턴스의 저장 반영, LRU/유효 시간, 적중 메트릭)
+"""
+
+import sqlite3
+import pytest
+from data_manager import DataManager
+from metrics import QUERY_CACHE_LOOKUPS
+from query_cache import QueryCache
+from test_data_manager import make_crawl_result
+
+def test_reads_are_cached_until_a_write(tmp_path):
+    """같은 조회는 캐시에서 반환하고, 저장하면 다음 조회가 새 데이터를 읽음"""
+    QUERY_CACHE_LOOKUPS.reset()
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1']))
+    
+    assert [post['post_url'] for post in data_manager.get_latest_posts('alice')] == ['https://www.instagram.com/p/A1/']
+    latest = data_manager.get_latest_posts('alice')
+    # 반환값을 수정해도 캐시된 결과는 그대로
+    latest.clear()
+    assert len(data_manager.get_latest_posts('alice')) == 1
+    assert QUERY_CACHE_LOOKUPS.value(method='get_latest_posts', result='miss') == 1
+    assert QUERY_CACHE_LOOKUPS.value(method='get_latest_posts', result='hit') == 2
+    
+    assert data_manager.get_statistics()['total_crawls'] == 1
+    assert data_manager.get_new_posts_count('alice') == 1
+    
+    # 다른 인스턴스(다른 프로세스와 같은 경우)의 저장도 세대가 바뀌어 바로 반영
+    DataManager(data_manager.db_path).save_crawl_data(make_crawl_result('alice', ['A2']))
+    assert data_manager.get_statistics()['total_crawls'] == 2
+    assert data_manager.get_new_posts_count('alice') == 2
+    assert len(data_manager.get_latest_posts('alice')) == 2
+    data_manager._record_crawl_error('alice', 'timeout')
+    assert data_manager.get_statistics()['total_crawls'] == 3
+    assert QUERY_CACHE_LOOKUPS.value(method='get_statistics', result='miss') == 3
+    
+    # 인자가 다르면 별도 항목
+    assert len(data_manager.get_latest_posts('alice', limit=1)) == 1
+    assert data_manager.get_latest_posts('bob') == []
+
+def test_restore_never_reuses_a_generation(tmp_path, monkeypatch):
+    """복원한 백업의 세대가 예전 값이어도 캐시된 결과를 반환하지 않음"""
+    from config import Config
+    monkeypatch.setattr(Config, 'BACKUP_DIRECTORY', str(tmp_path / 'backups'))
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1']))
+    backup_path = data_manager.backup_database(str(tmp_path / 'one.db'), compression='none')
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A2']))
+    assert data_manager.get_statistics()['total_crawls'] == 2
+    
+    generation = data_manager._current_generation()
+    assert data_manager.restore_database(backup_path)
+    assert data_manager._current_generation() > generation
+    assert data_manager.get_statistics()['total_crawls'] == 1
+
+def test_lru_eviction_expiry_and_failed_loads():
+    """가장 오래 사용하지 않은 항목부터 제거, 유효 시간이 지나면 다시 조회, 실패한 조회는 저장하지 않음"""
+    calls = []
+    
+    def loader(value):
+        def load():
+            calls.append(value)
+            return value
+        return load
+    
+    cache = QueryCache(max_entries=2, ttl_seconds=60)
+    cache.get_or_load('m', ('a',), 1, loader('a'))
+    cache.get_or_load('m', ('b',), 1, loader('b'))
+    cache.get_or_load('m', ('a',), 1, loader('a'))
+    cache.get_or_load('m', ('c',), 1, loader('c'))
+    assert len(cache) == 2
+    cache.get_or_load('m', ('a',), 1, loader('a'))
+    cache.get_or_load('m', ('b',), 1, loader('b'))
+    assert calls == ['a', 'b', 'c', 'b']
+    
+    # 세대가 바뀌면 다시 조회
+    cache.get_or_load('m', ('b',), 2, loader('b2'))
+    assert calls[-1] == 'b2'
+    
+    expired = QueryCache(max_entries=2, ttl_seconds=0)
+    expired.get_or_load('m', (), 1, loader('x'))
+    expired.get_or_load('m', (), 1, loader('y'))
+    assert calls[-2:] == ['x', 'y']
+    
+    def fail():
+        raise sqlite3.OperationalError('database is locked')
+    
+    with pytest.raises(sqlite3.OperationalError):
+        cache.get_or_load('m', ('d',), 2, fail)
+    assert cache.get_or_load('m', ('d',), 2, loader('d')) == 'd'
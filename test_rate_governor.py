@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+요청 속도 조절기 테스트 (페이지 상태 판별, AIMD, 차단기)
+"""
+
+import pytest
+from rate_governor import (CHALLENGE, LOGGED_OUT, NORMAL, RATE_LIMITED, CircuitOpenError,
+                           RateGovernor, classify_page)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+def make_governor(clock):
+    governor = RateGovernor('tester', clock=clock, sleep=clock.sleep)
+    governor.max_rate = 30
+    governor.min_rate = 1
+    governor.increase = 1
+    governor.decrease_factor = 0.5
+    governor.threshold = 3
+    governor.open_seconds = 100
+    governor.max_open_seconds = 150
+    governor.rate = 30.0
+    return governor
+
+def test_classify_page():
+    assert classify_page('https://www.instagram.com/instagram/', '게시물 팔로워') == NORMAL
+    assert classify_page('https://www.instagram.com/', 'Please wait a few minutes before you try again.') == RATE_LIMITED
+    assert classify_page('https://www.instagram.com/challenge/abc/', '') == CHALLENGE
+    assert classify_page('https://www.instagram.com/accounts/login/?next=/x/', '로그인') == LOGGED_OUT
+
+def test_aimd_rate_and_pacing():
+    """요청 제한 시 속도를 절반으로 줄이고 요청 간격을 늘림, 정상 페이지마다 1씩 회복"""
+    clock = FakeClock()
+    governor = make_governor(clock)
+    
+    governor.before_request()
+    governor.before_request()
+    assert clock.slept == [2.0]
+    
+    governor.observe(RATE_LIMITED)
+    assert governor.rate == 15
+    governor.before_request()
+    assert clock.slept[-1] == 4.0
+    
+    governor.observe(NORMAL)
+    governor.observe(NORMAL)
+    assert governor.rate == 17
+    assert not governor.is_open()
+
+def test_circuit_breaker_trips_and_backs_off():
+    """연속 요청 제한/본인 확인/로그인 실패 시 차단기가 열리고, 연속으로 열리면 시간이 두 배 (최대값 제한)"""
+    clock = FakeClock()
+    governor = make_governor(clock)
+    
+    for _ in range(3):
+        governor.observe(RATE_LIMITED)
+    assert governor.is_open()
+    assert governor.remaining_open_seconds() == 100
+    with pytest.raises(CircuitOpenError):
+        governor.before_request()
+    
+    clock.now += 100
+    governor.before_request()
+    governor.observe(CHALLENGE)
+    assert governor.remaining_open_seconds() == 150
+    
+    clock.now += 150
+    governor.observe(NORMAL)
+    assert governor.trips == 0
+    governor.record_login(False)
+    assert governor.remaining_open_seconds() == 100
+
+def test_logged_out_pages_trip_breaker():
+    """로그인 상태여야 하는 페이지에서 로그아웃이 연속되면 차단기가 열리고, 로그인 전 이동은 세지 않음"""
+    clock = FakeClock()
+    governor = make_governor(clock)
+    
+    governor.observe(LOGGED_OUT, login_expected=True)
+    governor.observe(LOGGED_OUT)
+    governor.observe(NORMAL)
+    assert governor.consecutive_logged_out == 0
+    
+    for _ in range(2):
+        governor.observe(LOGGED_OUT)
+        governor.observe(LOGGED_OUT, login_expected=True)
+    assert not governor.is_open()
+    governor.observe(LOGGED_OUT)
+    assert governor.is_open()
+    with pytest.raises(CircuitOpenError):
+        governor.before_request()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+게시물 재확인 테스트 (감소하는 확인 간격, 수정 필드만 기록, 삭제 표시, 변경 없는 확인은 게시물 행 유지)
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from data_manager import DataManager
+from revisit import content_hash, revisit_interval
+from test_data_manager import make_crawl_result
+
+def test_revisit_interval_grows_with_age():
+    """최근 게시물은 자주, 오래된 게시물은 드물게 확인 (최소/최대 간격으로 제한)"""
+    now = datetime(2024, 6, 1)
+    interval = lambda posted_at: revisit_interval(posted_at, now, 0.5, 6, 60)
+    assert interval('2024-05-31T23:00:00') == timedelta(hours=6)
+    assert interval('2024-05-29T00:00:00') == timedelta(days=1.5)
+    assert interval('2023-01-01T00:00:00Z') == timedelta(days=60)
+    assert interval(None) == timedelta(hours=6)
+    # 이미지 주소의 서명 쿼리가 바뀌어도 같은 내용
+    assert content_hash('a', 'https://cdn/x.jpg?sig=1', None) == content_hash('a', 'https://cdn/x.jpg?sig=2', None)
+
+def test_revisits_record_edits_and_deletions(tmp_path):
+    """바뀐 필드만 수정 기록에 남고 검색/태그/변경 피드가 갱신되며, 삭제된 게시물은 재확인 대상에서 제외"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2']))
+    assert data_manager.get_posts_due_for_revisit('alice') == []
+    later = datetime.now() + timedelta(days=61)
+    due = data_manager.get_posts_due_for_revisit('alice', now=later)
+    assert [post['post_url'] for post in due] == ['https://www.instagram.com/p/A1/', 'https://www.instagram.com/p/A2/']
+    
+    def rewrite_count():
+        with sqlite3.connect(data_manager.db_path) as conn:
+            row = conn.execute("SELECT value FROM metadata WHERE key = 'rewrite_count'").fetchone()
+            return row[0] if row else 0
+    
+    # 서명 쿼리만 바뀐 이미지는 변경이 아니므로 게시물 행을 수정하지 않음
+    unchanged = dict(make_crawl_result('alice', ['A1'])['recent_posts'][0])
+    unchanged['image_url'] += '?sig=new'
+    result = make_crawl_result('alice', [])
+    result['revisited_posts'] = [unchanged]
+    before = rewrite_count()
+    assert data_manager.save_crawl_data(result)
+    assert result['revisit_counts'] == {'unchanged': 1}
+    assert rewrite_count() == before
+    
+    edited = dict(make_crawl_result('alice', ['A1'])['recent_posts'][0])
+    edited.update(caption='A1 수정된 캡션 #edited', hashtags=['#edited'], mentions=[], image_url=None)
+    result = make_crawl_result('alice', [])
+    result['revisited_posts'] = [edited, {'post_url': 'https://www.instagram.com/A2/p/A2/', 'deleted': True}]
+    assert data_manager.save_crawl_data(result)
+    assert result['revisit_counts'] == {'edited': 1, 'deleted': 1}
+    
+    [revision] = data_manager.get_post_revisions('https://www.instagram.com/p/A1/')
+    assert revision['revision_type'] == 'edited'
+    assert revision['changes'] == {'caption': ['A1 캡션 #tag0 @friend0', 'A1 수정된 캡션 #edited']}
+    assert [item['revision_type'] for item in data_manager.get_post_revisions('https://www.instagram.com/p/A2/')] == ['deleted']
+    
+    assert [post['caption'] for post in data_manager.search_posts('수정된')['results']] == ['A1 수정된 캡션 #edited']
+    assert [post['post_url'] for post in data_manager.search_posts('friend0')['results']] == []
+    assert [post['post_url'] for post in data_manager.get_posts_by_hashtag('edited')] == ['https://www.instagram.com/p/A1/']
+    assert [(change['change_type'], change['post_url']) for change in data_manager.read_changes(2)] == [
+        ('update', 'https://www.instagram.com/p/A1/'), ('delete', 'https://www.instagram.com/p/A2/')
+    ]
+    
+    # 삭제된 게시물은 다시 확인하지 않고, 수정된 게시물은 새 일정으로 다시 확인
+    assert data_manager.get_posts_due_for_revisit('alice', now=datetime.now() + timedelta(days=59)) == []
+    due = data_manager.get_posts_due_for_revisit('alice', now=later)
+    assert [post['post_url'] for post in due] == ['https://www.instagram.com/p/A1/']
+
+def test_edits_of_compressed_posts_keep_search_index(tmp_path, monkeypatch):
+    """압축 저장된 게시물의 수정도 전문 검색 색인에 반영"""
+    import caption_codec
+    from config import Config
+    from test_caption_codec import ZlibCodec
+    monkeypatch.setattr(Config, 'CAPTION_COMPRESSION', 'zstd')
+    monkeypatch.setattr(caption_codec, 'zstd_available', lambda: True)
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    data_manager._codec = ZlibCodec()
+    data_manager.save_crawl_data(make_crawl_result('alice', ['A1']))
+    
+    edited = dict(make_crawl_result('alice', ['A1'])['recent_posts'][0])
+    edited.update(caption='A1 바뀐 캡션', hashtags=[], mentions=[])
+    result = make_crawl_result('alice', [])
+    result['revisited_posts'] = [edited]
+    assert data_manager.save_crawl_data(result)
+    assert result['revisit_counts'] == {'edited': 1}
+    
+    assert [post['caption'] for post in data_manager.search_posts('바뀐')['results']] == ['A1 바뀐 캡션']
+    assert data_manager.search_posts('friend0')['results'] == []
+    # 색인이 게시물 내용과 일치하므로 재구성 후에도 같은 결과
+    assert data_manager.rebuild_search_index()
+    assert [post['caption'] for post in data_manager.search_posts('바뀐')['results']] == ['A1 바뀐 캡션']
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+선택자 저장소 테스트 (복합 조회, 성공률 기반 순서 변경, 설정 파일 다시 읽기)
+"""
+
+import json
+import os
+from selector_registry import SelectorRegistry
+
+class FakeElement:
+    def __init__(self, text=''):
+        self.text = text
+
+class FakeDriver:
+    """선택자 → 요소 목록 매핑으로 동작하는 드라이버 (script=False이면 스크립트 실행 실패)"""
+    
+    def __init__(self, elements, script=True):
+        self.elements = elements
+        self.script = script
+        self.calls = 0
+    
+    def execute_script(self, source, selectors, all_elements, stop_at_first):
+        self.calls += 1
+        if not self.script:
+            raise RuntimeError('javascript disabled')
+        results = []
+        for selector in selectors:
+            found = list(self.elements.get(selector, []))
+            results.append(found if all_elements else found[:1])
+            if stop_at_first and found:
+                break
+        return results
+    
+    def find_elements(self, by, selector):
+        self.calls += 1
+        return list(self.elements.get(selector, []))
+
+def write_selectors(path, groups):
+    path.write_text(json.dumps(groups), encoding='utf-8')
+
+def test_find_reorders_by_recent_success(tmp_path):
+    """한 번의 왕복으로 조회하고, 성공한 선택자를 다음 조회에서 먼저 시도"""
+    path = tmp_path / 'selectors.json'
+    write_selectors(path, {'caption': ['.old', '.empty', '.new']})
+    registry = SelectorRegistry(str(path))
+    driver = FakeDriver({'.empty': [FakeElement('')], '.new': [FakeElement('캡션')]})
+    
+    element = registry.find(driver, 'caption', predicate=lambda e: e.text)
+    assert element.text == '캡션'
+    assert driver.calls == 1
+    assert registry.candidates('caption')[0] == '.new'
+    
+    stats = {item['selector']: item for item in registry.get_stats()}
+    assert stats['.new']['hits'] == 1
+    assert stats['.old']['misses'] == 1
+    assert stats['.empty']['misses'] == 1
+    
+    # 스크립트를 실행할 수 없으면 선택자마다 조회 (성공한 선택자가 먼저이므로 한 번)
+    fallback = FakeDriver(driver.elements, script=False)
+    elements, selector = registry.find_all(fallback, 'caption')
+    assert selector == '.new'
+    assert len(elements) == 1
+    assert fallback.calls == 2
+    
+    assert registry.find(driver, 'missing_group') is None
+
+def test_reload_if_changed(tmp_path):
+    """설정 파일이 바뀌면 다시 읽고, 잘못된 파일이면 기존 선택자 유지"""
+    path = tmp_path / 'selectors.json'
+    write_selectors(path, {'links': ['a.old']})
+    registry = SelectorRegistry(str(path))
+    assert not registry.reload_if_changed()
+    
+    write_selectors(path, {'links': ['a.new', 'a.old']})
+    os.utime(path, (os.path.getmtime(path) + 10, os.path.getmtime(path) + 10))
+    assert registry.reload_if_changed()
+    assert registry.candidates('links') == ['a.new', 'a.old']
+    
+    path.write_text('{broken', encoding='utf-8')
+    os.utime(path, (os.path.getmtime(path) + 20, os.path.getmtime(path) + 20))
+    assert not registry.reload_if_changed()
+    assert registry.candidates('links') == ['a.new', 'a.old']
+
+def test_default_selectors_file():
+    """기본 설정 파일에 크롤러가 사용하는 그룹이 모두 있는지 확인"""
+    from config import Config
+    
+    registry = SelectorRegistry(Config.SELECTORS_FILE)
+    for group in ['login_indicators', 'login_page_indicators', 'login_username_input', 'login_password_input',
+                  'login_submit_button', 'login_popup_containers', 'login_popup_buttons', 'post_links',
+                  'more_text_spans', 'more_text_close_buttons', 'post_image', 'post_caption', 'post_time',
+                  'page_description', 'profile_stats']:
+        assert registry.candidates(group), group
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CLI 시작 시간 회귀 테스트 (조회 명령이 무거운 모듈을 로드하지 않는지 확인)
+"""
+
+import bench_startup
+
+def test_read_only_commands_skip_heavy_imports():
+    """조회 명령은 selenium/pandas 등을 로드하지 않아야 함"""
+    results = bench_startup.run_benchmark(runs=1)
+    for command, result in results.items():
+        assert result['heavy_modules_loaded'] == [], command
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+지표 시계열 테스트 (프로필/참여 지표 파싱, 시간/일/주 집계, 원본 표본 보존 기간)
+"""
+
+from datetime import datetime
+from config import Config
+from data_manager import DataManager
+from profile_stats import POST_LABELS, PROFILE_LABELS, parse_counts
+from time_series import RESOLUTIONS, bucket_start
+from test_data_manager import make_crawl_result
+
+def test_parse_profile_and_post_counts():
+    """og:description과 프로필 헤더 문구에서 지표 추출 (영어/한국어, 축약 표기)"""
+    assert parse_counts(['1,234 Followers, 56 Following, 78 Posts - See Instagram photos'], PROFILE_LABELS) == {
+        'followers': 1234, 'following': 56, 'posts': 78
+    }
+    assert parse_counts(['팔로워 1.2만명, 팔로우 56명, 게시물 78개 - 사진 및 동영상 보기'], PROFILE_LABELS) == {
+        'followers': 12000, 'following': 56, 'posts': 78
+    }
+    assert parse_counts(['게시물\n78', '12.5K\nfollowers', '팔로잉 3'], PROFILE_LABELS) == {
+        'posts': 78, 'followers': 12500, 'following': 3
+    }
+    assert parse_counts(['1,234 likes, 56 comments - alice on January 1, 2024: "12 likes"'], POST_LABELS) == {
+        'likes': 1234, 'comments': 56
+    }
+
+def test_week_buckets_start_on_monday():
+    """주 단위 구간은 현지 시간 월요일 자정에 시작"""
+    ts = int(datetime(2024, 5, 16, 15, 30).timestamp())
+    assert datetime.fromtimestamp(bucket_start(ts, RESOLUTIONS['week'])) == datetime(2024, 5, 13)
+    assert datetime.fromtimestamp(bucket_start(ts, RESOLUTIONS['day'])) == datetime(2024, 5, 16)
+    assert datetime.fromtimestamp(bucket_start(ts, RESOLUTIONS['hour'])) == datetime(2024, 5, 16, 15)
+
+def test_samples_roll_up_and_expire(tmp_path, monkeypatch):
+    """표본마다 집계가 갱신되고, 보존 기간이 지난 원본 표본은 삭제되어도 집계로 추이를 조회"""
+    monkeypatch.setattr(Config, 'TIMESERIES_RAW_RETENTION_DAYS', 1)
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    day = bucket_start(int(datetime.now().timestamp()) - 3 * 86400, RESOLUTIONS['day'])
+    
+    def crawl(offset_hours, followers, post_ids=(), likes=None):
+        result = make_crawl_result('alice', list(post_ids), datetime.fromtimestamp(day + offset_hours * 3600).isoformat())
+        result['profile'] = {'followers': followers, 'following': 5}
+        for post in result['recent_posts']:
+            post['likes'] = likes
+        assert data_manager.save_crawl_data(result)
+    
+    crawl(1, 100, ['A1'], likes=10)
+    crawl(2, 110)
+    # 같은 시각의 표본은 한 번만 집계
+    crawl(2, 110)
+    assert [point['value'] for point in data_manager.get_metric_trend('alice', 'followers', days=30, resolution='raw')] == [100, 110]
+    
+    crawl(49, 130)
+    [first, second] = data_manager.get_metric_trend('alice', 'followers', days=30)
+    assert (first['value'], first['min'], first['max'], first['avg'], first['samples']) == (110, 100, 110, 105, 2)
+    assert (second['value'], second['samples']) == (130, 1)
+    assert [point['followers'] for point in data_manager.get_follower_trend('alice')] == [110, 130]
+    assert len(data_manager.get_metric_trend('alice', 'followers', days=4, resolution='hour')) == 3
+    assert len(data_manager.get_metric_trend('alice', 'followers', days=400)) == len({
+        bucket_start(day + hours * 3600, RESOLUTIONS['week']) for hours in (1, 2, 49)
+    })
+    
+    # 원본 표본은 마지막 표본 기준 하루만 보존
+    assert [point['value'] for point in data_manager.get_metric_trend('alice', 'followers', days=30, resolution='raw')] == [130]
+    
+    [likes] = data_manager.get_metric_trend('alice', 'likes', days=30, post_url='https://www.instagram.com/p/A1/')
+    assert likes['value'] == 10
+    assert data_manager.get_metric_trend('bob', 'followers') == []
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+웹훅 전송 테스트 (로컬 HTTP 수신기로 배치 전송, keep-alive 연결 재사용, 재시도 대기열)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from data_manager import DataManager
+from webhook_notifier import WebhookNotifier
+from test_data_manager import make_crawl_result
+
+def start_receiver(statuses=()):
+    """받은 요청을 기록하는 로컬 HTTP 수신기 (statuses 순서대로 응답 코드 반환, 이후 200)"""
+    received = []
+    statuses = list(statuses)
+    
+    class Receiver(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            status = statuses.pop(0) if statuses else 200
+            received.append({
+                'client': self.client_address,
+                'delivery': self.headers['X-Webhook-Delivery'],
+                'status': status,
+                'body': json.loads(body)
+            })
+            self.send_response(status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Receiver)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, received, f"http://127.0.0.1:{server.server_address[1]}/hook"
+
+def test_batches_are_delivered_over_one_connection(tmp_path):
+    """새 게시물이 배치로 묶여 전송되고, 같은 엔드포인트는 keep-alive 연결 하나를 재사용"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    # 전송기를 처음 만들기 전에 저장된 게시물은 보내지 않음
+    data_manager.save_crawl_data(make_crawl_result('old', ['O1']))
+    server, received, url = start_receiver()
+    notifier = WebhookNotifier(data_manager, [url], batch_size=2, batch_seconds=0.2, poll_seconds=0.05)
+    notifier.start()
+    try:
+        data_manager.save_crawl_data(make_crawl_result('alice', ['A1', 'A2', 'A3']))
+        notifier.notify()
+        deadline = time.monotonic() + 10
+        while sum(len(item['body']['events']) for item in received) < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        notifier.stop()
+        server.shutdown()
+    
+    assert [[event['post_url'] for event in item['body']['events']] for item in received] == [
+        ['https://www.instagram.com/p/A1/', 'https://www.instagram.com/p/A2/'],
+        ['https://www.instagram.com/p/A3/']
+    ]
+    assert received[0]['body']['first_seq'] == 2 and received[1]['body']['last_seq'] == 4
+    assert len({item['client'] for item in received}) == 1
+    assert notifier.get_status()['queue'] == []
+
+def test_failed_batches_stay_queued_until_delivered(tmp_path):
+    """실패한 배치는 SQLite 대기열에 남아 재시도되고, 최대 시도 수를 넘으면 실패로 표시"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    server, received, url = start_receiver(statuses=[500, 503, 500])
+    notifier = WebhookNotifier(data_manager, [url], max_retries=2, retry_seconds=0)
+    notifier.get_status()
+    try:
+        data_manager.save_crawl_data(make_crawl_result('alice', ['A1']))
+        assert notifier.enqueue_pending() == 1
+        
+        assert notifier.deliver_due() == 0
+        [item] = notifier.get_status()['queue']
+        assert item['status'] == 'pending' and item['last_error'] == 'HTTP 500'
+        
+        assert notifier.deliver_due() == 0
+        [item] = notifier.get_status()['queue']
+        assert item['status'] == 'failed'
+        assert notifier.deliver_due() == 0
+        
+        # 프로세스를 다시 시작해도 대기열은 유지되고, 수동으로 재시도 가능
+        restarted = WebhookNotifier(DataManager(data_manager.db_path), [url], retry_seconds=0)
+        assert restarted.retry_failed() == 1
+        assert restarted.deliver_due() == 0
+        assert restarted.deliver_due() == 1
+    finally:
+        notifier.stop(flush=False)
+        server.shutdown()
+    
+    assert [item['status'] for item in received] == [500, 503, 500, 200]
+    assert len({item['delivery'] for item in received}) == 1
+    with sqlite3.connect(data_manager.db_path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM webhook_deliveries').fetchone()[0] == 0
+
+def test_stop_flushes_pending_posts(tmp_path):
+    """중지 시 시간 창을 기다리지 않고 남은 새 게시물을 전송"""
+    data_manager = DataManager(str(tmp_path / 'test.db'))
+    server, received, url = start_receiver()
+    notifier = WebhookNotifier(data_manager, [url], batch_seconds=60, poll_seconds=60)
+    notifier.start()
+    try:
+        data_manager.save_crawl_data(make_crawl_result('alice', ['A1']))
+        notifier.notify()
+        time.sleep(0.1)
+        assert received == []
+    finally:
+        notifier.stop(flush=True)
+        server.shutdown()
+    assert [event['username'] for item in received for event in item['body']['events']] == ['alice']
@@ -0,0 +1,73 @@
+from datetime import datetime
+
+# 집계 단위별 길이 (초)
+RESOLUTIONS = {'hour': 3600, 'day': 86400, 'week': 604800}
+
+# 1970-01-05(월요일) 00:00 (주 단위 집계를 월요일부터 시작)
+_MONDAY_EPOCH = 4 * 86400
+
+def bucket_start(ts, seconds):
+    """
+    시각이 속한 집계 구간의 시작 시각 (현지 시간 기준 정시/자정/월요일 자정)
+    
+    Args:
+        ts (int): 유닉스 시각 (초)
+        seconds (int): 집계 단위 길이 (RESOLUTIONS 값)
+    
+    Returns:
+        int: 구간 시작 유닉스 시각 (초)
+    """
+    offset = int(datetime.fromtimestamp(ts).astimezone().utcoffset().total_seconds())
+    local = ts + offset
+    return local - (local - _MONDAY_EPOCH) % seconds - offset
+
+# 표본 하나를 모든 단위의 집계에 반영 (같은 구간의 기존 집계에 합산, rollup_rows의 행 순서)
+ROLLUP_UPSERT_SQL = '''
+    INSERT INTO metric_rollups
+    (series_id, resolution, bucket, sample_count, value_sum, value_min, value_max, last_ts, last_value)
+    VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?)
+    ON CONFLICT(series_id, resolution, bucket) DO UPDATE SET
+        sample_count = sample_count + 1,
+        value_sum = value_sum + excluded.value_sum,
+        value_min = MIN(value_min, excluded.value_min),
+        value_max = MAX(value_max, excluded.value_max),
+        last_value = CASE WHEN excluded.last_ts >= last_ts THEN excluded.last_value ELSE last_value END,
+        last_ts = MAX(last_ts, excluded.last_ts)
+'''
+
+def rollup_rows(series_id, ts, value):
+    """
+    표본 하나에 대한 단위별 ROLLUP_UPSERT_SQL 인자
+    
+    Returns:
+        list: 집계 단위마다 한 행
+    """
+    return [
+        (series_id, seconds, bucket_start(ts, seconds), value, value, value, ts, value)
+        for seconds in RESOLUTIONS.values()
+    ]
+
+def choose_resolution(days):
+    """
+    조회 기간에 맞는 집계 단위 (기간이 길수록 큰 단위를 사용해 반환 행 수를 제한)
+    
+    Returns:
+        str: 'hour', 'day', 'week' 중 하나
+    """
+    if days <= 7:
+        return 'hour'
+    if days <= 366:
+        return 'day'
+    return 'week'
+
+def to_timestamp(value):
+    """
+    ISO 형식 시간을 유닉스 시각(초)으로 변환 (시간대가 없으면 현지 시간)
+    
+    Returns:
+        int: 유닉스 시각 (해석할 수 없으면 현재 시각)
+    """
+    try:
+        return int(datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp())
+    except ValueError:
+        return int(datetime.now().timestamp())
@@ -0,0 +1,344 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+from config import Config
+from metrics import WEBHOOK_DELIVERIES
+
+# 한 번에 전송을 시도할 최대 대기열 행 수
+DELIVERY_BATCH = 100
+
+# 재시도 간격 상한 (초)
+MAX_RETRY_SECONDS = 3600
+
+logger = logging.getLogger(__name__)
+
+class WebhookNotifier:
+    def __init__(self, data_manager, endpoints, batch_size=100, batch_seconds=5.0, timeout=10,
+                 max_retries=8, retry_seconds=30, poll_seconds=5.0):
+        """
+        새 게시물 웹훅 전송기 (변경 피드를 배치로 묶어 HTTP 엔드포인트로 POST)
+        
+        save_crawl_data가 같은 트랜잭션에서 기록한 변경 피드(post_changes)를 읽어
+        배치 크기 또는 시간 창이 찰 때마다 엔드포인트별 전송 대기열(webhook_deliveries)에 넣고,
+        백그라운드 스레드에서 엔드포인트별 keep-alive 연결로 전송합니다.
+        실패한 배치는 대기열에 남아 지수 백오프로 재시도되므로 프로세스를 다시 시작해도 유실되지 않으며,
+        크롤링 스레드는 notify()로 전송 스레드를 깨우기만 합니다.
+        
+        Args:
+            data_manager (DataManager): 변경 피드를 읽을 데이터 관리자
+            endpoints (list): 전송할 HTTP(S) 주소 목록
+            batch_size (int): 배치당 최대 게시물 수 (이만큼 쌓이면 바로 전송)
+            batch_seconds (float): 첫 새 게시물 이후 배치를 닫기까지 기다리는 시간 (초)
+            timeout (float): HTTP 요청 시간 제한 (초)
+            max_retries (int): 실패로 표시하기 전 최대 전송 시도 수
+            retry_seconds (float): 첫 재시도 간격 (초, 시도마다 두 배)
+            poll_seconds (float): notify() 없이도 변경 피드/재시도 대기열을 확인하는 간격 (초, 다른 프로세스의 저장 반영)
+        """
+        self.data_manager = data_manager
+        self.db_path = data_manager.db_path
+        self.endpoints = list(endpoints)
+        self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_seconds = retry_seconds
+        self.poll_seconds = poll_seconds
+        self._connections = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flush = False
+        self._thread = None
+    
+    @classmethod
+    def from_config(cls, data_manager):
+        """
+        설정값으로 전송기 생성
+        
+        Returns:
+            WebhookNotifier: 전송기 (WEBHOOK_URLS가 비어 있으면 None)
+        """
+        endpoints = [url.strip() for url in Config.WEBHOOK_URLS.split(',') if url.strip()]
+        if not endpoints:
+            return None
+        return cls(
+            data_manager,
+            endpoints,
+            batch_size=Config.WEBHOOK_BATCH_SIZE,
+            batch_seconds=Config.WEBHOOK_BATCH_SECONDS,
+            timeout=Config.WEBHOOK_TIMEOUT,
+            max_retries=Config.WEBHOOK_MAX_RETRIES,
+            retry_seconds=Config.WEBHOOK_RETRY_SECONDS,
+            poll_seconds=Config.WEBHOOK_POLL_SECONDS
+        )
+    
+    def start(self):
+        """
+        백그라운드 전송 스레드 시작 (이미 실행 중이면 무시)
+        
+        처음 시작할 때의 읽기 위치는 스레드가 실행되기 전에 정하므로, 시작 직후 저장된 게시물도 전송됩니다.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._cursor()
+        self._stop.clear()
+        self._flush = False
+        self._thread = threading.Thread(target=self._run, name='webhook-notifier', daemon=True)
+        self._thread.start()
+        logger.info(f"웹훅 전송 시작: 엔드포인트 {len(self.endpoints)}개")
+    
+    def notify(self):
+        """새 게시물이 저장되었음을 알림 (전송 스레드를 깨우기만 하므로 바로 반환)"""
+        self._wake.set()
+    
+    def stop(self, flush=True, timeout=30):
+        """
+        전송 스레드 중지
+        
+        Args:
+            flush (bool): 시간 창을 기다리지 않고 남은 새 게시물을 대기열에 넣고 한 번 전송한 뒤 종료
+            timeout (float): 스레드 종료 대기 시간 (초)
+        """
+        self._flush = flush
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        self._close_connections()
+    
+    def _run(self):
+        pending_since = None
+        while True:
+            stopping = self._stop.is_set()
+            wait = self.poll_seconds
+            try:
+                pending = self.data_manager.get_latest_change_seq() - self._cursor()
+                if pending > 0:
+                    pending_since = pending_since or time.monotonic()
+                    elapsed = time.monotonic() - pending_since
+                    if (stopping and self._flush) or pending >= self.batch_size or elapsed >= self.batch_seconds:
+                        self.enqueue_pending()
+                        pending_since = None
+                    else:
+                        wait = min(wait, self.batch_seconds - elapsed)
+                else:
+                    pending_since = None
+                
+                if not stopping or self._flush:
+                    self.deliver_due()
+                next_due = self._next_due_in()
+                if next_due is not None:
+                    wait = min(wait, next_due)
+            except Exception as e:
+                logger.error(f"웹훅 전송 처리 실패: {e}")
+            
+            if stopping:
+                return
+            self._wake.wait(max(wait, 0.01))
+            self._wake.clear()
+    
+    def enqueue_pending(self):
+        """
+        아직 대기열에 넣지 않은 변경 피드를 배치로 묶어 엔드포인트별 전송 대기열에 추가
+        
+        읽기 위치(metadata.webhook_seq)를 비교 후 갱신하므로 여러 프로세스가 동시에 실행해도
+        같은 게시물이 두 번 들어가지 않습니다.
+        
+        Returns:
+            int: 대기열에 넣은 게시물 수
+        """
+        enqueued = 0
+        while True:
+            cursor = self._cursor()
+            changes = self.data_manager.read_changes(cursor, self.batch_size)
+            if not changes:
+                return enqueued
+            payload = json.dumps({
+                'first_seq': changes[0]['seq'],
+                'last_seq': changes[-1]['seq'],
+                'events': changes
+            }, ensure_ascii=False, default=str)
+            
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                updated = conn.execute(
+                    "UPDATE metadata SET value = ? WHERE key = 'webhook_seq' AND value = ?",
+                    (changes[-1]['seq'], cursor)
+                ).rowcount
+                if not updated:
+                    # 다른 프로세스가 먼저 대기열에 넣음
+                    conn.execute("ROLLBACK")
+                    continue
+                conn.executemany('''
+                    INSERT INTO webhook_deliveries (endpoint, first_seq, last_seq, event_count, payload, next_attempt_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', [
+                    (endpoint, changes[0]['seq'], changes[-1]['seq'], len(changes), payload, time.time())
+                    for endpoint in self.endpoints
+                ])
+                conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+            enqueued += len(changes)
+            logger.debug(f"웹훅 배치 추가: seq {changes[0]['seq']}~{changes[-1]['seq']} ({len(changes)}개)")
+    
+    def deliver_due(self):
+        """
+        재시도 시간이 된 대기열 배치 전송 (같은 엔드포인트가 실패하면 이번 회차의 나머지 배치는 건너뜀)
+        
+        Returns:
+            int: 전송에 성공한 배치 수
+        """
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute('''
+                SELECT id, endpoint, payload, attempts, next_attempt_at FROM webhook_deliveries
+                WHERE status = 'pending' AND next_attempt_at <= ?
+                ORDER BY id
+                LIMIT ?
+            ''', (now, DELIVERY_BATCH)).fetchall()
+        
+        delivered = 0
+        failed_endpoints = set()
+        for delivery_id, endpoint, payload, attempts, next_attempt_at in rows:
+            if endpoint in failed_endpoints or not self._claim(delivery_id, next_attempt_at):
+                continue
+            error = self._post(endpoint, payload.encode('utf-8'), delivery_id)
+            if error is None:
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute("DELETE FROM webhook_deliveries WHERE id = ?", (delivery_id,))
+                WEBHOOK_DELIVERIES.inc(status='delivered')
+                delivered += 1
+                continue
+            
+            failed_endpoints.add(endpoint)
+            attempts += 1
+            status = 'failed' if attempts >= self.max_retries else 'pending'
+            retry_at = time.time() + min(self.retry_seconds * 2 ** (attempts - 1), MAX_RETRY_SECONDS)
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute('''
+                    UPDATE webhook_deliveries SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?
+                    WHERE id = ?
+                ''', (status, attempts, retry_at, error, delivery_id))
+            WEBHOOK_DELIVERIES.inc(status='failed' if status == 'failed' else 'retry')
+            logger.warning(f"웹훅 전송 실패 ({endpoint}, 시도 {attempts}회): {error}")
+        return delivered
+    
+    def retry_failed(self):
+        """
+        최대 시도 수를 넘겨 실패로 표시된 배치를 다시 전송 대기 상태로 변경
+        
+        Returns:
+            int: 변경된 배치 수
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                return conn.execute('''
+                    UPDATE webhook_deliveries SET status = 'pending', attempts = 0, next_attempt_at = ?
+                    WHERE status = 'failed'
+                ''', (time.time(),)).rowcount
+        except Exception as e:
+            logger.error(f"웹훅 재시도 설정 실패: {e}")
+            return 0
+    
+    def get_status(self):
+        """
+        웹훅 전송 현황
+        
+        Returns:
+            dict: 엔드포인트별 대기/실패 배치 수와 변경 피드 읽기 위치
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute('''
+                    SELECT endpoint, status, COUNT(*), SUM(event_count), MAX(last_error)
+                    FROM webhook_deliveries
+                    GROUP BY endpoint, status
+                    ORDER BY endpoint, status
+                ''').fetchall()
+            return {
+                'cursor': self._cursor(),
+                'latest_seq': self.data_manager.get_latest_change_seq(),
+                'queue': [
+                    {'endpoint': endpoint, 'status': status, 'batches': batches, 'events': events, 'last_error': last_error}
+                    for endpoint, status, batches, events, last_error in rows
+                ]
+            }
+        except Exception as e:
+            logger.error(f"웹훅 현황 조회 실패: {e}")
+            return {}
+    
+    def _cursor(self):
+        """대기열에 넣은 마지막 변경 피드 seq (처음 사용할 때는 현재 마지막 seq부터 시작)"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO metadata (key, value) VALUES ('webhook_seq', (SELECT COALESCE(MAX(seq), 0) FROM post_changes))"
+            )
+            return conn.execute("SELECT value FROM metadata WHERE key = 'webhook_seq'").fetchone()[0]
+    
+    def _claim(self, delivery_id, next_attempt_at):
+        """전송할 배치 선점 (다른 프로세스가 같은 배치를 동시에 보내지 않도록 재시도 시간을 미룸)"""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute('''
+                UPDATE webhook_deliveries SET next_attempt_at = ?
+                WHERE id = ? AND status = 'pending' AND next_attempt_at = ?
+            ''', (time.time() + self.timeout * 2, delivery_id, next_attempt_at)).rowcount == 1
+    
+    def _next_due_in(self):
+        """다음 재시도까지 남은 시간 (초, 대기 중인 배치가 없으면 None)"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("SELECT MIN(next_attempt_at) FROM webhook_deliveries WHERE status = 'pending'").fetchone()
+        return None if row[0] is None else max(row[0] - time.time(), 0)
+    
+    def _post(self, endpoint, body, delivery_id):
+        """
+        엔드포인트로 배치 POST (호스트별 keep-alive 연결 재사용)
+        
+        Returns:
+            str: 오류 메시지 (성공하면 None)
+        """
+        import http.client
+        
+        url = urlsplit(endpoint)
+        key = (url.scheme, url.netloc)
+        path = (url.path or '/') + (f'?{url.query}' if url.query else '')
+        headers = {
+            'Content-Type': 'application/json; charset=utf-8',
+            'X-Webhook-Delivery': str(delivery_id)
+        }
+        # 재사용한 연결을 서버가 이미 닫았으면 새 연결로 한 번 더 시도
+        for attempt in range(2):
+            conn = self._connections.get(key)
+            reused = conn is not None
+            if conn is None:
+                connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+                conn = self._connections[key] = connection_class(url.netloc, timeout=self.timeout)
+            try:
+                conn.request('POST', path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                if response.will_close:
+                    self._drop_connection(key)
+                if 200 <= response.status < 300:
+                    return None
+                return f"HTTP {response.status}"
+            except (OSError, http.client.HTTPException) as e:
+                self._drop_connection(key)
+                if not reused or attempt:
+                    return str(e) or e.__class__.__name__
+    
+    def _drop_connection(self, key):
+        conn = self._connections.pop(key, None)
+        if conn:
+            conn.close()
+    
+    def _close_connections(self):
+        for key in list(self._connections):
+            self._drop_connection(key)